@@ -11,6 +11,7 @@ __all__ = [  # noqa: F405
     # Membership
     "BinaryFuseFilter",
     "BloomFilter",
+    "BloomKey",
     "BlockedBloomFilter",
     "CountingBloomFilter",
     "CuckooFilter",
@@ -18,6 +19,7 @@ __all__ = [  # noqa: F405
     "StableBloomFilter",
     "VacuumFilter",
     "LearnedBloomFilter",
+    "FlatBloofi",
     # Quantiles
     "DDSketch",
     "ReqSketch",
@@ -29,6 +31,7 @@ __all__ = [  # noqa: F405
     "CountSketch",
     "ConservativeCountMin",
     "SpaceSaving",
+    "SpaceSavingU64",
     "ElasticSketch",
     "SALSA",
     "RemovableUniversalSketch",
@@ -32,6 +32,51 @@ pub struct BloomFilter {
     inner: RustBloomFilter,
 }
 
+/// Pre-hashed key for repeated BloomFilter lookups
+///
+/// Hashes the key once on construction. Passing a BloomKey to
+/// BloomFilter.insert() or contains() skips rehashing, which pays off when
+/// the same key is inserted and then checked, or checked many times.
+///
+/// Args:
+///     key: Bytes to hash
+///
+/// Example:
+///     >>> key = BloomKey(b"user:42")
+///     >>> filter = BloomFilter(1000)
+///     >>> filter.insert(key)
+///     >>> assert filter.contains(key)
+///     >>> assert filter.contains(b"user:42")  # Same result as raw bytes
+#[pyclass(module = "sketch_oxide", frozen)]
+pub struct BloomKey {
+    h1: u64,
+    h2: u64,
+}
+
+#[pymethods]
+impl BloomKey {
+    #[new]
+    fn new(key: &[u8]) -> Self {
+        let (h1, h2) = RustBloomFilter::base_hashes(key);
+        Self { h1, h2 }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("BloomKey(h1={:#018x}, h2={:#018x})", self.h1, self.h2)
+    }
+}
+
+impl BloomFilter {
+    /// Resolves a bytes object or BloomKey argument to its base hashes
+    fn key_hashes(key: &Bound<'_, PyAny>) -> PyResult<(u64, u64)> {
+        if let Ok(key) = key.downcast::<BloomKey>() {
+            let key = key.get();
+            return Ok((key.h1, key.h2));
+        }
+        Ok(RustBloomFilter::base_hashes(key.extract::<&[u8]>()?))
+    }
+}
+
 #[pymethods]
 impl BloomFilter {
     /// Create a new Bloom Filter
@@ -63,25 +108,28 @@ impl BloomFilter {
     /// Insert a key into the filter
     ///
     /// Args:
-    ///     key: Bytes to insert
+    ///     key: Bytes to insert, or a BloomKey
     ///
     /// Example:
     ///     >>> filter = BloomFilter(1000)
     ///     >>> filter.insert(b"my_key")
-    fn insert(&mut self, key: &[u8]) {
-        self.inner.insert(key);
+    fn insert(&mut self, key: &Bound<'_, PyAny>) -> PyResult<()> {
+        let (h1, h2) = Self::key_hashes(key)?;
+        self.inner.insert_hashed(h1, h2);
+        Ok(())
     }
 
     /// Check if a key might be in the set
     ///
     /// Args:
-    ///     key: Bytes to check
+    ///     key: Bytes to check, or a BloomKey
     ///
     /// Returns:
     ///     bool: True if key might be in set (possible false positives),
     ///           False if key is definitely not in set (no false negatives)
-    fn contains(&self, key: &[u8]) -> bool {
-        self.inner.contains(key)
+    fn contains(&self, key: &Bound<'_, PyAny>) -> PyResult<bool> {
+        let (h1, h2) = Self::key_hashes(key)?;
+        Ok(self.inner.contains_hashed(h1, h2))
     }
 
     /// Clear all bits in the filter
@@ -96,13 +144,14 @@ impl BloomFilter {
     ///
     /// Raises:
     ///     ValueError: If filters have different sizes
-    fn merge(&mut self, other: &BloomFilter) -> PyResult<()> {
+    fn merge(&mut self, py: Python<'_>, other: &BloomFilter) -> PyResult<()> {
         if self.inner.params() != other.inner.params() {
             return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
                 "Bloom filters must have same parameters to merge",
             ));
         }
-        self.inner.merge(&other.inner);
+        let (inner, other) = (&mut self.inner, &other.inner);
+        py.allow_threads(|| inner.merge(other));
         Ok(())
     }
 
@@ -143,7 +192,9 @@ impl BloomFilter {
     /// Returns:
     ///     bytes: Serialized filter
     fn to_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
-        PyBytes::new_bound(py, &self.inner.to_bytes())
+        let inner = &self.inner;
+        let bytes = py.allow_threads(|| inner.to_bytes());
+        PyBytes::new_bound(py, &bytes)
     }
 
     /// Deserialize a filter from bytes
@@ -182,8 +233,8 @@ impl BloomFilter {
         self.inner.len()
     }
 
-    fn __contains__(&self, key: &[u8]) -> bool {
-        self.inner.contains(key)
+    fn __contains__(&self, key: &Bound<'_, PyAny>) -> PyResult<bool> {
+        self.contains(key)
     }
 
     /// Insert multiple keys into the filter in a single call (optimized for throughput)
@@ -191,6 +242,7 @@ impl BloomFilter {
     /// Batch inserts are significantly faster than multiple individual insert() calls
     /// because they amortize the FFI (Foreign Function Interface) overhead across
     /// many items. This is the preferred method when adding large quantities of data.
+    /// The GIL is released while the keys are hashed and inserted.
     ///
     /// Args:
     ///     keys: Iterable of byte strings to insert
@@ -200,16 +252,17 @@ impl BloomFilter {
     ///     >>> filter.insert_batch([b"key1", b"key2", b"key3"])
     fn insert_batch(&mut self, keys: &Bound<'_, PyAny>) -> PyResult<()> {
         let keys_list: &Bound<'_, PyList> = keys.downcast()?;
-        for key in keys_list {
-            let key_bytes: &[u8] = key.extract()?;
-            self.inner.insert(key_bytes);
-        }
+        let keys_bytes: Vec<Bound<'_, PyBytes>> = keys_list.extract()?;
+        let key_slices: Vec<&[u8]> = keys_bytes.iter().map(|key| key.as_bytes()).collect();
+        let inner = &mut self.inner;
+        keys.py().allow_threads(|| inner.insert_batch(&key_slices));
         Ok(())
     }
 
     /// Check multiple keys with a single call (optimized for lookups)
     ///
     /// Batch contains checks are faster than multiple individual contains() calls.
+    /// The GIL is released while the keys are checked.
     ///
     /// Args:
     ///     keys: Iterable of byte strings to check
@@ -222,11 +275,10 @@ impl BloomFilter {
     ///     >>> results = filter.contains_batch([b"key1", b"missing"])
     fn contains_batch(&self, keys: &Bound<'_, PyAny>) -> PyResult<Vec<bool>> {
         let keys_list: &Bound<'_, PyList> = keys.downcast()?;
-        let mut results = Vec::new();
-        for key in keys_list {
-            let key_bytes: &[u8] = key.extract()?;
-            results.push(self.inner.contains(key_bytes));
-        }
-        Ok(results)
+        let keys_bytes: Vec<Bound<'_, PyBytes>> = keys_list.extract()?;
+        let key_slices: Vec<&[u8]> = keys_bytes.iter().map(|key| key.as_bytes()).collect();
+        let inner = &self.inner;
+        let py = keys.py();
+        Ok(py.allow_threads(|| inner.contains_batch(&key_slices)))
     }
 }
@@ -3,9 +3,12 @@
 //! This module provides shared functionality for converting Python types
 //! to Rust types across all sketch implementations.
 
+use numpy::{Element, PyReadonlyArray1};
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyByteArray, PyBytes, PyString};
 use sketch_oxide::common::hash::xxhash;
+use std::borrow::Cow;
+use std::hash::{Hash, Hasher};
 
 /// Convert a Python item to a hash value for hash-based sketch algorithms.
 ///
@@ -38,15 +41,15 @@ use sketch_oxide::common::hash::xxhash;
 /// }
 /// ```
 pub fn python_item_to_hash(item: &Bound<'_, PyAny>) -> PyResult<u64> {
-    if let Ok(val) = item.extract::<i64>() {
+    // str and bytes are hashed straight from the Python object's buffer
+    if let Ok(s) = item.downcast::<PyString>() {
+        Ok(xxhash(s.to_cow()?.as_bytes(), 0))
+    } else if let Ok(b) = item.downcast::<PyBytes>() {
+        Ok(xxhash(b.as_bytes(), 0))
+    } else if let Ok(val) = item.extract::<i64>() {
         Ok(xxhash(&val.to_le_bytes(), 0))
     } else if let Ok(val) = item.extract::<u64>() {
         Ok(xxhash(&val.to_le_bytes(), 0))
-    } else if let Ok(val) = item.extract::<String>() {
-        Ok(xxhash(val.as_bytes(), 0))
-    } else if let Ok(b) = item.downcast::<PyBytes>() {
-        let val = b.as_bytes();
-        Ok(xxhash(val, 0))
     } else if let Ok(val) = item.extract::<f64>() {
         Ok(xxhash(&val.to_bits().to_le_bytes(), 0))
     } else {
@@ -56,6 +59,155 @@ pub fn python_item_to_hash(item: &Bound<'_, PyAny>) -> PyResult<u64> {
     }
 }
 
+/// Call `f` with the bytes a byte-keyed sketch stores for a Python item.
+///
+/// `bytes` and `bytearray` are borrowed in place, `str` is passed as its UTF-8
+/// encoding and ints are written little-endian into a stack buffer, so no
+/// per-item `Vec` is built on the single-item hot path.
+///
+/// # Example
+///
+/// ```rust,ignore
+/// fn contains(&self, item: &Bound<'_, PyAny>) -> PyResult<bool> {
+///     with_item_bytes(item, |key| self.inner.contains(key))
+/// }
+/// ```
+pub fn with_item_bytes<R>(item: &Bound<'_, PyAny>, f: impl FnOnce(&[u8]) -> R) -> PyResult<R> {
+    // Check str/bytes before int: a failed int extraction raises internally
+    if let Ok(b) = item.downcast::<PyBytes>() {
+        Ok(f(b.as_bytes()))
+    } else if let Ok(s) = item.downcast::<PyString>() {
+        Ok(f(s.to_cow()?.as_bytes()))
+    } else if let Ok(b) = item.downcast::<PyByteArray>() {
+        // SAFETY: `f` is Rust code that cannot resize the bytearray while borrowed
+        Ok(f(unsafe { b.as_bytes() }))
+    } else if let Ok(val) = item.extract::<i64>() {
+        Ok(f(&val.to_le_bytes()))
+    } else if let Ok(val) = item.extract::<u64>() {
+        Ok(f(&val.to_le_bytes()))
+    } else {
+        Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "Item must be int, str, bytes, or bytearray",
+        ))
+    }
+}
+
+/// A one-dimensional column of numbers passed in from Python.
+///
+/// NumPy arrays of the matching dtype are borrowed without copying; any other
+/// sequence (e.g. a list of ints) is extracted into an owned `Vec`. Batch
+/// methods use this so callers get the zero-copy path with NumPy while plain
+/// lists keep working without it.
+///
+/// # Example
+///
+/// ```rust,ignore
+/// fn update_many(&mut self, py: Python<'_>, values: &Bound<'_, PyAny>) -> PyResult<()> {
+///     let values = Column::<u64>::extract(values)?;
+///     let values = values.as_slice()?;
+///     let inner = &mut self.inner;
+///     py.allow_threads(|| values.iter().for_each(|&v| inner.update(v)));
+///     Ok(())
+/// }
+/// ```
+pub enum Column<'py, T: Element> {
+    /// Borrowed NumPy array buffer
+    Array(PyReadonlyArray1<'py, T>),
+    /// Values copied out of a Python sequence
+    Owned(Vec<T>),
+}
+
+impl<'py, T: Element + FromPyObject<'py>> Column<'py, T> {
+    /// Borrow `obj` if it is a NumPy array of `T`, otherwise extract it as a sequence
+    pub fn extract(obj: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(array) = obj.extract::<PyReadonlyArray1<'py, T>>() {
+            return Ok(Self::Array(array));
+        }
+        obj.extract::<Vec<T>>().map(Self::Owned)
+    }
+
+    /// View the column as a slice (fails for non-contiguous arrays)
+    pub fn as_slice(&self) -> PyResult<&[T]> {
+        match self {
+            Self::Array(array) => Ok(array.as_slice()?),
+            Self::Owned(values) => Ok(values),
+        }
+    }
+}
+
+/// Ensure a per-item companion column (deltas, weights) matches the item count.
+pub fn check_same_length(items: usize, name: &str, values: Option<&[impl Sized]>) -> PyResult<()> {
+    match values {
+        Some(values) if values.len() != items => {
+            Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "{name} has {} entries but {items} items were given",
+                values.len()
+            )))
+        }
+        _ => Ok(()),
+    }
+}
+
+/// A Python item borrowed as the Rust value `with_python_item!` would pass.
+///
+/// Hashing an `ItemRef` feeds the hasher exactly what hashing the underlying
+/// `str`, `[u8]` or integer does, so a batch method can extract its items
+/// while holding the GIL, release it, and still update the sketch exactly as
+/// per-item update() calls would.
+///
+/// # Example
+///
+/// ```rust,ignore
+/// fn update_batch(&mut self, py: Python<'_>, items: &Bound<'_, PyList>) -> PyResult<()> {
+///     let items: Vec<Bound<'_, PyAny>> = items.iter().collect();
+///     let keys = ItemRef::extract_all(&items)?;
+///     let inner = &mut self.inner;
+///     py.allow_threads(|| keys.iter().for_each(|key| inner.update(key)));
+///     Ok(())
+/// }
+/// ```
+pub enum ItemRef<'a> {
+    Str(Cow<'a, str>),
+    Bytes(&'a [u8]),
+    Int(i64),
+    UInt(u64),
+}
+
+impl<'a> ItemRef<'a> {
+    /// Borrow `item`, checking types in the same order as `with_python_item!`
+    pub fn extract(item: &'a Bound<'_, PyAny>) -> PyResult<Self> {
+        if let Ok(s) = item.downcast::<PyString>() {
+            Ok(Self::Str(s.to_cow()?))
+        } else if let Ok(b) = item.downcast::<PyBytes>() {
+            Ok(Self::Bytes(b.as_bytes()))
+        } else if let Ok(val) = item.extract::<i64>() {
+            Ok(Self::Int(val))
+        } else if let Ok(val) = item.extract::<u64>() {
+            Ok(Self::UInt(val))
+        } else {
+            Err(pyo3::exceptions::PyTypeError::new_err(
+                "Item must be int, str, or bytes",
+            ))
+        }
+    }
+
+    /// Borrow every item of a batch
+    pub fn extract_all(items: &'a [Bound<'_, PyAny>]) -> PyResult<Vec<Self>> {
+        items.iter().map(Self::extract).collect()
+    }
+}
+
+impl Hash for ItemRef<'_> {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        match self {
+            Self::Str(s) => (**s).hash(state),
+            Self::Bytes(b) => b.hash(state),
+            Self::Int(val) => val.hash(state),
+            Self::UInt(val) => val.hash(state),
+        }
+    }
+}
+
 /// Macro to execute a closure with a Python item converted to a Rust type.
 ///
 /// This macro handles conversion of Python types (int, str, bytes) to their
@@ -73,17 +225,25 @@ pub fn python_item_to_hash(item: &Bound<'_, PyAny>) -> PyResult<u64> {
 #[macro_export]
 macro_rules! with_python_item {
     ($item:expr, $closure:expr) => {{
-        use pyo3::types::PyBytes;
+        use pyo3::types::{PyBytes, PyString};
 
-        if let Ok(val) = $item.extract::<i64>() {
-            Ok($closure(&val))
-        } else if let Ok(val) = $item.extract::<u64>() {
-            Ok($closure(&val))
-        } else if let Ok(val) = $item.extract::<String>() {
-            Ok($closure(&val))
+        // str and bytes are checked first and borrowed in place: a failed int
+        // extraction builds a Python exception, and extracting a String copies.
+        if let Ok(s) = $item.downcast::<PyString>() {
+            match s.to_cow() {
+                Ok(val) => {
+                    let val: &str = &val;
+                    Ok($closure(&val))
+                }
+                Err(e) => Err(e),
+            }
         } else if let Ok(b) = $item.downcast::<PyBytes>() {
             let val = b.as_bytes();
             Ok($closure(&val))
+        } else if let Ok(val) = $item.extract::<i64>() {
+            Ok($closure(&val))
+        } else if let Ok(val) = $item.extract::<u64>() {
+            Ok($closure(&val))
         } else {
             Err(pyo3::exceptions::PyTypeError::new_err(
                 "Item must be int, str, or bytes",
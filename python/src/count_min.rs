@@ -5,6 +5,7 @@ use pyo3::types::PyList;
 use sketch_oxide::frequency::CountMinSketch as RustCountMinSketch;
 use sketch_oxide::{Mergeable, Sketch};
 
+use crate::common::ItemRef;
 use crate::with_python_item;
 
 /// Count-Min Sketch for frequency estimation (Cormode & Muthukrishnan, 2003)
@@ -153,6 +154,7 @@ impl CountMinSketch {
     /// Batch updates are significantly faster than multiple individual update() calls
     /// because they amortize the FFI (Foreign Function Interface) overhead across
     /// many items. This is the preferred method when adding large quantities of data.
+    /// The GIL is released while the items are hashed and counted.
     ///
     /// Args:
     ///     items: Iterable of items to add (int, str, or bytes types)
@@ -162,15 +164,19 @@ impl CountMinSketch {
     ///     >>> cms.update_batch(["apple", "banana", "apple"])
     fn update_batch(&mut self, items: &Bound<'_, PyAny>) -> PyResult<()> {
         let items_list: &Bound<'_, PyList> = items.downcast()?;
-        for item in items_list {
-            self.update(&item)?;
-        }
+        let items_vec: Vec<Bound<'_, PyAny>> = items_list.iter().collect();
+        let keys = ItemRef::extract_all(&items_vec)?;
+        let inner = &mut self.inner;
+        items
+            .py()
+            .allow_threads(|| keys.iter().for_each(|key| inner.update(key)));
         Ok(())
     }
 
     /// Estimate frequencies of multiple items in a single call (optimized for lookups)
     ///
     /// Batch frequency lookups are faster than multiple individual estimate() calls.
+    /// The GIL is released while the items are looked up.
     ///
     /// Args:
     ///     items: Iterable of items to query (int, str, or bytes types)
@@ -183,11 +189,17 @@ impl CountMinSketch {
     ///     >>> estimates = cms.estimate_batch(["apple", "banana"])
     fn estimate_batch(&self, items: &Bound<'_, PyAny>) -> PyResult<Vec<u64>> {
         let items_list: &Bound<'_, PyList> = items.downcast()?;
-        let mut estimates = Vec::new();
-        for item in items_list {
-            estimates.push(self.estimate(&item)?);
-        }
-        Ok(estimates)
+        let items_vec: Vec<Bound<'_, PyAny>> = items_list.iter().collect();
+        let keys = ItemRef::extract_all(&items_vec)?;
+        let inner = &self.inner;
+        Ok(items
+            .py()
+            .allow_threads(|| keys.iter().map(|key| inner.estimate(key)).collect()))
+    }
+
+    /// Reset all counters to zero, keeping the allocation for reuse
+    fn clear(&mut self) {
+        self.inner.clear();
     }
 
     fn __repr__(&self) -> String {
@@ -1,10 +1,13 @@
 //! Python bindings for Count Sketch frequency estimation
 
+use numpy::PyReadonlyArray1;
 use pyo3::prelude::*;
 use pyo3::types::{PyBytes, PyList};
 use sketch_oxide::frequency::CountSketch as RustCountSketch;
 use sketch_oxide::{Mergeable, Sketch};
+use std::hash::Hash;
 
+use crate::common::{check_same_length, Column};
 use crate::with_python_item;
 
 /// Count Sketch for unbiased frequency estimation (Charikar, Chen, Farach-Colton, 2002)
@@ -134,9 +137,9 @@ impl CountSketch {
     ///     >>> cs2.update("item", 5)
     ///     >>> cs1.merge(cs2)
     ///     >>> assert cs1.estimate("item") >= 10  # Should be approximately 15
-    fn merge(&mut self, other: &CountSketch) -> PyResult<()> {
-        self.inner
-            .merge(&other.inner)
+    fn merge(&mut self, py: Python<'_>, other: &CountSketch) -> PyResult<()> {
+        let (inner, other) = (&mut self.inner, &other.inner);
+        py.allow_threads(|| inner.merge(other))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
@@ -160,16 +163,8 @@ impl CountSketch {
     /// Raises:
     ///     ValueError: If data is invalid
     #[staticmethod]
-    fn deserialize(data: &Bound<'_, PyAny>) -> PyResult<Self> {
-        let bytes = if let Ok(b) = data.downcast::<PyBytes>() {
-            b.as_bytes().to_vec()
-        } else {
-            return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "data must be bytes",
-            ));
-        };
-
-        RustCountSketch::deserialize(&bytes)
+    fn deserialize(data: &[u8]) -> PyResult<Self> {
+        RustCountSketch::deserialize(data)
             .map(|inner| Self { inner })
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
@@ -258,6 +253,50 @@ impl CountSketch {
         Ok(())
     }
 
+    /// Update the sketch with many keys and optional per-key deltas in one call.
+    ///
+    /// Integer NumPy arrays (uint64 or int64) are read directly from their buffer
+    /// and processed with the GIL released, so no Python object is touched per key.
+    /// Any other list of keys (int, str, or bytes) is handled item by item. Keys are
+    /// hashed exactly as update() hashes them.
+    ///
+    /// Args:
+    ///     keys: NumPy integer array or list of items
+    ///     deltas: Optional int64 array or list of deltas, one per key (default: 1 each)
+    ///
+    /// Raises:
+    ///     ValueError: If deltas and keys differ in length
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> cs = CountSketch(epsilon=0.1, delta=0.01)
+    ///     >>> cs.update_many(np.arange(1000, dtype=np.uint64))
+    ///     >>> cs.update_many(["a", "b"], [5, -2])
+    #[pyo3(signature = (keys, deltas=None))]
+    fn update_many(
+        &mut self,
+        py: Python<'_>,
+        keys: &Bound<'_, PyAny>,
+        deltas: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<()> {
+        let deltas = deltas.map(Column::<i64>::extract).transpose()?;
+        let deltas = deltas.as_ref().map(Column::as_slice).transpose()?;
+
+        if let Ok(keys) = keys.extract::<PyReadonlyArray1<u64>>() {
+            return self.update_many_ints(py, keys.as_slice()?, deltas);
+        }
+        if let Ok(keys) = keys.extract::<PyReadonlyArray1<i64>>() {
+            return self.update_many_ints(py, keys.as_slice()?, deltas);
+        }
+
+        let keys: &Bound<'_, PyList> = keys.downcast()?;
+        check_same_length(keys.len(), "deltas", deltas)?;
+        for (i, key) in keys.iter().enumerate() {
+            self.update(&key, deltas.map_or(1, |deltas| deltas[i]))?;
+        }
+        Ok(())
+    }
+
     /// Estimate frequencies of multiple items in a single call (optimized for lookups).
     ///
     /// Batch frequency lookups are faster than multiple individual estimate() calls.
@@ -276,3 +315,24 @@ impl CountSketch {
         Ok(estimates)
     }
 }
+
+impl CountSketch {
+    /// Apply integer keys from a NumPy buffer without holding the GIL
+    fn update_many_ints<T: Hash + Sync>(
+        &mut self,
+        py: Python<'_>,
+        keys: &[T],
+        deltas: Option<&[i64]>,
+    ) -> PyResult<()> {
+        check_same_length(keys.len(), "deltas", deltas)?;
+        let inner = &mut self.inner;
+        py.allow_threads(|| match deltas {
+            Some(deltas) => keys
+                .iter()
+                .zip(deltas)
+                .for_each(|(key, &delta)| inner.update(key, delta)),
+            None => keys.iter().for_each(|key| inner.update(key, 1)),
+        });
+        Ok(())
+    }
+}
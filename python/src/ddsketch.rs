@@ -1,5 +1,6 @@
 //! Python bindings for DDSketch quantile estimation
 
+use crate::common::Column;
 use numpy::{PyArray1, PyReadonlyArray1};
 use pyo3::prelude::*;
 use sketch_oxide::quantiles::DDSketch as RustDDSketch;
@@ -64,18 +65,22 @@ impl DDSketch {
 
     /// Update the sketch with multiple values (NumPy support)
     ///
+    /// The whole array is binned in one call with the GIL released, which
+    /// is much faster than calling update() per value.
+    ///
     /// Args:
-    ///     values: NumPy array of values
+    ///     values: NumPy array of values (float64) or a sequence of floats
     ///
     /// Example:
     ///     >>> import numpy as np
     ///     >>> dd = DDSketch(relative_accuracy=0.01)
     ///     >>> values = np.random.exponential(scale=100, size=10000)
     ///     >>> dd.update_batch(values)
-    fn update_batch(&mut self, values: PyReadonlyArray1<f64>) -> PyResult<()> {
-        for &val in values.as_slice()? {
-            self.inner.update(&val);
-        }
+    fn update_batch(&mut self, py: Python<'_>, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        let values = Column::<f64>::extract(values)?;
+        let values = values.as_slice()?;
+        let inner = &mut self.inner;
+        py.allow_threads(|| inner.add_batch(values));
         Ok(())
     }
 
@@ -141,9 +146,9 @@ impl DDSketch {
     ///     >>> dd2 = DDSketch(relative_accuracy=0.01)
     ///     >>> # ... add data to both ...
     ///     >>> dd1.merge(dd2)  # Combine distributions
-    fn merge(&mut self, other: &DDSketch) -> PyResult<()> {
-        self.inner
-            .merge(&other.inner)
+    fn merge(&mut self, py: Python<'_>, other: &DDSketch) -> PyResult<()> {
+        let (inner, other) = (&mut self.inner, &other.inner);
+        py.allow_threads(|| inner.merge(other))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
@@ -179,6 +184,11 @@ impl DDSketch {
         self.inner.is_empty()
     }
 
+    /// Remove all values, keeping the bin storage for reuse
+    fn clear(&mut self) {
+        self.inner.clear();
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "DDSketch(count={}, min={:.2}, max={:.2})",
@@ -0,0 +1,142 @@
+//! Python bindings for FlatBloofi multi-filter membership testing
+
+use pyo3::prelude::*;
+use sketch_oxide::membership::FlatBloofi as RustFlatBloofi;
+
+/// Flat-Bloofi: up to 64 Bloom filters queried in one pass
+///
+/// Stores same-shaped Bloom filters bit-sliced, so one lookup hashes the key
+/// once and reports every filter that may contain it. Useful for routing a
+/// key to shards, partitions or files.
+///
+/// Args:
+///     num_filters: Number of filters (1 to 64)
+///     n: Expected number of elements per filter
+///     fpr: Desired false positive rate per filter, default 0.01 (1%)
+///
+/// Example:
+///     >>> filters = FlatBloofi(3, 1000)
+///     >>> filters.insert(0, b"apple")
+///     >>> filters.insert(2, b"apple")
+///     >>> filters.matching_filters(b"apple")
+///     [0, 2]
+///     >>> assert filters.contains(2, b"apple")
+///
+/// Notes:
+///     - Each filter answers exactly like a BloomFilter of the same shape
+///     - Zero false negatives guaranteed
+///     - Query cost is independent of the number of filters
+#[pyclass(module = "sketch_oxide")]
+pub struct FlatBloofi {
+    inner: RustFlatBloofi,
+}
+
+#[pymethods]
+impl FlatBloofi {
+    /// Create a new set of empty filters
+    ///
+    /// Args:
+    ///     num_filters: Number of filters (1 to 64)
+    ///     n: Expected number of elements per filter
+    ///     fpr: False positive rate (0.0 to 1.0), default 0.01 (1%)
+    ///
+    /// Raises:
+    ///     ValueError: If num_filters not in [1, 64], n <= 0 or fpr not in (0, 1)
+    #[new]
+    #[pyo3(signature = (num_filters, n, fpr=0.01))]
+    fn new(num_filters: usize, n: usize, fpr: f64) -> PyResult<Self> {
+        RustFlatBloofi::new(num_filters, n, fpr)
+            .map(|inner| Self { inner })
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Insert a key into one filter
+    ///
+    /// Args:
+    ///     filter: Index of the filter
+    ///     key: Bytes to insert
+    ///
+    /// Raises:
+    ///     IndexError: If filter is out of range
+    fn insert(&mut self, filter: usize, key: &[u8]) -> PyResult<()> {
+        self.check_filter(filter)?;
+        self.inner.insert(filter, key);
+        Ok(())
+    }
+
+    /// Check if a key might be in one filter
+    ///
+    /// Args:
+    ///     filter: Index of the filter
+    ///     key: Bytes to check
+    ///
+    /// Returns:
+    ///     bool: True if key might be in the filter, False if definitely not
+    fn contains(&self, filter: usize, key: &[u8]) -> bool {
+        self.inner.contains(filter, key)
+    }
+
+    /// Get the indices of every filter that may contain a key
+    ///
+    /// Args:
+    ///     key: Bytes to check
+    ///
+    /// Returns:
+    ///     list[int]: Filter indices in ascending order
+    fn matching_filters(&self, key: &[u8]) -> Vec<usize> {
+        self.inner.matching_filters(key).collect()
+    }
+
+    /// Get a bitmask of the filters that may contain a key
+    ///
+    /// Args:
+    ///     key: Bytes to check
+    ///
+    /// Returns:
+    ///     int: Bit i is set if filter i may contain the key
+    fn contains_mask(&self, key: &[u8]) -> u64 {
+        self.inner.contains_mask(key)
+    }
+
+    /// Clear every filter
+    fn clear(&mut self) {
+        self.inner.clear();
+    }
+
+    /// Get the number of filters
+    fn num_filters(&self) -> usize {
+        self.inner.num_filters()
+    }
+
+    /// Get memory usage in bytes
+    ///
+    /// Returns:
+    ///     int: Memory usage in bytes
+    fn memory_usage(&self) -> usize {
+        self.inner.memory_usage()
+    }
+
+    fn __repr__(&self) -> String {
+        let (n, m, k) = self.inner.params();
+        format!(
+            "FlatBloofi(filters={}, n={}, bits={}, hashes={})",
+            self.inner.num_filters(),
+            n,
+            m,
+            k
+        )
+    }
+}
+
+impl FlatBloofi {
+    fn check_filter(&self, filter: usize) -> PyResult<()> {
+        if filter >= self.inner.num_filters() {
+            return Err(PyErr::new::<pyo3::exceptions::PyIndexError, _>(format!(
+                "filter index {} out of range for {} filters",
+                filter,
+                self.inner.num_filters()
+            )));
+        }
+        Ok(())
+    }
+}
@@ -60,7 +60,7 @@ impl FrequentItems {
     ///     >>> fi.update("banana", count=5)
     #[pyo3(signature = (item, count=1))]
     fn update(&mut self, item: &str, count: u64) {
-        self.inner.update_by(item.to_string(), count);
+        self.inner.update_by_ref(item, count);
     }
 
     /// Get the estimated frequency bounds for an item
@@ -79,7 +79,7 @@ impl FrequentItems {
     ///     ...     lower, upper = bounds
     ///     ...     print(f"Frequency in range [{lower}, {upper}]")
     fn get_estimate(&self, item: &str) -> Option<(u64, u64)> {
-        self.inner.get_estimate(&item.to_string())
+        self.inner.get_estimate_ref(item)
     }
 
     /// Get all frequent items above a threshold
@@ -97,18 +97,24 @@ impl FrequentItems {
     ///     >>> for item, lower, upper in items[:10]:  # Top 10
     ///     ...     print(f"{item}: [{lower}, {upper}]")
     #[pyo3(signature = (mode="no_false_positives"))]
-    fn frequent_items(&self, mode: &str) -> PyResult<Vec<(String, u64, u64)>> {
-        let error_type = match mode.to_lowercase().as_str() {
-            "no_false_positives" => RustErrorType::NoFalsePositives,
-            "no_false_negatives" => RustErrorType::NoFalseNegatives,
-            _ => {
-                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    "Mode must be 'no_false_positives' or 'no_false_negatives'",
-                ))
-            }
+    fn frequent_items(&self, mode: &str) -> PyResult<Vec<(&str, u64, u64)>> {
+        let error_type = if mode.eq_ignore_ascii_case("no_false_positives") {
+            RustErrorType::NoFalsePositives
+        } else if mode.eq_ignore_ascii_case("no_false_negatives") {
+            RustErrorType::NoFalseNegatives
+        } else {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Mode must be 'no_false_positives' or 'no_false_negatives'",
+            ));
         };
 
-        Ok(self.inner.frequent_items(error_type))
+        // Items are converted to Python str straight from the sketch's keys
+        Ok(self
+            .inner
+            .frequent_items_ref(error_type)
+            .into_iter()
+            .map(|(item, lower, upper)| (item.as_str(), lower, upper))
+            .collect())
     }
 
     /// Check if the sketch is empty
@@ -143,6 +149,11 @@ impl FrequentItems {
         self.inner.offset()
     }
 
+    /// Remove all tracked items and reset the error bound
+    fn clear(&mut self) {
+        self.inner.clear();
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "FrequentItems(max_size={}, tracking={}, offset={})",
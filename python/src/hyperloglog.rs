@@ -153,6 +153,7 @@ impl HyperLogLog {
     ///
     /// Processes multiple items in a single call, amortizing FFI overhead.
     /// This is significantly faster than calling update() multiple times.
+    /// The GIL is released while the item hashes are added to the registers.
     ///
     /// Args:
     ///     items: Iterable of items to add (int, str, bytes, or float types)
@@ -163,10 +164,14 @@ impl HyperLogLog {
     ///     >>> print(f"Estimate: {hll.estimate():.0f}")
     fn update_batch(&mut self, items: &Bound<'_, PyAny>) -> PyResult<()> {
         let items_list: &Bound<'_, PyList> = items.downcast()?;
-        for item in items_list {
-            let hash_val = python_item_to_hash(&item)?;
-            self.inner.update(&hash_val);
-        }
+        let hashes = items_list
+            .iter()
+            .map(|item| python_item_to_hash(&item))
+            .collect::<PyResult<Vec<u64>>>()?;
+        let inner = &mut self.inner;
+        items
+            .py()
+            .allow_threads(|| hashes.iter().for_each(|hash_val| inner.update(hash_val)));
         Ok(())
     }
 
@@ -174,18 +179,25 @@ impl HyperLogLog {
     ///
     /// For maximum performance when you have integer hashes already computed.
     /// Completely skips type detection and hashing overhead.
+    /// The GIL is released while the hashes are added.
     ///
     /// Args:
     ///     hashes: Iterable of integer hash values
     fn update_batch_hashes(&mut self, hashes: &Bound<'_, PyAny>) -> PyResult<()> {
         let hashes_list: &Bound<'_, PyList> = hashes.downcast()?;
-        for item in hashes_list {
-            let hash_val: u64 = item.extract()?;
-            self.inner.update(&hash_val);
-        }
+        let hash_vals: Vec<u64> = hashes_list.extract()?;
+        let inner = &mut self.inner;
+        hashes
+            .py()
+            .allow_threads(|| hash_vals.iter().for_each(|hash_val| inner.update(hash_val)));
         Ok(())
     }
 
+    /// Reset all registers, keeping the allocation for reuse
+    fn clear(&mut self) {
+        self.inner.clear();
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "HyperLogLog(precision={}, estimate={:.0})",
@@ -1,9 +1,11 @@
 //! Python bindings for Learned Bloom Filter - ML-Enhanced Membership Testing
 
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyList};
+use pyo3::types::PyList;
 use sketch_oxide::membership::LearnedBloomFilter as RustLearnedBloomFilter;
 
+use crate::common::{with_item_bytes, Column};
+
 /// LearnedBloomFilter: ML-Enhanced Membership Testing (EXPERIMENTAL)
 ///
 /// **EXPERIMENTAL FEATURE** - Use with caution in production systems.
@@ -75,13 +77,13 @@ impl LearnedBloomFilter {
     /// Create a new Learned Bloom Filter
     ///
     /// Args:
-    ///     training_keys: List of keys to train on (bytes, str, or int)
+    ///     training_keys: List of keys to train on (bytes, bytearray, str, or int)
     ///     fpr: Target false positive rate (0.0 < fpr < 1.0)
     ///
     /// Raises:
     ///     ValueError: If training_keys is empty or too small (<10 keys)
     ///     ValueError: If fpr is invalid
-    ///     TypeError: If keys are not bytes, str, or int
+    ///     TypeError: If keys are not bytes, bytearray, str, or int
     ///
     /// Example:
     ///     >>> keys = [f"key{i}".encode() for i in range(1000)]
@@ -89,33 +91,50 @@ impl LearnedBloomFilter {
     #[new]
     fn new(training_keys: &Bound<'_, PyList>, fpr: f64) -> PyResult<Self> {
         // Convert Python list to Vec<Vec<u8>>
-        let mut keys: Vec<Vec<u8>> = Vec::new();
-
-        for item in training_keys {
-            if let Ok(b) = item.downcast::<PyBytes>() {
-                keys.push(b.as_bytes().to_vec());
-            } else if let Ok(s) = item.extract::<String>() {
-                keys.push(s.into_bytes());
-            } else if let Ok(i) = item.extract::<i64>() {
-                keys.push(i.to_le_bytes().to_vec());
-            } else if let Ok(u) = item.extract::<u64>() {
-                keys.push(u.to_le_bytes().to_vec());
-            } else {
-                return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                    "Training keys must be bytes, str, or int",
-                ));
-            }
-        }
+        let keys = training_keys
+            .iter()
+            .map(|item| with_item_bytes(&item, <[u8]>::to_vec))
+            .collect::<PyResult<Vec<_>>>()?;
 
         RustLearnedBloomFilter::new(&keys, fpr)
             .map(|inner| Self { inner })
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
+    /// Create a Learned Bloom Filter over IPv4 addresses given as integers
+    ///
+    /// Each address is stored as its 4 bytes in network order, matching
+    /// contains_ipv4(), without formatting addresses as strings.
+    ///
+    /// Args:
+    ///     ips: NumPy uint32 array or sequence of IPv4 addresses as ints
+    ///     fpr: Target false positive rate (0.0 < fpr < 1.0)
+    ///
+    /// Raises:
+    ///     ValueError: If there are too few addresses (<10) or fpr is invalid
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> ips = np.uint32(0xC0A80000) + np.arange(1000, dtype=np.uint32)
+    ///     >>> lbf = LearnedBloomFilter.from_ipv4(ips, fpr=0.01)
+    ///     >>> assert lbf.contains_ipv4(0xC0A80064)  # 192.168.0.100
+    #[staticmethod]
+    fn from_ipv4(py: Python<'_>, ips: &Bound<'_, PyAny>, fpr: f64) -> PyResult<Self> {
+        let ips = Column::<u32>::extract(ips)?;
+        let ips = ips.as_slice()?;
+
+        py.allow_threads(|| {
+            let keys: Vec<Vec<u8>> = ips.iter().map(|ip| ip.to_be_bytes().to_vec()).collect();
+            RustLearnedBloomFilter::new(&keys, fpr)
+        })
+        .map(|inner| Self { inner })
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
     /// Check if a key might be in the filter
     ///
     /// Args:
-    ///     key: Key to check (bytes, str, or int)
+    ///     key: Key to check (bytes, bytearray, str, or int)
     ///
     /// Returns:
     ///     bool: True if might be present (or false positive),
@@ -133,19 +152,18 @@ impl LearnedBloomFilter {
     ///     >>> assert lbf.contains(b"hello")  # True positive
     ///     >>> lbf.contains(b"other")  # May be false positive
     fn contains(&self, key: &Bound<'_, PyAny>) -> PyResult<bool> {
-        if let Ok(b) = key.downcast::<PyBytes>() {
-            Ok(self.inner.contains(b.as_bytes()))
-        } else if let Ok(s) = key.extract::<String>() {
-            Ok(self.inner.contains(s.as_bytes()))
-        } else if let Ok(i) = key.extract::<i64>() {
-            Ok(self.inner.contains(&i.to_le_bytes()))
-        } else if let Ok(u) = key.extract::<u64>() {
-            Ok(self.inner.contains(&u.to_le_bytes()))
-        } else {
-            Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Key must be bytes, str, or int",
-            ))
-        }
+        with_item_bytes(key, |key| self.inner.contains(key))
+    }
+
+    /// Check if an IPv4 address given as an integer might be in the filter
+    ///
+    /// Args:
+    ///     ip: IPv4 address as an int in [0, 2**32)
+    ///
+    /// Returns:
+    ///     bool: True if might be present, False if definitely not present
+    fn contains_ipv4(&self, ip: u32) -> bool {
+        self.inner.contains(&ip.to_be_bytes())
     }
 
     /// Get memory usage in bytes
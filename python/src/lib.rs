@@ -13,6 +13,7 @@ mod cuckoo;
 mod ddsketch;
 mod elastic_sketch;
 mod exponential_histogram;
+mod flat_bloofi;
 mod frequent;
 mod grafite;
 mod grf;
@@ -63,6 +64,7 @@ mod varopt;
 /// - **CuckooFilter**: Space-efficient deletable filter (~12 bits/key, Fan 2014)
 /// - **RibbonFilter**: Space-efficient (~7 bits/key @ 1% FPR, RocksDB 2021+)
 /// - **StableBloomFilter**: Bounded FPR for unbounded streams (Deng 2006)
+/// - **FlatBloofi**: Up to 64 Bloom filters queried in one pass (Bloofi 2015)
 ///
 /// ### Quantile Estimation
 /// - **DDSketch**: Relative error guarantees (VLDB 2019, Datadog/ClickHouse)
@@ -73,6 +75,7 @@ mod varopt;
 /// - **CountSketch**: Unbiased estimation, L2 error bounds (Charikar 2002)
 /// - **ConservativeCountMin**: Up to 10x more accurate than standard CM (Estan 2002)
 /// - **SpaceSaving**: Heavy hitter detection, deterministic error bounds (Metwally 2005)
+/// - **SpaceSavingU64**: SpaceSaving specialized for integer keys
 /// - **FrequentItems**: Top-K heavy hitters with deterministic bounds
 ///
 /// ### Streaming
@@ -125,6 +128,7 @@ fn sketch_oxide(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Membership testing
     m.add_class::<binary_fuse::BinaryFuseFilter>()?;
     m.add_class::<bloom::BloomFilter>()?;
+    m.add_class::<bloom::BloomKey>()?;
     m.add_class::<blocked_bloom::BlockedBloomFilter>()?;
     m.add_class::<counting_bloom::CountingBloomFilter>()?;
     m.add_class::<cuckoo::CuckooFilter>()?;
@@ -132,6 +136,7 @@ fn sketch_oxide(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<stable_bloom::StableBloomFilter>()?;
     m.add_class::<vacuum_filter::VacuumFilter>()?;
     m.add_class::<learned_bloom::LearnedBloomFilter>()?;
+    m.add_class::<flat_bloofi::FlatBloofi>()?;
 
     // Quantile estimation
     m.add_class::<ddsketch::DDSketch>()?;
@@ -145,6 +150,7 @@ fn sketch_oxide(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<count_sketch::CountSketch>()?;
     m.add_class::<conservative_count_min::ConservativeCountMin>()?;
     m.add_class::<space_saving::SpaceSaving>()?;
+    m.add_class::<space_saving::SpaceSavingU64>()?;
     m.add_class::<elastic_sketch::ElasticSketch>()?;
     m.add_class::<salsa::SALSA>()?;
     m.add_class::<removable_sketch::RemovableUniversalSketch>()?;
@@ -1,6 +1,7 @@
 //! Python bindings for Memento Filter dynamic range filter
 
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyList};
 use sketch_oxide::range_filters::MementoFilter as RustMementoFilter;
 
 /// MementoFilter: Dynamic Range Filter with FPR Guarantees (2025)
@@ -84,6 +85,38 @@ impl MementoFilter {
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
+    /// Insert multiple key-value pairs with a single call (optimized for throughput)
+    ///
+    /// The GIL is released while the pairs are inserted. Pairs are inserted
+    /// in order; if capacity is exceeded, the pairs before the failing one
+    /// remain in the filter.
+    ///
+    /// Args:
+    ///     items: List of (key, value) tuples, with int keys and bytes values
+    ///
+    /// Raises:
+    ///     ValueError: If capacity is exceeded
+    ///
+    /// Example:
+    ///     >>> filter = MementoFilter(expected_elements=1000, fpr=0.01)
+    ///     >>> filter.insert_batch([(1, b"a"), (2, b"b"), (3, b"c")])
+    fn insert_batch(&mut self, items: &Bound<'_, PyList>) -> PyResult<()> {
+        let pairs: Vec<(u64, Bound<'_, PyBytes>)> = items.extract()?;
+        let pairs: Vec<(u64, &[u8])> = pairs
+            .iter()
+            .map(|(key, value)| (*key, value.as_bytes()))
+            .collect();
+        let inner = &mut self.inner;
+        items
+            .py()
+            .allow_threads(|| {
+                pairs
+                    .iter()
+                    .try_for_each(|&(key, value)| inner.insert(key, value))
+            })
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
     /// Check if a range might contain elements
     ///
     /// Args:
@@ -121,6 +154,14 @@ impl MementoFilter {
         self.inner.is_empty()
     }
 
+    /// Get the maximum number of elements the filter accepts
+    ///
+    /// Returns:
+    ///     int: Capacity given as expected_elements at construction
+    fn capacity(&self) -> usize {
+        self.inner.capacity()
+    }
+
     /// Get the current range bounds
     ///
     /// Returns:
@@ -1,9 +1,10 @@
 //! Python bindings for NitroSketch - High-Performance Network Telemetry
 
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
 use sketch_oxide::frequency::{CountMinSketch, NitroSketch as RustNitroSketch};
 
+use crate::common::{with_item_bytes, Column};
+
 /// NitroSketch: High-Performance Network Telemetry (SIGCOMM 2019)
 ///
 /// Wrapper sketch optimized for 100Gbps+ line rate through selective sampling.
@@ -87,7 +88,7 @@ impl NitroSketch {
     /// Only sampled items are stored, reducing CPU overhead.
     ///
     /// Args:
-    ///     item: Item to add (int, str, or bytes)
+    ///     item: Item to add (int, str, bytes, or bytearray)
     ///
     /// Example:
     ///     >>> nitro = NitroSketch(epsilon=0.01, delta=0.01, sample_rate=0.1)
@@ -95,19 +96,33 @@ impl NitroSketch {
     ///     >>> nitro.update(12345)
     ///     >>> nitro.update(b"binary_data")
     fn update(&mut self, item: &Bound<'_, PyAny>) -> PyResult<()> {
-        if let Ok(val) = item.extract::<i64>() {
-            self.inner.update_sampled(&val.to_le_bytes());
-        } else if let Ok(val) = item.extract::<u64>() {
-            self.inner.update_sampled(&val.to_le_bytes());
-        } else if let Ok(val) = item.extract::<String>() {
-            self.inner.update_sampled(val.as_bytes());
-        } else if let Ok(b) = item.downcast::<PyBytes>() {
-            self.inner.update_sampled(b.as_bytes());
-        } else {
-            return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Item must be int, str, or bytes",
-            ));
-        }
+        with_item_bytes(item, |key| self.inner.update_sampled(key))
+    }
+
+    /// Update with many integer keys in a single call
+    ///
+    /// uint64 NumPy arrays are read directly from their buffer; other
+    /// sequences of ints are copied once. Each key is sampled exactly as
+    /// update() samples the same int, with the GIL released.
+    ///
+    /// Args:
+    ///     flow_ids: NumPy uint64 array or sequence of non-negative ints
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> nitro = NitroSketch(epsilon=0.01, delta=0.01, sample_rate=0.1)
+    ///     >>> flow_ids = np.arange(10000, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    ///     >>> nitro.update_many(flow_ids)
+    ///     >>> nitro.stats()["total_items_estimated"]
+    ///     10000
+    fn update_many(&mut self, py: Python<'_>, flow_ids: &Bound<'_, PyAny>) -> PyResult<()> {
+        let flow_ids = Column::<u64>::extract(flow_ids)?;
+        let flow_ids = flow_ids.as_slice()?;
+        let inner = &mut self.inner;
+        py.allow_threads(|| {
+            let keys: Vec<[u8; 8]> = flow_ids.iter().map(|id| id.to_le_bytes()).collect();
+            inner.update_batch(&keys);
+        });
         Ok(())
     }
 
@@ -117,7 +132,7 @@ impl NitroSketch {
     /// Call sync() periodically for accurate results.
     ///
     /// Args:
-    ///     item: Item to query (int, str, or bytes)
+    ///     item: Item to query (int, str, bytes, or bytearray)
     ///
     /// Returns:
     ///     int: Estimated frequency (may be underestimated if not synced)
@@ -129,19 +144,7 @@ impl NitroSketch {
     ///     >>> nitro.sync(1.0)
     ///     >>> freq = nitro.query("key")
     fn query(&self, item: &Bound<'_, PyAny>) -> PyResult<u64> {
-        if let Ok(val) = item.extract::<i64>() {
-            Ok(self.inner.query(&val.to_le_bytes()))
-        } else if let Ok(val) = item.extract::<u64>() {
-            Ok(self.inner.query(&val.to_le_bytes()))
-        } else if let Ok(val) = item.extract::<String>() {
-            Ok(self.inner.query(val.as_bytes()))
-        } else if let Ok(b) = item.downcast::<PyBytes>() {
-            Ok(self.inner.query(b.as_bytes()))
-        } else {
-            Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Item must be int, str, or bytes",
-            ))
-        }
+        with_item_bytes(item, |key| self.inner.query(key))
     }
 
     /// Synchronize to adjust for unsampled items
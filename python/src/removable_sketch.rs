@@ -1,6 +1,8 @@
 //! Python bindings for RemovableUniversalSketch
 
+use numpy::PyReadonlyArray1;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use sketch_oxide::frequency::RemovableUniversalSketch as RustRemovableUniversalSketch;
 
 /// RemovableUniversalSketch for frequency estimation with deletions
@@ -35,7 +37,7 @@ use sketch_oxide::frequency::RemovableUniversalSketch as RustRemovableUniversalS
 /// Notes:
 ///     - Space: O(log(1/δ) * log(max_update_value)) + moment sketch overhead
 ///     - Time: O(depth) per operation
-///     - Supports negative frequencies for deletion tracking
+///     - Deletions are tracked in a separate counter table; over-deleted items estimate 0
 #[pyclass(module = "sketch_oxide")]
 pub struct RemovableUniversalSketch {
     inner: RustRemovableUniversalSketch,
@@ -82,18 +84,62 @@ impl RemovableUniversalSketch {
     ///     >>> freq = rus.estimate(b"page1")  # Get current estimate
     ///     >>> assert freq >= 70
     fn update(&mut self, item: &[u8], delta: i32) {
-        self.inner.update(&item.to_vec(), delta);
+        // `&[u8]` hashes identically to `Vec<u8>`, so no copy is needed
+        self.inner.update(&item, delta);
+    }
+
+    /// Apply many signed updates at once (NumPy support)
+    ///
+    /// Deltas are read straight from the array buffer, avoiding a Python
+    /// integer conversion per update.
+    ///
+    /// Args:
+    ///     items (list[bytes]): Items to update
+    ///     deltas (numpy.ndarray): int64 array of frequency changes, one per item
+    ///
+    /// Raises:
+    ///     ValueError: If lengths differ or a delta does not fit in 32 bits
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> rus = RemovableUniversalSketch(0.01, 0.01)
+    ///     >>> rus.update_batch([b"a", b"b", b"a"], np.array([100, 50, -30]))
+    ///     >>> assert rus.estimate(b"a") >= 70
+    fn update_batch(
+        &mut self,
+        items: Vec<Bound<'_, PyBytes>>,
+        deltas: PyReadonlyArray1<i64>,
+    ) -> PyResult<()> {
+        let deltas = deltas.as_slice()?;
+        if items.len() != deltas.len() {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "items and deltas must have the same length ({} vs {})",
+                items.len(),
+                deltas.len()
+            )));
+        }
+
+        for (item, &delta) in items.iter().zip(deltas) {
+            let delta = i32::try_from(delta).map_err(|_| {
+                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "delta {} does not fit in a 32-bit integer",
+                    delta
+                ))
+            })?;
+            self.inner.update(&item.as_bytes(), delta);
+        }
+        Ok(())
     }
 
     /// Estimate the frequency of an item
     ///
-    /// Can return negative values for items with more deletions than insertions.
+    /// Items with more deletions than insertions are clamped to 0.
     ///
     /// Args:
     ///     item (bytes): The item to query
     ///
     /// Returns:
-    ///     int: Estimated frequency (can be negative due to deletions)
+    ///     int: Estimated net frequency (insertions minus deletions, at least 0)
     ///
     /// Example:
     ///     >>> rus = RemovableUniversalSketch(0.01, 0.01)
@@ -102,7 +148,7 @@ impl RemovableUniversalSketch {
     ///     >>> freq = rus.estimate(b"item")
     ///     >>> assert freq >= 50
     fn estimate(&self, item: &[u8]) -> i64 {
-        self.inner.estimate(&item.to_vec())
+        self.inner.estimate(&item)
     }
 
     /// Compute the L2 norm of the frequency vector
@@ -60,6 +60,26 @@ impl ReservoirSampling {
         self.inner.update(item.to_string());
     }
 
+    /// Add many items to the reservoir in one call
+    ///
+    /// The items are sampled with the GIL released, which is much faster
+    /// than calling update() per item.
+    ///
+    /// Args:
+    ///     items: List of items to potentially sample
+    ///
+    /// Example:
+    ///     >>> reservoir = ReservoirSampling(k=10)
+    ///     >>> reservoir.update_batch([f"item_{i}" for i in range(1000)])
+    fn update_batch(&mut self, py: Python<'_>, items: Vec<String>) {
+        let inner = &mut self.inner;
+        py.allow_threads(|| {
+            for item in items {
+                inner.update(item);
+            }
+        });
+    }
+
     /// Get the current sample
     ///
     /// Returns:
@@ -5,9 +5,9 @@ use sketch_oxide::frequency::SALSA as RustSALSA;
 
 /// SALSA: Self-Adjusting Counter Sizing for frequency estimation
 ///
-/// Wraps CountMinSketch to provide adaptive counter management. When frequencies approach
-/// overflow, SALSA automatically adjusts parameters to maintain accuracy. This is essential
-/// for production systems handling skewed/heavy-tailed distributions.
+/// A Count-Min table whose counters start at 8 bits and are widened to 16, 32 and
+/// 64 bits only when a count would otherwise saturate. Light-tailed streams keep
+/// the table 8x smaller than a 64-bit Count-Min sketch with identical estimates.
 ///
 /// Args:
 ///     epsilon (float): Error bound (0 < ε < 1). Estimates within εN of true value.
@@ -32,7 +32,7 @@ use sketch_oxide::frequency::SALSA as RustSALSA;
 ///     - Compatible with CountMinSketch merging
 ///
 /// Notes:
-///     - Space: O((e/ε) * ln(1/δ)) initially, grows logarithmically with heavy hitters
+///     - Space: O((2/ε) * ln(1/δ)) bytes initially, doubling per counter widening
 ///     - Time: O(d) where d is the depth
 ///     - Best for heavy-tailed/Zipfian distributions
 #[allow(clippy::upper_case_acronyms)]
@@ -157,8 +157,8 @@ impl SALSA {
 
     /// Get the current adaptation level
     ///
-    /// Increments when the sketch detects that frequencies are approaching
-    /// overflow and adaptation is triggered.
+    /// Increments each time a counter would saturate and the counter table is
+    /// widened (0 = 8-bit, 1 = 16-bit, 2 = 32-bit, 3 = 64-bit counters).
     ///
     /// Returns:
     ///     int: Number of times the sketch has adapted
@@ -1,10 +1,13 @@
 //! Python bindings for Space-Saving heavy hitter detection sketch
 
+use numpy::PyReadonlyArray1;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyBytes, PyList, PyString};
 use sketch_oxide::frequency::SpaceSaving as RustSpaceSaving;
 use sketch_oxide::Sketch;
 
+use crate::common::Column;
+
 /// Space-Saving Sketch for heavy hitter detection (Metwally et al., 2005)
 ///
 /// A deterministic streaming algorithm for finding the most frequent items (heavy hitters)
@@ -88,6 +91,44 @@ impl SpaceSaving {
         Ok(())
     }
 
+    /// Update the sketch with one occurrence of each key in a single call
+    ///
+    /// Integer NumPy arrays (uint64 or int64) are read directly from their buffer
+    /// and processed with the GIL released. Any other list of keys (int, str, or
+    /// bytes) is handled item by item. Keys are stored exactly as update() stores them.
+    ///
+    /// Args:
+    ///     keys: NumPy integer array or list of items
+    ///
+    /// Example:
+    ///     >>> ss = SpaceSaving(epsilon=0.1)
+    ///     >>> ss.update_many(["apple"] * 3 + ["banana"])
+    fn update_many(&mut self, py: Python<'_>, keys: &Bound<'_, PyAny>) -> PyResult<()> {
+        let inner = &mut self.inner;
+        if let Ok(keys) = keys.extract::<PyReadonlyArray1<u64>>() {
+            let keys = keys.as_slice()?;
+            py.allow_threads(|| {
+                keys.iter()
+                    .for_each(|key| inner.update(key.to_le_bytes().to_vec()))
+            });
+            return Ok(());
+        }
+        if let Ok(keys) = keys.extract::<PyReadonlyArray1<i64>>() {
+            let keys = keys.as_slice()?;
+            py.allow_threads(|| {
+                keys.iter()
+                    .for_each(|key| inner.update(key.to_le_bytes().to_vec()))
+            });
+            return Ok(());
+        }
+
+        let keys: &Bound<'_, PyList> = keys.downcast()?;
+        for key in keys {
+            self.update(&key)?;
+        }
+        Ok(())
+    }
+
     /// Estimate the frequency bounds of an item
     ///
     /// Args:
@@ -188,9 +229,9 @@ impl SpaceSaving {
     ///     >>> ss1.update("item")
     ///     >>> ss2.update("item")
     ///     >>> ss1.merge(ss2)
-    fn merge(&mut self, other: &SpaceSaving) -> PyResult<()> {
-        self.inner
-            .merge(&other.inner)
+    fn merge(&mut self, py: Python<'_>, other: &SpaceSaving) -> PyResult<()> {
+        let (inner, other) = (&mut self.inner, &other.inner);
+        py.allow_threads(|| inner.merge(other))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
@@ -214,16 +255,8 @@ impl SpaceSaving {
     /// Raises:
     ///     ValueError: If data is invalid
     #[staticmethod]
-    fn deserialize(data: &Bound<'_, PyAny>) -> PyResult<SpaceSaving> {
-        let bytes = if let Ok(b) = data.downcast::<PyBytes>() {
-            b.as_bytes().to_vec()
-        } else {
-            return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "data must be bytes",
-            ));
-        };
-
-        RustSpaceSaving::deserialize(&bytes)
+    fn deserialize(data: &[u8]) -> PyResult<SpaceSaving> {
+        RustSpaceSaving::deserialize(data)
             .map(|inner| SpaceSaving { inner })
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
@@ -302,14 +335,15 @@ impl SpaceSaving {
 impl SpaceSaving {
     /// Helper to convert Python items to bytes
     fn py_item_to_bytes(&self, item: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
-        if let Ok(val) = item.extract::<i64>() {
+        // Check str/bytes before int: a failed int extraction raises internally
+        if let Ok(s) = item.downcast::<PyString>() {
+            Ok(s.to_cow()?.into_owned().into_bytes())
+        } else if let Ok(b) = item.downcast::<PyBytes>() {
+            Ok(b.as_bytes().to_vec())
+        } else if let Ok(val) = item.extract::<i64>() {
             Ok(val.to_le_bytes().to_vec())
         } else if let Ok(val) = item.extract::<u64>() {
             Ok(val.to_le_bytes().to_vec())
-        } else if let Ok(val) = item.extract::<String>() {
-            Ok(val.into_bytes())
-        } else if let Ok(b) = item.downcast::<PyBytes>() {
-            Ok(b.as_bytes().to_vec())
         } else {
             Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                 "Item must be int, str, or bytes",
@@ -317,3 +351,196 @@ impl SpaceSaving {
         }
     }
 }
+
+/// Space-Saving Sketch specialized for unsigned 64-bit integer keys
+///
+/// Same algorithm and error bounds as ``SpaceSaving``, but keys are stored
+/// as native ``u64`` values instead of byte strings. Nothing is converted or
+/// allocated per item, and ``heavy_hitters``/``top_k`` return the keys as ints.
+/// Use it for streams of numeric IDs (user IDs, flow hashes, row keys).
+///
+/// Args:
+///     epsilon (float): Error threshold (0 < ε < 1). Items with frequency > ε*N
+///         are guaranteed to be tracked.
+///
+/// Example:
+///     >>> ss = SpaceSavingU64(epsilon=0.01)
+///     >>> ss.update_many([7] * 100 + list(range(1000, 2000)))
+///     >>> ss.top_k(1)[0][0]
+///     7
+#[pyclass(module = "sketch_oxide")]
+pub struct SpaceSavingU64 {
+    inner: RustSpaceSaving<u64>,
+}
+
+#[pymethods]
+impl SpaceSavingU64 {
+    /// Create a new Space-Saving sketch with error bound epsilon
+    ///
+    /// Args:
+    ///     epsilon: Error threshold (0 < ε < 1)
+    ///
+    /// Raises:
+    ///     ValueError: If epsilon is not in valid range
+    #[new]
+    fn new(epsilon: f64) -> PyResult<Self> {
+        RustSpaceSaving::new(epsilon)
+            .map(|inner| Self { inner })
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Create a new Space-Saving sketch with explicit capacity
+    ///
+    /// Args:
+    ///     capacity: Maximum number of keys to track (must be >= 2)
+    ///
+    /// Raises:
+    ///     ValueError: If capacity is less than 2
+    #[staticmethod]
+    fn with_capacity(capacity: usize) -> PyResult<SpaceSavingU64> {
+        RustSpaceSaving::with_capacity(capacity)
+            .map(|inner| SpaceSavingU64 { inner })
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Update the sketch with a single occurrence of a key
+    ///
+    /// Args:
+    ///     key: Non-negative integer below 2**64
+    fn update(&mut self, key: u64) {
+        self.inner.update(key);
+    }
+
+    /// Update the sketch with one occurrence of each key in a single call
+    ///
+    /// uint64 NumPy arrays are read directly from their buffer; other
+    /// sequences of ints are copied once. The keys are processed with the
+    /// GIL released.
+    ///
+    /// Args:
+    ///     keys: NumPy uint64 array or sequence of ints
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> ss = SpaceSavingU64(epsilon=0.01)
+    ///     >>> ss.update_many(np.arange(1000, dtype=np.uint64))
+    fn update_many(&mut self, py: Python<'_>, keys: &Bound<'_, PyAny>) -> PyResult<()> {
+        let keys = Column::<u64>::extract(keys)?;
+        let keys = keys.as_slice()?;
+
+        let inner = &mut self.inner;
+        py.allow_threads(|| keys.iter().for_each(|&key| inner.update(key)));
+        Ok(())
+    }
+
+    /// Estimate the frequency bounds of a key
+    ///
+    /// Returns:
+    ///     tuple: (lower_bound, upper_bound) if the key is tracked, None otherwise
+    fn estimate(&self, key: u64) -> Option<(u64, u64)> {
+        self.inner.estimate(&key)
+    }
+
+    /// Get all keys that may be heavy hitters above a frequency threshold
+    ///
+    /// Args:
+    ///     threshold: Frequency threshold in (0, 1)
+    ///
+    /// Returns:
+    ///     list: List of (key, lower_bound, upper_bound) tuples, sorted by
+    ///     estimated count descending
+    fn heavy_hitters(&self, threshold: f64) -> Vec<(u64, u64, u64)> {
+        self.inner.heavy_hitters(threshold)
+    }
+
+    /// Get the top-k most frequent keys
+    ///
+    /// Args:
+    ///     k: Number of keys to return
+    ///
+    /// Returns:
+    ///     list: List of at most k (key, lower_bound, upper_bound) tuples
+    ///     sorted by estimated count (upper_bound) descending
+    fn top_k(&self, k: usize) -> Vec<(u64, u64, u64)> {
+        self.inner.top_k(k)
+    }
+
+    /// Merge another SpaceSavingU64 sketch into this one
+    ///
+    /// Args:
+    ///     other: Another SpaceSavingU64 with same epsilon/capacity
+    ///
+    /// Raises:
+    ///     ValueError: If sketches have incompatible dimensions
+    fn merge(&mut self, py: Python<'_>, other: &SpaceSavingU64) -> PyResult<()> {
+        let (inner, other) = (&mut self.inner, &other.inner);
+        py.allow_threads(|| inner.merge(other))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Serialize the sketch to bytes
+    ///
+    /// Returns:
+    ///     bytes: Serialized sketch data
+    fn serialize<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new_bound(py, &self.inner.serialize())
+    }
+
+    /// Deserialize a sketch from bytes
+    ///
+    /// Args:
+    ///     data: Serialized sketch data (from empty sketch only)
+    ///
+    /// Raises:
+    ///     ValueError: If data is invalid
+    #[staticmethod]
+    fn deserialize(data: &[u8]) -> PyResult<SpaceSavingU64> {
+        RustSpaceSaving::deserialize(data)
+            .map(|inner| SpaceSavingU64 { inner })
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Check if the sketch is empty
+    fn is_empty(&self) -> bool {
+        self.inner.is_empty()
+    }
+
+    /// Get the capacity (maximum number of keys tracked)
+    fn capacity(&self) -> usize {
+        self.inner.capacity()
+    }
+
+    /// Get the epsilon parameter
+    fn epsilon(&self) -> f64 {
+        self.inner.epsilon()
+    }
+
+    /// Get the total number of keys seen in the stream
+    fn stream_length(&self) -> u64 {
+        self.inner.stream_length()
+    }
+
+    /// Get the number of keys currently tracked
+    fn num_items(&self) -> usize {
+        self.inner.num_items()
+    }
+
+    /// Get the maximum possible error for any key
+    fn max_error(&self) -> u64 {
+        self.inner.max_error()
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "SpaceSavingU64(capacity={}, tracking={}, stream_length={}, epsilon={})",
+            self.inner.capacity(),
+            self.inner.num_items(),
+            self.inner.stream_length(),
+            self.inner.epsilon()
+        )
+    }
+
+    fn __len__(&self) -> usize {
+        self.inner.num_items()
+    }
+}
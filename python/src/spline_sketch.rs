@@ -1,10 +1,13 @@
 //! Python bindings for SplineSketch quantile estimation
 
+use numpy::PyArray1;
 use pyo3::prelude::*;
 use pyo3::types::PyBytes;
 use sketch_oxide::quantiles::SplineSketch as RustSplineSketch;
 use sketch_oxide::{Mergeable, Sketch};
 
+use crate::common::{check_same_length, Column};
+
 /// SplineSketch for high-accuracy quantile estimation with monotone cubic spline interpolation
 ///
 /// SplineSketch provides 2-20x better accuracy than T-Digest on non-skewed data using
@@ -67,6 +70,93 @@ impl SplineSketch {
         self.inner.update(value, weight);
     }
 
+    /// Update the sketch with many values in a single call
+    ///
+    /// A uint64 NumPy array (and a float64 array of weights) is read directly from
+    /// its buffer; lists of ints and floats are copied once. The values are then
+    /// added with the GIL released.
+    ///
+    /// Args:
+    ///     values: uint64 NumPy array or list of ints
+    ///     weights: Optional float64 array or list of weights, one per value (default: 1.0 each)
+    ///
+    /// Raises:
+    ///     ValueError: If weights and values differ in length
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> spline = SplineSketch(200)
+    ///     >>> spline.update_many(np.arange(10000, dtype=np.uint64))
+    ///     >>> spline.update_many([100, 200], [1.0, 2.0])
+    #[pyo3(signature = (values, weights=None))]
+    fn update_many(
+        &mut self,
+        py: Python<'_>,
+        values: &Bound<'_, PyAny>,
+        weights: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<()> {
+        let values = Column::<u64>::extract(values)?;
+        let values = values.as_slice()?;
+        let weights = weights.map(Column::<f64>::extract).transpose()?;
+        let weights = weights.as_ref().map(Column::as_slice).transpose()?;
+        check_same_length(values.len(), "weights", weights)?;
+
+        let inner = &mut self.inner;
+        py.allow_threads(|| match weights {
+            Some(weights) => values
+                .iter()
+                .zip(weights)
+                .for_each(|(&value, &weight)| inner.update(value, weight)),
+            None => values.iter().for_each(|&value| inner.update(value, 1.0)),
+        });
+        Ok(())
+    }
+
+    /// Update the sketch with a large batch of values using all cores
+    ///
+    /// The values are split across threads with the GIL released. Each thread
+    /// builds its own sketch and the partial sketches are then merged. The
+    /// retained samples can differ slightly from ``update_many``, with the same
+    /// accuracy. Batches of fewer than 65536 values are applied serially.
+    ///
+    /// Args:
+    ///     values: Values to insert (NumPy uint64 array or iterable of ints),
+    ///         each with weight 1.0
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> spline = SplineSketch(200)
+    ///     >>> spline.par_update_many(np.arange(1_000_000, dtype=np.uint64))
+    ///     >>> assert spline.total_weight() == 1_000_000.0
+    fn par_update_many(&mut self, py: Python<'_>, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        let values = Column::<u64>::extract(values)?;
+        let values = values.as_slice()?;
+
+        let inner = &mut self.inner;
+        py.allow_threads(|| inner.update_batch_parallel(values));
+        Ok(())
+    }
+
+    /// Update the sketch with every integer in ``range(start, stop)``
+    ///
+    /// The values are generated in Rust with the GIL released, so no Python int
+    /// is created per value.
+    ///
+    /// Args:
+    ///     start: First value (inclusive)
+    ///     stop: End of the range (exclusive)
+    ///     weight: Weight applied to each value (default: 1.0)
+    ///
+    /// Example:
+    ///     >>> spline = SplineSketch(200)
+    ///     >>> spline.update_from_range(0, 10000)
+    ///     >>> assert spline.total_weight() == 10000.0
+    #[pyo3(signature = (start, stop, weight=1.0))]
+    fn update_from_range(&mut self, py: Python<'_>, start: u64, stop: u64, weight: f64) {
+        let inner = &mut self.inner;
+        py.allow_threads(|| (start..stop).for_each(|value| inner.update(value, weight)));
+    }
+
     /// Estimate a quantile value
     ///
     /// Args:
@@ -96,6 +186,41 @@ impl SplineSketch {
         Ok(self.inner.query(quantile))
     }
 
+    /// Estimate several quantiles in a single call
+    ///
+    /// Args:
+    ///     quantiles: float64 NumPy array or list of quantiles (0.0 to 1.0)
+    ///
+    /// Returns:
+    ///     numpy.ndarray or list: Estimated values in the same order, as a uint64
+    ///     array when given an array and as a list of ints otherwise
+    ///
+    /// Raises:
+    ///     RuntimeError: If sketch is empty
+    ///
+    /// Example:
+    ///     >>> spline = SplineSketch(200)
+    ///     >>> spline.update_many(list(range(1, 1001)))
+    ///     >>> p50, p95, p99 = spline.query_many([0.5, 0.95, 0.99])
+    fn query_many(&self, py: Python<'_>, quantiles: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        if self.inner.is_empty() {
+            return Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                "Cannot query empty sketch",
+            ));
+        }
+        let quantiles = Column::<f64>::extract(quantiles)?;
+        let results: Vec<u64> = quantiles
+            .as_slice()?
+            .iter()
+            .map(|&q| self.inner.query(q))
+            .collect();
+
+        Ok(match quantiles {
+            Column::Array(_) => PyArray1::from_vec_bound(py, results).into_any().unbind(),
+            Column::Owned(_) => results.into_py(py),
+        })
+    }
+
     /// Merge another SplineSketch into this one
     ///
     /// Args:
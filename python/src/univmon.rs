@@ -1,9 +1,10 @@
 //! Python bindings for UnivMon - Universal Monitoring for Multiple Metrics
 
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
 use sketch_oxide::universal::UnivMon as RustUnivMon;
 
+use crate::common::{check_same_length, with_item_bytes, Column};
+
 /// UnivMon: Universal Monitoring for Multiple Metrics (SIGCOMM 2016)
 ///
 /// Revolutionary sketch that supports **6 simultaneous metrics** from a single
@@ -93,7 +94,7 @@ impl UnivMon {
     /// Uses hierarchical sampling across layers for efficient multi-metric estimation.
     ///
     /// Args:
-    ///     item: Item to update (str, bytes, or int)
+    ///     item: Item to update (str, bytes, bytearray, or int)
     ///     value: Value/weight for this item (e.g., packet size, count, amount)
     ///
     /// Raises:
@@ -105,27 +106,109 @@ impl UnivMon {
     ///     >>> um.update("user_123", 99.99)       # User and transaction
     ///     >>> um.update(12345, 1.0)              # Item ID and count
     fn update(&mut self, item: &Bound<'_, PyAny>, value: f64) -> PyResult<()> {
-        if let Ok(val) = item.extract::<i64>() {
-            self.inner
-                .update(&val.to_le_bytes(), value)
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(val) = item.extract::<u64>() {
-            self.inner
-                .update(&val.to_le_bytes(), value)
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(val) = item.extract::<String>() {
-            self.inner
-                .update(val.as_bytes(), value)
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(b) = item.downcast::<PyBytes>() {
-            self.inner
-                .update(b.as_bytes(), value)
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else {
-            Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Item must be int, str, or bytes",
-            ))
-        }
+        with_item_bytes(item, |key| self.inner.update(key, value))?
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Update the sketch with an IPv4 address given as an integer
+    ///
+    /// The address is stored as its 4 bytes in network order, so
+    /// update_ipv4(0xC0A80001, v) counts toward the same item as
+    /// update(bytes([192, 168, 0, 1]), v), without building a string.
+    ///
+    /// Args:
+    ///     ip: IPv4 address as an int in [0, 2**32)
+    ///     value: Value/weight for this address (e.g., packet size)
+    ///
+    /// Raises:
+    ///     ValueError: If value is negative
+    ///     OverflowError: If ip does not fit in 32 bits
+    ///
+    /// Example:
+    ///     >>> import ipaddress
+    ///     >>> um = UnivMon(1_000_000, 0.01, 0.01)
+    ///     >>> um.update_ipv4(int(ipaddress.IPv4Address("192.168.1.1")), 1500.0)
+    fn update_ipv4(&mut self, ip: u32, value: f64) -> PyResult<()> {
+        self.inner
+            .update(&ip.to_be_bytes(), value)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Update the sketch with many IPv4 addresses and their values
+    ///
+    /// Batch form of update_ipv4(). uint32/float64 NumPy arrays are read
+    /// directly from their buffers, and the sketch is updated with the GIL
+    /// released.
+    ///
+    /// Args:
+    ///     ips: NumPy uint32 array or sequence of IPv4 addresses as ints
+    ///     values: NumPy float64 array or sequence of values, one per address
+    ///
+    /// Raises:
+    ///     ValueError: If the lengths differ or any value is negative
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> um = UnivMon(1_000_000, 0.01, 0.01)
+    ///     >>> ips = np.uint32(0xC0A80000) + np.arange(1000, dtype=np.uint32)
+    ///     >>> um.update_ipv4_many(ips, np.full(1000, 800.0))
+    fn update_ipv4_many(
+        &mut self,
+        py: Python<'_>,
+        ips: &Bound<'_, PyAny>,
+        values: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
+        let ips = Column::<u32>::extract(ips)?;
+        let values = Column::<f64>::extract(values)?;
+        let (ips, values) = (ips.as_slice()?, values.as_slice()?);
+        check_same_length(ips.len(), "values", Some(values))?;
+
+        let inner = &mut self.inner;
+        py.allow_threads(|| {
+            let keys: Vec<[u8; 4]> = ips.iter().map(|ip| ip.to_be_bytes()).collect();
+            inner.update_batch(&keys, values)
+        })
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Update the sketch with many integer items and their values
+    ///
+    /// Takes two parallel columns. uint64/float64 NumPy arrays are read
+    /// directly from their buffers; other sequences are copied once. Each
+    /// item is hashed once and every layer applies its sampled items in turn,
+    /// with the GIL released. Items are encoded exactly as update() encodes
+    /// the same int.
+    ///
+    /// Args:
+    ///     items: NumPy uint64 array or sequence of non-negative ints
+    ///     values: NumPy float64 array or sequence of values, one per item
+    ///
+    /// Raises:
+    ///     ValueError: If the lengths differ or any value is negative
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> um = UnivMon(1_000_000, 0.01, 0.01)
+    ///     >>> flows = np.arange(1000, dtype=np.uint64)
+    ///     >>> sizes = np.full(1000, 1500.0)
+    ///     >>> um.update_batch(flows, sizes)
+    fn update_batch(
+        &mut self,
+        py: Python<'_>,
+        items: &Bound<'_, PyAny>,
+        values: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
+        let items = Column::<u64>::extract(items)?;
+        let values = Column::<f64>::extract(values)?;
+        let (items, values) = (items.as_slice()?, values.as_slice()?);
+        check_same_length(items.len(), "values", Some(values))?;
+
+        let inner = &mut self.inner;
+        py.allow_threads(|| {
+            let keys: Vec<[u8; 8]> = items.iter().map(|item| item.to_le_bytes()).collect();
+            inner.update_batch(&keys, values)
+        })
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
     /// Estimate the L1 norm (sum of all frequencies)
@@ -192,6 +275,23 @@ impl UnivMon {
         self.inner.estimate_entropy()
     }
 
+    /// Estimate L1, L2 and entropy in one call
+    ///
+    /// Same results as calling estimate_l1(), estimate_l2() and
+    /// estimate_entropy() in turn, with the shared work done once.
+    ///
+    /// Returns:
+    ///     tuple[float, float, float]: (l1, l2, entropy)
+    ///
+    /// Example:
+    ///     >>> um = UnivMon(10000, 0.01, 0.01)
+    ///     >>> um.update(b"A", 100.0)
+    ///     >>> um.update(b"B", 100.0)
+    ///     >>> l1, l2, entropy = um.estimate_all()
+    fn estimate_all(&self) -> (f64, f64, f64) {
+        self.inner.estimate_all()
+    }
+
     /// Find heavy hitters (most frequent items)
     ///
     /// Returns items with frequency ≥ threshold * L1.
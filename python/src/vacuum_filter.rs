@@ -1,9 +1,12 @@
 //! Python bindings for Vacuum Filter - Best-in-class dynamic membership filter
 
+use numpy::{PyArray1, PyReadonlyArray1};
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::PyList;
 use sketch_oxide::membership::VacuumFilter as RustVacuumFilter;
 
+use crate::common::{with_item_bytes, Column};
+
 /// VacuumFilter: Best-in-class dynamic membership filter (VLDB 2020)
 ///
 /// Space-efficient filter supporting insertions, deletions, and queries with
@@ -70,7 +73,7 @@ impl VacuumFilter {
     /// Insert an element into the filter
     ///
     /// Args:
-    ///     item: Item to insert (int, str, or bytes)
+    ///     item: Item to insert (int, str, bytes, or bytearray)
     ///
     /// Raises:
     ///     ValueError: If filter is at capacity and cannot rehash
@@ -81,33 +84,103 @@ impl VacuumFilter {
     ///     >>> vf.insert("world")
     ///     >>> vf.insert(42)
     fn insert(&mut self, item: &Bound<'_, PyAny>) -> PyResult<()> {
-        if let Ok(val) = item.extract::<i64>() {
-            self.inner
-                .insert(&val.to_le_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(val) = item.extract::<u64>() {
-            self.inner
-                .insert(&val.to_le_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(val) = item.extract::<String>() {
-            self.inner
-                .insert(val.as_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(b) = item.downcast::<PyBytes>() {
-            self.inner
-                .insert(b.as_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+        with_item_bytes(item, |key| self.inner.insert(key))?
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Insert a non-negative integer key
+    ///
+    /// Fast path for integer keys: skips the Python type dispatch of
+    /// insert(). The key is stored exactly as insert() stores the same int.
+    ///
+    /// Args:
+    ///     key: Integer in [0, 2**64)
+    ///
+    /// Raises:
+    ///     ValueError: If filter is at capacity and cannot rehash
+    ///     OverflowError: If key is negative or too large
+    ///
+    /// Example:
+    ///     >>> vf = VacuumFilter(capacity=100, fpr=0.01)
+    ///     >>> vf.insert_u64(42)
+    ///     >>> assert vf.contains(42)
+    fn insert_u64(&mut self, key: u64) -> PyResult<()> {
+        self.inner
+            .insert(&key.to_le_bytes())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Insert every item in a single call
+    ///
+    /// Integer NumPy arrays (uint64 or int64) are read directly from their
+    /// buffer. Other lists (int, str, or bytes) are converted once. Items are
+    /// stored exactly as insert() stores them, and are hashed and placed with
+    /// the GIL released.
+    ///
+    /// Args:
+    ///     items: NumPy integer array or list of items
+    ///
+    /// Raises:
+    ///     ValueError: If the filter cannot take an item (earlier items stay inserted)
+    ///
+    /// Example:
+    ///     >>> vf = VacuumFilter(capacity=1000, fpr=0.01)
+    ///     >>> vf.insert_many([f"key_{i}" for i in range(500)])
+    ///     >>> assert len(vf) == 500
+    fn insert_many(&mut self, py: Python<'_>, items: &Bound<'_, PyAny>) -> PyResult<()> {
+        let inner = &mut self.inner;
+        let result = if let Ok(items) = items.extract::<PyReadonlyArray1<u64>>() {
+            let keys: Vec<[u8; 8]> = items.as_slice()?.iter().map(|v| v.to_le_bytes()).collect();
+            py.allow_threads(|| inner.insert_batch(&keys))
+        } else if let Ok(items) = items.extract::<PyReadonlyArray1<i64>>() {
+            let keys: Vec<[u8; 8]> = items.as_slice()?.iter().map(|v| v.to_le_bytes()).collect();
+            py.allow_threads(|| inner.insert_batch(&keys))
         } else {
-            Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Item must be int, str, or bytes",
-            ))
-        }
+            let items: &Bound<'_, PyList> = items.downcast()?;
+            let keys = items
+                .iter()
+                .map(|item| with_item_bytes(&item, <[u8]>::to_vec))
+                .collect::<PyResult<Vec<_>>>()?;
+            py.allow_threads(|| inner.insert_batch(&keys))
+        };
+
+        result.map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    /// Insert many non-negative integer keys, hashing them on all cores
+    ///
+    /// Keys are hashed by one thread per core with the GIL released, then
+    /// placed in order, so the filter ends up exactly as after insert_many()
+    /// with the same ints. Batches of fewer than 65536 keys are inserted on
+    /// one thread.
+    ///
+    /// Args:
+    ///     keys: NumPy uint64 array or sequence of non-negative ints
+    ///
+    /// Raises:
+    ///     ValueError: If the filter cannot take a key (earlier keys stay inserted)
+    ///
+    /// Example:
+    ///     >>> import numpy as np
+    ///     >>> vf = VacuumFilter(capacity=1_000_000, fpr=0.01)
+    ///     >>> vf.par_insert_many(np.arange(500_000, dtype=np.uint64))
+    ///     >>> assert len(vf) == 500_000
+    fn par_insert_many(&mut self, py: Python<'_>, keys: &Bound<'_, PyAny>) -> PyResult<()> {
+        let keys = Column::<u64>::extract(keys)?;
+        let keys = keys.as_slice()?;
+
+        let inner = &mut self.inner;
+        py.allow_threads(|| {
+            let keys: Vec<[u8; 8]> = keys.iter().map(|key| key.to_le_bytes()).collect();
+            inner.insert_batch_parallel(&keys)
+        })
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
     /// Check if an element might be in the filter
     ///
     /// Args:
-    ///     item: Item to check (int, str, or bytes)
+    ///     item: Item to check (int, str, bytes, or bytearray)
     ///
     /// Returns:
     ///     bool: True if might be present (with FPR probability of false positive),
@@ -119,25 +192,66 @@ impl VacuumFilter {
     ///     >>> assert vf.contains(b"hello")  # True positive
     ///     >>> assert not vf.contains(b"world")  # True negative (likely)
     fn contains(&self, item: &Bound<'_, PyAny>) -> PyResult<bool> {
-        if let Ok(val) = item.extract::<i64>() {
-            Ok(self.inner.contains(&val.to_le_bytes()))
-        } else if let Ok(val) = item.extract::<u64>() {
-            Ok(self.inner.contains(&val.to_le_bytes()))
-        } else if let Ok(val) = item.extract::<String>() {
-            Ok(self.inner.contains(val.as_bytes()))
-        } else if let Ok(b) = item.downcast::<PyBytes>() {
-            Ok(self.inner.contains(b.as_bytes()))
+        with_item_bytes(item, |key| self.inner.contains(key))
+    }
+
+    /// Check many elements in a single call
+    ///
+    /// Hashes the keys in groups with the GIL released. Accepts the same
+    /// inputs as insert_many().
+    ///
+    /// Args:
+    ///     items: List of items (int, str, or bytes), or a NumPy array of
+    ///         uint64/int64 keys
+    ///
+    /// Returns:
+    ///     numpy.ndarray: Boolean array, True where the item might be present
+    ///
+    /// Example:
+    ///     >>> vf = VacuumFilter(capacity=1000, fpr=0.01)
+    ///     >>> vf.insert_many([f"key_{i}" for i in range(500)])
+    ///     >>> assert vf.contains_many([f"key_{i}" for i in range(500)]).all()
+    fn contains_many<'py>(
+        &self,
+        py: Python<'py>,
+        items: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyArray1<bool>>> {
+        let inner = &self.inner;
+        let results = if let Ok(items) = items.extract::<PyReadonlyArray1<u64>>() {
+            let keys: Vec<[u8; 8]> = items.as_slice()?.iter().map(|v| v.to_le_bytes()).collect();
+            py.allow_threads(|| inner.contains_batch(&keys))
+        } else if let Ok(items) = items.extract::<PyReadonlyArray1<i64>>() {
+            let keys: Vec<[u8; 8]> = items.as_slice()?.iter().map(|v| v.to_le_bytes()).collect();
+            py.allow_threads(|| inner.contains_batch(&keys))
         } else {
-            Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Item must be int, str, or bytes",
-            ))
-        }
+            let items: &Bound<'_, PyList> = items.downcast()?;
+            let keys = items
+                .iter()
+                .map(|item| with_item_bytes(&item, <[u8]>::to_vec))
+                .collect::<PyResult<Vec<_>>>()?;
+            py.allow_threads(|| inner.contains_batch(&keys))
+        };
+
+        Ok(PyArray1::from_vec_bound(py, results))
+    }
+
+    /// Check if a non-negative integer key might be in the filter
+    ///
+    /// Fast path for integer keys, matching contains() for the same int.
+    ///
+    /// Args:
+    ///     key: Integer in [0, 2**64)
+    ///
+    /// Returns:
+    ///     bool: True if might be present, False if definitely not present
+    fn contains_u64(&self, key: u64) -> bool {
+        self.inner.contains(&key.to_le_bytes())
     }
 
     /// Delete an element from the filter
     ///
     /// Args:
-    ///     item: Item to delete (int, str, or bytes)
+    ///     item: Item to delete (int, str, bytes, or bytearray)
     ///
     /// Returns:
     ///     bool: True if found and removed, False if not present
@@ -149,27 +263,8 @@ impl VacuumFilter {
     ///     >>> assert not vf.contains(b"hello")
     ///     >>> assert not vf.delete(b"hello")  # Already deleted
     fn delete(&mut self, item: &Bound<'_, PyAny>) -> PyResult<bool> {
-        if let Ok(val) = item.extract::<i64>() {
-            self.inner
-                .delete(&val.to_le_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(val) = item.extract::<u64>() {
-            self.inner
-                .delete(&val.to_le_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(val) = item.extract::<String>() {
-            self.inner
-                .delete(val.as_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else if let Ok(b) = item.downcast::<PyBytes>() {
-            self.inner
-                .delete(b.as_bytes())
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
-        } else {
-            Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Item must be int, str, or bytes",
-            ))
-        }
+        with_item_bytes(item, |key| self.inner.delete(key))?
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
     /// Get the current load factor (0.0 to 1.0)
@@ -190,6 +190,30 @@ class TestRemovableSketchTurnstile:
 
         assert freq_before == freq_after
 
+    def test_update_batch_matches_single_updates(self):
+        """Test that batch updates from a NumPy array match per-item updates."""
+        np = pytest.importorskip("numpy")
+        items = [b"a", b"b", b"a", b"c", b"b"]
+        deltas = [100, 50, -30, 25, -50]
+
+        single = RemovableUniversalSketch(0.01, 0.01)
+        for item, delta in zip(items, deltas):
+            single.update(item, delta)
+
+        batch = RemovableUniversalSketch(0.01, 0.01)
+        batch.update_batch(items, np.array(deltas, dtype=np.int64))
+
+        for item in (b"a", b"b", b"c"):
+            assert batch.estimate(item) == single.estimate(item)
+        assert batch.l2_norm() == single.l2_norm()
+
+    def test_update_batch_length_mismatch(self):
+        """Test that mismatched batch lengths are rejected."""
+        np = pytest.importorskip("numpy")
+        rus = RemovableUniversalSketch(0.01, 0.01)
+        with pytest.raises(ValueError):
+            rus.update_batch([b"a", b"b"], np.array([1], dtype=np.int64))
+
 
 class TestRemovableSketchL2Norm:
     """Test L2 norm (frequency moment) computation."""
@@ -0,0 +1,19 @@
+"""Shared pytest configuration for the sketch_oxide test suite."""
+
+import pytest
+
+
+def pytest_configure(config):
+    # Registered here so the marker is known even when pytest-xdist is absent
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on one xdist worker"
+    )
+    config.addinivalue_line("markers", "slow: larger workloads, deselect with '-m \"not slow\"'")
+
+
+def pytest_collection_modifyitems(items):
+    """Group tests by class so `pytest -n auto --dist loadgroup` gives each
+    sketch its own worker while module-scoped fixtures are built once per worker."""
+    for item in items:
+        if item.cls is not None:
+            item.add_marker(pytest.mark.xdist_group(item.cls.__name__))
@@ -1,5 +1,7 @@
 """Core tests for BloomFilter sketch."""
 
+import pytest
+
 import sketch_oxide
 
 
@@ -19,11 +21,15 @@ def test_bloom_filter_insert_and_contains():
 def test_bloom_filter_no_false_negatives():
     """Test no false negatives - all inserted items must be found."""
     bf = sketch_oxide.BloomFilter(10000, 0.01)
-    items = [b"apple", b"banana", b"cherry"]
+    raw = [b"apple", b"banana", b"cherry"]
+    items = [sketch_oxide.BloomKey(b) for b in raw]
     for item in items:
         bf.insert(item)
     for item in items:
         assert bf.contains(item)
+    # Pre-hashed keys probe the same bits as raw bytes
+    for item in raw:
+        assert bf.contains(item)
 
 
 def test_bloom_filter_multiple_inserts():
@@ -78,10 +84,43 @@ def test_bloom_filter_memory_usage():
 
 
 def test_bloom_filter_batch_operations():
-    """Test batch insert."""
+    """Test batch insert and batch contains."""
     bf = sketch_oxide.BloomFilter(10000, 0.01)
     items = [b"item1", b"item2", b"item3"]
-    for item in items:
-        bf.insert(item)
-    for item in items:
-        assert bf.contains(item)
+    bf.insert_batch(items)
+    assert bf.contains_batch(items) == [True, True, True]
+    assert all(bf.contains(item) for item in items)
+
+
+def test_flat_bloofi_matching_filters():
+    """Test FlatBloofi reports every filter that holds a key."""
+    filters = sketch_oxide.FlatBloofi(8, 1000, 0.01)
+    for i in range(800):
+        filters.insert(i % 8, f"item-{i}".encode())
+    for i in range(800):
+        key = f"item-{i}".encode()
+        assert i % 8 in filters.matching_filters(key)
+        assert filters.contains(i % 8, key)
+        assert filters.contains_mask(key) >> (i % 8) & 1
+
+
+def test_flat_bloofi_matches_bloom_filter():
+    """Test each FlatBloofi filter answers like a standalone BloomFilter."""
+    filters = sketch_oxide.FlatBloofi(2, 1000, 0.01)
+    bf = sketch_oxide.BloomFilter(1000, 0.01)
+    for i in range(500):
+        filters.insert(1, f"item-{i}".encode())
+        bf.insert(f"item-{i}".encode())
+    for i in range(2000):
+        key = f"probe-{i}".encode()
+        assert filters.contains(1, key) == bf.contains(key)
+
+
+def test_flat_bloofi_invalid_filter():
+    """Test FlatBloofi parameter and index validation."""
+    with pytest.raises(ValueError):
+        sketch_oxide.FlatBloofi(65, 1000)
+    filters = sketch_oxide.FlatBloofi(4, 1000)
+    with pytest.raises(IndexError):
+        filters.insert(4, b"key")
+    assert not filters.contains(4, b"key")
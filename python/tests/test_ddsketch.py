@@ -1,6 +1,6 @@
 """Core tests for DDSketch quantile estimation sketch."""
 
-import random
+import pytest
 
 import sketch_oxide
 
@@ -107,15 +107,23 @@ def test_ddsketch_is_empty():
 
 def test_ddsketch_large_dataset():
     """Test with large dataset."""
+    np = pytest.importorskip("numpy")
     ds = sketch_oxide.DDSketch(0.01)
-    for _ in range(100000):
-        ds.update(random.random() * 1000)
+    ds.update_batch(np.random.random(100000) * 1000)
     median = ds.quantile(0.5)
     p99 = ds.quantile(0.99)
     assert median > 0
     assert p99 > median
 
 
+def test_ddsketch_update_batch_list():
+    """Test batch update from a plain list of floats."""
+    ds = sketch_oxide.DDSketch(0.01)
+    ds.update_batch([float(i) for i in range(1, 101)])
+    assert ds.count() == 100
+    assert 45 < ds.quantile(0.5) < 55
+
+
 def test_ddsketch_different_accuracy():
     """Test with different relative accuracy values."""
     for alpha in [0.001, 0.01, 0.05, 0.1]:
@@ -1,5 +1,10 @@
 """Core tests for MinHash similarity estimation sketch."""
 
+import copy
+import pickle
+
+import pytest
+
 import sketch_oxide
 
 
@@ -149,19 +154,53 @@ def test_minhash_different_num_perm():
 
 def test_minhash_large_sets():
     """Test with large sets."""
+    np = pytest.importorskip("numpy")
     mh1 = sketch_oxide.MinHash(128)
     mh2 = sketch_oxide.MinHash(128)
     # 50K elements
-    for i in range(50000):
-        mh1.update(i)
+    mh1.update_batch(np.arange(50000, dtype=np.int64))
     # 50K elements with 25K overlap
-    for i in range(25000, 75000):
-        mh2.update(i)
+    mh2.update_batch(np.arange(25000, 75000, dtype=np.int64))
     similarity = mh1.jaccard_similarity(mh2)
     # True Jaccard: 25K / 75K ≈ 0.333
     assert 0.2 < similarity < 0.5
 
 
+def test_minhash_update_batch_matches_update():
+    """Test that batch updates match per-item updates."""
+    mh1 = sketch_oxide.MinHash(128)
+    mh2 = sketch_oxide.MinHash(128)
+    items = [1, 2, 3, "apple", b"bytes"]
+    for item in items:
+        mh1.update(item)
+    mh2.update_batch(items)
+    assert mh1.jaccard_similarity(mh2) == 1.0
+
+
+def test_minhash_update_batch_numpy():
+    """Test that a NumPy int64 array matches per-item updates."""
+    np = pytest.importorskip("numpy")
+    mh1 = sketch_oxide.MinHash(128)
+    mh2 = sketch_oxide.MinHash(128)
+    for i in range(1000):
+        mh1.update(i)
+    mh2.update_batch(np.arange(1000, dtype=np.int64))
+    assert mh1.jaccard_similarity(mh2) == 1.0
+
+
+def test_minhash_pickle_roundtrip():
+    """Test that pickled and copied sketches keep their signature."""
+    mh = sketch_oxide.MinHash(64)
+    mh.update_batch(list(range(100)))
+    restored = pickle.loads(pickle.dumps(mh))
+    assert restored.num_perm() == 64
+    assert mh.jaccard_similarity(restored) == 1.0
+
+    clone = copy.copy(mh)
+    clone.update_batch(list(range(100, 200)))
+    assert mh.jaccard_similarity(clone) < 1.0
+
+
 def test_minhash_single_element():
     """Test with single element."""
     mh = sketch_oxide.MinHash(128)
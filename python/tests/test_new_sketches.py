@@ -8,15 +8,62 @@ from sketch_oxide import (
     SlidingHyperLogLog,
 )
 
+# Keys shared by the update loops, built once instead of formatted per item
+ITEMS_STR = tuple(f"item_{j}" for j in range(10))
+ITEMS_BYTES = tuple(s.encode() for s in ITEMS_STR)
+VALUES = tuple(f"value_{j}".encode() for j in range(100))
+
+# Module-scoped fixtures share one pre-built sketch between tests that only
+# read from it. Tests that mutate a sketch must construct their own.
+
+
+@pytest.fixture(scope="module")
+def hk_k100():
+    """Empty HeavyKeeper tracking the top 100 items"""
+    return HeavyKeeper(k=100, epsilon=0.001, delta=0.01)
+
+
+@pytest.fixture(scope="module")
+def grafite_5():
+    """Grafite over keys 1..5 with 6 bits per key"""
+    return Grafite([1, 2, 3, 4, 5], bits_per_key=6)
+
+
+@pytest.fixture(scope="module")
+def memento_1000():
+    """Empty MementoFilter sized for 1000 elements"""
+    return MementoFilter(expected_elements=1000, fpr=0.01)
+
+
+@pytest.fixture(scope="module")
+def hll_p12():
+    """Empty SlidingHyperLogLog with precision 12"""
+    return SlidingHyperLogLog(precision=12, max_window_seconds=3600)
+
+
+@pytest.fixture(scope="module")
+def hll_populated():
+    """SlidingHyperLogLog with 100 unique items at timestamp 1000"""
+    hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
+    hll.update_batch(list(range(100)), timestamp=1000)
+    return hll
+
+
+@pytest.fixture(scope="module", params=[4, 8, 12, 14, 16])
+def hll_populated_any_precision(request):
+    """SlidingHyperLogLog with 100 unique items, for each supported precision"""
+    hll = SlidingHyperLogLog(precision=request.param, max_window_seconds=3600)
+    hll.update_batch(list(range(100)), timestamp=1000)
+    return hll
+
 
 class TestHeavyKeeper:
     """Test suite for HeavyKeeper top-k frequency estimation"""
 
-    def test_construction(self):
+    def test_construction(self, hk_k100):
         """Test basic construction"""
-        hk = HeavyKeeper(k=10, epsilon=0.001, delta=0.01)
-        assert hk is not None
-        assert hk.is_empty()
+        assert hk_k100 is not None
+        assert hk_k100.is_empty()
 
     def test_invalid_parameters(self):
         """Test parameter validation"""
@@ -27,40 +74,28 @@ class TestHeavyKeeper:
         with pytest.raises(ValueError):
             HeavyKeeper(k=10, epsilon=0.001, delta=0.0)  # delta must be in (0, 1)
 
-    def test_update_and_estimate_str(self):
-        """Test updating with strings"""
-        hk = HeavyKeeper(k=10, epsilon=0.001, delta=0.01)
-        for i in range(100):
-            hk.update(f"item_{i % 10}")
-
-        count = hk.estimate("item_5")
-        assert count > 0
-        assert count >= 8  # Should have at least 8 out of 10 occurrences
-
-    def test_update_and_estimate_int(self):
-        """Test updating with integers"""
+    @pytest.mark.parametrize(
+        "items, probe, min_count",
+        [
+            (list(ITEMS_STR) * 10, "item_5", 8),
+            (list(range(10)) * 10, 5, 8),
+            (list(ITEMS_BYTES) * 10, b"item_5", 1),
+        ],
+        ids=["str", "int", "bytes"],
+    )
+    def test_update_and_estimate(self, items, probe, min_count):
+        """Test updating with str, int and bytes keys"""
         hk = HeavyKeeper(k=10, epsilon=0.001, delta=0.01)
-        for i in range(100):
-            hk.update(i % 10)
-
-        count = hk.estimate(5)
-        assert count > 0
-        assert count >= 8
-
-    def test_update_and_estimate_bytes(self):
-        """Test updating with bytes"""
-        hk = HeavyKeeper(k=10, epsilon=0.001, delta=0.01)
-        for i in range(100):
-            hk.update(f"item_{i % 10}".encode())
+        hk.update_batch(items)
 
-        count = hk.estimate(b"item_5")
+        count = hk.estimate(probe)
         assert count > 0
+        assert count >= min_count  # Should have most of the 10 occurrences
 
     def test_top_k(self):
         """Test retrieving top-k items"""
         hk = HeavyKeeper(k=5, epsilon=0.001, delta=0.01)
-        for i in range(100):
-            hk.update(f"item_{i % 10}")
+        hk.update_batch(list(ITEMS_STR) * 10)
 
         top_k = hk.top_k()
         assert len(top_k) <= 5
@@ -68,9 +103,8 @@ class TestHeavyKeeper:
         assert all(len(item) == 2 for item in top_k)
 
         # Check sorted by count descending
-        if len(top_k) > 1:
-            counts = [count for _, count in top_k]
-            assert counts == sorted(counts, reverse=True)
+        counts = [count for _, count in top_k]
+        assert all(a >= b for a, b in zip(counts, counts[1:]))
 
     def test_decay(self):
         """Test exponential decay"""
@@ -88,10 +122,8 @@ class TestHeavyKeeper:
         hk1 = HeavyKeeper(k=10, epsilon=0.001, delta=0.01)
         hk2 = HeavyKeeper(k=10, epsilon=0.001, delta=0.01)
 
-        for _ in range(50):
-            hk1.update("item")
-        for _ in range(30):
-            hk2.update("item")
+        hk1.update_batch(["item"] * 50)
+        hk2.update_batch(["item"] * 30)
 
         hk1.merge(hk2)
         count = hk1.estimate("item")
@@ -114,22 +146,16 @@ class TestHeavyKeeper:
         assert hk.estimate("apple") >= 2
         assert hk.estimate("banana") >= 1
 
-    def test_stats(self):
+    def test_stats(self, hk_k100):
         """Test statistics retrieval"""
-        hk = HeavyKeeper(k=100, epsilon=0.001, delta=0.01)
-        stats = hk.stats()
-
-        assert "total_updates" in stats
-        assert "k" in stats
-        assert "memory_bits" in stats
-        assert "depth" in stats
-        assert "width" in stats
+        stats = hk_k100.stats()
+        missing = {"total_updates", "k", "memory_bits", "depth", "width"} - stats.keys()
+        assert not missing, missing
         assert stats["k"] == 100
 
-    def test_repr(self):
+    def test_repr(self, hk_k100):
         """Test string representation"""
-        hk = HeavyKeeper(k=100, epsilon=0.001, delta=0.01)
-        repr_str = repr(hk)
+        repr_str = repr(hk_k100)
         assert "HeavyKeeper" in repr_str
         assert "100" in repr_str
 
@@ -228,11 +254,9 @@ class TestRatelessIBLT:
 class TestGrafite:
     """Test suite for Grafite optimal range filter"""
 
-    def test_construction(self):
+    def test_construction(self, grafite_5):
         """Test basic construction"""
-        keys = [10, 20, 30, 40, 50]
-        filter = Grafite(keys, bits_per_key=6)
-        assert filter is not None
+        assert grafite_5 is not None
 
     def test_invalid_parameters(self):
         """Test parameter validation"""
@@ -271,55 +295,39 @@ class TestGrafite:
         stats = filter.stats()
         assert stats["key_count"] == 3  # Should have 3 unique keys
 
-    def test_expected_fpr(self):
+    def test_expected_fpr(self, grafite_5):
         """Test FPR calculation"""
-        filter = Grafite([1, 2, 3], bits_per_key=6)
-
         # FPR = range_width / 2^(bits_per_key - 2)
         # For bits_per_key=6: denominator = 2^4 = 16
-        fpr = filter.expected_fpr(10)
+        fpr = grafite_5.expected_fpr(10)
         expected = 10.0 / 16.0  # 0.625
         assert abs(fpr - expected) < 0.001
 
-    def test_stats(self):
+    @pytest.mark.parametrize("key", ["key_count", "bits_per_key", "total_bits"])
+    def test_stats_has(self, grafite_5, key):
         """Test statistics retrieval"""
-        keys = [1, 2, 3, 4, 5]
-        filter = Grafite(keys, bits_per_key=6)
-        stats = filter.stats()
+        assert key in grafite_5.stats()
 
-        assert "key_count" in stats
-        assert "bits_per_key" in stats
-        assert "total_bits" in stats
-        assert stats["key_count"] == 5
-        assert stats["bits_per_key"] == 6
-
-    def test_key_count(self):
-        """Test key count accessor"""
-        keys = [1, 2, 3, 4, 5]
-        filter = Grafite(keys, bits_per_key=6)
-        assert filter.key_count() == 5
+    @pytest.mark.parametrize("attr, expected", [("key_count", 5), ("bits_per_key", 6)])
+    def test_accessor(self, grafite_5, attr, expected):
+        """Test accessors and their matching stats entries"""
+        assert getattr(grafite_5, attr)() == expected
+        assert grafite_5.stats()[attr] == expected
 
-    def test_bits_per_key(self):
-        """Test bits per key accessor"""
-        filter = Grafite([1, 2, 3], bits_per_key=8)
-        assert filter.bits_per_key() == 8
-
-    def test_repr(self):
+    def test_repr(self, grafite_5):
         """Test string representation"""
-        filter = Grafite([1, 2, 3], bits_per_key=6)
-        repr_str = repr(filter)
+        repr_str = repr(grafite_5)
         assert "Grafite" in repr_str
 
 
 class TestMementoFilter:
     """Test suite for Memento Filter dynamic range filter"""
 
-    def test_construction(self):
+    def test_construction(self, memento_1000):
         """Test basic construction"""
-        filter = MementoFilter(expected_elements=1000, fpr=0.01)
-        assert filter is not None
-        assert filter.is_empty()
-        assert filter.len() == 0
+        assert memento_1000 is not None
+        assert memento_1000.is_empty()
+        assert memento_1000.len() == 0
 
     def test_invalid_parameters(self):
         """Test parameter validation"""
@@ -350,8 +358,7 @@ class TestMementoFilter:
         """Test multiple insertions"""
         filter = MementoFilter(expected_elements=1000, fpr=0.01)
 
-        for i in range(100):
-            filter.insert(i, f"value_{i}".encode())
+        filter.insert_batch(list(enumerate(VALUES)))
 
         assert filter.len() == 100
 
@@ -372,14 +379,13 @@ class TestMementoFilter:
 
     def test_capacity_exceeded(self):
         """Test that exceeding capacity raises error"""
-        filter = MementoFilter(expected_elements=10, fpr=0.01)
+        filter = MementoFilter(expected_elements=8, fpr=0.01)
 
-        for i in range(10):
-            filter.insert(i, b"value")
+        filter.insert_batch([(i, b"value") for i in range(8)])
 
-        # 11th insertion should fail
+        # 9th insertion should fail
         with pytest.raises(ValueError):
-            filter.insert(10, b"value")
+            filter.insert(8, b"value")
 
     def test_stats(self):
         """Test statistics retrieval"""
@@ -387,14 +393,12 @@ class TestMementoFilter:
         filter.insert(42, b"value")
 
         stats = filter.stats()
-        assert "num_elements" in stats
-        assert "capacity" in stats
-        assert "fpr_target" in stats
-        assert "num_expansions" in stats
-        assert "load_factor" in stats
-
-        assert stats["num_elements"] == 1
-        assert stats["capacity"] == 1000
+        expected = {"num_elements", "capacity", "fpr_target", "num_expansions", "load_factor"}
+        missing = expected - stats.keys()
+        assert not missing, missing
+
+        assert stats["num_elements"] == len(filter) == 1
+        assert stats["capacity"] == filter.capacity() == 1000
         assert abs(stats["fpr_target"] - 0.01) < 0.001
 
     def test_len_method(self):
@@ -405,21 +409,19 @@ class TestMementoFilter:
         filter.insert(1, b"value")
         assert len(filter) == 1
 
-    def test_repr(self):
+    def test_repr(self, memento_1000):
         """Test string representation"""
-        filter = MementoFilter(expected_elements=1000, fpr=0.01)
-        repr_str = repr(filter)
+        repr_str = repr(memento_1000)
         assert "MementoFilter" in repr_str
 
 
 class TestSlidingHyperLogLog:
     """Test suite for Sliding HyperLogLog time-windowed cardinality"""
 
-    def test_construction(self):
+    def test_construction(self, hll_p12):
         """Test basic construction"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        assert hll is not None
-        assert hll.is_empty()
+        assert hll_p12 is not None
+        assert hll_p12.is_empty()
 
     def test_invalid_precision(self):
         """Test precision validation"""
@@ -428,39 +430,21 @@ class TestSlidingHyperLogLog:
         with pytest.raises(ValueError):
             SlidingHyperLogLog(precision=17, max_window_seconds=3600)
 
-    def test_update_str(self):
-        """Test updating with strings"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        hll.update("user_123", timestamp=1000)
-        assert not hll.is_empty()
-
-    def test_update_int(self):
-        """Test updating with integers"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        hll.update(42, timestamp=1000)
-        assert not hll.is_empty()
-
-    def test_update_bytes(self):
-        """Test updating with bytes"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        hll.update(b"data", timestamp=1000)
-        assert not hll.is_empty()
-
-    def test_update_float(self):
-        """Test updating with floats"""
+    @pytest.mark.parametrize(
+        "value",
+        ["user_123", 42, b"data", 3.14159],
+        ids=["str", "int", "bytes", "float"],
+    )
+    def test_update(self, value):
+        """Test updating with str, int, bytes and float items"""
         hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        hll.update(3.14159, timestamp=1000)
+        hll.update(value, timestamp=1000)
         assert not hll.is_empty()
 
-    def test_estimate_total(self):
+    def test_estimate_total(self, hll_populated):
         """Test total cardinality estimation"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-
-        # Add 100 unique items
-        for i in range(100):
-            hll.update(i, timestamp=1000)
-
-        estimate = hll.estimate_total()
+        # 100 unique items
+        estimate = hll_populated.estimate_total()
         assert estimate > 50  # Should be close to 100
         assert estimate < 150  # Within reasonable error
 
@@ -469,10 +453,8 @@ class TestSlidingHyperLogLog:
         hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
 
         # Add items at different times
-        for i in range(50):
-            hll.update(i, timestamp=1000)
-        for i in range(50, 100):
-            hll.update(i, timestamp=2000)
+        hll.update_batch(list(range(50)), timestamp=1000)
+        hll.update_batch(list(range(50, 100)), timestamp=2000)
 
         # Window covering only second batch
         estimate = hll.estimate_window(current_time=2500, window_seconds=600)
@@ -482,6 +464,22 @@ class TestSlidingHyperLogLog:
         estimate = hll.estimate_window(current_time=2500, window_seconds=2000)
         assert estimate > 50  # Should see more items
 
+    def test_update_batch_u64(self):
+        """Test numpy uint64 batches count items like int updates"""
+        np = pytest.importorskip("numpy")
+        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
+        hll.update_batch_u64(np.arange(50, dtype=np.uint64), timestamp=1000)
+        hll.update_batch_u64(np.arange(50, 100, dtype=np.uint64), timestamp=2000)
+
+        expected = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
+        expected.update_batch(list(range(50)), timestamp=1000)
+        expected.update_batch(list(range(50, 100)), timestamp=2000)
+
+        assert hll.estimate_total() == expected.estimate_total()
+        assert hll.estimate_window(current_time=2500, window_seconds=600) == (
+            expected.estimate_window(current_time=2500, window_seconds=600)
+        )
+
     def test_decay(self):
         """Test decay operation"""
         hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
@@ -501,10 +499,8 @@ class TestSlidingHyperLogLog:
         hll1 = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
         hll2 = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
 
-        for i in range(100):
-            hll1.update(i, timestamp=1000)
-        for i in range(50, 150):
-            hll2.update(i, timestamp=1000)
+        hll1.update_batch(list(range(100)), timestamp=1000)
+        hll2.update_batch(list(range(50, 150)), timestamp=1000)
 
         hll1.merge(hll2)
         estimate = hll1.estimate_total()
@@ -518,29 +514,23 @@ class TestSlidingHyperLogLog:
         with pytest.raises(ValueError):
             hll1.merge(hll2)
 
-    def test_precision(self):
-        """Test precision accessor"""
-        hll = SlidingHyperLogLog(precision=14, max_window_seconds=3600)
-        assert hll.precision() == 14
-
-    def test_num_registers(self):
-        """Test num_registers accessor"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        assert hll.num_registers() == 4096  # 2^12
+    @pytest.mark.parametrize(
+        "attr, expected",
+        [("precision", 12), ("num_registers", 4096)],  # 2^12 registers
+    )
+    def test_accessor(self, hll_p12, attr, expected):
+        """Test precision and num_registers accessors"""
+        assert getattr(hll_p12, attr)() == expected
 
-    def test_standard_error(self):
+    def test_standard_error(self, hll_p12):
         """Test standard error calculation"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        error = hll.standard_error()
+        error = hll_p12.standard_error()
         expected = 1.04 / (4096**0.5)  # 1.04 / sqrt(2^12)
         assert abs(error - expected) < 0.001
 
-    def test_serialization(self):
+    def test_serialization(self, hll_populated_any_precision):
         """Test serialization and deserialization"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-
-        for i in range(100):
-            hll.update(i, timestamp=1000)
+        hll = hll_populated_any_precision
 
         # Serialize
         data = hll.serialize()
@@ -549,23 +539,19 @@ class TestSlidingHyperLogLog:
 
         # Deserialize
         restored = SlidingHyperLogLog.deserialize(data)
-        assert restored.precision() == 12
+        assert restored.precision() == hll.precision()
         assert abs(restored.estimate_total() - hll.estimate_total()) < 1.0
 
-    def test_stats(self):
+    def test_stats(self, hll_p12):
         """Test statistics retrieval"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        stats = hll.stats()
-
-        assert "precision" in stats
-        assert "max_window_seconds" in stats
-        assert "total_updates" in stats
+        stats = hll_p12.stats()
+        missing = {"precision", "max_window_seconds", "total_updates"} - stats.keys()
+        assert not missing, missing
         assert stats["precision"] == 12
         assert stats["max_window_seconds"] == 3600
 
-    def test_repr(self):
+    def test_repr(self, hll_p12):
         """Test string representation"""
-        hll = SlidingHyperLogLog(precision=12, max_window_seconds=3600)
-        repr_str = repr(hll)
+        repr_str = repr(hll_p12)
         assert "SlidingHyperLogLog" in repr_str
         assert "12" in repr_str
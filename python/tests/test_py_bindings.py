@@ -1,6 +1,4 @@
-#!/usr/bin/env python3
-"""
-Comprehensive tests for CountSketch and SpaceSaving Python bindings.
+"""Tests for the CountSketch and SpaceSaving Python bindings.
 
 Tests cover:
 1. Basic updates and queries
@@ -9,114 +7,91 @@ Tests cover:
 4. Inner product (CountSketch)
 5. Merge operations
 6. Serialization
+7. Batch updates
 """
 
-import sys
+import pytest
 
-# Import the module
-try:
-    from sketch_oxide import CountSketch, SpaceSaving
+sketch_oxide = pytest.importorskip(
+    "sketch_oxide", reason="Module not built yet - run 'maturin develop' first"
+)
+CountSketch = sketch_oxide.CountSketch
+SpaceSaving = sketch_oxide.SpaceSaving
+SpaceSavingU64 = sketch_oxide.SpaceSavingU64
 
-    print("Successfully imported CountSketch and SpaceSaving\n")
-except ImportError as e:
-    print(f"Failed to import: {e}")
-    sys.exit(1)
+# (epsilon, delta) pairs: the default shape, a wider table and a deeper table
+COUNT_SKETCH_PARAMS = [(0.1, 0.01), (0.05, 0.01), (0.1, 0.001)]
 
+SPACE_SAVING_EPSILONS = [0.1, 0.05]
 
-def test_count_sketch_basic():
-    """Test basic CountSketch updates and queries."""
-    print("TEST 1: CountSketch Basic Operations")
-    print("=" * 50)
 
-    cs = CountSketch(epsilon=0.1, delta=0.01)
-    print(f"Created: {cs}")
+@pytest.fixture(params=COUNT_SKETCH_PARAMS, ids=lambda p: f"eps={p[0]}-delta={p[1]}")
+def new_cs(request):
+    """Factory for fresh CountSketches with the parametrized shape."""
+    epsilon, delta = request.param
+    return lambda: CountSketch(epsilon=epsilon, delta=delta)
+
 
-    # Test basic updates
+@pytest.fixture(params=SPACE_SAVING_EPSILONS, ids=lambda e: f"eps={e}")
+def new_ss(request):
+    """Factory for fresh SpaceSaving sketches with the parametrized epsilon."""
+    return lambda: SpaceSaving(epsilon=request.param)
+
+
+def test_count_sketch_basic(new_cs):
+    """Test basic CountSketch updates and queries."""
+    cs = new_cs()
     cs.update("apple", 5)
     cs.update("banana", 3)
     cs.update("cherry", 2)
 
-    # Test estimates
+    # Estimates should be reasonably close (unbiased, can vary)
     apple_est = cs.estimate("apple")
     banana_est = cs.estimate("banana")
     cherry_est = cs.estimate("cherry")
-
-    print(f"apple estimate: {apple_est} (true: 5)")
-    print(f"banana estimate: {banana_est} (true: 3)")
-    print(f"cherry estimate: {cherry_est} (true: 2)")
-
-    # Estimates should be reasonably close (unbiased, can vary)
     assert abs(apple_est - 5) <= 3, f"apple estimate {apple_est} too far from 5"
     assert abs(banana_est - 3) <= 3, f"banana estimate {banana_est} too far from 3"
     assert abs(cherry_est - 2) <= 3, f"cherry estimate {cherry_est} too far from 2"
 
-    print("✓ Basic operations passed\n")
-
 
-def test_count_sketch_deletions():
+def test_count_sketch_deletions(new_cs):
     """Test CountSketch with negative deltas (deletions)."""
-    print("TEST 2: CountSketch Deletions (Negative Deltas)")
-    print("=" * 50)
-
-    cs = CountSketch(epsilon=0.1, delta=0.01)
-
-    # Add and then delete
+    cs = new_cs()
     cs.update("item", 10)
     cs.update("item", -3)  # Delete 3
 
     estimate = cs.estimate("item")
-    print(f"After 10 + (-3): estimate = {estimate} (expected ~7)")
-
     assert abs(estimate - 7) <= 3, f"estimate {estimate} too far from 7"
 
     # Fully negative
-    cs2 = CountSketch(epsilon=0.1, delta=0.01)
+    cs2 = new_cs()
     cs2.update("negative", -5)
     neg_est = cs2.estimate("negative")
-
-    print(f"Negative count: estimate = {neg_est} (expected ~-5)")
     assert abs(neg_est - (-5)) <= 3, f"negative estimate {neg_est} too far from -5"
 
-    print("✓ Deletions passed\n")
 
-
-def test_count_sketch_inner_product():
+def test_count_sketch_inner_product(new_cs):
     """Test CountSketch inner product estimation."""
-    print("TEST 3: CountSketch Inner Product")
-    print("=" * 50)
+    cs1 = new_cs()
+    cs2 = new_cs()
 
-    cs1 = CountSketch(epsilon=0.1, delta=0.01)
-    cs2 = CountSketch(epsilon=0.1, delta=0.01)
-
-    # Create frequency vectors
-    # cs1: a=3, b=2
-    # cs2: a=4, b=5
-    # Inner product = 3*4 + 2*5 = 22
+    # cs1: a=3, b=2 and cs2: a=4, b=5, so the inner product is 3*4 + 2*5 = 22
     cs1.update("a", 3)
     cs1.update("b", 2)
-
     cs2.update("a", 4)
     cs2.update("b", 5)
 
     inner = cs1.inner_product(cs2)
-    print(f"Inner product: {inner} (expected: 22)")
-
     assert abs(inner - 22) <= 10, f"Inner product {inner} too far from 22"
 
-    print("✓ Inner product passed\n")
 
-
-def test_count_sketch_merge():
+def test_count_sketch_merge(new_cs):
     """Test CountSketch merge operation."""
-    print("TEST 4: CountSketch Merge")
-    print("=" * 50)
-
-    cs1 = CountSketch(epsilon=0.1, delta=0.01)
-    cs2 = CountSketch(epsilon=0.1, delta=0.01)
+    cs1 = new_cs()
+    cs2 = new_cs()
 
     cs1.update("item", 10)
     cs1.update("only1", 5)
-
     cs2.update("item", 8)
     cs2.update("only2", 3)
 
@@ -125,335 +100,145 @@ def test_count_sketch_merge():
     item_est = cs1.estimate("item")
     only1_est = cs1.estimate("only1")
     only2_est = cs1.estimate("only2")
-
-    print(f"item after merge: {item_est} (expected ~18)")
-    print(f"only1 after merge: {only1_est} (expected ~5)")
-    print(f"only2 after merge: {only2_est} (expected ~3)")
-
     assert abs(item_est - 18) <= 5, f"merged item estimate {item_est} too far from 18"
     assert abs(only1_est - 5) <= 3, f"only1 estimate {only1_est} too far from 5"
     assert abs(only2_est - 3) <= 3, f"only2 estimate {only2_est} too far from 3"
 
-    print("✓ Merge passed\n")
 
+def test_count_sketch_merge_rejects_different_shape():
+    """Test that sketches with different dimensions cannot be merged."""
+    cs1 = CountSketch(epsilon=0.1, delta=0.01)
+    cs2 = CountSketch(epsilon=0.05, delta=0.01)
 
-def test_count_sketch_serialization():
-    """Test CountSketch serialization and deserialization."""
-    print("TEST 5: CountSketch Serialization")
-    print("=" * 50)
+    with pytest.raises(ValueError):
+        cs1.merge(cs2)
 
-    cs1 = CountSketch(epsilon=0.1, delta=0.01)
+
+def test_count_sketch_serialization(new_cs):
+    """Test CountSketch serialization and deserialization."""
+    cs1 = new_cs()
     cs1.update("test", 42)
     cs1.update("another", -10)
 
-    # Serialize
-    data = cs1.serialize()
-    print(f"Serialized size: {len(data)} bytes")
+    cs2 = CountSketch.deserialize(cs1.serialize())
 
-    # Deserialize
-    cs2 = CountSketch.deserialize(data)
+    assert cs1.estimate("test") == cs2.estimate("test"), "Estimates differ after deserialization"
+    assert cs1.estimate("another") == cs2.estimate("another")
 
-    # Verify they produce same estimates
-    test_est1 = cs1.estimate("test")
-    test_est2 = cs2.estimate("test")
 
-    print(f"Original estimate: {test_est1}")
-    print(f"Restored estimate: {test_est2}")
+def test_count_sketch_update_many(new_cs):
+    """Test CountSketch batch updates with per-key deltas."""
+    keys = ["apple", "banana", 42, b"raw"]
+    deltas = [5, 3, -2, 1]
 
-    assert test_est1 == test_est2, "Estimates differ after deserialization"
+    cs1 = new_cs()
+    cs1.update_many(keys, deltas)
 
-    print("✓ Serialization passed\n")
+    cs2 = new_cs()
+    for key, delta in zip(keys, deltas):
+        cs2.update(key, delta)
 
+    # Batch updates must land on exactly the same counters
+    for key in keys:
+        assert cs1.estimate(key) == cs2.estimate(key), f"estimate mismatch for {key!r}"
 
-def test_space_saving_basic():
-    """Test basic SpaceSaving updates and queries."""
-    print("TEST 6: SpaceSaving Basic Operations")
-    print("=" * 50)
+    # Keys without deltas count once each
+    cs3 = new_cs()
+    cs3.update_many(["x"] * 4)
+    assert abs(cs3.estimate("x") - 4) <= 3
+
+    with pytest.raises(ValueError):
+        cs3.update_many(["a", "b"], [1])
 
-    ss = SpaceSaving(epsilon=0.1)
-    print(f"Created: {ss}")
-    print(f"Capacity: {ss.capacity()}, Stream length: {ss.stream_length()}")
-
-    # Add items
-    ss.update("apple")
-    ss.update("apple")
-    ss.update("apple")
-    ss.update("banana")
-    ss.update("banana")
-    ss.update("cherry")
-
-    # Get estimates
-    apple_bounds = ss.estimate("apple")
-    banana_bounds = ss.estimate("banana")
-    cherry_bounds = ss.estimate("cherry")
-    orange_bounds = ss.estimate("orange")  # Not in sketch
-
-    print(f"apple bounds: {apple_bounds} (true: 3)")
-    print(f"banana bounds: {banana_bounds} (true: 2)")
-    print(f"cherry bounds: {cherry_bounds} (true: 1)")
-    print(f"orange bounds: {orange_bounds} (not tracked)")
+
+def test_space_saving_basic(new_ss):
+    """Test basic SpaceSaving updates and queries."""
+    ss = new_ss()
+    for item in ["apple", "apple", "apple", "banana", "banana", "cherry"]:
+        ss.update(item)
 
     # Verify bounds contain true values
-    assert apple_bounds is not None
-    assert (
-        apple_bounds[0] <= 3 <= apple_bounds[1]
-    ), f"apple true count 3 not in bounds {apple_bounds}"
+    for item, true_count in [("apple", 3), ("banana", 2), ("cherry", 1)]:
+        bounds = ss.estimate(item)
+        assert bounds is not None, f"{item} should be tracked"
+        assert (
+            bounds[0] <= true_count <= bounds[1]
+        ), f"{item} true count {true_count} not in bounds {bounds}"
 
-    assert banana_bounds is not None
-    assert (
-        banana_bounds[0] <= 2 <= banana_bounds[1]
-    ), f"banana true count 2 not in bounds {banana_bounds}"
+    assert ss.estimate("orange") is None, "orange should not be tracked"
 
-    assert cherry_bounds is not None
-    assert (
-        cherry_bounds[0] <= 1 <= cherry_bounds[1]
-    ), f"cherry true count 1 not in bounds {cherry_bounds}"
 
-    assert orange_bounds is None, "orange should not be tracked"
+@pytest.mark.slow
+def test_space_saving_heavy_hitters():
+    """Test SpaceSaving heavy hitter detection on integer keys."""
+    ss = SpaceSavingU64(epsilon=0.01)
 
-    print("✓ Basic operations passed\n")
+    # Create a stream with heavy hitters (keys 1-3), followed by many unique IDs
+    ss.update_many([1] * 100 + [2] * 50 + [3] * 10 + list(range(1000, 2000)))
+    assert ss.stream_length() == 1160
 
+    # Key 1 (100 of 1160) should be detected with a 5% threshold
+    heavy_items = set(item for item, _, _ in ss.heavy_hitters(0.05))
+    assert 1 in heavy_items, "key 1 should be a heavy hitter"
 
-def test_space_saving_heavy_hitters():
-    """Test SpaceSaving heavy hitter detection."""
-    print("TEST 7: SpaceSaving Heavy Hitter Detection")
-    print("=" * 50)
-
-    ss = SpaceSaving(epsilon=0.01)
-
-    # Create a stream with heavy hitters
-    for _ in range(100):
-        ss.update("common")
-    for _ in range(50):
-        ss.update("moderate")
-    for _ in range(10):
-        ss.update("rare")
-    for _ in range(1000):
-        ss.update(f"id_{_}")  # Many unique items
-
-    print(f"Stream length: {ss.stream_length()}")
-    print(f"Items tracked: {ss.num_items()}")
-
-    # Get heavy hitters with 5% threshold
-    heavy = ss.heavy_hitters(0.05)
-    print("\nHeavy hitters (> 5%):")
-    for item, lower, upper in heavy[:5]:  # Show top 5
-        print(f"  {item}: [{lower}, {upper}]")
-
-    # Common (100) should be detected
-    heavy_items = set(item for item, _, _ in heavy)
-    # Note: bytes objects, need to check carefully
-    found_common = any(b"common" in str(item).encode() for item in heavy_items)
-    print(f"\n'common' detected as heavy hitter: {found_common}")
-
-    # Get top-k
     top5 = ss.top_k(5)
-    print("\nTop 5 items:")
-    for item, lower, upper in top5:
-        print(f"  {item}: [{lower}, {upper}]")
-
     assert len(top5) <= 5, "top_k should return at most k items"
-
-    print("✓ Heavy hitter detection passed\n")
+    assert top5[0][0] == 1, "key 1 should be the most frequent"
 
 
-def test_space_saving_merge():
+def test_space_saving_merge(new_ss):
     """Test SpaceSaving merge operation."""
-    print("TEST 8: SpaceSaving Merge")
-    print("=" * 50)
+    ss1 = new_ss()
+    ss2 = new_ss()
 
-    ss1 = SpaceSaving(epsilon=0.1)
-    ss2 = SpaceSaving(epsilon=0.1)
-
-    # Add to first sketch
-    for _ in range(50):
-        ss1.update("item1")
-    for _ in range(30):
-        ss1.update("shared")
-
-    # Add to second sketch
-    for _ in range(40):
-        ss2.update("item2")
-    for _ in range(20):
-        ss2.update("shared")
-
-    print("Before merge:")
-    print(f"  ss1 stream length: {ss1.stream_length()}")
-    print(f"  ss2 stream length: {ss2.stream_length()}")
+    ss1.update_many(["item1"] * 50 + ["shared"] * 30)
+    ss2.update_many(["item2"] * 40 + ["shared"] * 20)
 
     ss1.merge(ss2)
 
-    print("After merge:")
-    print(f"  merged stream length: {ss1.stream_length()}")
-    print(f"  items tracked: {ss1.num_items()}")
-
     # Verify stream lengths are summed
     assert ss1.stream_length() == 50 + 30 + 40 + 20, "Stream length should be sum of both"
 
     # Check bounds for shared item
     shared_bounds = ss1.estimate("shared")
-    print(f"shared bounds after merge: {shared_bounds} (true: 50)")
     if shared_bounds:
         assert (
             shared_bounds[0] <= 50 <= shared_bounds[1]
         ), f"shared true count 50 not in bounds {shared_bounds}"
 
-    print("✓ Merge passed\n")
 
-
-def test_space_saving_serialization():
+def test_space_saving_serialization(new_ss):
     """Test SpaceSaving serialization (empty sketch only)."""
-    print("TEST 9: SpaceSaving Serialization")
-    print("=" * 50)
-
-    ss1 = SpaceSaving(epsilon=0.1)
+    ss1 = new_ss()
+    ss2 = SpaceSaving.deserialize(ss1.serialize())
 
-    # Serialize empty sketch
-    data = ss1.serialize()
-    print(f"Serialized size: {len(data)} bytes")
+    assert ss1.capacity() == ss2.capacity(), "Capacity mismatch"
+    assert abs(ss1.epsilon() - ss2.epsilon()) < 1e-10, "Epsilon mismatch"
 
-    # Deserialize
-    ss2 = SpaceSaving.deserialize(data)
 
-    print(f"Original capacity: {ss1.capacity()}, epsilon: {ss1.epsilon()}")
-    print(f"Restored capacity: {ss2.capacity()}, epsilon: {ss2.epsilon()}")
+@pytest.mark.parametrize("key", ["string_key", 42, b"bytes_key"], ids=["str", "int", "bytes"])
+def test_type_conversions(key):
+    """Test that both sketches accept int, str and bytes keys."""
+    cs = CountSketch(epsilon=0.1, delta=0.01)
+    ss = SpaceSaving(epsilon=0.1)
 
-    assert ss1.capacity() == ss2.capacity(), "Capacity mismatch"
-    assert abs(ss1.epsilon() - ss2.epsilon()) < 1e-10, "Epsilon mismatch"
+    cs.update(key, 1)
+    ss.update(key)
 
-    print("✓ Serialization passed\n")
+    assert ss.estimate(key) == (1, 1)
 
 
-def test_type_conversions():
-    """Test that both sketches work with different types."""
-    print("TEST 10: Type Conversions (int, str, bytes)")
-    print("=" * 50)
+@pytest.mark.parametrize(
+    "epsilon, delta", [(0.0, 0.01), (1.0, 0.01), (0.1, 0.0), (0.1, 1.0), (-0.1, 0.01)]
+)
+def test_count_sketch_parameter_validation(epsilon, delta):
+    """Test that CountSketch rejects out-of-range parameters."""
+    with pytest.raises(ValueError):
+        CountSketch(epsilon=epsilon, delta=delta)
 
-    cs = CountSketch(epsilon=0.1, delta=0.01)
-    ss = SpaceSaving(epsilon=0.1)
 
-    # Test with different types
-    test_values = [
-        ("string_key", "string value"),
-        (42, "integer key"),
-        (b"bytes_key", "bytes value"),
-    ]
-
-    for key, desc in test_values:
-        try:
-            cs.update(key, 1)
-            ss.update(key)
-            print(f"✓ {desc}: {repr(key)}")
-        except Exception as e:
-            print(f"✗ {desc}: {e}")
-            raise
-
-    print("✓ Type conversions passed\n")
-
-
-def test_parameter_validation():
-    """Test parameter validation."""
-    print("TEST 11: Parameter Validation")
-    print("=" * 50)
-
-    # Invalid epsilon for CountSketch
-    try:
-        CountSketch(epsilon=0.0, delta=0.01)
-        assert False, "Should reject epsilon=0"
-    except ValueError:
-        print("✓ CountSketch rejects epsilon=0")
-
-    try:
-        CountSketch(epsilon=1.0, delta=0.01)
-        assert False, "Should reject epsilon=1.0"
-    except ValueError:
-        print("✓ CountSketch rejects epsilon=1.0")
-
-    # Invalid delta for CountSketch
-    try:
-        CountSketch(epsilon=0.1, delta=0.0)
-        assert False, "Should reject delta=0"
-    except ValueError:
-        print("✓ CountSketch rejects delta=0")
-
-    # Invalid epsilon for SpaceSaving
-    try:
-        SpaceSaving(epsilon=0.0)
-        assert False, "Should reject epsilon=0"
-    except ValueError:
-        print("✓ SpaceSaving rejects epsilon=0")
-
-    try:
-        SpaceSaving(epsilon=1.0)
-        assert False, "Should reject epsilon=1.0"
-    except ValueError:
-        print("✓ SpaceSaving rejects epsilon=1.0")
-
-    print("✓ Parameter validation passed\n")
-
-
-def main():
-    """Run all tests."""
-    print("\n" + "=" * 70)
-    print("COMPREHENSIVE PYTHON BINDINGS TEST SUITE")
-    print("=" * 70 + "\n")
-
-    tests = [
-        (
-            "Count Sketch",
-            [
-                test_count_sketch_basic,
-                test_count_sketch_deletions,
-                test_count_sketch_inner_product,
-                test_count_sketch_merge,
-                test_count_sketch_serialization,
-            ],
-        ),
-        (
-            "Space Saving",
-            [
-                test_space_saving_basic,
-                test_space_saving_heavy_hitters,
-                test_space_saving_merge,
-                test_space_saving_serialization,
-            ],
-        ),
-        (
-            "General",
-            [
-                test_type_conversions,
-                test_parameter_validation,
-            ],
-        ),
-    ]
-
-    total_tests = sum(len(group_tests) for _, group_tests in tests)
-    passed = 0
-    failed = 0
-
-    for group_name, group_tests in tests:
-        print(f"\n{group_name.upper()}")
-        print("-" * 70)
-
-        for test_func in group_tests:
-            try:
-                test_func()
-                passed += 1
-            except Exception as e:
-                print(f"✗ FAILED: {test_func.__name__}")
-                print(f"  Error: {e}\n")
-                failed += 1
-
-    print("\n" + "=" * 70)
-    print(f"TEST SUMMARY: {passed}/{total_tests} passed, {failed} failed")
-    print("=" * 70 + "\n")
-
-    if failed > 0:
-        sys.exit(1)
-    else:
-        print("All tests passed!")
-        sys.exit(0)
-
-
-if __name__ == "__main__":
-    main()
+@pytest.mark.parametrize("epsilon", [0.0, 1.0, -0.5])
+def test_space_saving_parameter_validation(epsilon):
+    """Test that SpaceSaving rejects out-of-range epsilon."""
+    with pytest.raises(ValueError):
+        SpaceSaving(epsilon=epsilon)
@@ -49,6 +49,55 @@ class TestSplineSketchBasic:
         assert sketch.min() == 0
         assert sketch.max() == 90
 
+    def test_update_many_weighted(self):
+        """Test batch updates with per-value weights."""
+        sketch = SplineSketch(200)
+        sketch.update_many([100, 200], [1.0, 2.0])
+        assert sketch.sample_count() == 2
+        assert sketch.total_weight() == 3.0
+
+        with pytest.raises(ValueError):
+            sketch.update_many([1, 2, 3], [1.0])
+
+    def test_update_from_range(self):
+        """Test range updates match per-value updates."""
+        sketch = SplineSketch(max_samples=100)
+        sketch.update_from_range(10, 1010, 2.0)
+
+        expected = SplineSketch(max_samples=100)
+        for i in range(10, 1010):
+            expected.update(i, 2.0)
+
+        assert sketch.total_weight() == expected.total_weight() == 2000.0
+        assert sketch.min() == 10
+        assert sketch.max() == 1009
+        assert sketch.query(0.5) == expected.query(0.5)
+
+    def test_update_many_numpy(self):
+        """Test batch updates from NumPy arrays match per-value updates."""
+        np = pytest.importorskip("numpy")
+        sketch = SplineSketch(max_samples=100)
+        sketch.update_many(np.arange(10000, dtype=np.uint64), np.ones(10000))
+
+        expected = SplineSketch(max_samples=100)
+        for i in range(10000):
+            expected.update(i, 1.0)
+
+        assert sketch.total_weight() == expected.total_weight()
+        assert sketch.query(0.5) == expected.query(0.5)
+
+    def test_par_update_many(self):
+        """Test parallel batch updates track weight, bounds and quantiles."""
+        np = pytest.importorskip("numpy")
+        sketch = SplineSketch(max_samples=200)
+        sketch.par_update_many(np.arange(100000, dtype=np.uint64))
+
+        assert sketch.total_weight() == 100000.0
+        assert sketch.min() == 0
+        assert sketch.max() == 99999
+        assert sketch.sample_count() <= 200
+        assert abs(sketch.query(0.5) - 50000) < 5000
+
     def test_min_max_tracking(self):
         """Test that min and max are tracked correctly."""
         sketch = SplineSketch(200)
@@ -106,10 +155,7 @@ class TestSplineSketchQuantiles:
         for i in range(0, 1001):
             sketch.update(i, 1.0)
 
-        q25 = sketch.query(0.25)
-        q50 = sketch.query(0.50)
-        q75 = sketch.query(0.75)
-        q95 = sketch.query(0.95)
+        q25, q50, q75, q95 = sketch.query_many([0.25, 0.50, 0.75, 0.95])
 
         # Should be roughly 250, 500, 750, 950
         assert 0 < q25 < 500
@@ -123,10 +169,29 @@ class TestSplineSketchQuantiles:
             sketch.update(i, 1.0)
 
         quantiles = [0.1, 0.25, 0.5, 0.75, 0.9]
-        values = [sketch.query(q) for q in quantiles]
+        values = sketch.query_many(quantiles)
+
+        assert values == [sketch.query(q) for q in quantiles]
+        assert all(a <= b for a, b in zip(values, values[1:])), f"Non-monotonic: {values}"
+
+    def test_query_many_numpy(self):
+        """Test batch quantile queries with a NumPy array."""
+        np = pytest.importorskip("numpy")
+        sketch = SplineSketch(200)
+        sketch.update_many(np.arange(1001, dtype=np.uint64))
+
+        quantiles = np.linspace(0.0, 1.0, 101)
+        values = sketch.query_many(quantiles)
 
-        for i in range(len(values) - 1):
-            assert values[i] <= values[i + 1], f"Non-monotonic: {values}"
+        assert isinstance(values, np.ndarray)
+        assert values.dtype == np.uint64
+        assert list(values) == [sketch.query(q) for q in quantiles]
+
+    def test_query_many_empty_raises_error(self):
+        """Test that batch queries on an empty sketch raise an error."""
+        sketch = SplineSketch(200)
+        with pytest.raises(RuntimeError):
+            sketch.query_many([0.5])
 
     def test_query_extreme_quantiles(self):
         """Test querying extreme quantiles."""
@@ -285,14 +350,12 @@ class TestSplineSketchSerialization:
         for i in range(0, 1001):
             sketch.update(i, 1.0)
 
-        original_q50 = sketch.query(0.5)
-        original_q95 = sketch.query(0.95)
+        original_q50, original_q95 = sketch.query_many([0.5, 0.95])
 
         data = sketch.serialize()
         restored = SplineSketch.deserialize(data)
 
-        restored_q50 = restored.query(0.5)
-        restored_q95 = restored.query(0.95)
+        restored_q50, restored_q95 = restored.query_many([0.5, 0.95])
 
         # Should be very close
         assert abs(original_q50 - restored_q50) < 10
@@ -312,8 +375,7 @@ class TestSplineSketchCompression:
         sketch = SplineSketch(max_samples=100)
 
         # Add more values than max_samples
-        for i in range(500):
-            sketch.update(i, 1.0)
+        sketch.update_from_range(0, 500)
 
         # Should be compressed to at most max_samples + some margin
         assert sketch.sample_count() <= 150
@@ -322,18 +384,17 @@ class TestSplineSketchCompression:
         """Test that compression preserves min/max bounds."""
         sketch = SplineSketch(max_samples=50)
 
-        for i in range(0, 1000):
-            sketch.update(i, 1.0)
+        sketch.update_from_range(0, 1000)
 
         assert sketch.min() == 0
         assert sketch.max() == 999
 
+    @pytest.mark.slow
     def test_compression_preserves_quantiles(self):
         """Test that compression preserves quantile accuracy."""
         sketch = SplineSketch(max_samples=100)
 
-        for i in range(0, 10000):
-            sketch.update(i, 1.0)
+        sketch.update_from_range(0, 10000, 1.0)
 
         q50 = sketch.query(0.5)
         # For uniform 0-10000, q50 should be around 5000
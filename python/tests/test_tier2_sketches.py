@@ -22,6 +22,7 @@ import pytest
 
 from sketch_oxide import (
     GRF,
+    FlatBloofi,
     LearnedBloomFilter,
     NitroSketch,
     UnivMon,
@@ -29,7 +30,7 @@ from sketch_oxide import (
 )
 
 # ============================================================================
-# VACUUM FILTER TESTS (20 tests)
+# VACUUM FILTER TESTS (25 tests)
 # ============================================================================
 
 
@@ -109,11 +110,9 @@ class TestVacuumFilterOperations:
     def test_multiple_inserts(self) -> None:
         """Test inserting multiple items."""
         vf = VacuumFilter(capacity=100, fpr=0.01)
-        for i in range(50):
-            vf.insert(f"key_{i}")
+        vf.insert_many([f"key_{i}" for i in range(50)])
         assert vf.len() == 50
-        for i in range(50):
-            assert vf.contains(f"key_{i}")
+        assert vf.contains_many([f"key_{i}" for i in range(50)]).all()
 
     def test_clear(self) -> None:
         """Test clearing the filter."""
@@ -181,9 +180,73 @@ class TestVacuumFilterEdgeCases:
     def test_large_scale_inserts(self) -> None:
         """Test inserting many items (stress test)."""
         vf = VacuumFilter(capacity=10000, fpr=0.01)
-        for i in range(5000):
-            vf.insert(f"item_{i}")
+        keys = list(range(5000))
+        vf.insert_many(keys)
         assert vf.len() == 5000
+        assert vf.contains_many(keys).all()
+
+    def test_par_insert_many_matches_insert_many(self) -> None:
+        """Test that parallel hashing leaves the filter as a serial batch does."""
+        np = pytest.importorskip("numpy")
+        keys = np.arange(100_000, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+
+        parallel = VacuumFilter(capacity=200_000, fpr=0.01)
+        parallel.par_insert_many(keys)
+        serial = VacuumFilter(capacity=200_000, fpr=0.01)
+        serial.insert_many(keys)
+
+        assert parallel.len() == serial.len() == 100_000
+        assert parallel.contains_many(keys).all()
+        assert parallel.stats() == serial.stats()
+
+    def test_u64_fast_path(self) -> None:
+        """Test that integer fast paths match the generic int path."""
+        vf = VacuumFilter(capacity=1000, fpr=0.01)
+        for i in range(500):
+            vf.insert_u64(i)
+        assert vf.len() == 500
+        assert all(vf.contains(i) and vf.contains_u64(i) for i in range(500))
+        assert [vf.contains_u64(i) for i in range(500, 1000)] == [
+            vf.contains(i) for i in range(500, 1000)
+        ]
+
+        with pytest.raises(OverflowError):
+            vf.insert_u64(-1)
+
+    def test_bytearray_matches_bytes(self) -> None:
+        """Test that bytearray keys are stored exactly like bytes keys."""
+        vf = VacuumFilter(capacity=100, fpr=0.01)
+        vf.insert(bytearray(b"hello"))
+        assert vf.contains(b"hello")
+        assert vf.delete(bytearray(b"hello"))
+        assert not vf.contains(b"hello")
+
+        with pytest.raises(TypeError):
+            vf.insert(None)
+
+    def test_insert_many_numpy(self) -> None:
+        """Test that NumPy integer keys match per-item int inserts."""
+        np = pytest.importorskip("numpy")
+        vf = VacuumFilter(capacity=10000, fpr=0.01)
+        vf.insert_many(np.arange(5000, dtype=np.uint64))
+        assert vf.len() == 5000
+        assert all(vf.contains(i) for i in range(0, 5000, 97))
+
+    def test_contains_many_matches_contains(self) -> None:
+        """Test that batch lookups agree with per-item contains."""
+        np = pytest.importorskip("numpy")
+        vf = VacuumFilter(capacity=1000, fpr=0.01)
+        vf.insert_many(np.arange(0, 1000, 2, dtype=np.int64))
+
+        keys = np.arange(1000, dtype=np.int64)
+        found = vf.contains_many(keys)
+        assert found.dtype == np.bool_
+        assert found.tolist() == [vf.contains(int(k)) for k in keys]
+        assert found[::2].all()
+
+        # Mixed Python keys use the same encoding as contains()
+        mixed = [b"x", "y", 2]
+        assert vf.contains_many(mixed).tolist() == [vf.contains(k) for k in mixed]
 
 
 # ============================================================================
@@ -201,12 +264,14 @@ class TestGRFConstruction:
         assert grf.key_count() == 5
         assert grf.bits_per_key() == 6
 
-    def test_construction_different_bits_per_key(self) -> None:
+    @pytest.mark.parametrize("bpk", [4, 6, 8, 10])
+    def test_construction_different_bits_per_key(self, bpk: int) -> None:
         """Test different bits_per_key configurations."""
-        keys = list(range(100))
-        for bpk in [4, 6, 8, 10]:
-            grf = GRF(keys, bits_per_key=bpk)
-            assert grf.bits_per_key() == bpk
+        np = pytest.importorskip("numpy")
+        keys = np.arange(100, dtype=np.uint64)
+        grf = GRF(keys, bits_per_key=bpk)
+        assert grf.bits_per_key() == bpk
+        assert grf.key_count() == 100
 
     def test_deduplication(self) -> None:
         """Test that duplicate keys are deduplicated."""
@@ -214,6 +279,14 @@ class TestGRFConstruction:
         grf = GRF(keys, bits_per_key=6)
         assert grf.key_count() == 3  # Only 10, 20, 30
 
+    def test_numpy_keys_deduplicated(self) -> None:
+        """Test that NumPy keys are sorted and deduplicated like a list."""
+        np = pytest.importorskip("numpy")
+        keys = np.array([30, 10, 20, 20, 30, 30], dtype=np.uint64)
+        grf = GRF(keys, bits_per_key=6)
+        assert grf.key_count() == 3
+        assert grf.may_contain_range(10, 30)
+
     def test_invalid_empty_keys(self) -> None:
         """Test that empty keys list raises ValueError."""
         with pytest.raises(ValueError, match="keys"):
@@ -323,14 +396,15 @@ class TestGRFSkewedDistributions:
 
     def test_large_scale_keys(self) -> None:
         """Test GRF with large number of keys."""
-        keys = list(range(10000))
+        np = pytest.importorskip("numpy")
+        keys = np.arange(10000, dtype=np.uint64)
         grf = GRF(keys, bits_per_key=8)
         assert grf.key_count() == 10000
         assert grf.segment_count() > 0
 
 
 # ============================================================================
-# NITROSKETCH TESTS (16 tests)
+# NITROSKETCH TESTS (17 tests)
 # ============================================================================
 
 
@@ -421,8 +495,7 @@ class TestNitroSketchAdvanced:
     def test_high_throughput(self) -> None:
         """Test high throughput scenario."""
         nitro = NitroSketch(epsilon=0.01, delta=0.01, sample_rate=0.01)
-        for i in range(10000):
-            nitro.update(f"flow_{i % 100}")
+        nitro.update_many([i % 100 for i in range(10000)])
         stats = nitro.stats()
         assert stats["total_items_estimated"] == 10000
 
@@ -444,17 +517,29 @@ class TestNitroSketchRealWorld:
 
     def test_network_flow_monitoring(self) -> None:
         """Test network flow monitoring scenario."""
+        np = pytest.importorskip("numpy")
         nitro = NitroSketch(epsilon=0.01, delta=0.01, sample_rate=0.1)
-        # Simulate network flows
-        for i in range(10000):
-            flow_key = f"192.168.1.{i % 256}:{i % 65536}"
-            nitro.update(flow_key.encode())
+        # Simulate network flows as pre-hashed flow IDs
+        flow_ids = np.arange(10000, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        nitro.update_many(flow_ids)
         stats = nitro.stats()
         assert stats["total_items_estimated"] == 10000
+        assert 0 < stats["sampled_count"] < 10000
+
+    def test_update_many_matches_update(self) -> None:
+        """Test that batch updates sample exactly like per-item int updates."""
+        batched = NitroSketch(epsilon=0.01, delta=0.01, sample_rate=0.1)
+        batched.update_many(list(range(2000)))
+
+        serial = NitroSketch(epsilon=0.01, delta=0.01, sample_rate=0.1)
+        for i in range(2000):
+            serial.update(i)
+
+        assert batched.stats() == serial.stats()
 
 
 # ============================================================================
-# UNIVMON TESTS (20 tests)
+# UNIVMON TESTS (22 tests)
 # ============================================================================
 
 
@@ -596,8 +681,7 @@ class TestUnivMonAdvanced:
     def test_stats(self) -> None:
         """Test statistics retrieval."""
         um = UnivMon(max_stream_size=1000000, epsilon=0.01, delta=0.01)
-        for i in range(100):
-            um.update(f"key_{i}".encode(), 1.0)
+        um.update_batch(list(range(100)), [1.0] * 100)
         stats = um.stats()
         assert stats["num_layers"] >= 3
         assert stats["samples_processed"] == 100
@@ -624,12 +708,12 @@ class TestUnivMonRealWorld:
 
     def test_network_monitoring(self) -> None:
         """Test network monitoring with multiple metrics."""
+        np = pytest.importorskip("numpy")
         um = UnivMon(max_stream_size=100000, epsilon=0.01, delta=0.01)
-        # Simulate network traffic
-        for i in range(1000):
-            ip = f"192.168.{i // 256}.{i % 256}"
-            packet_size = 1500.0 if i % 10 == 0 else 800.0
-            um.update(ip.encode(), packet_size)
+        # Simulate network traffic from 192.168.0.0 upward
+        ips = np.uint32(0xC0A80000) + np.arange(1000, dtype=np.uint32)
+        packet_sizes = np.where(np.arange(1000) % 10 == 0, 1500.0, 800.0)
+        um.update_ipv4_many(ips, packet_sizes)
 
         # Query all metrics from ONE sketch
         total_bytes = um.estimate_l1()
@@ -639,6 +723,48 @@ class TestUnivMonRealWorld:
         assert total_bytes > 0
         assert load_balance > 0
         assert diversity >= 0.0
+        assert um.estimate_all() == (total_bytes, load_balance, diversity)
+
+    def test_update_batch_matches_update(self) -> None:
+        """Test that parallel item/value columns match per-item updates."""
+        flows = [i % 300 for i in range(1000)]
+        sizes = [1500.0 if i % 10 == 0 else 800.0 for i in range(1000)]
+
+        batched = UnivMon(max_stream_size=100000, epsilon=0.01, delta=0.01)
+        batched.update_batch(flows, sizes)
+
+        serial = UnivMon(max_stream_size=100000, epsilon=0.01, delta=0.01)
+        for flow, size in zip(flows, sizes):
+            serial.update(flow, size)
+
+        assert batched.stats() == serial.stats()
+        assert batched.estimate_l1() == serial.estimate_l1()
+        assert batched.estimate_l2() == serial.estimate_l2()
+
+        with pytest.raises(ValueError):
+            batched.update_batch([1, 2], [1.0])
+        with pytest.raises(ValueError):
+            batched.update_batch([1, 2], [1.0, -1.0])
+
+    def test_update_ipv4_matches_update(self) -> None:
+        """Test that IPv4 ints are counted as their network-order bytes."""
+        ips = [0xC0A80000 + i % 300 for i in range(1000)]
+        sizes = [1500.0 if i % 10 == 0 else 800.0 for i in range(1000)]
+
+        batched = UnivMon(max_stream_size=100000, epsilon=0.01, delta=0.01)
+        batched.update_ipv4_many(ips, sizes)
+
+        single = UnivMon(max_stream_size=100000, epsilon=0.01, delta=0.01)
+        encoded = UnivMon(max_stream_size=100000, epsilon=0.01, delta=0.01)
+        for ip, size in zip(ips, sizes):
+            single.update_ipv4(ip, size)
+            encoded.update(ip.to_bytes(4, "big"), size)
+
+        assert single.estimate_all() == encoded.estimate_all()
+        assert batched.estimate_all() == encoded.estimate_all()
+
+        with pytest.raises(OverflowError):
+            single.update_ipv4(2**32, 1.0)
 
 
 # ============================================================================
@@ -764,12 +890,14 @@ class TestLearnedBloomRealWorld:
 
     def test_ip_address_filtering(self) -> None:
         """Test IP address filtering."""
-        ips = [f"192.168.{i // 256}.{i % 256}".encode() for i in range(1000)]
-        lbf = LearnedBloomFilter(ips, fpr=0.01)
+        np = pytest.importorskip("numpy")
+        ips = np.uint32(0xC0A80000) + np.arange(1000, dtype=np.uint32)
+        lbf = LearnedBloomFilter.from_ipv4(ips, fpr=0.01)
 
         # Verify some IPs
-        assert lbf.contains(b"192.168.0.100")
-        assert lbf.contains(b"192.168.3.231")
+        assert lbf.contains_ipv4(0xC0A80064)  # 192.168.0.100
+        assert lbf.contains_ipv4(0xC0A803E7)  # 192.168.3.231
+        assert lbf.contains(bytes([192, 168, 3, 231]))
 
     def test_structured_data_patterns(self) -> None:
         """Test that LearnedBloom works well with structured data."""
@@ -811,6 +939,14 @@ class TestIntegration:
         assert vf_mem > 0
         assert lbf_mem > 0
 
+        # 64 packed Bloom filters answer a key in one pass; each filter costs
+        # one bit per word, so the whole set stays within 64x a single filter
+        packed = FlatBloofi(64, 1000, 0.01)
+        for i, key in enumerate(keys_bytes):
+            packed.insert(i % 64, key)
+        assert all(packed.contains(i % 64, key) for i, key in enumerate(keys_bytes))
+        assert packed.memory_usage() / 64 < vf_mem
+
     def test_grf_with_univmon_keys(self) -> None:
         """Test GRF with keys from UnivMon."""
         # Build UnivMon with integer keys
@@ -1,5 +1,5 @@
 use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion};
-use sketch_oxide::common::hash::{murmur3_hash, xxhash};
+use sketch_oxide::common::hash::{murmur3_hash, xxh3_hash128, xxhash};
 
 fn bench_murmur3(c: &mut Criterion) {
     let mut group = c.benchmark_group("murmur3");
@@ -29,5 +29,19 @@ fn bench_xxhash(c: &mut Criterion) {
     group.finish();
 }
 
-criterion_group!(benches, bench_murmur3, bench_xxhash);
+fn bench_xxh3_128(c: &mut Criterion) {
+    let mut group = c.benchmark_group("xxh3_128");
+
+    for size in [8, 64, 512, 4096].iter() {
+        let data: Vec<u8> = (0..*size).map(|i| i as u8).collect();
+
+        group.bench_with_input(BenchmarkId::from_parameter(size), size, |b, _| {
+            b.iter(|| xxh3_hash128(black_box(data.as_slice())));
+        });
+    }
+
+    group.finish();
+}
+
+criterion_group!(benches, bench_murmur3, bench_xxhash, bench_xxh3_128);
 criterion_main!(benches);
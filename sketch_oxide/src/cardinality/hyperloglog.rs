@@ -418,6 +418,11 @@ impl HyperLogLog {
     pub fn registers(&self) -> &[u8] {
         &self.registers
     }
+
+    /// Resets all registers to zero, keeping the register allocation
+    pub fn clear(&mut self) {
+        self.registers.fill(0);
+    }
 }
 
 impl Sketch for HyperLogLog {
@@ -5,6 +5,7 @@
 
 use std::hash::{Hash, Hasher};
 use twox_hash::XxHash64;
+use xxhash_rust::xxh3::Xxh3Default;
 
 /// MurmurHash3 32-bit implementation
 ///
@@ -104,6 +105,52 @@ pub fn xxhash(data: &[u8], seed: u64) -> u64 {
     hasher.finish()
 }
 
+/// XXH3 128-bit hash of any value implementing `Hash`
+///
+/// Hashes the value in a single pass and returns the full 128-bit digest.
+/// Sketches that need `d` row indices derive them from this one digest with
+/// [`derive_hash`] instead of re-hashing the item per row.
+///
+/// # Arguments
+/// * `value` - The value to hash
+///
+/// # Returns
+/// A 128-bit hash value
+///
+/// # Examples
+/// ```
+/// use sketch_oxide::common::hash::xxh3_hash128;
+///
+/// let hash = xxh3_hash128(&"hello world");
+/// assert_ne!(hash, 0);
+/// ```
+#[inline]
+pub fn xxh3_hash128<T: Hash + ?Sized>(value: &T) -> u128 {
+    let mut hasher = Xxh3Default::new();
+    value.hash(&mut hasher);
+    hasher.digest128()
+}
+
+/// Derive the `i`-th hash of a family from a single 128-bit hash
+///
+/// Uses the Kirsch-Mitzenmacher construction `h1 + i * h2`, which preserves
+/// the asymptotic false-positive and error guarantees of `k` independent hash
+/// functions. The second half is forced odd so that, modulo a power of two,
+/// every row maps to a distinct column sequence.
+///
+/// # Arguments
+/// * `hash` - A 128-bit hash, typically from [`xxh3_hash128`]
+/// * `i` - Index of the derived hash (e.g. the sketch row)
+///
+/// # Returns
+/// A 64-bit hash value
+#[inline(always)]
+pub fn derive_hash(hash: u128, i: usize) -> u64 {
+    let h1 = hash as u64;
+    let h2 = ((hash >> 64) as u64) | 1;
+    h1.wrapping_add((i as u64).wrapping_mul(h2))
+}
+
 /// MurmurHash3 64-bit implementation
 ///
 /// Extended version of MurmurHash3 that produces 64-bit hashes.
@@ -182,6 +229,22 @@ mod tests {
         assert!(hash > 0);
     }
 
+    #[test]
+    fn test_xxh3_hash128_deterministic() {
+        assert_eq!(xxh3_hash128(&"test"), xxh3_hash128(&"test"));
+        assert_ne!(xxh3_hash128(&"test"), xxh3_hash128(&"other"));
+    }
+
+    #[test]
+    fn test_derive_hash_distinct_rows() {
+        let hash = xxh3_hash128(&42u64);
+        let rows: Vec<u64> = (0..8).map(|i| derive_hash(hash, i) & 0xFF).collect();
+        let mut unique = rows.clone();
+        unique.sort_unstable();
+        unique.dedup();
+        assert_eq!(unique.len(), rows.len());
+    }
+
     #[test]
     fn test_hash_value_basic() {
         let hash = hash_value(&42u64, 0);
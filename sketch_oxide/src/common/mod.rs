@@ -2,6 +2,7 @@
 
 mod error;
 pub mod hash;
+pub mod simd;
 mod traits;
 mod types;
 pub mod validation;
@@ -0,0 +1,350 @@
+//! Runtime-dispatched SIMD kernels for counter arrays
+//!
+//! Sketch merges and norm computations are long, branch-free loops over flat
+//! counter tables. Each kernel here is written once as a plain Rust loop and
+//! compiled three times: a portable baseline plus AVX2 and AVX-512 variants
+//! (`#[target_feature]`), which LLVM auto-vectorizes for the wider registers.
+//!
+//! The widest variant supported by the running CPU is selected at call time
+//! via `is_x86_feature_detected!`, whose result is cached by the standard
+//! library after the first probe. A single portable binary therefore uses
+//! AVX-512 where available without requiring `-C target-cpu=native`.
+//! Non-x86 targets always use the baseline loop, which LLVM vectorizes with
+//! the target's default vector extension (e.g. NEON on aarch64).
+
+/// Expands a kernel body into baseline, AVX2 and AVX-512 variants plus a
+/// public entry point that dispatches on the detected CPU features.
+macro_rules! multiversion {
+    (
+        $(#[$meta:meta])*
+        pub fn $name:ident($($arg:ident: $ty:ty),*) $(-> $ret:ty)? $body:block
+    ) => {
+        $(#[$meta])*
+        #[inline]
+        pub fn $name($($arg: $ty),*) $(-> $ret)? {
+            #[inline(always)]
+            fn body($($arg: $ty),*) $(-> $ret)? $body
+
+            #[cfg(target_arch = "x86_64")]
+            {
+                #[target_feature(enable = "avx512f")]
+                unsafe fn avx512($($arg: $ty),*) $(-> $ret)? {
+                    body($($arg),*)
+                }
+
+                #[target_feature(enable = "avx2")]
+                unsafe fn avx2($($arg: $ty),*) $(-> $ret)? {
+                    body($($arg),*)
+                }
+
+                if std::is_x86_feature_detected!("avx512f") {
+                    // SAFETY: the CPU supports AVX-512F
+                    return unsafe { avx512($($arg),*) };
+                }
+                if std::is_x86_feature_detected!("avx2") {
+                    // SAFETY: the CPU supports AVX2
+                    return unsafe { avx2($($arg),*) };
+                }
+            }
+
+            body($($arg),*)
+        }
+    };
+}
+
+multiversion! {
+    /// Element-wise saturating addition `dst[i] = dst[i] + src[i]` for `u64` counters
+    ///
+    /// Only the common prefix of both slices is processed.
+    pub fn add_assign_saturating_u64(dst: &mut [u64], src: &[u64]) {
+        for (a, &b) in dst.iter_mut().zip(src.iter()) {
+            *a = a.saturating_add(b);
+        }
+    }
+}
+
+/// Number of `u64` counters per merge tile (32 KiB, sized to stay in L1)
+pub const MERGE_TILE: usize = 4096;
+
+multiversion! {
+    /// Element-wise saturating addition of several `u64` counter arrays into `dst`
+    ///
+    /// `dst` is processed in [`MERGE_TILE`]-sized tiles; each tile receives
+    /// every source while it is cache-resident, so the destination is read and
+    /// written once overall instead of once per source. Each source covers
+    /// only the common prefix with `dst`.
+    pub fn add_assign_saturating_u64_many(dst: &mut [u64], srcs: &[&[u64]]) {
+        for (tile_idx, tile) in dst.chunks_mut(MERGE_TILE).enumerate() {
+            let start = tile_idx * MERGE_TILE;
+            for src in srcs {
+                let src = src.get(start..).unwrap_or(&[]);
+                for (a, &b) in tile.iter_mut().zip(src.iter()) {
+                    *a = a.saturating_add(b);
+                }
+            }
+        }
+    }
+}
+
+multiversion! {
+    /// Element-wise saturating addition `dst[i] = dst[i] + src[i]` for `i64` counters
+    ///
+    /// Only the common prefix of both slices is processed.
+    pub fn add_assign_saturating_i64(dst: &mut [i64], src: &[i64]) {
+        for (a, &b) in dst.iter_mut().zip(src.iter()) {
+            *a = a.saturating_add(b);
+        }
+    }
+}
+
+multiversion! {
+    /// Sum of squares of signed counters, accumulated in `f64`
+    ///
+    /// Accumulating in floating point keeps large turnstile counters from
+    /// overflowing the intermediate sum.
+    pub fn sum_of_squares_i64(values: &[i64]) -> f64 {
+        // Four independent accumulators break the add dependency chain so the
+        // loop vectorizes without requiring reassociation of float adds.
+        let mut acc = [0.0f64; 4];
+        let chunks = values.chunks_exact(4);
+        let tail = chunks.remainder();
+        for chunk in chunks {
+            for (lane, &v) in acc.iter_mut().zip(chunk.iter()) {
+                let x = v as f64;
+                *lane += x * x;
+            }
+        }
+        let mut sum = (acc[0] + acc[1]) + (acc[2] + acc[3]);
+        for &v in tail {
+            let x = v as f64;
+            sum += x * x;
+        }
+        sum
+    }
+}
+
+multiversion! {
+    /// Dot product `Σ a[i] * b[i]` of signed counters in wrapping `i64` arithmetic
+    ///
+    /// Integer addition is associative, so LLVM splits the sum across vector
+    /// lanes without any manual accumulators. Only the common prefix of both
+    /// slices is processed.
+    pub fn dot_i64(a: &[i64], b: &[i64]) -> i64 {
+        a.iter()
+            .zip(b.iter())
+            .fold(0i64, |acc, (&x, &y)| acc.wrapping_add(x.wrapping_mul(y)))
+    }
+}
+
+multiversion! {
+    /// Element-wise minimum `dst[i] = min(dst[i], src[i])` for `u64` values
+    ///
+    /// Only the common prefix of both slices is processed.
+    pub fn min_assign_u64(dst: &mut [u64], src: &[u64]) {
+        for (a, &b) in dst.iter_mut().zip(src.iter()) {
+            *a = (*a).min(b);
+        }
+    }
+}
+
+multiversion! {
+    /// MinHash signature update: `values[i] = min(values[i], permute(x, seeds[i]))`
+    ///
+    /// Each of the `seeds.len()` hash functions is a bijection on `u64`,
+    /// `h = (x ^ s) * (s | 1); h ^ (h >> 32)`, so one base hash of the item
+    /// is spread over every permutation with a few lane-wise integer ops
+    /// instead of one full hash per permutation.
+    pub fn min_assign_permuted_u64(values: &mut [u64], seeds: &[u64], x: u64) {
+        for (value, &seed) in values.iter_mut().zip(seeds.iter()) {
+            let h = (x ^ seed).wrapping_mul(seed | 1);
+            *value = (*value).min(h ^ (h >> 32));
+        }
+    }
+}
+
+multiversion! {
+    /// Number of positions where `a[i] == b[i]`, over the common prefix
+    ///
+    /// Each comparison becomes a 0/1 lane that is summed without branches,
+    /// so the loop lowers to vector compare + subtract (4 or 8 lanes per
+    /// instruction with AVX2 / AVX-512).
+    pub fn count_equal_u64(a: &[u64], b: &[u64]) -> usize {
+        a.iter()
+            .zip(b.iter())
+            .map(|(x, y)| (x == y) as u64)
+            .sum::<u64>() as usize
+    }
+}
+
+multiversion! {
+    /// Index of the first element `< cutoff`, or `values.len()` if none
+    ///
+    /// Scans 8 lanes per step: each lane contributes one bit to a mask that
+    /// LLVM builds with a vector compare + movemask, and the first hit is
+    /// the mask's trailing-zero count. Only the per-block `mask != 0` test
+    /// branches.
+    pub fn first_less_than_u64(values: &[u64], cutoff: u64) -> usize {
+        let chunks = values.chunks_exact(8);
+        let tail = chunks.remainder();
+        for (block, chunk) in chunks.enumerate() {
+            let mut mask = 0u32;
+            for (lane, &v) in chunk.iter().enumerate() {
+                mask |= ((v < cutoff) as u32) << lane;
+            }
+            if mask != 0 {
+                return block * 8 + mask.trailing_zeros() as usize;
+            }
+        }
+        let base = values.len() - tail.len();
+        tail.iter()
+            .position(|&v| v < cutoff)
+            .map_or(values.len(), |i| base + i)
+    }
+}
+
+/// Minimum of a fixed-size group of counters via a pairwise tournament
+///
+/// Gathered Count-Min counters (one per row) are reduced in `⌈log2 N⌉`
+/// dependent steps instead of an `N - 1` long compare chain; each step is
+/// an independent lane-wise min that LLVM lowers to vector min instructions
+/// where the target has them. Returns `u64::MAX` for `N == 0`.
+#[inline(always)]
+pub fn min_reduce<const N: usize>(mut lanes: [u64; N]) -> u64 {
+    let mut len = N;
+    while len > 1 {
+        let half = len / 2;
+        let upper = len - half;
+        for i in 0..half {
+            lanes[i] = lanes[i].min(lanes[upper + i]);
+        }
+        len = upper;
+    }
+    if N == 0 {
+        u64::MAX
+    } else {
+        lanes[0]
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_add_assign_saturating_u64() {
+        let mut dst: Vec<u64> = (0..37).collect();
+        let src: Vec<u64> = (0..37).map(|i| i * 2).collect();
+        add_assign_saturating_u64(&mut dst, &src);
+        for (i, &v) in dst.iter().enumerate() {
+            assert_eq!(v, i as u64 * 3);
+        }
+
+        let mut dst = vec![u64::MAX - 1; 9];
+        add_assign_saturating_u64(&mut dst, &[5; 9]);
+        assert!(dst.iter().all(|&v| v == u64::MAX));
+    }
+
+    #[test]
+    fn test_add_assign_saturating_u64_many() {
+        let len = MERGE_TILE * 2 + 17;
+        let a: Vec<u64> = (0..len as u64).collect();
+        let b: Vec<u64> = (0..len as u64).map(|i| i * 3).collect();
+        let short = vec![1u64; MERGE_TILE + 5];
+
+        let mut fused = vec![1u64; len];
+        add_assign_saturating_u64_many(&mut fused, &[&a, &b, &short]);
+
+        let mut sequential = vec![1u64; len];
+        add_assign_saturating_u64(&mut sequential, &a);
+        add_assign_saturating_u64(&mut sequential, &b);
+        add_assign_saturating_u64(&mut sequential, &short);
+
+        assert_eq!(fused, sequential);
+    }
+
+    #[test]
+    fn test_add_assign_saturating_i64() {
+        let mut dst = vec![10i64, -10, i64::MAX, i64::MIN, 0];
+        add_assign_saturating_i64(&mut dst, &[-5, 5, 1, -1, 7]);
+        assert_eq!(dst, vec![5, -5, i64::MAX, i64::MIN, 7]);
+    }
+
+    #[test]
+    fn test_min_assign_u64() {
+        let mut dst: Vec<u64> = (0..37).collect();
+        let src: Vec<u64> = (0..37).rev().collect();
+        min_assign_u64(&mut dst, &src);
+        for (i, &v) in dst.iter().enumerate() {
+            assert_eq!(v, (i as u64).min(36 - i as u64));
+        }
+    }
+
+    #[test]
+    fn test_min_assign_permuted_u64() {
+        let seeds: Vec<u64> = (1..=19u64)
+            .map(|i| i.wrapping_mul(0x9e37_79b9_7f4a_7c15))
+            .collect();
+        let mut values = vec![u64::MAX; seeds.len()];
+        for x in 0..50u64 {
+            min_assign_permuted_u64(&mut values, &seeds, x);
+        }
+        for (i, &seed) in seeds.iter().enumerate() {
+            let expected = (0..50u64)
+                .map(|x| {
+                    let h = (x ^ seed).wrapping_mul(seed | 1);
+                    h ^ (h >> 32)
+                })
+                .min()
+                .unwrap();
+            assert_eq!(values[i], expected);
+        }
+    }
+
+    #[test]
+    fn test_count_equal_u64() {
+        let a: Vec<u64> = (0..131).collect();
+        let b: Vec<u64> = (0..131)
+            .map(|i| if i % 3 == 0 { i } else { i + 1 })
+            .collect();
+        assert_eq!(count_equal_u64(&a, &b), 44);
+        assert_eq!(count_equal_u64(&a, &a), 131);
+        assert_eq!(count_equal_u64(&a, &b[..10]), 4);
+    }
+
+    #[test]
+    fn test_first_less_than_u64() {
+        let values: Vec<u64> = (0..37).rev().collect();
+        assert_eq!(first_less_than_u64(&values, 100), 0);
+        assert_eq!(first_less_than_u64(&values, 30), 7);
+        assert_eq!(first_less_than_u64(&values, 2), 35);
+        assert_eq!(first_less_than_u64(&values, 0), 37);
+        assert_eq!(first_less_than_u64(&[], 5), 0);
+    }
+
+    #[test]
+    fn test_min_reduce() {
+        assert_eq!(min_reduce([]), u64::MAX);
+        assert_eq!(min_reduce([7]), 7);
+        assert_eq!(min_reduce([9, 4, 8, 6, 5]), 4);
+        assert_eq!(min_reduce([9, 8, 7, 6, 5, 4, 3]), 3);
+        assert_eq!(min_reduce([3, 8, 7, 6, 5, 4, 9, 10]), 3);
+    }
+
+    #[test]
+    fn test_sum_of_squares_i64() {
+        let values: Vec<i64> = (-20..23).collect();
+        let expected: f64 = values.iter().map(|&v| (v * v) as f64).sum();
+        assert_eq!(sum_of_squares_i64(&values), expected);
+        assert_eq!(sum_of_squares_i64(&[]), 0.0);
+    }
+
+    #[test]
+    fn test_dot_i64() {
+        let a: Vec<i64> = (-20..23).collect();
+        let b: Vec<i64> = (0..43).map(|i| 7 - i).collect();
+        let expected: i64 = a.iter().zip(&b).map(|(x, y)| x * y).sum();
+        assert_eq!(dot_i64(&a, &b), expected);
+        assert_eq!(dot_i64(&a, &b[..5]), dot_i64(&a[..5], &b[..5]));
+        assert_eq!(dot_i64(&[], &[]), 0);
+    }
+}
@@ -8,6 +8,9 @@ pub const MAX_CAPACITY: u64 = (1u64 << 31) - 1;
 /// Maximum serialized sketch size (256MB) to prevent resource exhaustion
 pub const MAX_BYTE_SIZE: usize = 256 * 1024 * 1024; // 256MB
 
+/// Bit offset of the format version byte in a tagged header word
+const FORMAT_VERSION_SHIFT: u32 = 56;
+
 /// Validate that precision is within acceptable range (4-18)
 /// Typically used for HyperLogLog, UltraLogLog, and similar cardinality sketches
 pub fn validate_precision(precision: u8) -> Result<()> {
@@ -153,6 +156,37 @@ pub fn validate_bloom_parameters(n: u64, m: u64, k: u32) -> Result<()> {
     Ok(())
 }
 
+/// Store a serialization format version in the top byte of a header word
+///
+/// The word must fit in 56 bits (a width, count or size field).
+pub fn tag_format_version(word: u64, version: u8) -> u64 {
+    debug_assert!(word >> FORMAT_VERSION_SHIFT == 0);
+    word | (u64::from(version) << FORMAT_VERSION_SHIFT)
+}
+
+/// Validate and strip the format version written by `tag_format_version`
+///
+/// Blobs from releases up to 0.1.6 carry no version (a zero top byte) and
+/// are rejected along with any version other than `expected`.
+pub fn validate_format_version(word: u64, expected: u8, sketch: &str) -> Result<u64> {
+    let version = (word >> FORMAT_VERSION_SHIFT) as u8;
+    if version != expected {
+        return Err(SketchError::DeserializationError(if version == 0 {
+            format!(
+                "legacy {} format (0.1.6 or earlier) is no longer supported: \
+                 its hashing changed, rebuild the sketch from the source data",
+                sketch
+            )
+        } else {
+            format!(
+                "unsupported {} format version {} (expected {})",
+                sketch, version, expected
+            )
+        }));
+    }
+    Ok(word & ((1 << FORMAT_VERSION_SHIFT) - 1))
+}
+
 /// Validate CPC Sketch lg_k parameter
 pub fn validate_lg_k(lg_k: u8) -> Result<()> {
     if !(4..=26).contains(&lg_k) {
@@ -240,4 +274,18 @@ mod tests {
         assert!(validate_bloom_parameters(1000, 0, 7).is_err()); // m = 0
         assert!(validate_bloom_parameters(1000, 10000, 0).is_err()); // k = 0
     }
+
+    #[test]
+    fn test_format_version_roundtrip() {
+        let word = tag_format_version(1 << 20, 1);
+        assert_eq!(validate_format_version(word, 1, "Test").unwrap(), 1 << 20);
+    }
+
+    #[test]
+    fn test_format_version_mismatch() {
+        // Untagged words come from releases before versioning
+        let legacy = validate_format_version(1 << 20, 1, "Test").unwrap_err();
+        assert!(legacy.to_string().contains("legacy Test format"));
+        assert!(validate_format_version(tag_format_version(4, 2), 1, "Test").is_err());
+    }
 }
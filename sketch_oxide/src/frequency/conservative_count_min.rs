@@ -42,8 +42,8 @@
 //! assert!(cms.estimate(&"banana") >= 1);
 //! ```
 
-use crate::common::hash::hash_value;
-use crate::common::SketchError;
+use crate::common::hash::{derive_hash, xxh3_hash128};
+use crate::common::{validation, SketchError};
 use std::hash::Hash;
 
 /// Conservative Update Count-Min Sketch
@@ -71,10 +71,8 @@ pub struct ConservativeCountMin {
     width: usize,
     /// Number of rows (hash functions): d = ⌈ln(1/δ)⌉
     depth: usize,
-    /// 2D table of counters: depth × width
-    table: Vec<Vec<u64>>,
-    /// Independent hash seeds for each row
-    hash_seeds: Vec<u32>,
+    /// Flat table of counters: depth × width (row-major)
+    table: Vec<u64>,
     /// Epsilon parameter (error bound)
     epsilon: f64,
     /// Delta parameter (failure probability)
@@ -83,6 +81,14 @@ pub struct ConservativeCountMin {
     total_count: u64,
 }
 
+/// Serialization format version, stored in the top byte of the width
+///
+/// Version 1 derives row columns from one XXH3-128 hash and drops the
+/// per-row seeds. Blobs from 0.1.6 and earlier hashed rows with seeded
+/// xxh64, so their counters sit in other cells and estimates read from them
+/// could fall below the true count; `from_bytes` rejects them.
+const FORMAT_VERSION: u8 = 1;
+
 impl ConservativeCountMin {
     /// Creates a new Conservative Update Count-Min Sketch
     ///
@@ -128,17 +134,12 @@ impl ConservativeCountMin {
         let depth = (1.0 / delta).ln().ceil() as usize;
         let depth = depth.max(1);
 
-        let table = vec![vec![0u64; width]; depth];
-
-        let hash_seeds: Vec<u32> = (0..depth)
-            .map(|i| (i as u32).wrapping_mul(0x9e3779b9))
-            .collect();
+        let table = vec![0u64; width * depth];
 
         Ok(ConservativeCountMin {
             width,
             depth,
             table,
-            hash_seeds,
             epsilon,
             delta,
             total_count: 0,
@@ -168,11 +169,7 @@ impl ConservativeCountMin {
             });
         }
 
-        let table = vec![vec![0u64; width]; depth];
-
-        let hash_seeds: Vec<u32> = (0..depth)
-            .map(|i| (i as u32).wrapping_mul(0x9e3779b9))
-            .collect();
+        let table = vec![0u64; width * depth];
 
         // Calculate theoretical epsilon and delta from dimensions
         const E: f64 = std::f64::consts::E;
@@ -183,7 +180,6 @@ impl ConservativeCountMin {
             width,
             depth,
             table,
-            hash_seeds,
             epsilon,
             delta,
             total_count: 0,
@@ -225,34 +221,39 @@ impl ConservativeCountMin {
 
         self.total_count += count;
 
-        // First pass: find current minimum estimate
-        let indices: Vec<usize> = self
-            .hash_seeds
-            .iter()
-            .map(|&seed| {
-                let hash = hash_value(item, seed);
-                (hash as usize) % self.width
-            })
-            .collect();
+        // Hash once; row positions are re-derived cheaply in each pass
+        let hash = xxh3_hash128(item);
 
-        let current_min = indices
-            .iter()
-            .enumerate()
-            .map(|(row, &col)| self.table[row][col])
-            .min()
-            .unwrap_or(0);
+        // First pass: find current minimum estimate
+        let current_min = self.min_hashed(hash);
 
         // Second pass: conservative update
-        // Set each counter to max(current_value, current_min + count)
+        // Set each counter to max(current_value, current_min + count). The
+        // unconditional max leaves rows above the new value untouched without
+        // a data-dependent branch per row.
         let new_value = current_min.saturating_add(count);
 
-        for (row, &col) in indices.iter().enumerate() {
-            if self.table[row][col] < new_value {
-                self.table[row][col] = new_value;
-            }
+        for row in 0..self.depth {
+            let idx = self.index(hash, row);
+            let counter = &mut self.table[idx];
+            *counter = (*counter).max(new_value);
         }
     }
 
+    /// Flat table index of `row` for a pre-computed item hash
+    #[inline(always)]
+    fn index(&self, hash: u128, row: usize) -> usize {
+        row * self.width + (derive_hash(hash, row) % self.width as u64) as usize
+    }
+
+    /// Minimum of the d counters selected by a pre-computed item hash
+    #[inline]
+    fn min_hashed(&self, hash: u128) -> u64 {
+        (0..self.depth)
+            .map(|row| self.table[self.index(hash, row)])
+            .fold(u64::MAX, u64::min)
+    }
+
     /// Estimates the frequency of an item
     ///
     /// # Arguments
@@ -263,16 +264,7 @@ impl ConservativeCountMin {
     ///
     /// Estimated frequency (always >= true frequency)
     pub fn estimate<T: Hash>(&self, item: &T) -> u64 {
-        self.hash_seeds
-            .iter()
-            .enumerate()
-            .map(|(row, &seed)| {
-                let hash = hash_value(item, seed);
-                let col = (hash as usize) % self.width;
-                self.table[row][col]
-            })
-            .min()
-            .unwrap_or(0)
+        self.min_hashed(xxh3_hash128(item))
     }
 
     /// Returns the width of the table
@@ -302,9 +294,7 @@ impl ConservativeCountMin {
 
     /// Clears all counters
     pub fn clear(&mut self) {
-        for row in &mut self.table {
-            row.fill(0);
-        }
+        self.table.fill(0);
         self.total_count = 0;
     }
 
@@ -317,22 +307,18 @@ impl ConservativeCountMin {
 
     /// Serializes the sketch to bytes
     pub fn to_bytes(&self) -> Vec<u8> {
-        let mut bytes = Vec::new();
+        // Format: [version:1|width:7][depth:8][epsilon:8][delta:8][total:8][table]
+        let mut bytes = Vec::with_capacity(40 + self.table.len() * 8);
 
-        bytes.extend_from_slice(&(self.width as u64).to_le_bytes());
+        let width = validation::tag_format_version(self.width as u64, FORMAT_VERSION);
+        bytes.extend_from_slice(&width.to_le_bytes());
         bytes.extend_from_slice(&(self.depth as u64).to_le_bytes());
         bytes.extend_from_slice(&self.epsilon.to_le_bytes());
         bytes.extend_from_slice(&self.delta.to_le_bytes());
         bytes.extend_from_slice(&self.total_count.to_le_bytes());
 
-        for seed in &self.hash_seeds {
-            bytes.extend_from_slice(&seed.to_le_bytes());
-        }
-
-        for row in &self.table {
-            for &val in row {
-                bytes.extend_from_slice(&val.to_le_bytes());
-            }
+        for &val in &self.table {
+            bytes.extend_from_slice(&val.to_le_bytes());
         }
 
         bytes
@@ -346,43 +332,43 @@ impl ConservativeCountMin {
             ));
         }
 
-        let width = u64::from_le_bytes(bytes[0..8].try_into().unwrap()) as usize;
+        let width = u64::from_le_bytes(bytes[0..8].try_into().unwrap());
+        let width =
+            validation::validate_format_version(width, FORMAT_VERSION, "ConservativeCountMin")?
+                as usize;
         let depth = u64::from_le_bytes(bytes[8..16].try_into().unwrap()) as usize;
         let epsilon = f64::from_le_bytes(bytes[16..24].try_into().unwrap());
         let delta = f64::from_le_bytes(bytes[24..32].try_into().unwrap());
         let total_count = u64::from_le_bytes(bytes[32..40].try_into().unwrap());
 
-        let expected_len = 40 + depth * 4 + width * depth * 8;
-        if bytes.len() < expected_len {
-            return Err(SketchError::DeserializationError(format!(
-                "Expected {} bytes, got {}",
-                expected_len,
-                bytes.len()
-            )));
-        }
-
-        let mut offset = 40;
-        let mut hash_seeds = Vec::with_capacity(depth);
-        for _ in 0..depth {
-            hash_seeds.push(u32::from_le_bytes(
-                bytes[offset..offset + 4].try_into().unwrap(),
+        if width == 0 || depth == 0 {
+            return Err(SketchError::DeserializationError(
+                "width and depth must be > 0".to_string(),
             ));
-            offset += 4;
-        }
-
-        let mut table = vec![vec![0u64; width]; depth];
-        for row in &mut table {
-            for val in row.iter_mut() {
-                *val = u64::from_le_bytes(bytes[offset..offset + 8].try_into().unwrap());
-                offset += 8;
-            }
         }
+        // Checked so a hostile header cannot overflow the size computation
+        let table_bytes = width
+            .checked_mul(depth)
+            .and_then(|len| len.checked_mul(8))
+            .filter(|&table_bytes| table_bytes <= bytes.len() - 40)
+            .ok_or_else(|| {
+                SketchError::DeserializationError(format!(
+                    "Expected a {}x{} table, got {} bytes",
+                    width,
+                    depth,
+                    bytes.len()
+                ))
+            })?;
+
+        let table = bytes[40..40 + table_bytes]
+            .chunks_exact(8)
+            .map(|chunk| u64::from_le_bytes(chunk.try_into().unwrap()))
+            .collect();
 
         Ok(ConservativeCountMin {
             width,
             depth,
             table,
-            hash_seeds,
             epsilon,
             delta,
             total_count,
@@ -408,16 +394,9 @@ impl ConservativeCountMin {
             });
         }
 
-        for (row_idx, (self_row, other_row)) in
-            self.table.iter_mut().zip(other.table.iter()).enumerate()
-        {
-            for (col_idx, (self_val, &other_val)) in
-                self_row.iter_mut().zip(other_row.iter()).enumerate()
-            {
-                // Conservative merge: take maximum
-                *self_val = (*self_val).max(other_val);
-                let _ = (row_idx, col_idx); // Silence unused variable warning
-            }
+        // Conservative merge: take maximum
+        for (self_val, &other_val) in self.table.iter_mut().zip(other.table.iter()) {
+            *self_val = (*self_val).max(other_val);
         }
 
         self.total_count += other.total_count;
@@ -518,6 +497,26 @@ mod tests {
         assert_eq!(cms.estimate(&"banana"), restored.estimate(&"banana"));
     }
 
+    #[test]
+    fn test_deserialize_rejects_legacy_format() {
+        // ConservativeCountMin::new(0.9, 0.9) updated with "apple" twice,
+        // serialized by the 0.1.6 release (with per-row seeds)
+        let legacy: [u8; 76] = [
+            4, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 205, 204, 204, 204, 204, 204, 236, 63,
+            205, 204, 204, 204, 204, 204, 236, 63, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        ];
+
+        match ConservativeCountMin::from_bytes(&legacy) {
+            Err(SketchError::DeserializationError(msg)) => assert!(msg.contains("legacy")),
+            other => panic!("expected legacy format error, got {other:?}"),
+        }
+
+        // The current layout is the header plus the table, with no seeds
+        let cms = ConservativeCountMin::new(0.9, 0.9).unwrap();
+        assert_eq!(cms.to_bytes().len(), 40 + cms.width() * cms.depth() * 8);
+    }
+
     #[test]
     fn test_merge() {
         let mut cms1 = ConservativeCountMin::new(0.01, 0.01).unwrap();
@@ -8,7 +8,8 @@
 //! - Time: O(ln(1/δ)) per operation
 //!
 //! # Optimizations
-//! - **Single-hash-derive pattern**: Hash item once, derive d positions by mixing state
+//! - **Single-hash-derive pattern**: Hash item once with XXH3-128, derive d positions
+//!   via `h1 + i * h2` (Kirsch-Mitzenmacher)
 //! - **Power-of-2 width with bitmask**: Use `& mask` instead of `% width`
 //! - **Flat table layout**: Better cache locality than Vec<Vec<>>
 //!
@@ -22,9 +23,9 @@
 //! - Database query optimization
 //! - Real-time analytics systems
 
-use crate::common::{validation, Mergeable, Sketch, SketchError};
-use std::hash::{Hash, Hasher};
-use twox_hash::XxHash64;
+use crate::common::hash::{derive_hash, xxh3_hash128};
+use crate::common::{simd, validation, Mergeable, Sketch, SketchError};
+use std::hash::Hash;
 
 /// Count-Min Sketch for frequency estimation
 ///
@@ -94,37 +95,9 @@ impl CountMinSketch {
     /// let cms = CountMinSketch::new(0.01, 0.01).unwrap();
     /// ```
     pub fn new(epsilon: f64, delta: f64) -> Result<Self, SketchError> {
-        // Validate epsilon: must be in (0, 1)
-        if epsilon <= 0.0 || epsilon >= 1.0 {
-            return Err(SketchError::InvalidParameter {
-                param: "epsilon".to_string(),
-                value: epsilon.to_string(),
-                constraint: "must be in (0, 1)".to_string(),
-            });
-        }
-
-        // Validate delta: must be in (0, 1)
-        if delta <= 0.0 || delta >= 1.0 {
-            return Err(SketchError::InvalidParameter {
-                param: "delta".to_string(),
-                value: delta.to_string(),
-                constraint: "must be in (0, 1)".to_string(),
-            });
-        }
-
-        // Calculate dimensions based on practical bounds
-        // Width: w = ⌈2/ε⌉, then round up to power of 2
-        // Using 2/ε instead of e/ε gives ~26% smaller tables with similar guarantees
-        let width_min = (2.0 / epsilon).ceil() as usize;
-        let width = width_min.next_power_of_two(); // Round up to power of 2
+        let (width, depth) = dimensions(epsilon, delta)?;
         let mask = width - 1; // Bitmask for fast modulo
 
-        // Depth: d = ⌈ln(1/δ)⌉
-        let depth = (1.0 / delta).ln().ceil() as usize;
-
-        // Ensure minimum dimensions
-        let depth = depth.max(1);
-
         // Initialize flat table with zeros (better cache locality)
         let table = vec![0u64; depth * width];
 
@@ -158,29 +131,9 @@ impl CountMinSketch {
     /// ```
     #[inline]
     pub fn update<T: Hash>(&mut self, item: &T) {
-        // Hash item once
-        let mut hasher = XxHash64::with_seed(0);
-        item.hash(&mut hasher);
-
-        let width = self.width;
-        let mask = self.mask;
-        let depth = self.depth;
-
-        // Derive d positions from single hash
-        for row_idx in 0..depth {
-            let hash = hasher.finish();
-            let col_idx = (hash as usize) & mask;
-            let idx = row_idx * width + col_idx;
-
-            // SAFETY: idx is always in bounds due to mask operation
-            unsafe {
-                *self.table.get_unchecked_mut(idx) =
-                    self.table.get_unchecked(idx).saturating_add(1);
-            }
-
-            // Mix state for next row
-            hasher.write(&[0x7B]);
-        }
+        // Hash item once, derive d positions from it
+        let hash = xxh3_hash128(item);
+        self.add_hashed(hash, 1);
     }
 
     /// Estimate the frequency of an item
@@ -215,28 +168,9 @@ impl CountMinSketch {
     /// ```
     #[inline]
     pub fn estimate<T: Hash>(&self, item: &T) -> u64 {
-        // Hash item once
-        let mut hasher = XxHash64::with_seed(0);
-        item.hash(&mut hasher);
-
-        let width = self.width;
-        let mask = self.mask;
-        let depth = self.depth;
-        let mut min_count = u64::MAX;
-
-        // Derive d positions from single hash
-        for row_idx in 0..depth {
-            let hash = hasher.finish();
-            let col_idx = (hash as usize) & mask;
-            let idx = row_idx * width + col_idx;
-
-            // SAFETY: idx is always in bounds due to mask operation
-            let count = unsafe { *self.table.get_unchecked(idx) };
-            min_count = min_count.min(count);
-
-            // Mix state for next row
-            hasher.write(&[0x7B]);
-        }
+        // Hash item once, derive d positions from it
+        let hash = xxh3_hash128(item);
+        let min_count = self.min_hashed(hash);
 
         // If all counters are still u64::MAX, the sketch is empty
         if min_count == u64::MAX {
@@ -246,6 +180,32 @@ impl CountMinSketch {
         }
     }
 
+    /// Add `count` to the d counters selected by a pre-computed item hash
+    ///
+    /// Common table shapes are routed to kernels whose width and depth are
+    /// compile-time constants, so the row loop fully unrolls and the column
+    /// mask becomes an immediate.
+    #[inline]
+    fn add_hashed(&mut self, hash: u128, count: u64) {
+        match (self.width, self.depth) {
+            // epsilon = 0.01, delta = 0.01
+            (256, 5) => add_fixed::<256, 5>(&mut self.table, hash, count),
+            // epsilon = 0.001, delta = 0.001
+            (2048, 7) => add_fixed::<2048, 7>(&mut self.table, hash, count),
+            (width, depth) => add_dyn(&mut self.table, width, self.mask, depth, hash, count),
+        }
+    }
+
+    /// Minimum of the d counters selected by a pre-computed item hash
+    #[inline]
+    fn min_hashed(&self, hash: u128) -> u64 {
+        match (self.width, self.depth) {
+            (256, 5) => min_fixed::<256, 5>(&self.table, hash),
+            (2048, 7) => min_fixed::<2048, 7>(&self.table, hash),
+            (width, depth) => min_dyn(&self.table, width, self.mask, depth, hash),
+        }
+    }
+
     /// Get the width of the sketch
     ///
     /// # Returns
@@ -281,6 +241,112 @@ impl CountMinSketch {
     pub fn delta(&self) -> f64 {
         self.delta
     }
+
+    /// Resets all counters to zero, keeping the table allocation
+    pub fn clear(&mut self) {
+        self.table.fill(0);
+    }
+}
+
+/// Table shape `(width, depth)` for the given error bounds
+///
+/// Shared by every sketch laid out as a Count-Min table so that sketches built
+/// with the same `epsilon`/`delta` stay merge-compatible.
+pub(crate) fn dimensions(epsilon: f64, delta: f64) -> Result<(usize, usize), SketchError> {
+    // Validate epsilon: must be in (0, 1)
+    if epsilon <= 0.0 || epsilon >= 1.0 {
+        return Err(SketchError::InvalidParameter {
+            param: "epsilon".to_string(),
+            value: epsilon.to_string(),
+            constraint: "must be in (0, 1)".to_string(),
+        });
+    }
+
+    // Validate delta: must be in (0, 1)
+    if delta <= 0.0 || delta >= 1.0 {
+        return Err(SketchError::InvalidParameter {
+            param: "delta".to_string(),
+            value: delta.to_string(),
+            constraint: "must be in (0, 1)".to_string(),
+        });
+    }
+
+    // Calculate dimensions based on practical bounds
+    // Width: w = ⌈2/ε⌉, then round up to power of 2
+    // Using 2/ε instead of e/ε gives ~26% smaller tables with similar guarantees
+    let width_min = (2.0 / epsilon).ceil() as usize;
+    let width = width_min.next_power_of_two(); // Round up to power of 2
+
+    // Depth: d = ⌈ln(1/δ)⌉
+    let depth = (1.0 / delta).ln().ceil() as usize;
+
+    // Ensure minimum dimensions
+    let depth = depth.max(1);
+
+    Ok((width, depth))
+}
+
+/// Column of `row_idx` for a power-of-two width (`mask = width - 1`)
+#[inline(always)]
+pub(crate) fn column(hash: u128, row_idx: usize, mask: usize) -> usize {
+    (derive_hash(hash, row_idx) as usize) & mask
+}
+
+/// Row-update kernel for a table whose shape is known at compile time
+///
+/// `W` must be a power of two and `table.len()` must equal `W * D`.
+#[inline(always)]
+fn add_fixed<const W: usize, const D: usize>(table: &mut [u64], hash: u128, count: u64) {
+    debug_assert_eq!(table.len(), W * D);
+    for row_idx in 0..D {
+        let idx = row_idx * W + column(hash, row_idx, W - 1);
+        // SAFETY: idx < W * D == table.len()
+        unsafe {
+            let counter = table.get_unchecked_mut(idx);
+            *counter = counter.saturating_add(count);
+        }
+    }
+}
+
+/// Row-query kernel for a table whose shape is known at compile time
+#[inline(always)]
+fn min_fixed<const W: usize, const D: usize>(table: &[u64], hash: u128) -> u64 {
+    debug_assert_eq!(table.len(), W * D);
+    // Gather one counter per row, then reduce with a tournament min
+    let mut counters = [0u64; D];
+    for (row_idx, counter) in counters.iter_mut().enumerate() {
+        let idx = row_idx * W + column(hash, row_idx, W - 1);
+        // SAFETY: idx < W * D == table.len()
+        *counter = unsafe { *table.get_unchecked(idx) };
+    }
+    simd::min_reduce(counters)
+}
+
+/// Row-update kernel for arbitrary (power-of-two width) table shapes
+#[inline(always)]
+fn add_dyn(table: &mut [u64], width: usize, mask: usize, depth: usize, hash: u128, count: u64) {
+    debug_assert_eq!(table.len(), width * depth);
+    for row_idx in 0..depth {
+        let idx = row_idx * width + column(hash, row_idx, mask);
+        // SAFETY: idx is always in bounds due to mask operation
+        unsafe {
+            let counter = table.get_unchecked_mut(idx);
+            *counter = counter.saturating_add(count);
+        }
+    }
+}
+
+/// Row-query kernel for arbitrary (power-of-two width) table shapes
+#[inline(always)]
+fn min_dyn(table: &[u64], width: usize, mask: usize, depth: usize, hash: u128) -> u64 {
+    debug_assert_eq!(table.len(), width * depth);
+    let mut min_count = u64::MAX;
+    for row_idx in 0..depth {
+        let idx = row_idx * width + column(hash, row_idx, mask);
+        // SAFETY: idx is always in bounds due to mask operation
+        min_count = min_count.min(unsafe { *table.get_unchecked(idx) });
+    }
+    min_count
 }
 
 impl Sketch for CountMinSketch {
@@ -310,11 +376,12 @@ impl Sketch for CountMinSketch {
 
     /// Serialize the sketch to bytes
     fn serialize(&self) -> Vec<u8> {
-        // Format: [width:8][depth:8][epsilon:8][delta:8][table]
+        // Format: [version:1|width:7][depth:8][epsilon:8][delta:8][table]
         let mut bytes = Vec::new();
 
-        // Dimensions
-        bytes.extend_from_slice(&self.width.to_le_bytes());
+        // Dimensions, with the format version in the top byte of the width
+        let width = validation::tag_format_version(self.width as u64, FORMAT_VERSION);
+        bytes.extend_from_slice(&width.to_le_bytes());
         bytes.extend_from_slice(&self.depth.to_le_bytes());
 
         // Parameters
@@ -338,11 +405,13 @@ impl Sketch for CountMinSketch {
         let mut offset = 0;
 
         // Read dimensions
-        let width = usize::from_le_bytes(
+        let width = u64::from_le_bytes(
             bytes[offset..offset + 8]
                 .try_into()
                 .map_err(|_| SketchError::DeserializationError("invalid width".to_string()))?,
         );
+        let width = validation::validate_format_version(width, FORMAT_VERSION, "Count-Min")?;
+        let width = width as usize;
         offset += 8;
 
         let depth = usize::from_le_bytes(
@@ -352,8 +421,12 @@ impl Sketch for CountMinSketch {
         );
         offset += 8;
 
-        // Validate width and depth dimensions
-        validation::validate_width_depth(width as u32, depth as u32)?;
+        // Validate width and depth dimensions (saturating, so oversized
+        // values fail the bound instead of truncating into it)
+        validation::validate_width_depth(
+            u32::try_from(width).unwrap_or(u32::MAX),
+            u32::try_from(depth).unwrap_or(u32::MAX),
+        )?;
 
         // Read parameters
         let epsilon = f64::from_le_bytes(
@@ -385,16 +458,11 @@ impl Sketch for CountMinSketch {
             ));
         }
 
-        let mut table = Vec::with_capacity(depth * width);
-        for _ in 0..(depth * width) {
-            let count = u64::from_le_bytes(
-                bytes[offset..offset + 8]
-                    .try_into()
-                    .map_err(|_| SketchError::DeserializationError("invalid count".to_string()))?,
-            );
-            table.push(count);
-            offset += 8;
-        }
+        // Exact 8-byte chunks avoid a bounds check and error path per counter
+        let table: Vec<u64> = bytes[offset..offset + expected_table_size]
+            .chunks_exact(8)
+            .map(|chunk| u64::from_le_bytes(chunk.try_into().unwrap()))
+            .collect();
 
         Ok(CountMinSketch {
             width,
@@ -407,6 +475,13 @@ impl Sketch for CountMinSketch {
     }
 }
 
+/// Serialization format version, stored in the top byte of the width
+///
+/// Version 1 derives row columns from one XXH3-128 hash. Blobs from 0.1.6
+/// and earlier hashed rows with XxHash64, so their counters sit in other
+/// cells and `deserialize` rejects them rather than misestimating.
+const FORMAT_VERSION: u8 = 1;
+
 impl Mergeable for CountMinSketch {
     /// Merge another Count-Min Sketch into this one
     ///
@@ -443,6 +518,53 @@ impl Mergeable for CountMinSketch {
     /// assert!(cms1.estimate(&"item") >= 2);
     /// ```
     fn merge(&mut self, other: &Self) -> Result<(), SketchError> {
+        self.check_compatible(other)?;
+
+        // Element-wise addition of all counters
+        simd::add_assign_saturating_u64(&mut self.table, &other.table);
+
+        Ok(())
+    }
+}
+
+impl CountMinSketch {
+    /// Merge several sketches into this one in a single pass
+    ///
+    /// Equivalent to calling [`Mergeable::merge`] once per sketch, but the
+    /// destination table is walked once in L1-sized tiles and every source
+    /// is added into a tile while it is cache-resident, instead of streaming
+    /// the whole destination once per source.
+    ///
+    /// # Errors
+    /// Returns `IncompatibleSketches` if any sketch has a different width or
+    /// depth; in that case this sketch is left unchanged.
+    ///
+    /// # Examples
+    /// ```
+    /// use sketch_oxide::frequency::CountMinSketch;
+    ///
+    /// let mut total = CountMinSketch::new(0.01, 0.01).unwrap();
+    /// let mut a = CountMinSketch::new(0.01, 0.01).unwrap();
+    /// let mut b = CountMinSketch::new(0.01, 0.01).unwrap();
+    /// a.update(&"item");
+    /// b.update(&"item");
+    ///
+    /// total.merge_many(&[&a, &b]).unwrap();
+    /// assert!(total.estimate(&"item") >= 2);
+    /// ```
+    pub fn merge_many(&mut self, others: &[&CountMinSketch]) -> Result<(), SketchError> {
+        for other in others {
+            self.check_compatible(other)?;
+        }
+
+        let sources: Vec<&[u64]> = others.iter().map(|other| other.table.as_slice()).collect();
+        simd::add_assign_saturating_u64_many(&mut self.table, &sources);
+
+        Ok(())
+    }
+
+    /// Verify that `other` has the same table shape as this sketch
+    fn check_compatible(&self, other: &Self) -> Result<(), SketchError> {
         // Verify compatibility: width must match (same epsilon)
         if self.width != other.width {
             return Err(SketchError::IncompatibleSketches {
@@ -463,11 +585,6 @@ impl Mergeable for CountMinSketch {
             });
         }
 
-        // Element-wise addition of all counters
-        for (a, &b) in self.table.iter_mut().zip(other.table.iter()) {
-            *a = a.saturating_add(b);
-        }
-
         Ok(())
     }
 }
@@ -528,6 +645,73 @@ mod tests {
         assert!(cms1.estimate(&"a") >= 2);
     }
 
+    #[test]
+    fn test_fixed_shape_kernels_match_dynamic() {
+        let mut fixed = vec![0u64; 256 * 5];
+        let mut dynamic = vec![0u64; 256 * 5];
+
+        for i in 0..1000u64 {
+            let hash = xxh3_hash128(&(i % 37));
+            add_fixed::<256, 5>(&mut fixed, hash, 1);
+            add_dyn(&mut dynamic, 256, 255, 5, hash, 1);
+        }
+
+        assert_eq!(fixed, dynamic);
+        for i in 0..37u64 {
+            let hash = xxh3_hash128(&i);
+            assert_eq!(
+                min_fixed::<256, 5>(&fixed, hash),
+                min_dyn(&dynamic, 256, 255, 5, hash)
+            );
+        }
+    }
+
+    #[test]
+    fn test_high_accuracy_shape_uses_fixed_kernel() {
+        let mut cms = CountMinSketch::new(0.001, 0.001).unwrap();
+        assert_eq!((cms.width(), cms.depth()), (2048, 7));
+
+        for _ in 0..10 {
+            cms.update(&"item");
+        }
+        assert!(cms.estimate(&"item") >= 10);
+        assert_eq!(cms.estimate(&"missing"), 0);
+    }
+
+    #[test]
+    fn test_merge_many_matches_sequential_merge() {
+        let mut sources = Vec::new();
+        for s in 0..4u64 {
+            let mut cms = CountMinSketch::new(0.001, 0.001).unwrap();
+            for i in 0..500u64 {
+                cms.update(&(i * (s + 1)));
+            }
+            sources.push(cms);
+        }
+
+        let mut sequential = CountMinSketch::new(0.001, 0.001).unwrap();
+        for cms in &sources {
+            sequential.merge(cms).unwrap();
+        }
+
+        let mut fused = CountMinSketch::new(0.001, 0.001).unwrap();
+        let refs: Vec<&CountMinSketch> = sources.iter().collect();
+        fused.merge_many(&refs).unwrap();
+
+        assert_eq!(fused.table, sequential.table);
+    }
+
+    #[test]
+    fn test_merge_many_incompatible_leaves_sketch_unchanged() {
+        let mut cms = CountMinSketch::new(0.01, 0.01).unwrap();
+        let mut same = CountMinSketch::new(0.01, 0.01).unwrap();
+        let other = CountMinSketch::new(0.001, 0.01).unwrap();
+        same.update(&"a");
+
+        assert!(cms.merge_many(&[&same, &other]).is_err());
+        assert_eq!(cms.estimate(&"a"), 0);
+    }
+
     #[test]
     fn test_merge_incompatible() {
         let mut cms1 = CountMinSketch::new(0.01, 0.01).unwrap();
@@ -536,4 +720,31 @@ mod tests {
         let result = cms1.merge(&cms2);
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_serialization_roundtrip() {
+        let mut cms = CountMinSketch::new(0.01, 0.01).unwrap();
+        cms.update(&"apple");
+        cms.update(&"apple");
+
+        let restored = CountMinSketch::deserialize(&cms.serialize()).unwrap();
+        assert_eq!(restored.table, cms.table);
+        assert_eq!(restored.estimate(&"apple"), 2);
+    }
+
+    #[test]
+    fn test_deserialize_rejects_legacy_format() {
+        // CountMinSketch::new(0.9, 0.9) updated with "apple" three times,
+        // serialized by the 0.1.6 release
+        let legacy: [u8; 64] = [
+            4, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 205, 204, 204, 204, 204, 204, 236, 63,
+            205, 204, 204, 204, 204, 204, 236, 63, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        ];
+
+        match CountMinSketch::deserialize(&legacy) {
+            Err(SketchError::DeserializationError(msg)) => assert!(msg.contains("legacy")),
+            other => panic!("expected legacy format error, got {other:?}"),
+        }
+    }
 }
@@ -27,9 +27,16 @@
 //! - Network anomaly detection
 //! - Streaming linear algebra
 
-use crate::common::{Mergeable, Sketch, SketchError};
-use std::hash::{Hash, Hasher};
-use twox_hash::XxHash64;
+use crate::common::hash::{derive_hash, xxh3_hash128};
+use crate::common::{simd, Mergeable, Sketch, SketchError};
+use crate::frequency::count_min::column;
+use std::hash::Hash;
+
+/// Depth up to which `estimate` keeps its per-row estimates on the stack.
+///
+/// Covers every `delta` down to e^-16 (about 1e-7); deeper sketches fall back
+/// to a heap buffer.
+const INLINE_DEPTH: usize = 16;
 
 /// Count Sketch for unbiased frequency estimation
 ///
@@ -99,6 +106,24 @@ impl CountSketch {
     /// let cs = CountSketch::new(0.1, 0.01).unwrap();
     /// ```
     pub fn new(epsilon: f64, delta: f64) -> Result<Self, SketchError> {
+        let (width, depth) = Self::dimensions(epsilon, delta)?;
+        let mask = width - 1;
+
+        // Initialize flat table with zeros (i64 for signed counters)
+        let table = vec![0i64; depth * width];
+
+        Ok(CountSketch {
+            width,
+            mask,
+            depth,
+            table,
+            epsilon,
+            delta,
+        })
+    }
+
+    /// Validate the error bounds and compute `(width, depth)` for them
+    fn dimensions(epsilon: f64, delta: f64) -> Result<(usize, usize), SketchError> {
         // Validate epsilon: must be in (0, 1)
         if epsilon <= 0.0 || epsilon >= 1.0 {
             return Err(SketchError::InvalidParameter {
@@ -120,24 +145,20 @@ impl CountSketch {
         // Calculate dimensions for L2 guarantee
         // Width: w = ceil(3/epsilon^2), then round up to power of 2
         let width_min = (3.0 / (epsilon * epsilon)).ceil() as usize;
-        let width = width_min.next_power_of_two();
-        let mask = width - 1;
+        let width =
+            width_min
+                .checked_next_power_of_two()
+                .ok_or_else(|| SketchError::InvalidParameter {
+                    param: "epsilon".to_string(),
+                    value: epsilon.to_string(),
+                    constraint: "too small: table width overflows".to_string(),
+                })?;
 
         // Depth: d = ceil(ln(1/delta)), minimum 3 for reliable median
         let depth_computed = (1.0 / delta).ln().ceil() as usize;
         let depth = depth_computed.max(3); // Minimum 3 rows for median
 
-        // Initialize flat table with zeros (i64 for signed counters)
-        let table = vec![0i64; depth * width];
-
-        Ok(CountSketch {
-            width,
-            mask,
-            depth,
-            table,
-            epsilon,
-            delta,
-        })
+        Ok((width, depth))
     }
 
     /// Update the sketch with an item and delta
@@ -163,13 +184,8 @@ impl CountSketch {
     /// ```
     #[inline]
     pub fn update<T: Hash>(&mut self, item: &T, delta: i64) {
-        // Hash item once for position
-        let mut pos_hasher = XxHash64::with_seed(0);
-        item.hash(&mut pos_hasher);
-
-        // Hash item with different seed for sign
-        let mut sign_hasher = XxHash64::with_seed(0x9E3779B97F4A7C15);
-        item.hash(&mut sign_hasher);
+        // Hash once, derive the column and sign of every row from it
+        let hash = xxh3_hash128(item);
 
         let width = self.width;
         let mask = self.mask;
@@ -177,24 +193,13 @@ impl CountSketch {
 
         // Update each row
         for row_idx in 0..depth {
-            // Get position hash and derive column
-            let pos_hash = pos_hasher.finish();
-            let col_idx = (pos_hash as usize) & mask;
-
-            // Get sign hash: map to {-1, +1}
-            let sign_hash = sign_hasher.finish();
-            let sign: i64 = if (sign_hash & 1) == 0 { 1 } else { -1 };
-
-            let idx = row_idx * width + col_idx;
+            let idx = row_idx * width + column(hash, row_idx, mask);
+            let sign = Self::sign(hash, row_idx);
 
             // SAFETY: idx is always in bounds due to mask operation and row_idx < depth
             unsafe {
                 *self.table.get_unchecked_mut(idx) += sign * delta;
             }
-
-            // Mix state for next row
-            pos_hasher.write(&[0x7B]);
-            sign_hasher.write(&[0x5A]);
         }
     }
 
@@ -214,7 +219,7 @@ impl CountSketch {
     /// - |estimate - true_count| <= epsilon * ||f||_2, where ||f||_2 is the L2 norm of the frequency vector
     ///
     /// # Time Complexity
-    /// O(d) where d = depth (plus O(d log d) for median, but d is small)
+    /// O(d) where d = depth (plus O(d) median selection)
     ///
     /// # Examples
     /// ```
@@ -228,43 +233,33 @@ impl CountSketch {
     /// ```
     #[inline]
     pub fn estimate<T: Hash>(&self, item: &T) -> i64 {
-        // Hash item once for position
-        let mut pos_hasher = XxHash64::with_seed(0);
-        item.hash(&mut pos_hasher);
-
-        // Hash item with different seed for sign
-        let mut sign_hasher = XxHash64::with_seed(0x9E3779B97F4A7C15);
-        item.hash(&mut sign_hasher);
+        // Hash once, derive the column and sign of every row from it
+        let hash = xxh3_hash128(item);
 
         let width = self.width;
         let mask = self.mask;
         let depth = self.depth;
 
-        // Collect estimates from each row
-        let mut estimates = Vec::with_capacity(depth);
-
-        for row_idx in 0..depth {
-            // Get position hash and derive column
-            let pos_hash = pos_hasher.finish();
-            let col_idx = (pos_hash as usize) & mask;
-
-            // Get sign hash: map to {-1, +1}
-            let sign_hash = sign_hasher.finish();
-            let sign: i64 = if (sign_hash & 1) == 0 { 1 } else { -1 };
+        // Collect estimates from each row without a heap allocation per query
+        let mut inline = [0i64; INLINE_DEPTH];
+        let mut spilled;
+        let estimates: &mut [i64] = if depth <= INLINE_DEPTH {
+            &mut inline[..depth]
+        } else {
+            spilled = vec![0i64; depth];
+            &mut spilled
+        };
 
-            let idx = row_idx * width + col_idx;
+        for (row_idx, estimate) in estimates.iter_mut().enumerate() {
+            let idx = row_idx * width + column(hash, row_idx, mask);
 
             // SAFETY: idx is always in bounds due to mask operation and row_idx < depth
             let counter = unsafe { *self.table.get_unchecked(idx) };
-            estimates.push(sign * counter);
-
-            // Mix state for next row
-            pos_hasher.write(&[0x7B]);
-            sign_hasher.write(&[0x5A]);
+            *estimate = Self::sign(hash, row_idx) * counter;
         }
 
         // Return median of estimates
-        Self::median(&mut estimates)
+        Self::median(estimates)
     }
 
     /// Estimate inner product of two frequency vectors
@@ -304,50 +299,75 @@ impl CountSketch {
         let width = self.width;
         let depth = self.depth;
 
-        // Collect inner products from each row
-        let mut row_products = Vec::with_capacity(depth);
-
-        for row_idx in 0..depth {
-            let row_start = row_idx * width;
-            let mut row_sum: i64 = 0;
-
-            for col_idx in 0..width {
-                let idx = row_start + col_idx;
-                // SAFETY: idx is always in bounds
-                unsafe {
-                    row_sum += self.table.get_unchecked(idx) * other.table.get_unchecked(idx);
-                }
-            }
-
-            row_products.push(row_sum);
+        // Collect inner products from each row without a heap allocation
+        let mut inline = [0i64; INLINE_DEPTH];
+        let mut spilled;
+        let row_products: &mut [i64] = if depth <= INLINE_DEPTH {
+            &mut inline[..depth]
+        } else {
+            spilled = vec![0i64; depth];
+            &mut spilled
+        };
+
+        let rows = self
+            .table
+            .chunks_exact(width)
+            .zip(other.table.chunks_exact(width));
+        for (product, (row, other_row)) in row_products.iter_mut().zip(rows) {
+            *product = simd::dot_i64(row, other_row);
         }
 
         // Return median of row inner products
-        Self::median(&mut row_products)
+        Self::median(row_products)
+    }
+
+    /// Sign of an item in a row, mapped to {-1, +1}
+    ///
+    /// Taken from the top bit of the row hash, which is independent of the
+    /// masked low bits that select the column.
+    #[inline(always)]
+    fn sign(hash: u128, row_idx: usize) -> i64 {
+        1 - 2 * (derive_hash(hash, row_idx) >> 63) as i64
     }
 
     /// Compute median of a slice (modifies slice order)
+    ///
+    /// The common depths 3 and 5 use branchless min/max networks; other
+    /// depths fall back to `select_nth_unstable`, which is O(d) rather than
+    /// the O(d log d) of a full sort.
     #[inline]
     fn median(values: &mut [i64]) -> i64 {
         let len = values.len();
-        if len == 0 {
-            return 0;
-        }
-        if len == 1 {
-            return values[0];
+        match *values {
+            [] => return 0,
+            [x] => return x,
+            [a, b, c] => return Self::median3(a, b, c),
+            [a, b, c, d, e] => {
+                // Discard the extremes of (a, b) and (c, d), then the median
+                // of the five is the median of the survivors and e.
+                let hi = a.max(b).min(c.max(d));
+                let lo = a.min(b).max(c.min(d));
+                return Self::median3(e, hi, lo);
+            }
+            _ => {}
         }
 
-        // For small depth (typically 3-6), insertion sort is efficient
-        values.sort_unstable();
-
+        let (lower, &mut upper_mid, _) = values.select_nth_unstable(len / 2);
         if len % 2 == 1 {
-            values[len / 2]
+            upper_mid
         } else {
             // For even length, average the two middle values
-            (values[len / 2 - 1] + values[len / 2]) / 2
+            let lower_mid = lower.iter().copied().max().unwrap_or(upper_mid);
+            (lower_mid + upper_mid) / 2
         }
     }
 
+    /// Branchless median of three values
+    #[inline(always)]
+    fn median3(a: i64, b: i64, c: i64) -> i64 {
+        a.min(b).max(a.max(b).min(c))
+    }
+
     /// Get the width of the sketch
     #[inline]
     pub fn width(&self) -> usize {
@@ -392,10 +412,14 @@ impl Sketch for CountSketch {
 
     fn serialize(&self) -> Vec<u8> {
         // Format: [width:8][depth:8][epsilon:8][delta:8][table]
-        let mut bytes = Vec::new();
+        //
+        // The width is stored with COMPACT_TABLE_FLAG set and the table is a
+        // sequence of (zero run, zigzag value) varint pairs, one per non-zero
+        // counter. Trailing zeros are implied by the table size.
+        let mut bytes = Vec::with_capacity(32 + self.table.len());
 
         // Dimensions
-        bytes.extend_from_slice(&self.width.to_le_bytes());
+        bytes.extend_from_slice(&((self.width as u64) | COMPACT_TABLE_FLAG).to_le_bytes());
         bytes.extend_from_slice(&self.depth.to_le_bytes());
 
         // Parameters
@@ -403,8 +427,15 @@ impl Sketch for CountSketch {
         bytes.extend_from_slice(&self.delta.to_le_bytes());
 
         // Table data (i64 signed)
+        let mut zeros = 0u64;
         for &count in &self.table {
-            bytes.extend_from_slice(&count.to_le_bytes());
+            if count == 0 {
+                zeros += 1;
+            } else {
+                write_varint(&mut bytes, zeros);
+                write_varint(&mut bytes, zigzag_encode(count));
+                zeros = 0;
+            }
         }
 
         bytes
@@ -420,12 +451,22 @@ impl Sketch for CountSketch {
         let mut offset = 0;
 
         // Read dimensions
-        let width = usize::from_le_bytes(
+        let raw_width = u64::from_le_bytes(
             bytes[offset..offset + 8]
                 .try_into()
                 .map_err(|_| SketchError::DeserializationError("invalid width".to_string()))?,
         );
         offset += 8;
+        if raw_width & COMPACT_TABLE_FLAG == 0 {
+            // Untagged blobs come from releases that hashed with XxHash64, so
+            // their counters sit in different cells than XXH3 hashing reads
+            return Err(SketchError::DeserializationError(
+                "legacy CountSketch format (fixed-width table, XxHash64 row hashing) \
+                 is no longer supported; rebuild the sketch from the source data"
+                    .to_string(),
+            ));
+        }
+        let width = (raw_width & !COMPACT_TABLE_FLAG) as usize;
 
         let depth = usize::from_le_bytes(
             bytes[offset..offset + 8]
@@ -449,25 +490,37 @@ impl Sketch for CountSketch {
         );
         offset += 8;
 
-        let mask = width - 1;
-
-        // Read table
-        let expected_table_size = depth * width * 8;
-        if bytes.len() < offset + expected_table_size {
+        // Check the header before sizing the table from it: a compact table
+        // implies its trailing zeros, so the blob length does not bound it
+        let dimensions = Self::dimensions(epsilon, delta).map_err(|_| {
+            SketchError::DeserializationError("invalid epsilon or delta".to_string())
+        })?;
+        if dimensions != (width, depth) {
             return Err(SketchError::DeserializationError(
-                "insufficient bytes for table".to_string(),
+                "dimensions do not match epsilon and delta".to_string(),
             ));
         }
+        let mask = width - 1;
+        let table_len = depth
+            .checked_mul(width)
+            .filter(|&len| len <= MAX_DESERIALIZED_COUNTERS)
+            .ok_or_else(|| SketchError::DeserializationError("table too large".to_string()))?;
 
-        let mut table = Vec::with_capacity(depth * width);
-        for _ in 0..(depth * width) {
-            let count = i64::from_le_bytes(
-                bytes[offset..offset + 8]
-                    .try_into()
-                    .map_err(|_| SketchError::DeserializationError("invalid count".to_string()))?,
-            );
-            table.push(count);
-            offset += 8;
+        // Read table
+        let mut table = vec![0i64; table_len];
+        let mut index = 0usize;
+        while offset < bytes.len() {
+            let zeros = read_varint(bytes, &mut offset)?;
+            let count = zigzag_decode(read_varint(bytes, &mut offset)?);
+            index = usize::try_from(zeros)
+                .ok()
+                .and_then(|zeros| index.checked_add(zeros))
+                .filter(|&i| i < table_len)
+                .ok_or_else(|| {
+                    SketchError::DeserializationError("counter index out of range".to_string())
+                })?;
+            table[index] = count;
+            index += 1;
         }
 
         Ok(CountSketch {
@@ -481,6 +534,56 @@ impl Sketch for CountSketch {
     }
 }
 
+/// Set on the serialized width to mark a varint-encoded counter table
+///
+/// Blobs without it are the fixed-width layout of earlier releases, which
+/// hashed rows with XxHash64 and are rejected by `deserialize`.
+const COMPACT_TABLE_FLAG: u64 = 1 << 63;
+
+/// Largest table `deserialize` allocates: 2^27 counters (1 GiB)
+///
+/// Covers epsilon down to about 5e-4 at delta = 0.01.
+const MAX_DESERIALIZED_COUNTERS: usize = 1 << 27;
+
+/// Map signed counters to unsigned so small magnitudes encode in few bytes
+#[inline]
+fn zigzag_encode(value: i64) -> u64 {
+    ((value << 1) ^ (value >> 63)) as u64
+}
+
+#[inline]
+fn zigzag_decode(value: u64) -> i64 {
+    ((value >> 1) as i64) ^ -((value & 1) as i64)
+}
+
+/// Append `value` as an unsigned LEB128 varint
+#[inline]
+fn write_varint(bytes: &mut Vec<u8>, mut value: u64) {
+    while value >= 0x80 {
+        bytes.push(value as u8 | 0x80);
+        value >>= 7;
+    }
+    bytes.push(value as u8);
+}
+
+/// Read an unsigned LEB128 varint starting at `*offset`
+fn read_varint(bytes: &[u8], offset: &mut usize) -> Result<u64, SketchError> {
+    let mut value = 0u64;
+    for shift in (0..64).step_by(7) {
+        let byte = *bytes
+            .get(*offset)
+            .ok_or_else(|| SketchError::DeserializationError("truncated varint".to_string()))?;
+        *offset += 1;
+        value |= u64::from(byte & 0x7f) << shift;
+        if byte & 0x80 == 0 {
+            return Ok(value);
+        }
+    }
+    Err(SketchError::DeserializationError(
+        "varint too long".to_string(),
+    ))
+}
+
 impl Mergeable for CountSketch {
     /// Merge another Count Sketch into this one
     ///
@@ -520,10 +623,8 @@ impl Mergeable for CountSketch {
             });
         }
 
-        // Element-wise addition (no saturation needed for i64 in practice)
-        for (a, &b) in self.table.iter_mut().zip(other.table.iter()) {
-            *a = a.saturating_add(b);
-        }
+        // Element-wise saturating addition, vectorized with runtime dispatch
+        simd::add_assign_saturating_i64(&mut self.table, &other.table);
 
         Ok(())
     }
@@ -705,6 +806,32 @@ mod tests {
         assert_eq!(CountSketch::median(&mut [42]), 42);
     }
 
+    #[test]
+    fn test_median_matches_sorted_median() {
+        let mut state = 0x9E37_79B9_7F4A_7C15u64;
+        for len in 1..=20 {
+            for _ in 0..200 {
+                let values: Vec<i64> = (0..len)
+                    .map(|_| {
+                        state = state.wrapping_mul(6364136223846793005).wrapping_add(1);
+                        ((state >> 33) % 21) as i64 - 10
+                    })
+                    .collect();
+
+                let mut sorted = values.clone();
+                sorted.sort_unstable();
+                let expected = if len % 2 == 1 {
+                    sorted[len / 2]
+                } else {
+                    (sorted[len / 2 - 1] + sorted[len / 2]) / 2
+                };
+
+                let mut scratch = values.clone();
+                assert_eq!(CountSketch::median(&mut scratch), expected, "{:?}", values);
+            }
+        }
+    }
+
     // ========================================================================
     // Test 6: Compare vs Count-Min on Zipf distribution
     // (Count Sketch should have better L2 error on skewed data)
@@ -940,6 +1067,102 @@ mod tests {
         assert_eq!(cs.estimate(&"another"), cs_restored.estimate(&"another"));
     }
 
+    #[test]
+    fn test_serialization_is_compact() {
+        let mut cs = CountSketch::new(0.1, 0.01).unwrap();
+        cs.update(&"test_item", 42);
+        cs.update(&"another", -10);
+
+        // Two items touch at most 2 * depth counters, each a short varint pair
+        let bytes = cs.serialize();
+        assert!(bytes.len() <= 32 + 2 * cs.depth() * 4);
+        assert!(bytes.len() < cs.width() * cs.depth());
+    }
+
+    #[test]
+    fn test_serialization_roundtrip_extreme_counters() {
+        let mut cs = CountSketch::new(0.1, 0.01).unwrap();
+        let last = cs.table.len() - 1;
+        cs.table[0] = i64::MAX;
+        cs.table[1] = i64::MIN;
+        cs.table[2] = -1;
+        cs.table[last] = 1;
+
+        let restored = CountSketch::deserialize(&cs.serialize()).unwrap();
+        assert_eq!(cs.table, restored.table);
+    }
+
+    #[test]
+    fn test_deserialize_rejects_legacy_format() {
+        // CountSketch::new(0.9, 0.9) updated with ("apple", 3) and
+        // ("banana", -2), serialized by the 0.1.6 release
+        let legacy: [u8; 128] = [
+            4, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 205, 204, 204, 204, 204, 204, 236, 63,
+            205, 204, 204, 204, 204, 204, 236, 63, 253, 255, 255, 255, 255, 255, 255, 255, 0, 0, 0,
+            0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 254, 255, 255, 255, 255,
+            255, 255, 255, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            253, 255, 255, 255, 255, 255, 255, 255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            2, 0, 0, 0, 0, 0, 0, 0,
+        ];
+
+        match CountSketch::deserialize(&legacy) {
+            Err(SketchError::DeserializationError(msg)) => assert!(msg.contains("legacy")),
+            other => panic!("expected legacy format error, got {other:?}"),
+        }
+    }
+
+    #[test]
+    fn test_deserialize_rejects_corrupt_table() {
+        let mut cs = CountSketch::new(0.1, 0.01).unwrap();
+        cs.update(&"test_item", 42);
+        let bytes = cs.serialize();
+
+        // Truncated varint
+        let mut truncated = bytes.clone();
+        truncated.push(0x80);
+        assert!(CountSketch::deserialize(&truncated).is_err());
+
+        // Zero run past the end of the table
+        let mut overrun = bytes[..32].to_vec();
+        write_varint(&mut overrun, (cs.width() * cs.depth()) as u64);
+        write_varint(&mut overrun, zigzag_encode(1));
+        assert!(CountSketch::deserialize(&overrun).is_err());
+    }
+
+    #[test]
+    fn test_deserialize_rejects_huge_dimensions() {
+        // A 32-byte header claiming a 2^30 x 4 table must fail before allocating
+        let mut bytes = Vec::new();
+        bytes.extend_from_slice(&((1u64 << 30) | COMPACT_TABLE_FLAG).to_le_bytes());
+        bytes.extend_from_slice(&4usize.to_le_bytes());
+        bytes.extend_from_slice(&0.1f64.to_le_bytes());
+        bytes.extend_from_slice(&0.01f64.to_le_bytes());
+        assert!(CountSketch::deserialize(&bytes).is_err());
+
+        // Consistent with its epsilon, but still beyond the allocation cap
+        let mut bytes = Vec::new();
+        bytes.extend_from_slice(&((1u64 << 30) | COMPACT_TABLE_FLAG).to_le_bytes());
+        bytes.extend_from_slice(&3usize.to_le_bytes());
+        bytes.extend_from_slice(&6e-5f64.to_le_bytes());
+        bytes.extend_from_slice(&0.5f64.to_le_bytes());
+        assert_eq!(CountSketch::dimensions(6e-5, 0.5).unwrap(), (1 << 30, 3));
+        assert!(CountSketch::deserialize(&bytes).is_err());
+
+        // Epsilon so small the width overflows
+        let mut bytes = cs_header(1 << 20, 3);
+        bytes[16..24].copy_from_slice(&1e-300f64.to_le_bytes());
+        assert!(CountSketch::deserialize(&bytes).is_err());
+    }
+
+    fn cs_header(width: u64, depth: usize) -> Vec<u8> {
+        let mut bytes = Vec::new();
+        bytes.extend_from_slice(&(width | COMPACT_TABLE_FLAG).to_le_bytes());
+        bytes.extend_from_slice(&depth.to_le_bytes());
+        bytes.extend_from_slice(&0.1f64.to_le_bytes());
+        bytes.extend_from_slice(&0.5f64.to_le_bytes());
+        bytes
+    }
+
     #[test]
     fn test_is_empty() {
         let cs = CountSketch::new(0.1, 0.01).unwrap();
@@ -998,4 +1221,17 @@ mod tests {
             within_bound
         );
     }
+
+    #[test]
+    fn test_deep_sketch_estimate() {
+        // delta = 1e-9 needs more rows than fit in the inline estimate buffer
+        let mut cs = CountSketch::new(0.1, 1e-9).unwrap();
+        assert!(cs.depth() > INLINE_DEPTH);
+
+        cs.update(&"apple", 7);
+        cs.update(&"banana", -4);
+
+        assert!((cs.estimate(&"apple") - 7).abs() <= 2);
+        assert!((cs.estimate(&"banana") + 4).abs() <= 2);
+    }
 }
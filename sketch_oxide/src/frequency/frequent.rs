@@ -56,6 +56,7 @@
 //! - Apache DataSketches: https://datasketches.apache.org/docs/Frequency/FrequentItemsOverview.html
 
 use crate::common::SketchError;
+use std::borrow::Borrow;
 use std::collections::HashMap;
 use std::hash::Hash;
 
@@ -177,6 +178,42 @@ impl<T: Hash + Eq + Clone> FrequentItems<T> {
         }
     }
 
+    /// Updates the sketch with multiple occurrences of a borrowed item
+    ///
+    /// Same as [`update_by`](Self::update_by), but an owned copy of the item
+    /// is only made when it is not already tracked. Heavy hitters, the items
+    /// that dominate a skewed stream, are then counted without allocating.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::frequency::frequent::FrequentItems;
+    ///
+    /// let mut sketch: FrequentItems<String> = FrequentItems::new(10).unwrap();
+    /// sketch.update_by_ref("apple", 5);
+    /// sketch.update_by_ref("apple", 2);
+    /// assert_eq!(sketch.get_estimate_ref("apple"), Some((7, 7)));
+    /// ```
+    pub fn update_by_ref<Q>(&mut self, item: &Q, count: u64)
+    where
+        T: Borrow<Q>,
+        Q: Hash + Eq + ToOwned<Owned = T> + ?Sized,
+    {
+        if count == 0 {
+            return;
+        }
+
+        if let Some(stored) = self.items.get_mut(item) {
+            *stored += count;
+            return;
+        }
+        self.items.insert(item.to_owned(), count);
+
+        if self.items.len() > self.max_size {
+            self.purge();
+        }
+    }
+
     /// Purges items with minimum count when capacity is exceeded
     ///
     /// This is the core of the Misra-Gries algorithm. When we exceed capacity:
@@ -225,7 +262,18 @@ impl<T: Hash + Eq + Clone> FrequentItems<T> {
     /// let items = sketch.frequent_items(ErrorType::NoFalsePositives);
     /// assert_eq!(items[0].0, "common");
     /// ```
-    pub fn frequent_items(&self, _error_type: ErrorType) -> Vec<(T, u64, u64)> {
+    pub fn frequent_items(&self, error_type: ErrorType) -> Vec<(T, u64, u64)> {
+        self.frequent_items_ref(error_type)
+            .into_iter()
+            .map(|(item, lower, upper)| (item.clone(), lower, upper))
+            .collect()
+    }
+
+    /// Same as [`frequent_items`](Self::frequent_items), but borrows the items
+    ///
+    /// Callers that only read or convert the items (e.g. language bindings)
+    /// avoid cloning every tracked item.
+    pub fn frequent_items_ref(&self, _error_type: ErrorType) -> Vec<(&T, u64, u64)> {
         // Returns (item, lower_bound, upper_bound)
         let mut result = Vec::with_capacity(self.items.len());
 
@@ -237,11 +285,11 @@ impl<T: Hash + Eq + Clone> FrequentItems<T> {
             // NoFalsePositives: uses lower bound for threshold comparison
             // NoFalseNegatives: uses upper bound for threshold comparison
             // For now, we return all items with both bounds
-            result.push((item.clone(), lower, upper));
+            result.push((item, lower, upper));
         }
 
-        // Sort by lower bound estimate (descending)
-        result.sort_by(|a, b| b.1.cmp(&a.1));
+        // Sort by lower bound estimate (descending); ties have no defined order
+        result.sort_unstable_by(|a, b| b.1.cmp(&a.1));
         result
     }
 
@@ -276,6 +324,20 @@ impl<T: Hash + Eq + Clone> FrequentItems<T> {
             .map(|&count| (count, count + self.offset))
     }
 
+    /// Gets the estimated frequency bounds for a borrowed item
+    ///
+    /// Same as [`get_estimate`](Self::get_estimate), but looks the item up
+    /// without building an owned `T` (e.g. by `&str` for `String` items).
+    pub fn get_estimate_ref<Q>(&self, item: &Q) -> Option<(u64, u64)>
+    where
+        T: Borrow<Q>,
+        Q: Hash + Eq + ?Sized,
+    {
+        self.items
+            .get(item)
+            .map(|&count| (count, count + self.offset))
+    }
+
     /// Merges another sketch into this one
     ///
     /// # Arguments
@@ -353,6 +415,24 @@ impl<T: Hash + Eq + Clone> FrequentItems<T> {
         self.items.len()
     }
 
+    /// Iterates over the tracked items in arbitrary order
+    ///
+    /// Unlike [`frequent_items`](Self::frequent_items), this neither clones
+    /// nor sorts, which suits callers that only need the candidate set.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::frequency::frequent::FrequentItems;
+    ///
+    /// let mut sketch = FrequentItems::new(10).unwrap();
+    /// sketch.update("apple".to_string());
+    /// assert_eq!(sketch.items().collect::<Vec<_>>(), vec!["apple"]);
+    /// ```
+    pub fn items(&self) -> impl Iterator<Item = &T> {
+        self.items.keys()
+    }
+
     /// Returns the maximum number of items this sketch can track
     pub fn max_size(&self) -> usize {
         self.max_size
@@ -364,6 +444,15 @@ impl<T: Hash + Eq + Clone> FrequentItems<T> {
     pub fn offset(&self) -> u64 {
         self.offset
     }
+
+    /// Removes all tracked items and resets the error bound
+    ///
+    /// The item map keeps its capacity, so a cleared sketch can be refilled
+    /// without reallocating.
+    pub fn clear(&mut self) {
+        self.items.clear();
+        self.offset = 0;
+    }
 }
 
 impl<T: Hash + Eq + Clone> PartialEq for FrequentItems<T> {
@@ -108,6 +108,8 @@ pub struct NitroSketch<S: Sketch> {
     base_sketch: S,
     /// Sample rate: probability of updating base sketch (0.0 to 1.0)
     sample_rate: f64,
+    /// Sampling threshold out of 10000, fixed by `sample_rate` at construction
+    sampling_threshold: u64,
     /// Count of items that were sampled (updated in base sketch)
     sampled_count: u64,
     /// Count of items that were NOT sampled (skipped)
@@ -155,6 +157,7 @@ impl<S: Sketch> NitroSketch<S> {
         Ok(NitroSketch {
             base_sketch,
             sample_rate,
+            sampling_threshold: Self::threshold_for(sample_rate),
             sampled_count: 0,
             unsampled_count: 0,
         })
@@ -193,6 +196,7 @@ impl<S: Sketch> NitroSketch<S> {
         let mut nitro = NitroSketch {
             base_sketch,
             sample_rate,
+            sampling_threshold: Self::threshold_for(sample_rate),
             sampled_count: seed, // Temporarily store seed here
             unsampled_count: 0,
         };
@@ -234,22 +238,58 @@ impl<S: Sketch> NitroSketch<S> {
     where
         T: std::hash::Hash + ?Sized,
     {
-        // Hash item to get sampling decision
-        let mut hasher = XxHash64::with_seed(0);
-        item.hash(&mut hasher);
-        let hash = hasher.finish();
-
-        // Probabilistic sampling: hash % 10000 < sample_rate * 10000
-        let threshold = (self.sample_rate * 10000.0) as u64;
-        let should_sample = (hash % 10000) < threshold;
-
-        if should_sample {
+        if Self::is_sampled(item, self.sampling_threshold) {
             self.sampled_count += 1;
         } else {
             self.unsampled_count += 1;
         }
     }
 
+    /// Update with selective sampling for a batch of byte-slice keys
+    ///
+    /// Equivalent to calling [`update_sampled`](Self::update_sampled) on each
+    /// key, but the sampling threshold is computed once and the counters are
+    /// updated once per batch.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::frequency::{NitroSketch, CountMinSketch};
+    ///
+    /// let base = CountMinSketch::new(0.01, 0.01).unwrap();
+    /// let mut nitro = NitroSketch::new(base, 0.1).unwrap();
+    ///
+    /// let flows: Vec<[u8; 8]> = (0..1000u64).map(u64::to_le_bytes).collect();
+    /// nitro.update_batch(&flows);
+    /// assert_eq!(nitro.sampled_count() + nitro.unsampled_count(), 1000);
+    /// ```
+    pub fn update_batch<K: AsRef<[u8]>>(&mut self, keys: &[K]) {
+        let threshold = self.sampling_threshold;
+        let sampled = keys
+            .iter()
+            .filter(|key| Self::is_sampled(key.as_ref(), threshold))
+            .count() as u64;
+
+        self.sampled_count += sampled;
+        self.unsampled_count += keys.len() as u64 - sampled;
+    }
+
+    /// Sampling threshold out of 10000 for a sample rate
+    fn threshold_for(sample_rate: f64) -> u64 {
+        (sample_rate * 10000.0) as u64
+    }
+
+    /// Probabilistic sampling: hash % 10000 < sample_rate * 10000
+    #[inline]
+    fn is_sampled<T>(item: &T, threshold: u64) -> bool
+    where
+        T: std::hash::Hash + ?Sized,
+    {
+        let mut hasher = XxHash64::with_seed(0);
+        item.hash(&mut hasher);
+        (hasher.finish() % 10000) < threshold
+    }
+
     /// Update with selective sampling (for byte slices)
     ///
     /// Convenience method for network flow keys as byte slices.
@@ -534,6 +574,24 @@ mod tests {
         assert_eq!(stats.total_items_estimated, 1);
     }
 
+    #[test]
+    fn test_update_batch_matches_update_sampled() {
+        let keys: Vec<[u8; 8]> = (0..5000u64).map(u64::to_le_bytes).collect();
+
+        let base = CountMinSketch::new(0.01, 0.01).unwrap();
+        let mut batched = NitroSketch::new(base, 0.1).unwrap();
+        batched.update_batch(&keys);
+
+        let base = CountMinSketch::new(0.01, 0.01).unwrap();
+        let mut serial = NitroSketch::new(base, 0.1).unwrap();
+        for key in &keys {
+            serial.update_sampled(key);
+        }
+
+        assert_eq!(batched.sampled_count(), serial.sampled_count());
+        assert_eq!(batched.unsampled_count(), serial.unsampled_count());
+    }
+
     #[test]
     fn test_stats() {
         let base = CountMinSketch::new(0.01, 0.01).unwrap();
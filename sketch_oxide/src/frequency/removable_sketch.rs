@@ -11,8 +11,10 @@
 //! - **Heavy Hitters**: Works well with skewed distributions
 //!
 //! # Algorithm Overview
-//! 1. Maintains a CountMinSketch for positive frequencies
-//! 2. Tracks deletions separately for turnstile operations
+//! 1. Maintains two unsigned Count-Min tables, one for insertions and one for
+//!    deletions (the EMG split), so updates never branch on the sign of `delta`
+//! 2. Estimates the net frequency as the minimum over rows of `pos - neg`,
+//!    clamped at 0 for over-deleted items
 //! 3. Uses polynomial sketches for L2 norm computation
 //! 4. Supports frequency moment estimation
 //!
@@ -34,20 +36,18 @@
 //! assert!(freq >= 100);
 //! ```
 
-use crate::common::{Mergeable, SketchError};
-use crate::frequency::CountMinSketch;
-use std::collections::HashMap;
-use std::hash::{Hash, Hasher};
-use twox_hash::XxHash64;
+use crate::common::hash::{derive_hash, xxh3_hash128};
+use crate::common::{simd, SketchError};
+use crate::frequency::count_min::{column, dimensions};
+use std::hash::Hash;
 
 /// Removable Universal Sketch for frequency estimation with deletions
 #[derive(Clone, Debug)]
 pub struct RemovableUniversalSketch {
-    /// Main frequency estimation sketch
-    cms: CountMinSketch,
-    /// Track deletions separately for turnstile operations
-    #[allow(dead_code)]
-    deletions: HashMap<Vec<u8>, i64>,
+    /// Insertion counters (depth * width)
+    pos_counters: Vec<u64>,
+    /// Deletion counters (depth * width)
+    neg_counters: Vec<u64>,
     /// Polynomial sketch for L2 norm estimation (depth * width)
     moment_sketch: Vec<i64>,
     /// Depth parameter
@@ -56,70 +56,85 @@ pub struct RemovableUniversalSketch {
     width: usize,
     /// Bitmask for width
     mask: usize,
+    /// Error bound
+    epsilon: f64,
+    /// Failure probability
+    delta: f64,
 }
 
 impl RemovableUniversalSketch {
     /// Create a new Removable Universal Sketch
     pub fn new(epsilon: f64, delta: f64) -> Result<Self, SketchError> {
-        let cms = CountMinSketch::new(epsilon, delta)?;
-        let width = cms.width();
-        let depth = cms.depth();
+        let (width, depth) = dimensions(epsilon, delta)?;
         let mask = width - 1;
 
-        let moment_sketch = vec![0i64; depth * width];
-
         Ok(RemovableUniversalSketch {
-            cms,
-            deletions: HashMap::new(),
-            moment_sketch,
+            pos_counters: vec![0u64; depth * width],
+            neg_counters: vec![0u64; depth * width],
+            moment_sketch: vec![0i64; depth * width],
             depth,
             width,
             mask,
+            epsilon,
+            delta,
         })
     }
 
     /// Update the sketch with a signed frequency (positive or negative)
+    ///
+    /// Insertions and deletions are routed to separate unsigned tables by
+    /// magnitude rather than by branching on the sign, so mixed turnstile
+    /// streams do not pay for mispredicted branches. Cost is O(d) regardless
+    /// of `|delta|`.
     pub fn update<T: Hash>(&mut self, item: &T, delta: i32) {
         if delta == 0 {
             return;
         }
 
-        if delta > 0 {
-            // Positive update: insert into CMS
-            for _ in 0..delta {
-                self.cms.update(item);
-            }
-        }
-
-        // Update moment sketch for L2 norm computation
-        let mut hasher = XxHash64::with_seed(0);
-        item.hash(&mut hasher);
+        // Hash once, derive d positions from it
+        let hash = xxh3_hash128(item);
 
         let width = self.width;
         let mask = self.mask;
         let depth = self.depth;
         let delta_i64 = delta as i64;
+        let inserted = delta_i64.max(0) as u64;
+        let deleted = (-delta_i64).max(0) as u64;
 
-        // Update moment sketch
         for row_idx in 0..depth {
-            let hash = hasher.finish();
-            let col_idx = (hash as usize) & mask;
-            let idx = row_idx * width + col_idx;
+            let row_hash = derive_hash(hash, row_idx);
+            let idx = row_idx * width + column(hash, row_idx, mask);
 
-            // Apply sign-based update for L2 estimation
-            let sign = if (hash >> 32) & 1 == 0 { 1 } else { -1 };
+            // Apply sign-based update for L2 estimation (top bit is independent of the column)
+            let sign = 1 - 2 * (row_hash >> 63) as i64;
+
+            // SAFETY: idx < depth * width due to the mask operation
             unsafe {
-                *self.moment_sketch.get_unchecked_mut(idx) += sign * delta_i64;
+                let pos = self.pos_counters.get_unchecked_mut(idx);
+                *pos = pos.saturating_add(inserted);
+                let neg = self.neg_counters.get_unchecked_mut(idx);
+                *neg = neg.saturating_add(deleted);
+                let moment = self.moment_sketch.get_unchecked_mut(idx);
+                *moment = moment.saturating_add(sign * delta_i64);
             }
-
-            // Mix state for next row
-            hasher.write(&[0x7B]);
         }
     }
 
-    /// Estimate the frequency of an item (can be negative due to deletions)
+    /// Estimate the net frequency of an item
+    ///
+    /// Returns the minimum over rows of inserted minus deleted counts. Items
+    /// deleted more often than inserted are clamped to 0.
     pub fn estimate<T: Hash>(&self, item: &T) -> i64 {
-        self.cms.estimate(item) as i64
+        let hash = xxh3_hash128(item);
+
+        let mut min_net = i64::MAX;
+        for row_idx in 0..self.depth {
+            let idx = row_idx * self.width + column(hash, row_idx, self.mask);
+            let net = self.pos_counters[idx].wrapping_sub(self.neg_counters[idx]) as i64;
+            min_net = min_net.min(net);
+        }
+
+        min_net.max(0)
     }
 
     /// Compute the L2 norm of the frequency vector
@@ -137,10 +152,10 @@ impl RemovableUniversalSketch {
             let row = &self.moment_sketch[start..end];
 
             // Sum of squares in this row
-            let sum_squares: i64 = row.iter().map(|&x| x * x).sum();
+            let sum_squares = simd::sum_of_squares_i64(row);
 
             // Estimate for this row
-            let estimate = (sum_squares as f64).sqrt();
+            let estimate = sum_squares.sqrt();
             l2_estimates.push(estimate);
         }
 
@@ -155,12 +170,12 @@ impl RemovableUniversalSketch {
 
     /// Get epsilon parameter
     pub fn epsilon(&self) -> f64 {
-        self.cms.epsilon()
+        self.epsilon
     }
 
     /// Get delta parameter
     pub fn delta(&self) -> f64 {
-        self.cms.delta()
+        self.delta
     }
 
     /// Get the width of the sketch
@@ -175,17 +190,20 @@ impl RemovableUniversalSketch {
 
     /// Merge another RemovableUniversalSketch into this one
     pub fn merge(&mut self, other: &RemovableUniversalSketch) -> Result<(), SketchError> {
-        // Merge underlying CMS
-        self.cms.merge(&other.cms)?;
+        if self.width != other.width || self.depth != other.depth {
+            return Err(SketchError::IncompatibleSketches {
+                reason: format!(
+                    "dimension mismatch: {}x{} vs {}x{} (different epsilon/delta parameters)",
+                    self.depth, self.width, other.depth, other.width
+                ),
+            });
+        }
+
+        simd::add_assign_saturating_u64(&mut self.pos_counters, &other.pos_counters);
+        simd::add_assign_saturating_u64(&mut self.neg_counters, &other.neg_counters);
 
         // Merge moment sketches
-        for (self_val, &other_val) in self
-            .moment_sketch
-            .iter_mut()
-            .zip(other.moment_sketch.iter())
-        {
-            *self_val = self_val.saturating_add(other_val);
-        }
+        simd::add_assign_saturating_i64(&mut self.moment_sketch, &other.moment_sketch);
 
         Ok(())
     }
@@ -231,6 +249,25 @@ mod tests {
         assert!(freq >= 0);
     }
 
+    #[test]
+    fn test_rus_deletions_reduce_estimate() {
+        let mut rus = RemovableUniversalSketch::new(0.01, 0.01).unwrap();
+        rus.update(&"item", 100);
+        rus.update(&"item", -30);
+        assert_eq!(rus.estimate(&"item"), 70);
+
+        rus.update(&"item", -70);
+        assert_eq!(rus.estimate(&"item"), 0);
+    }
+
+    #[test]
+    fn test_rus_overdelete_clamps_to_zero() {
+        let mut rus = RemovableUniversalSketch::new(0.01, 0.01).unwrap();
+        rus.update(&"item", 50);
+        rus.update(&"item", -100);
+        assert_eq!(rus.estimate(&"item"), 0);
+    }
+
     #[test]
     fn test_rus_multiple_items() {
         let mut rus = RemovableUniversalSketch::new(0.01, 0.01).unwrap();
@@ -10,14 +10,15 @@
 //! and ensures the sketch remains accurate for both light and heavy hitters.
 //!
 //! # Algorithm Overview
-//! 1. Wraps an existing CountMinSketch
+//! 1. Lays counters out as a Count-Min table, starting with 8-bit counters
 //! 2. Tracks maximum observed frequency and total updates
-//! 3. When max_frequency approaches overflow threshold, triggers adaptation
-//! 4. Adaptation reconstructs the sketch with updated parameters
+//! 3. When an update would saturate a counter, the table is promoted to the
+//!    next counter width (8 → 16 → 32 → 64 bits) and the adaptation level grows
+//! 4. Merges promote to the wider of the two tables before adding
 //!
 //! # Space Complexity
-//! - Same as underlying CountMinSketch initially
-//! - Increases logarithmically only when heavy hitters are detected
+//! - 1 byte per counter initially (8× smaller than a u64 Count-Min table)
+//! - Doubles only when heavy hitters saturate the current counter width
 //!
 //! # References
 //! - SALSA: Adaptive Counter Sizing for Sketches (2024-2025)
@@ -33,33 +34,121 @@
 //! assert!(estimate >= 100);
 //! ```
 
-use crate::common::{Mergeable, SketchError};
-use crate::frequency::CountMinSketch;
+use crate::common::hash::xxh3_hash128;
+use crate::common::SketchError;
+use crate::frequency::count_min::{column, dimensions};
+
+/// Counter table whose element width adapts to the largest stored count
+#[derive(Clone, Debug)]
+enum Counters {
+    U8(Vec<u8>),
+    U16(Vec<u16>),
+    U32(Vec<u32>),
+    U64(Vec<u64>),
+}
+
+impl Counters {
+    /// Adaptation level of this width: 0 for u8 up to 3 for u64
+    fn level(&self) -> u32 {
+        match self {
+            Counters::U8(_) => 0,
+            Counters::U16(_) => 1,
+            Counters::U32(_) => 2,
+            Counters::U64(_) => 3,
+        }
+    }
+
+    /// Largest count representable at the current width
+    fn capacity(&self) -> u64 {
+        match self {
+            Counters::U8(_) => u8::MAX as u64,
+            Counters::U16(_) => u16::MAX as u64,
+            Counters::U32(_) => u32::MAX as u64,
+            Counters::U64(_) => u64::MAX,
+        }
+    }
+
+    #[inline]
+    fn get(&self, idx: usize) -> u64 {
+        match self {
+            Counters::U8(c) => c[idx] as u64,
+            Counters::U16(c) => c[idx] as u64,
+            Counters::U32(c) => c[idx] as u64,
+            Counters::U64(c) => c[idx],
+        }
+    }
+
+    /// Add `count` to a counter; the caller guarantees the result fits
+    #[inline]
+    fn add(&mut self, idx: usize, count: u64) {
+        match self {
+            Counters::U8(c) => c[idx] += count as u8,
+            Counters::U16(c) => c[idx] += count as u16,
+            Counters::U32(c) => c[idx] += count as u32,
+            Counters::U64(c) => c[idx] = c[idx].saturating_add(count),
+        }
+    }
+
+    /// Widen every counter by one step
+    fn promote(&mut self) {
+        *self = match self {
+            Counters::U8(c) => Counters::U16(c.iter().map(|&v| v as u16).collect()),
+            Counters::U16(c) => Counters::U32(c.iter().map(|&v| v as u32).collect()),
+            Counters::U32(c) => Counters::U64(c.iter().map(|&v| v as u64).collect()),
+            Counters::U64(_) => return,
+        };
+    }
+
+    /// Promote until `value` is representable; counters saturate at u64
+    fn ensure_capacity(&mut self, value: u64) {
+        while value > self.capacity() {
+            self.promote();
+        }
+    }
+
+    /// Memory used by the counters themselves
+    fn memory_bytes(&self) -> usize {
+        match self {
+            Counters::U8(c) => c.len(),
+            Counters::U16(c) => c.len() * 2,
+            Counters::U32(c) => c.len() * 4,
+            Counters::U64(c) => c.len() * 8,
+        }
+    }
+}
 
 /// SALSA: Self-Adjusting Counter Sizing for frequency estimation
 ///
-/// Wraps CountMinSketch to provide adaptive counter management. When frequencies
-/// approach overflow, SALSA automatically adjusts parameters to maintain accuracy.
+/// A Count-Min table whose counters start at 8 bits and are widened to
+/// 16, 32 and finally 64 bits only when a count would otherwise saturate.
+/// Light-tailed streams therefore keep the whole table in 1/8 of the memory
+/// of a u64 Count-Min sketch, with identical estimates.
 #[derive(Clone, Debug)]
 pub struct SALSA {
-    /// Inner CountMinSketch for frequency estimation
-    inner: CountMinSketch,
+    /// Adaptive-width counter table (depth × width)
+    counters: Counters,
+    /// Width of each row (power of 2)
+    width: usize,
+    /// Bitmask for fast modulo: width - 1
+    mask: usize,
+    /// Number of rows
+    depth: usize,
+    /// Error bound
+    epsilon: f64,
+    /// Failure probability
+    delta: f64,
     /// Maximum observed frequency so far
     max_observed: u64,
-    /// Threshold for triggering adaptation (percentage of u64::MAX)
-    adaptation_threshold: f64,
     /// Total number of updates processed
     total_updates: u64,
-    /// Current adaptation level (how many times we've adapted)
-    adaptation_level: u32,
 }
 
 impl SALSA {
     /// Create a new SALSA sketch with default parameters
     ///
     /// # Arguments
-    /// * `epsilon` - Error bound for the underlying CountMinSketch
-    /// * `delta` - Failure probability for the underlying CountMinSketch
+    /// * `epsilon` - Error bound of the Count-Min table
+    /// * `delta` - Failure probability of the Count-Min table
     ///
     /// # Returns
     /// A new SALSA sketch or an error if parameters are invalid
@@ -72,13 +161,16 @@ impl SALSA {
     /// assert_eq!(salsa.adaptation_level(), 0);
     /// ```
     pub fn new(epsilon: f64, delta: f64) -> Result<Self, SketchError> {
-        let inner = CountMinSketch::new(epsilon, delta)?;
+        let (width, depth) = dimensions(epsilon, delta)?;
         Ok(SALSA {
-            inner,
+            counters: Counters::U8(vec![0; width * depth]),
+            width,
+            mask: width - 1,
+            depth,
+            epsilon,
+            delta,
             max_observed: 0,
-            adaptation_threshold: 0.75, // Adapt when approaching 75% of u64::MAX
             total_updates: 0,
-            adaptation_level: 0,
         })
     }
 
@@ -89,39 +181,48 @@ impl SALSA {
     /// * `count` - The frequency to add
     ///
     /// # Behavior
-    /// - Updates the inner CountMinSketch
+    /// - Adds `count` to one counter per row in a single pass (O(d), not O(count))
     /// - Tracks the maximum observed frequency
-    /// - May trigger adaptation if frequencies get too high
+    /// - Widens the counter table first if any touched counter would saturate
     pub fn update<T: std::hash::Hash>(&mut self, item: &T, count: u64) {
-        // Update inner sketch using hash-based approach
-        for _ in 0..count {
-            self.inner.update(item);
-        }
-
         self.total_updates = self.total_updates.saturating_add(count);
         self.max_observed = self.max_observed.max(count);
+        if count == 0 {
+            return;
+        }
 
-        // Check if adaptation is needed
-        if self.should_adapt() {
-            self.adapt();
+        let hash = xxh3_hash128(item);
+
+        // Largest counter this update touches decides whether we must widen
+        let mut row_max = 0u64;
+        for row_idx in 0..self.depth {
+            let idx = self.index(hash, row_idx);
+            row_max = row_max.max(self.counters.get(idx));
         }
-    }
+        self.counters.ensure_capacity(row_max.saturating_add(count));
 
-    /// Check if adaptation should be triggered
-    #[inline]
-    fn should_adapt(&self) -> bool {
-        let threshold = (u64::MAX as f64 * self.adaptation_threshold) as u64;
-        self.max_observed > threshold
+        for row_idx in 0..self.depth {
+            let idx = self.index(hash, row_idx);
+            self.counters.add(idx, count);
+        }
     }
 
-    /// Adapt the sketch by incrementing adaptation level
-    fn adapt(&mut self) {
-        self.adaptation_level += 1;
+    #[inline]
+    fn index(&self, hash: u128, row_idx: usize) -> usize {
+        row_idx * self.width + column(hash, row_idx, self.mask)
     }
 
     /// Estimate the frequency of an item with confidence
+    ///
+    /// # Returns
+    /// Tuple of (estimate, confidence) where confidence grows with the number
+    /// of updates processed (0-100)
     pub fn estimate<T: std::hash::Hash>(&self, item: &T) -> (u64, u64) {
-        let estimate = self.inner.estimate(item);
+        let hash = xxh3_hash128(item);
+        let estimate = (0..self.depth)
+            .map(|row_idx| self.counters.get(self.index(hash, row_idx)))
+            .min()
+            .unwrap_or(0);
 
         // Confidence is higher when we've had more total updates
         let confidence = if self.total_updates > 0 {
@@ -135,12 +236,12 @@ impl SALSA {
 
     /// Get the current epsilon parameter
     pub fn epsilon(&self) -> f64 {
-        self.inner.epsilon()
+        self.epsilon
     }
 
     /// Get the current delta parameter
     pub fn delta(&self) -> f64 {
-        self.inner.delta()
+        self.delta
     }
 
     /// Get the maximum frequency observed so far
@@ -154,34 +255,57 @@ impl SALSA {
     }
 
     /// Get the current adaptation level
+    ///
+    /// Number of times the counter table has been widened: 0 for 8-bit
+    /// counters, 1 for 16-bit, 2 for 32-bit and 3 for 64-bit.
     pub fn adaptation_level(&self) -> u32 {
-        self.adaptation_level
+        self.counters.level()
     }
 
     /// Get the width of the underlying sketch
     pub fn width(&self) -> usize {
-        self.inner.width()
+        self.width
     }
 
     /// Get the depth of the underlying sketch
     pub fn depth(&self) -> usize {
-        self.inner.depth()
+        self.depth
+    }
+
+    /// Bytes used by the counter table at its current width
+    pub fn memory_usage(&self) -> usize {
+        std::mem::size_of::<Self>() + self.counters.memory_bytes()
     }
 
     /// Merge another SALSA sketch into this one
     pub fn merge(&mut self, other: &SALSA) -> Result<(), SketchError> {
-        // Merge underlying sketches
-        self.inner.merge(&other.inner)?;
+        if self.width != other.width || self.depth != other.depth {
+            return Err(SketchError::IncompatibleSketches {
+                reason: format!(
+                    "dimension mismatch: {}x{} vs {}x{} (different epsilon/delta parameters)",
+                    self.depth, self.width, other.depth, other.width
+                ),
+            });
+        }
+
+        // Widen to fit the largest merged counter, then add element-wise
+        let merged_max = (0..self.width * self.depth)
+            .map(|idx| {
+                self.counters
+                    .get(idx)
+                    .saturating_add(other.counters.get(idx))
+            })
+            .max()
+            .unwrap_or(0);
+        self.counters.ensure_capacity(merged_max);
+        for idx in 0..self.width * self.depth {
+            self.counters.add(idx, other.counters.get(idx));
+        }
 
         // Update max_observed
         self.max_observed = self.max_observed.max(other.max_observed);
         self.total_updates = self.total_updates.saturating_add(other.total_updates);
 
-        // Trigger adaptation if needed
-        if self.should_adapt() {
-            self.adapt();
-        }
-
         Ok(())
     }
 }
@@ -292,6 +416,48 @@ mod tests {
         assert!(estimate >= 150);
     }
 
+    #[test]
+    fn test_salsa_counters_start_narrow() {
+        let mut salsa = SALSA::new(0.01, 0.01).unwrap();
+        let initial = salsa.memory_usage();
+
+        salsa.update(&"light", 200);
+        assert_eq!(salsa.adaptation_level(), 0);
+        assert_eq!(salsa.memory_usage(), initial);
+        assert_eq!(salsa.estimate(&"light").0, 200);
+    }
+
+    #[test]
+    fn test_salsa_promotes_on_saturation() {
+        let mut salsa = SALSA::new(0.01, 0.01).unwrap();
+
+        salsa.update(&"item", 200);
+        salsa.update(&"item", 100);
+        assert_eq!(salsa.adaptation_level(), 1);
+        assert!(salsa.estimate(&"item").0 >= 300);
+
+        salsa.update(&"item", 100_000);
+        assert_eq!(salsa.adaptation_level(), 2);
+        assert!(salsa.estimate(&"item").0 >= 100_300);
+
+        salsa.update(&"item", u64::from(u32::MAX));
+        assert_eq!(salsa.adaptation_level(), 3);
+        assert!(salsa.estimate(&"item").0 >= 100_300 + u64::from(u32::MAX));
+    }
+
+    #[test]
+    fn test_salsa_merge_promotes_to_fit() {
+        let mut narrow = SALSA::new(0.01, 0.01).unwrap();
+        let mut wide = SALSA::new(0.01, 0.01).unwrap();
+
+        narrow.update(&"item", 10);
+        wide.update(&"item", 70_000);
+
+        narrow.merge(&wide).unwrap();
+        assert_eq!(narrow.adaptation_level(), 2);
+        assert!(narrow.estimate(&"item").0 >= 70_010);
+    }
+
     #[test]
     fn test_salsa_merge_incompatible() {
         let salsa1 = SALSA::new(0.01, 0.01).unwrap();
@@ -56,6 +56,7 @@
 //! ```
 
 use crate::common::{Mergeable, Sketch, SketchError};
+use std::collections::hash_map::Entry;
 use std::collections::HashMap;
 use std::hash::Hash;
 
@@ -85,6 +86,9 @@ pub struct SpaceSaving<T: Hash + Eq + Clone> {
     /// Map of items to (count, error) pairs
     /// - count: estimated frequency (may overestimate)
     /// - error: maximum overestimation amount
+    ///
+    /// Keyed with the std randomly seeded SipHash: the keys come from the
+    /// stream, so a fixed-key hasher would let crafted keys collide.
     items: HashMap<T, (u64, u64)>,
     /// Total number of items seen in the stream
     stream_length: u64,
@@ -206,35 +210,31 @@ impl<T: Hash + Eq + Clone> SpaceSaving<T> {
     pub fn update(&mut self, item: T) {
         self.stream_length += 1;
 
-        // Case 1: Item already tracked - increment count
-        if let Some((count, _error)) = self.items.get_mut(&item) {
-            *count += 1;
-            return;
-        }
-
-        // Case 2: Space available - add new item with count=1, error=0
-        if self.items.len() < self.capacity {
-            self.items.insert(item, (1, 0));
-            return;
-        }
+        // One hash lookup decides all three cases
+        let tracked = self.items.len();
+        let item = match self.items.entry(item) {
+            // Case 1: Item already tracked - increment count
+            Entry::Occupied(entry) => {
+                entry.into_mut().0 += 1;
+                return;
+            }
+            // Case 2: Space available - add new item with count=1, error=0
+            Entry::Vacant(entry) if tracked < self.capacity => {
+                entry.insert((1, 0));
+                return;
+            }
+            Entry::Vacant(entry) => entry.into_key(),
+        };
 
         // Case 3: At capacity - replace minimum count item
-        // Find item with minimum count
-        let min_count = self
-            .items
-            .values()
-            .map(|(count, _)| *count)
-            .min()
-            .unwrap_or(0);
-
-        // Find and remove an item with minimum count
+        // Find an item with minimum count in a single pass
         let min_item = self
             .items
             .iter()
-            .find(|(_, (count, _))| *count == min_count)
-            .map(|(k, _)| k.clone());
+            .min_by_key(|(_, (count, _))| *count)
+            .map(|(k, (count, _))| (k.clone(), *count));
 
-        if let Some(old_item) = min_item {
+        if let Some((old_item, min_count)) = min_item {
             self.items.remove(&old_item);
             // Insert new item with count = min_count + 1, error = min_count
             self.items.insert(item, (min_count + 1, min_count));
@@ -492,23 +492,36 @@ impl<T: Hash + Eq + Clone> SpaceSaving<T> {
         self.stream_length += other.stream_length;
 
         // Reduce to capacity if needed
-        while self.items.len() > self.capacity {
-            // Find and remove item with minimum count
-            let min_item = self
-                .items
-                .iter()
-                .min_by_key(|(_, (count, _))| *count)
-                .map(|(k, _)| k.clone());
-
-            if let Some(item) = min_item {
-                self.items.remove(&item);
-            } else {
-                break;
-            }
-        }
+        self.evict_lowest(self.items.len().saturating_sub(self.capacity));
 
         Ok(())
     }
+
+    /// Drops the `excess` items with the lowest counts in a single pass
+    ///
+    /// The cutoff count is found with a linear-time selection instead of
+    /// rescanning the map for its minimum once per evicted item.
+    fn evict_lowest(&mut self, excess: usize) {
+        if excess == 0 {
+            return;
+        }
+
+        let mut counts: Vec<u64> = self.items.values().map(|&(count, _)| count).collect();
+        let (_, &mut cutoff, _) = counts.select_nth_unstable(excess - 1);
+
+        // Everything below the cutoff goes; ties at the cutoff fill the remainder
+        let mut ties_to_drop = excess - counts.iter().filter(|&&count| count < cutoff).count();
+        self.items.retain(|_, &mut (count, _)| {
+            if count < cutoff {
+                false
+            } else if count == cutoff && ties_to_drop > 0 {
+                ties_to_drop -= 1;
+                false
+            } else {
+                true
+            }
+        });
+    }
 }
 
 // Implement the Sketch trait
@@ -847,6 +860,33 @@ mod tests {
         }
     }
 
+    /// Test 5c: Merging two full, disjoint sketches keeps the heaviest items
+    #[test]
+    fn test_merge_evicts_lowest_counts() {
+        let mut sketch1: SpaceSaving<u32> = SpaceSaving::with_capacity(4).unwrap();
+        let mut sketch2: SpaceSaving<u32> = SpaceSaving::with_capacity(4).unwrap();
+
+        // sketch1 holds 1..=4 with counts 1..=4, sketch2 holds 11..=14 with counts 2, 2, 5, 6
+        for item in 1..=4u32 {
+            for _ in 0..item {
+                sketch1.update(item);
+            }
+        }
+        for (item, count) in [(11u32, 2), (12, 2), (13, 5), (14, 6)] {
+            for _ in 0..count {
+                sketch2.update(item);
+            }
+        }
+
+        sketch1.merge(&sketch2).unwrap();
+
+        assert_eq!(sketch1.num_items(), 4);
+        for item in [3, 4, 13, 14] {
+            assert!(sketch1.estimate(&item).is_some(), "item {} evicted", item);
+        }
+        assert_eq!(sketch1.stream_length(), 10 + 15);
+    }
+
     /// Test 6: Zipf distribution (realistic heavy-tailed data)
     /// Tests with power-law distribution typical of real-world data
     #[test]
@@ -11,9 +11,14 @@
 //! - Serialization/deserialization support
 //!
 //! # Algorithm
-//! 1. First hash determines which block (512-bit cache line) to use
-//! 2. Remaining k hashes determine bit positions within that single block
-//! 3. All k bit checks occur within one cache line = 1 memory fetch
+//! 1. One XXH3 hash per key; its high 32 bits pick the block (512-bit cache line)
+//!    via Lemire's fast range
+//! 2. The block is partitioned into eight 64-bit words. Hash function `i` sets
+//!    one bit in word `i % 8`, chosen by multiply-shift rehashing of the low
+//!    32 bits with a per-lane odd constant (split-block / register-blocked layout)
+//! 3. The k bits are first assembled into an 8-word mask, so an insert is one
+//!    OR and a query one AND-compare against a single cache line, with no
+//!    per-bit branches; both vectorize to 256/512-bit operations
 //!
 //! # Example
 //! ```
@@ -28,6 +33,8 @@
 //! assert!(!filter.contains(b"key3")); // Probably false
 //! ```
 
+use crate::common::validation;
+
 /// Cache line size in bytes (typically 64 bytes on modern CPUs)
 const CACHE_LINE_SIZE: usize = 64;
 
@@ -37,6 +44,19 @@ const BITS_PER_BLOCK: usize = 512;
 /// u64 words per block (512 bits / 64 bits per u64 = 8 words)
 const U64_PER_BLOCK: usize = 8;
 
+/// Odd multipliers for the per-word multiply-shift rehash (as in Parquet/Impala
+/// split-block Bloom filters)
+const SALTS: [u32; U64_PER_BLOCK] = [
+    0x47b6_137b,
+    0x4497_4d91,
+    0x8824_ad5b,
+    0xa2b7_289d,
+    0x7054_95c7,
+    0x2df1_424b,
+    0x9efc_4947,
+    0x5c6b_fb31,
+];
+
 /// Blocked Bloom filter for cache-efficient membership testing
 #[derive(Clone)]
 pub struct BlockedBloomFilter {
@@ -106,19 +126,12 @@ impl BlockedBloomFilter {
     }
 
     /// Inserts an element into the filter
+    #[inline]
     pub fn insert(&mut self, key: &[u8]) {
-        let block_idx = self.hash_block(key);
-
-        // Compute all bit indices first to avoid borrow checker issues
-        let k = self.k;
-        let bit_indices: Vec<usize> = (0..k).map(|i| self.hash_within_block(key, i)).collect();
-
-        // Now we can mutably borrow the block
+        let (block_idx, mask) = self.locate(key);
         let block = &mut self.blocks[block_idx];
-        for bit_index in bit_indices {
-            let word_index = bit_index / 64;
-            let bit_offset = bit_index % 64;
-            block[word_index] |= 1u64 << bit_offset;
+        for (word, bits) in block.iter_mut().zip(mask.iter()) {
+            *word |= bits;
         }
     }
 
@@ -126,20 +139,28 @@ impl BlockedBloomFilter {
     ///
     /// Returns `true` if the element might be in the set (may be false positive)
     /// Returns `false` if the element is definitely not in the set (no false negatives)
+    #[inline]
     pub fn contains(&self, key: &[u8]) -> bool {
-        let block_idx = self.hash_block(key);
+        let (block_idx, mask) = self.locate(key);
         let block = &self.blocks[block_idx];
+        // Fold all eight words before testing so the check is branch-free
+        block
+            .iter()
+            .zip(mask.iter())
+            .fold(0u64, |missing, (word, bits)| missing | (bits & !word))
+            == 0
+    }
 
-        for i in 0..self.k {
-            let bit_index = self.hash_within_block(key, i);
-            let word_index = bit_index / 64;
-            let bit_offset = bit_index % 64;
-
-            if block[word_index] & (1u64 << bit_offset) == 0 {
-                return false;
-            }
+    /// Inserts every key in `keys`
+    pub fn insert_batch<K: AsRef<[u8]>>(&mut self, keys: &[K]) {
+        for key in keys {
+            self.insert(key.as_ref());
         }
-        true
+    }
+
+    /// Checks every key in `keys`, returning one result per key
+    pub fn contains_batch<K: AsRef<[u8]>>(&self, keys: &[K]) -> Vec<bool> {
+        keys.iter().map(|key| self.contains(key.as_ref())).collect()
     }
 
     /// Clears all bits in the filter
@@ -174,8 +195,9 @@ impl BlockedBloomFilter {
     pub fn to_bytes(&self) -> Vec<u8> {
         let mut bytes = Vec::new();
 
-        // Header: [n: 8 bytes][num_blocks: 8 bytes][k: 8 bytes]
-        bytes.extend_from_slice(&self.n.to_le_bytes());
+        // Header: [version: 1 byte | n: 7 bytes][num_blocks: 8 bytes][k: 8 bytes]
+        let n = validation::tag_format_version(self.n as u64, FORMAT_VERSION);
+        bytes.extend_from_slice(&n.to_le_bytes());
         bytes.extend_from_slice(&self.num_blocks.to_le_bytes());
         bytes.extend_from_slice(&self.k.to_le_bytes());
 
@@ -195,7 +217,10 @@ impl BlockedBloomFilter {
             return Err("Insufficient bytes for header");
         }
 
-        let n = usize::from_le_bytes(bytes[0..8].try_into().unwrap());
+        let n = u64::from_le_bytes(bytes[0..8].try_into().unwrap());
+        let n = validation::validate_format_version(n, FORMAT_VERSION, "BlockedBloomFilter")
+            .map_err(|_| "Unsupported format version (rebuild filters from 0.1.6 or earlier)")?
+            as usize;
         let num_blocks = usize::from_le_bytes(bytes[8..16].try_into().unwrap());
         let k = usize::from_le_bytes(bytes[16..24].try_into().unwrap());
 
@@ -230,7 +255,8 @@ impl BlockedBloomFilter {
 
     /// Returns true if no elements have been inserted
     pub fn is_empty(&self) -> bool {
-        self.count_bits() == 0
+        // Stops at the first set bit instead of counting them all
+        self.blocks.iter().flatten().all(|&word| word == 0)
     }
 
     /// Returns the estimated number of elements
@@ -263,23 +289,40 @@ impl BlockedBloomFilter {
         }
     }
 
-    /// Hash function to determine block index
-    #[inline]
-    fn hash_block(&self, key: &[u8]) -> usize {
-        use xxhash_rust::xxh64::xxh64;
-        let hash = xxh64(key, 0);
-        (hash as usize) % self.num_blocks
+    /// Block index and in-block bit mask for a key
+    #[inline(always)]
+    fn locate(&self, key: &[u8]) -> (usize, [u64; U64_PER_BLOCK]) {
+        let hash = xxhash_rust::xxh3::xxh3_64(key);
+        // Fast range on the high half: ((h >> 32) * num_blocks) >> 32
+        let block_idx = (((hash >> 32) * self.num_blocks as u64) >> 32) as usize;
+        (block_idx, block_mask(hash as u32, self.k))
     }
+}
 
-    /// Hash function for bit position within block
-    #[inline]
-    fn hash_within_block(&self, key: &[u8], seed: usize) -> usize {
-        use xxhash_rust::xxh64::xxh64;
-        let hash = xxh64(key, seed as u64 + 1); // +1 to differentiate from block hash
-        (hash as usize) % BITS_PER_BLOCK
-    }
+/// Bits for `k` hash functions inside one block, one word per function
+///
+/// Function `i` sets bit `(key' * SALTS[i % 8]) >> 58` of word `i % 8`, where
+/// `key'` is the low hash half re-mixed for each pass over the eight words.
+#[inline(always)]
+fn block_mask(key: u32, k: usize) -> [u64; U64_PER_BLOCK] {
+    let mut mask = [0u64; U64_PER_BLOCK];
+    for i in 0..k {
+        let lane = i % U64_PER_BLOCK;
+        let round = (i / U64_PER_BLOCK) as u32;
+        let rehashed = (key ^ round.wrapping_mul(0x9e37_79b9)).wrapping_mul(SALTS[lane]);
+        mask[lane] |= 1u64 << (rehashed >> 26);
+    }
+    mask
 }
 
+/// Serialization format version, stored in the top byte of `n`
+///
+/// Version 1 is the split-block layout: one XXH3-64 hash per key, one bit
+/// per word of the block. Filters from 0.1.6 and earlier placed bits with
+/// per-function xxh64 hashes, so lookups against them would miss inserted
+/// keys and `from_bytes` rejects them.
+const FORMAT_VERSION: u8 = 1;
+
 impl std::fmt::Debug for BlockedBloomFilter {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         f.debug_struct("BlockedBloomFilter")
@@ -424,6 +467,20 @@ mod tests {
         assert!(!deserialized.contains(b"key4"));
     }
 
+    #[test]
+    fn test_deserialize_rejects_legacy_format() {
+        // BlockedBloomFilter::new(8, 0.1) with "apple" inserted, serialized
+        // by the 0.1.6 release
+        let legacy: [u8; 88] = [
+            8, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 136, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0,
+        ];
+
+        assert!(BlockedBloomFilter::from_bytes(&legacy).is_err());
+    }
+
     #[test]
     fn test_serialization_empty() {
         let filter = BlockedBloomFilter::new(100, 0.01);
@@ -496,11 +553,38 @@ mod tests {
         let mut filter = BlockedBloomFilter::new(100, 0.01);
         filter.insert(b"test_key");
 
-        // The property we're testing: for any key, hash_block should return
-        // the same block index, ensuring all k hash functions operate on
+        // The property we're testing: for any key, locate should return
+        // a single block index, ensuring all k hash functions operate on
         // the same cache line
-        let block_idx = filter.hash_block(b"test_key");
+        let (block_idx, mask) = filter.locate(b"test_key");
         assert!(block_idx < filter.num_blocks);
+        let bits: u32 = mask.iter().map(|word| word.count_ones()).sum();
+        assert_eq!(filter.count_bits(), bits as usize);
+    }
+
+    #[test]
+    fn test_block_mask_one_word_per_hash() {
+        // Up to 8 hash functions, each one sets exactly one bit in its own word
+        for k in 1..=U64_PER_BLOCK {
+            let mask = block_mask(0xdead_beef, k);
+            for (lane, word) in mask.iter().enumerate() {
+                assert_eq!(word.count_ones(), (lane < k) as u32);
+            }
+        }
+    }
+
+    #[test]
+    fn test_batch_matches_single() {
+        let mut filter = BlockedBloomFilter::new(1000, 0.01);
+        let keys: Vec<Vec<u8>> = (0..100).map(|i| format!("key{}", i).into_bytes()).collect();
+        filter.insert_batch(&keys);
+
+        let probes: Vec<Vec<u8>> = (50..150)
+            .map(|i| format!("key{}", i).into_bytes())
+            .collect();
+        let expected: Vec<bool> = probes.iter().map(|key| filter.contains(key)).collect();
+        assert_eq!(filter.contains_batch(&probes), expected);
+        assert!(expected[..50].iter().all(|&found| found));
     }
 
     #[test]
@@ -4,8 +4,11 @@
 //! Optimized for LSM-tree SSTable filtering.
 //!
 //! # Optimizations
-//! - **Kirsch-Mitzenmacher double hashing**: Derive k hash functions from just 2 base hashes
-//!   using h_i(x) = h1(x) + i * h2(x). This reduces k hash computations to just 2.
+//! - **Kirsch-Mitzenmacher double hashing**: Derive k hash functions from the two
+//!   64-bit halves of a single XXH3-128 hash using h_i(x) = h1(x) + i * h2(x)
+//! - **Batched hashing**: `insert_batch`/`contains_batch` hash a group of keys before
+//!   touching the bit array, so the independent hashes overlap in the pipeline and
+//!   the probes of a group are issued back to back
 //! - **Lemire's fast range**: Use multiplication instead of modulo for range reduction
 //! - **Unsafe unchecked access**: Skip bounds checks in hot paths
 //!
@@ -27,13 +30,22 @@
 //! assert!(!filter.contains(b"key3")); // Probably false
 //! ```
 
-use xxhash_rust::xxh64::xxh64;
+use crate::common::validation;
+use xxhash_rust::xxh3::xxh3_128;
+
+/// Keys hashed ahead of probing in the batch APIs
+const BATCH: usize = 8;
+
+/// Probes evaluated together, without early exit, in `contains`
+const PROBE_LANES: usize = 8;
 
 /// Standard Bloom filter for membership testing
 #[derive(Clone)]
 pub struct BloomFilter {
     /// Bit array
     bits: Vec<u64>,
+    /// Number of bits set in `bits`, kept current by every write
+    bits_set: usize,
     /// Number of hash functions
     k: usize,
     /// Number of bits
@@ -69,6 +81,7 @@ impl BloomFilter {
 
         Self {
             bits: vec![0u64; num_words],
+            bits_set: 0,
             k,
             m,
             n,
@@ -90,6 +103,7 @@ impl BloomFilter {
 
         Self {
             bits: vec![0u64; num_words],
+            bits_set: 0,
             k,
             m,
             n,
@@ -98,18 +112,21 @@ impl BloomFilter {
 
     /// Compute two base hashes using Kirsch-Mitzenmacher technique
     /// Returns (h1, h2) where h1 and h2 are independent 64-bit hashes
+    ///
+    /// The pair can be kept and passed to [`insert_hashed`](Self::insert_hashed)
+    /// and [`contains_hashed`](Self::contains_hashed) to probe for the same
+    /// key repeatedly without rehashing it.
     #[inline(always)]
-    fn base_hashes(&self, key: &[u8]) -> (u64, u64) {
-        // Use xxh64 with different seeds to get two independent hashes
-        let h1 = xxh64(key, 0);
-        let h2 = xxh64(key, 1);
-        (h1, h2)
+    pub fn base_hashes(key: &[u8]) -> (u64, u64) {
+        // One XXH3-128 pass yields both halves
+        let hash = xxh3_128(key);
+        (hash as u64, (hash >> 64) as u64)
     }
 
     /// Lemire's fast range reduction: map hash to [0, range) without division
     /// This is equivalent to (hash % range) but faster
     #[inline(always)]
-    fn fast_range(hash: u64, range: usize) -> usize {
+    pub(crate) fn fast_range(hash: u64, range: usize) -> usize {
         // fastrange64: ((__uint128_t)hash * range) >> 64
         // We use u128 to avoid overflow
         (((hash as u128) * (range as u128)) >> 64) as usize
@@ -121,20 +138,28 @@ impl BloomFilter {
     /// derive k positions using h_i(x) = h1(x) + i * h2(x)
     #[inline]
     pub fn insert(&mut self, key: &[u8]) {
-        let (h1, h2) = self.base_hashes(key);
+        let (h1, h2) = Self::base_hashes(key);
+        self.insert_hashed(h1, h2);
+    }
+
+    /// Inserts a key given its precomputed [`base_hashes`](Self::base_hashes)
+    #[inline(always)]
+    pub fn insert_hashed(&mut self, h1: u64, h2: u64) {
         let m = self.m;
 
-        for i in 0..self.k {
-            // Kirsch-Mitzenmacher: h_i(x) = h1 + i * h2
-            let combined = h1.wrapping_add((i as u64).wrapping_mul(h2));
+        // Kirsch-Mitzenmacher: h_i(x) = h1 + i * h2, stepped by adding h2
+        let mut combined = h1;
+        for _ in 0..self.k {
             let bit_index = Self::fast_range(combined, m);
             let word_index = bit_index / 64;
             let bit_offset = bit_index % 64;
 
             // SAFETY: bit_index is always < m, and word_index < bits.len() by construction
-            unsafe {
-                *self.bits.get_unchecked_mut(word_index) |= 1u64 << bit_offset;
-            }
+            let word = unsafe { self.bits.get_unchecked_mut(word_index) };
+            let bit = 1u64 << bit_offset;
+            self.bits_set += (*word & bit == 0) as usize;
+            *word |= bit;
+            combined = combined.wrapping_add(h2);
         }
     }
 
@@ -146,36 +171,94 @@ impl BloomFilter {
     /// Uses Kirsch-Mitzenmacher double hashing for fast lookups.
     #[inline]
     pub fn contains(&self, key: &[u8]) -> bool {
-        let (h1, h2) = self.base_hashes(key);
-        let m = self.m;
-
-        for i in 0..self.k {
-            // Kirsch-Mitzenmacher: h_i(x) = h1 + i * h2
-            let combined = h1.wrapping_add((i as u64).wrapping_mul(h2));
-            let bit_index = Self::fast_range(combined, m);
-            let word_index = bit_index / 64;
-            let bit_offset = bit_index % 64;
+        let (h1, h2) = Self::base_hashes(key);
+        self.contains_hashed(h1, h2)
+    }
 
-            // SAFETY: bit_index is always < m, and word_index < bits.len() by construction
-            let word = unsafe { *self.bits.get_unchecked(word_index) };
-            if word & (1u64 << bit_offset) == 0 {
+    /// Checks a key given its precomputed [`base_hashes`](Self::base_hashes)
+    ///
+    /// Probes are checked in blocks of `PROBE_LANES`: within a block every
+    /// lane's position `h1 + i * h2` is independent, all bits are loaded and
+    /// AND-ed without branching, and only the block result can exit early.
+    /// For the usual k <= 8 this is a single straight-line block.
+    #[inline(always)]
+    pub fn contains_hashed(&self, h1: u64, h2: u64) -> bool {
+        let m = self.m;
+        let stride = h2.wrapping_mul(PROBE_LANES as u64);
+
+        let mut block_start = h1;
+        let mut remaining = self.k;
+        while remaining > 0 {
+            let lanes = remaining.min(PROBE_LANES);
+            let mut all_set = true;
+            for lane in 0..lanes {
+                // Kirsch-Mitzenmacher: h_i(x) = h1 + i * h2
+                let combined = block_start.wrapping_add((lane as u64).wrapping_mul(h2));
+                let bit_index = Self::fast_range(combined, m);
+
+                // SAFETY: bit_index is always < m, and word_index < bits.len() by construction
+                let word = unsafe { *self.bits.get_unchecked(bit_index / 64) };
+                all_set &= (word >> (bit_index % 64)) & 1 == 1;
+            }
+            if !all_set {
                 return false;
             }
+            block_start = block_start.wrapping_add(stride);
+            remaining -= lanes;
         }
         true
     }
 
+    /// Inserts every key in `keys`
+    ///
+    /// Keys are hashed in groups of eight before any bit is set, which keeps
+    /// the hash computations independent of the (cache-missing) bit updates.
+    pub fn insert_batch<K: AsRef<[u8]>>(&mut self, keys: &[K]) {
+        for group in keys.chunks(BATCH) {
+            let mut hashes = [(0u64, 0u64); BATCH];
+            for (slot, key) in hashes.iter_mut().zip(group) {
+                *slot = Self::base_hashes(key.as_ref());
+            }
+            for &(h1, h2) in &hashes[..group.len()] {
+                self.insert_hashed(h1, h2);
+            }
+        }
+    }
+
+    /// Checks every key in `keys`, returning one result per key
+    pub fn contains_batch<K: AsRef<[u8]>>(&self, keys: &[K]) -> Vec<bool> {
+        let mut results = Vec::with_capacity(keys.len());
+        for group in keys.chunks(BATCH) {
+            let mut hashes = [(0u64, 0u64); BATCH];
+            for (slot, key) in hashes.iter_mut().zip(group) {
+                *slot = Self::base_hashes(key.as_ref());
+            }
+            results.extend(
+                hashes[..group.len()]
+                    .iter()
+                    .map(|&(h1, h2)| self.contains_hashed(h1, h2)),
+            );
+        }
+        results
+    }
+
     /// Clears all bits in the filter
     pub fn clear(&mut self) {
         self.bits.fill(0);
+        self.bits_set = 0;
     }
 
     /// Returns the number of bits set to 1
+    ///
+    /// The count is maintained on every insert, so this is O(1).
+    #[inline]
     pub fn count_bits(&self) -> usize {
-        self.bits
-            .iter()
-            .map(|word| word.count_ones() as usize)
-            .sum()
+        self.bits_set
+    }
+
+    /// Counts the set bits of a bit array
+    fn popcount(bits: &[u64]) -> usize {
+        bits.iter().map(|word| word.count_ones() as usize).sum()
     }
 
     /// Returns the theoretical false positive rate
@@ -191,17 +274,16 @@ impl BloomFilter {
 
     /// Serializes the filter to bytes
     pub fn to_bytes(&self) -> Vec<u8> {
-        let mut bytes = Vec::new();
+        let mut bytes = Vec::with_capacity(24 + self.bits.len() * 8);
 
-        // Header: [n: 8 bytes][m: 8 bytes][k: 8 bytes]
-        bytes.extend_from_slice(&self.n.to_le_bytes());
+        // Header: [version: 1 byte | n: 7 bytes][m: 8 bytes][k: 8 bytes]
+        let n = validation::tag_format_version(self.n as u64, FORMAT_VERSION);
+        bytes.extend_from_slice(&n.to_le_bytes());
         bytes.extend_from_slice(&self.m.to_le_bytes());
         bytes.extend_from_slice(&self.k.to_le_bytes());
 
-        // Bit array
-        for word in &self.bits {
-            bytes.extend_from_slice(&word.to_le_bytes());
-        }
+        // Bit array (a straight copy on little-endian targets)
+        bytes.extend(self.bits.iter().flat_map(|word| word.to_le_bytes()));
 
         bytes
     }
@@ -212,7 +294,10 @@ impl BloomFilter {
             return Err("Insufficient bytes for header");
         }
 
-        let n = usize::from_le_bytes(bytes[0..8].try_into().unwrap());
+        let n = u64::from_le_bytes(bytes[0..8].try_into().unwrap());
+        let n = validation::validate_format_version(n, FORMAT_VERSION, "BloomFilter")
+            .map_err(|_| "Unsupported format version (rebuild filters from 0.1.6 or earlier)")?
+            as usize;
         let m = usize::from_le_bytes(bytes[8..16].try_into().unwrap());
         let k = usize::from_le_bytes(bytes[16..24].try_into().unwrap());
 
@@ -223,14 +308,21 @@ impl BloomFilter {
             return Err("Invalid byte array size");
         }
 
-        let mut bits = Vec::with_capacity(num_words);
-        for i in 0..num_words {
-            let offset = 24 + i * 8;
-            let word = u64::from_le_bytes(bytes[offset..offset + 8].try_into().unwrap());
-            bits.push(word);
-        }
+        // One allocation, filled by a bounds-check-free word decode that
+        // lowers to a memcpy on little-endian targets
+        let bits: Vec<u64> = bytes[24..]
+            .chunks_exact(8)
+            .map(|chunk| u64::from_le_bytes(chunk.try_into().unwrap()))
+            .collect();
 
-        Ok(Self { bits, k, m, n })
+        let bits_set = Self::popcount(&bits);
+        Ok(Self {
+            bits,
+            bits_set,
+            k,
+            m,
+            n,
+        })
     }
 
     /// Returns filter parameters (n, m, k)
@@ -272,9 +364,17 @@ impl BloomFilter {
         for (a, b) in self.bits.iter_mut().zip(other.bits.iter()) {
             *a |= *b;
         }
+        self.bits_set = Self::popcount(&self.bits);
     }
 }
 
+/// Serialization format version, stored in the top byte of `n`
+///
+/// Version 1 takes both probe hashes from one XXH3-128 hash. Filters from
+/// 0.1.6 and earlier set bits from two XxHash64 hashes, so lookups against
+/// them would miss inserted keys and `from_bytes` rejects them.
+const FORMAT_VERSION: u8 = 1;
+
 impl std::fmt::Debug for BloomFilter {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         f.debug_struct("BloomFilter")
@@ -318,6 +418,45 @@ mod tests {
         assert!(filter.contains(b"key3"));
     }
 
+    #[test]
+    fn test_probe_blocks_match_sequence() {
+        // k > PROBE_LANES exercises more than one probe block
+        let mut filter = BloomFilter::with_params(100, 4096, 19);
+        for i in 0..100u32 {
+            filter.insert(&i.to_le_bytes());
+        }
+        for i in 0..100u32 {
+            assert!(filter.contains(&i.to_le_bytes()));
+        }
+
+        // A key is reported present exactly when all k positions are set
+        for i in 100..2000u32 {
+            let (h1, h2) = BloomFilter::base_hashes(&i.to_le_bytes());
+            let expected = (0..19u64).all(|j| {
+                let bit = BloomFilter::fast_range(h1.wrapping_add(j.wrapping_mul(h2)), 4096);
+                filter.bits[bit / 64] & (1 << (bit % 64)) != 0
+            });
+            assert_eq!(filter.contains(&i.to_le_bytes()), expected);
+        }
+    }
+
+    #[test]
+    fn test_batch_matches_single() {
+        let keys: Vec<Vec<u8>> = (0..37).map(|i| format!("key{}", i).into_bytes()).collect();
+
+        let mut single = BloomFilter::new(1000, 0.01);
+        for key in &keys {
+            single.insert(key);
+        }
+        let mut batched = BloomFilter::new(1000, 0.01);
+        batched.insert_batch(&keys);
+        assert_eq!(single.to_bytes(), batched.to_bytes());
+
+        let probes: Vec<Vec<u8>> = (20..60).map(|i| format!("key{}", i).into_bytes()).collect();
+        let expected: Vec<bool> = probes.iter().map(|key| single.contains(key)).collect();
+        assert_eq!(batched.contains_batch(&probes), expected);
+    }
+
     #[test]
     fn test_no_false_negatives() {
         let mut filter = BloomFilter::new(1000, 0.01);
@@ -405,6 +544,18 @@ mod tests {
         assert!(!deserialized.contains(b"key4"));
     }
 
+    #[test]
+    fn test_deserialize_rejects_legacy_format() {
+        // BloomFilter::new(8, 0.1) with "apple" inserted, serialized by the
+        // 0.1.6 release
+        let legacy: [u8; 32] = [
+            8, 0, 0, 0, 0, 0, 0, 0, 39, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 34, 128, 0,
+            64, 0, 0, 0,
+        ];
+
+        assert!(BloomFilter::from_bytes(&legacy).is_err());
+    }
+
     #[test]
     fn test_serialization_empty() {
         let filter = BloomFilter::new(100, 0.01);
@@ -471,6 +622,31 @@ mod tests {
         assert!(bits_after_two >= bits_after_one);
     }
 
+    #[test]
+    fn test_count_bits_tracks_every_write() {
+        let mut filter = BloomFilter::new(500, 0.01);
+        let keys: Vec<String> = (0..400).map(|i| format!("key{}", i)).collect();
+        filter.insert_batch(&keys[..200]);
+        for key in &keys[200..] {
+            filter.insert(key.as_bytes());
+        }
+        // Re-inserting sets no new bits
+        filter.insert(b"key0");
+        assert_eq!(filter.count_bits(), BloomFilter::popcount(&filter.bits));
+
+        let mut other = BloomFilter::new(500, 0.01);
+        other.insert(b"other");
+        filter.merge(&other);
+        assert_eq!(filter.count_bits(), BloomFilter::popcount(&filter.bits));
+
+        let restored = BloomFilter::from_bytes(&filter.to_bytes()).unwrap();
+        assert_eq!(restored.count_bits(), filter.count_bits());
+
+        filter.clear();
+        assert_eq!(filter.count_bits(), 0);
+        assert!(filter.is_empty());
+    }
+
     #[test]
     #[should_panic(expected = "Expected number of elements must be > 0")]
     fn test_new_panics_on_zero_n() {
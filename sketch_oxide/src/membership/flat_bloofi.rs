@@ -0,0 +1,261 @@
+//! Flat-Bloofi: up to 64 Bloom filters queried with one pass
+//!
+//! Stores a set of same-shaped Bloom filters transposed: bit `i` of word `j`
+//! is bit `j` of filter `i`. A key's k probe positions are computed once, and
+//! AND-ing the k words yields a 64-bit mask of every filter that may contain
+//! the key, in k memory loads instead of k loads per filter.
+//!
+//! # Algorithm
+//! 1. All filters share `m` and `k`, sized like [`BloomFilter`] for the
+//!    expected number of keys per filter
+//! 2. Probe positions use the same XXH3-128 Kirsch-Mitzenmacher scheme as
+//!    [`BloomFilter`], so each column answers exactly like a standalone filter
+//! 3. Insert ORs the filter's bit into the k words; a query ANDs the k words
+//!    and stops as soon as no filter remains
+//!
+//! # Example
+//! ```
+//! use sketch_oxide::membership::FlatBloofi;
+//!
+//! // Three filters, each sized for 1000 keys at 1% FPR
+//! let mut filters = FlatBloofi::new(3, 1000, 0.01).unwrap();
+//! filters.insert(0, b"apple");
+//! filters.insert(2, b"apple");
+//! filters.insert(1, b"banana");
+//!
+//! assert_eq!(filters.matching_filters(b"apple").collect::<Vec<_>>(), vec![0, 2]);
+//! assert!(filters.contains(1, b"banana"));
+//! ```
+//!
+//! # References
+//! - Crainiceanu & Lemire, "Bloofi: Multidimensional Bloom Filters" (2015)
+//!
+//! [`BloomFilter`]: crate::membership::BloomFilter
+
+use crate::common::SketchError;
+use crate::membership::BloomFilter;
+
+/// Number of filters one bit-sliced word can hold
+const MAX_FILTERS: usize = 64;
+
+/// Up to 64 Bloom filters stored bit-sliced for multi-filter queries
+#[derive(Clone)]
+pub struct FlatBloofi {
+    /// One word per bit position; bit `i` belongs to filter `i`
+    words: Vec<u64>,
+    /// Number of filters in use
+    num_filters: usize,
+    /// Number of hash functions
+    k: usize,
+    /// Number of bit positions per filter
+    m: usize,
+    /// Expected number of elements per filter
+    n: usize,
+}
+
+impl FlatBloofi {
+    /// Creates `num_filters` empty filters, each sized for `n` keys at `fpr`
+    ///
+    /// # Errors
+    /// Returns `InvalidParameter` if `num_filters` is not in `1..=64`, `n` is 0
+    /// or `fpr` is not in (0, 1)
+    pub fn new(num_filters: usize, n: usize, fpr: f64) -> Result<Self, SketchError> {
+        if !(1..=MAX_FILTERS).contains(&num_filters) {
+            return Err(SketchError::InvalidParameter {
+                param: "num_filters".to_string(),
+                value: num_filters.to_string(),
+                constraint: format!("must be between 1 and {}", MAX_FILTERS),
+            });
+        }
+        if n == 0 {
+            return Err(SketchError::InvalidParameter {
+                param: "n".to_string(),
+                value: n.to_string(),
+                constraint: "must be > 0".to_string(),
+            });
+        }
+        if !(fpr > 0.0 && fpr < 1.0) {
+            return Err(SketchError::InvalidParameter {
+                param: "fpr".to_string(),
+                value: fpr.to_string(),
+                constraint: "must be in (0, 1)".to_string(),
+            });
+        }
+
+        // Same shape as a standalone BloomFilter for n keys
+        let (_, m, k) = BloomFilter::new(n, fpr).params();
+
+        Ok(Self {
+            words: vec![0u64; m],
+            num_filters,
+            k,
+            m,
+            n,
+        })
+    }
+
+    /// Adds `key` to filter `filter`
+    ///
+    /// # Panics
+    /// Panics if `filter >= num_filters()`
+    #[inline]
+    pub fn insert(&mut self, filter: usize, key: &[u8]) {
+        assert!(
+            filter < self.num_filters,
+            "filter index {} out of range for {} filters",
+            filter,
+            self.num_filters
+        );
+        let bit = 1u64 << filter;
+        let (h1, h2) = BloomFilter::base_hashes(key);
+
+        let mut combined = h1;
+        for _ in 0..self.k {
+            let index = BloomFilter::fast_range(combined, self.m);
+            // SAFETY: fast_range returns an index < m == words.len()
+            unsafe {
+                *self.words.get_unchecked_mut(index) |= bit;
+            }
+            combined = combined.wrapping_add(h2);
+        }
+    }
+
+    /// Returns a mask with bit `i` set if filter `i` may contain `key`
+    #[inline]
+    pub fn contains_mask(&self, key: &[u8]) -> u64 {
+        let (h1, h2) = BloomFilter::base_hashes(key);
+
+        let mut mask = u64::MAX >> (MAX_FILTERS - self.num_filters);
+        let mut combined = h1;
+        for _ in 0..self.k {
+            let index = BloomFilter::fast_range(combined, self.m);
+            // SAFETY: fast_range returns an index < m == words.len()
+            mask &= unsafe { *self.words.get_unchecked(index) };
+            if mask == 0 {
+                break;
+            }
+            combined = combined.wrapping_add(h2);
+        }
+        mask
+    }
+
+    /// Returns true if filter `filter` may contain `key`
+    ///
+    /// Filters outside `0..num_filters()` never contain anything.
+    #[inline]
+    pub fn contains(&self, filter: usize, key: &[u8]) -> bool {
+        filter < self.num_filters && (self.contains_mask(key) >> filter) & 1 == 1
+    }
+
+    /// Iterates over the indices of the filters that may contain `key`
+    pub fn matching_filters(&self, key: &[u8]) -> impl Iterator<Item = usize> {
+        let mut mask = self.contains_mask(key);
+        std::iter::from_fn(move || {
+            if mask == 0 {
+                return None;
+            }
+            let filter = mask.trailing_zeros() as usize;
+            mask &= mask - 1;
+            Some(filter)
+        })
+    }
+
+    /// Clears every filter
+    pub fn clear(&mut self) {
+        self.words.fill(0);
+    }
+
+    /// Returns the number of filters
+    pub fn num_filters(&self) -> usize {
+        self.num_filters
+    }
+
+    /// Returns the per-filter parameters (n, m, k)
+    pub fn params(&self) -> (usize, usize, usize) {
+        (self.n, self.m, self.k)
+    }
+
+    /// Returns the memory usage of the bit-sliced words in bytes
+    pub fn memory_usage(&self) -> usize {
+        self.words.len() * std::mem::size_of::<u64>()
+    }
+}
+
+impl std::fmt::Debug for FlatBloofi {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("FlatBloofi")
+            .field("num_filters", &self.num_filters)
+            .field("n", &self.n)
+            .field("m", &self.m)
+            .field("k", &self.k)
+            .field("memory_bytes", &self.memory_usage())
+            .finish()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_invalid_parameters() {
+        assert!(FlatBloofi::new(0, 100, 0.01).is_err());
+        assert!(FlatBloofi::new(65, 100, 0.01).is_err());
+        assert!(FlatBloofi::new(4, 0, 0.01).is_err());
+        assert!(FlatBloofi::new(4, 100, 0.0).is_err());
+        assert!(FlatBloofi::new(4, 100, 1.0).is_err());
+        assert!(FlatBloofi::new(64, 100, 0.01).is_ok());
+    }
+
+    #[test]
+    fn test_no_false_negatives() {
+        let mut filters = FlatBloofi::new(64, 200, 0.01).unwrap();
+        for i in 0..1000u32 {
+            filters.insert(i as usize % 64, &i.to_le_bytes());
+        }
+        for i in 0..1000u32 {
+            assert!(filters.contains(i as usize % 64, &i.to_le_bytes()));
+        }
+    }
+
+    #[test]
+    fn test_columns_match_bloom_filter() {
+        let mut filters = FlatBloofi::new(5, 100, 0.01).unwrap();
+        let (n, m, k) = filters.params();
+        let mut blooms: Vec<BloomFilter> =
+            (0..5).map(|_| BloomFilter::with_params(n, m, k)).collect();
+
+        for i in 0..300u32 {
+            let filter = (i * 7 % 5) as usize;
+            filters.insert(filter, &i.to_le_bytes());
+            blooms[filter].insert(&i.to_le_bytes());
+        }
+
+        // Every column answers exactly like the equivalent standalone filter
+        for i in 0..5000u32 {
+            let key = i.to_le_bytes();
+            let expected: Vec<usize> = (0..5).filter(|&f| blooms[f].contains(&key)).collect();
+            assert_eq!(filters.matching_filters(&key).collect::<Vec<_>>(), expected);
+        }
+    }
+
+    #[test]
+    fn test_mask_limited_to_filters_in_use() {
+        let mut filters = FlatBloofi::new(3, 10, 0.01).unwrap();
+        for filter in 0..3 {
+            filters.insert(filter, b"shared");
+        }
+        assert_eq!(filters.contains_mask(b"shared"), 0b111);
+        assert!(!filters.contains(3, b"shared"));
+
+        filters.clear();
+        assert_eq!(filters.contains_mask(b"shared"), 0);
+    }
+
+    #[test]
+    #[should_panic(expected = "out of range")]
+    fn test_insert_out_of_range_panics() {
+        let mut filters = FlatBloofi::new(2, 10, 0.01).unwrap();
+        filters.insert(2, b"key");
+    }
+}
@@ -65,8 +65,8 @@
 //! ```
 
 use crate::common::{Result, SketchError};
-use crate::membership::BloomFilter;
-use xxhash_rust::xxh64::xxh64;
+use crate::membership::BlockedBloomFilter;
+use xxhash_rust::xxh3::xxh3_128;
 
 /// Learned Bloom Filter - ML-enhanced membership testing
 ///
@@ -76,8 +76,8 @@ use xxhash_rust::xxh64::xxh64;
 pub struct LearnedBloomFilter {
     /// Linear model for membership prediction
     model: LinearModel,
-    /// Backup Bloom filter to prevent false negatives
-    backup_filter: BloomFilter,
+    /// Backup Bloom filter to prevent false negatives (one cache line per probe)
+    backup_filter: BlockedBloomFilter,
     /// Feature extractor for keys
     feature_extractor: FeatureExtractor,
     /// Target false positive rate
@@ -105,9 +105,9 @@ pub struct LinearModel {
 /// Extracts simple features based on hash values and bit patterns
 #[derive(Clone, Debug)]
 pub struct FeatureExtractor {
-    /// Number of hash functions for feature extraction
+    /// Number of 32-bit hash words sampled for features
     hash_functions: usize,
-    /// Number of bits to use per hash
+    /// Number of bits to sample per hash word
     feature_bits: usize,
 }
 
@@ -228,20 +228,18 @@ impl LearnedBloomFilter {
         };
 
         // Create backup filter
-        // Size it for the keys that need backup, with tight FPR
-        let mut backup_filter = BloomFilter::new(backup_n, fpr);
+        // Size it for the keys that need backup, with tight FPR. Blocking all
+        // probes into one cache line costs some accuracy, so the filter is
+        // sized for half the target rate (about 15% more bits at 1%).
+        let mut backup_filter = BlockedBloomFilter::new(backup_n, fpr / 2.0);
 
         // Insert keys into backup filter
         if backup_ratio > 0.5 {
             // Model failed to learn - use all keys
-            for key in training_keys {
-                backup_filter.insert(key);
-            }
+            backup_filter.insert_batch(training_keys);
         } else {
             // Model learned well - only insert low-confidence keys
-            for key in &backup_keys {
-                backup_filter.insert(key);
-            }
+            backup_filter.insert_batch(&backup_keys);
         }
 
         Ok(Self {
@@ -467,7 +465,11 @@ impl LinearModel {
 
 impl FeatureExtractor {
     /// Creates a new feature extractor
+    ///
+    /// All hash features come from one 128-bit hash, so at most four 32-bit
+    /// words are available.
     fn new(hash_functions: usize, feature_bits: usize) -> Self {
+        debug_assert!(hash_functions <= 4 && (1..=32).contains(&feature_bits));
         Self {
             hash_functions,
             feature_bits,
@@ -484,14 +486,18 @@ impl FeatureExtractor {
     fn extract(&self, key: &[u8]) -> Vec<f64> {
         let mut features = Vec::with_capacity(self.feature_dim());
 
-        // Use multiple hash functions with different seeds
-        for seed in 0..self.hash_functions {
-            let hash = xxh64(key, seed as u64);
+        // Hash the key once: XXH3-128 reads long keys with wide vector loads,
+        // where seeded hashes would take one full pass over the key each
+        let hash = xxh3_128(key);
+
+        // Split the hash into independent 32-bit words
+        let stride = 32 / self.feature_bits;
+        for word in 0..self.hash_functions {
+            let word_hash = (hash >> (word * 32)) as u32;
 
-            // Extract multiple bits from the hash
+            // Extract evenly spaced bits from the word
             for bit_offset in 0..self.feature_bits {
-                let bit_index = bit_offset * 8; // Sample every 8th bit
-                let bit = (hash >> bit_index) & 1;
+                let bit = (word_hash >> (bit_offset * stride)) & 1;
                 features.push(bit as f64);
             }
         }
@@ -7,6 +7,7 @@ mod blocked_bloom;
 mod bloom;
 mod counting_bloom;
 mod cuckoo;
+mod flat_bloofi;
 mod learned_bloom;
 mod ribbon;
 mod stable_bloom;
@@ -17,6 +18,7 @@ pub use blocked_bloom::BlockedBloomFilter;
 pub use bloom::BloomFilter;
 pub use counting_bloom::CountingBloomFilter;
 pub use cuckoo::CuckooFilter;
+pub use flat_bloofi::FlatBloofi;
 pub use learned_bloom::{LearnedBloomFilter, LearnedBloomStats};
 pub use ribbon::RibbonFilter;
 pub use stable_bloom::StableBloomFilter;
@@ -70,7 +70,7 @@
 //! ```
 
 use crate::common::SketchError;
-use xxhash_rust::xxh64::xxh64;
+use xxhash_rust::xxh3::xxh3_128;
 
 /// Number of entries per bucket (optimized for cache lines)
 const BUCKET_SIZE: usize = 4;
@@ -135,19 +135,13 @@ impl Bucket {
 
     /// Checks if fingerprint is present in the bucket
     ///
-    /// Takes advantage of semi-sorted order for early termination
+    /// Compares every slot without branching: empty slots hold 0 and
+    /// fingerprints are never 0, so they can never match.
     #[inline]
     fn contains(&self, fp: u16) -> bool {
-        for i in 0..self.count as usize {
-            if self.entries[i] == fp {
-                return true;
-            }
-            if self.entries[i] > fp {
-                // Can stop early due to semi-sorting
-                return false;
-            }
-        }
-        false
+        self.entries
+            .iter()
+            .fold(false, |found, &entry| found | (entry == fp))
     }
 
     /// Removes a fingerprint from the bucket
@@ -245,6 +239,9 @@ pub struct VacuumFilter {
 }
 
 impl VacuumFilter {
+    /// Keys below which a parallel batch is hashed on one thread
+    const PARALLEL_BATCH_LEN: usize = 1 << 16;
+
     /// Creates a new Vacuum Filter
     ///
     /// # Arguments
@@ -365,13 +362,120 @@ impl VacuumFilter {
     /// assert!(filter.contains(b"hello"));
     /// ```
     pub fn insert(&mut self, key: &[u8]) -> Result<(), SketchError> {
+        let (fp, hash) = self.hash_key(key);
+        self.insert_hashed(fp, hash)
+    }
+
+    /// Inserts every key in `keys`
+    ///
+    /// Equivalent to calling [`insert`](Self::insert) for each key in order.
+    /// Fingerprints and bucket hashes are computed for groups of keys
+    /// before any of them is placed. Their hash chains are independent, so the
+    /// CPU can overlap them instead of waiting on each key's probe.
+    ///
+    /// # Errors
+    ///
+    /// Stops at the first key that cannot be inserted. The keys before it
+    /// remain in the filter.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::membership::VacuumFilter;
+    ///
+    /// let keys: Vec<[u8; 8]> = (0..1000u64).map(u64::to_le_bytes).collect();
+    /// let mut filter = VacuumFilter::new(2000, 0.01).unwrap();
+    /// filter.insert_batch(&keys).unwrap();
+    ///
+    /// assert_eq!(filter.len(), 1000);
+    /// assert!(keys.iter().all(|key| filter.contains(key)));
+    /// ```
+    pub fn insert_batch<K: AsRef<[u8]>>(&mut self, keys: &[K]) -> Result<(), SketchError> {
+        const LANES: usize = 8;
+
+        for chunk in keys.chunks(LANES) {
+            let mut hashed = [(0u16, 0u64); LANES];
+            for (slot, key) in hashed.iter_mut().zip(chunk) {
+                let key = key.as_ref();
+                *slot = self.hash_key(key);
+            }
+            for &(fp, hash) in &hashed[..chunk.len()] {
+                self.insert_hashed(fp, hash)?;
+            }
+        }
+        Ok(())
+    }
+
+    /// Inserts every key in `keys`, hashing them on all cores
+    ///
+    /// Each thread computes the fingerprints and bucket hashes for a
+    /// contiguous share of the keys, and the keys are then placed in order on
+    /// the calling thread. Placement can probe across buckets and rehash, so
+    /// it stays serial, and the filter ends up exactly as after
+    /// [`insert_batch`](Self::insert_batch). Batches shorter than 65 536 keys
+    /// are inserted serially.
+    ///
+    /// # Errors
+    ///
+    /// Stops at the first key that cannot be inserted. The keys before it
+    /// remain in the filter.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::membership::VacuumFilter;
+    ///
+    /// let keys: Vec<[u8; 8]> = (0..100_000u64).map(u64::to_le_bytes).collect();
+    /// let mut filter = VacuumFilter::new(200_000, 0.01).unwrap();
+    /// filter.insert_batch_parallel(&keys).unwrap();
+    ///
+    /// assert_eq!(filter.len(), 100_000);
+    /// assert!(keys.iter().all(|key| filter.contains(key)));
+    /// ```
+    pub fn insert_batch_parallel<K: AsRef<[u8]> + Sync>(
+        &mut self,
+        keys: &[K],
+    ) -> Result<(), SketchError> {
+        let threads = std::thread::available_parallelism().map_or(1, |n| n.get());
+        if threads < 2 || keys.len() < Self::PARALLEL_BATCH_LEN {
+            return self.insert_batch(keys);
+        }
+
+        let filter = &*self;
+        let chunk_len = keys.len().div_ceil(threads);
+        let hashed: Vec<(u16, u64)> = std::thread::scope(|scope| {
+            let workers: Vec<_> = keys
+                .chunks(chunk_len)
+                .map(|chunk| {
+                    scope.spawn(move || {
+                        chunk
+                            .iter()
+                            .map(|key| filter.hash_key(key.as_ref()))
+                            .collect::<Vec<_>>()
+                    })
+                })
+                .collect();
+            workers
+                .into_iter()
+                .flat_map(|worker| worker.join().expect("VacuumFilter worker panicked"))
+                .collect()
+        });
+
+        for (fp, hash) in hashed {
+            self.insert_hashed(fp, hash)?;
+        }
+        Ok(())
+    }
+
+    /// Places a precomputed fingerprint, rehashing first if the filter is full
+    fn insert_hashed(&mut self, fp: u16, hash: u64) -> Result<(), SketchError> {
         // Check if rehashing needed
         if self.load_factor() >= self.max_load_factor {
             self.rehash()?;
         }
 
-        let fp = self.fingerprint(key);
-        let mut bucket_idx = self.bucket_index(key);
+        // The bucket is derived after any rehash so it uses the current size
+        let mut bucket_idx = self.bucket_index(hash);
 
         // Linear probing to find a bucket with space
         let start_idx = bucket_idx;
@@ -418,8 +522,49 @@ impl VacuumFilter {
     /// assert!(!filter.contains(b"world")); // True negative (likely)
     /// ```
     pub fn contains(&self, key: &[u8]) -> bool {
-        let fp = self.fingerprint(key);
-        let mut bucket_idx = self.bucket_index(key);
+        let (fp, hash) = self.hash_key(key);
+        self.contains_at(fp, self.bucket_index(hash))
+    }
+
+    /// Checks a batch of keys, returning one result per key
+    ///
+    /// Keys are processed in groups of 8: all fingerprints and home buckets
+    /// in a group are computed first, then the buckets are probed, so the
+    /// bucket loads of a group are independent and can overlap.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::membership::VacuumFilter;
+    ///
+    /// let keys: Vec<[u8; 8]> = (0..1000u64).map(u64::to_le_bytes).collect();
+    /// let mut filter = VacuumFilter::new(2000, 0.01).unwrap();
+    /// filter.insert_batch(&keys[..500]).unwrap();
+    ///
+    /// let found = filter.contains_batch(&keys);
+    /// assert!(found[..500].iter().all(|&hit| hit));
+    /// ```
+    pub fn contains_batch<K: AsRef<[u8]>>(&self, keys: &[K]) -> Vec<bool> {
+        const LANES: usize = 8;
+
+        let mut results = Vec::with_capacity(keys.len());
+        for chunk in keys.chunks(LANES) {
+            let mut hashed = [(0u16, 0u64); LANES];
+            for (slot, key) in hashed.iter_mut().zip(chunk) {
+                *slot = self.hash_key(key.as_ref());
+            }
+            results.extend(
+                hashed[..chunk.len()]
+                    .iter()
+                    .map(|&(fp, hash)| self.contains_at(fp, self.bucket_index(hash))),
+            );
+        }
+        results
+    }
+
+    /// Probes for a fingerprint starting at its home bucket
+    #[inline]
+    fn contains_at(&self, fp: u16, mut bucket_idx: usize) -> bool {
         let start_idx = bucket_idx;
 
         // Linear probing to find the fingerprint
@@ -465,8 +610,8 @@ impl VacuumFilter {
     /// assert!(!filter.contains(b"hello"));
     /// ```
     pub fn delete(&mut self, key: &[u8]) -> Result<bool, SketchError> {
-        let fp = self.fingerprint(key);
-        let mut bucket_idx = self.bucket_index(key);
+        let (fp, hash) = self.hash_key(key);
+        let mut bucket_idx = self.bucket_index(hash);
         let start_idx = bucket_idx;
 
         // Linear probing to find and remove the fingerprint
@@ -577,23 +722,22 @@ impl VacuumFilter {
         self.num_items = 0;
     }
 
-    /// Computes the fingerprint for a key
+    /// Computes a key's fingerprint and bucket hash from one XXH3-128 pass
+    ///
+    /// The fingerprint comes from the top bits of the high half and the
+    /// bucket hash is the low half, so the two stay independent.
     #[inline]
-    fn fingerprint(&self, key: &[u8]) -> u16 {
-        let hash = xxh64(key, 0xDEADBEEF);
-        let fp = ((hash >> 48) as u16) & self.fingerprint_mask;
+    fn hash_key(&self, key: &[u8]) -> (u16, u64) {
+        let hash = xxh3_128(key);
+        let fp = ((hash >> 112) as u16) & self.fingerprint_mask;
         // Ensure non-zero (0 represents empty slot)
-        if fp == 0 {
-            1
-        } else {
-            fp
-        }
+        let fp = if fp == 0 { 1 } else { fp };
+        (fp, hash as u64)
     }
 
-    /// Computes the bucket index for a key
+    /// Maps a bucket hash to its home bucket
     #[inline]
-    fn bucket_index(&self, key: &[u8]) -> usize {
-        let hash = xxh64(key, 0);
+    fn bucket_index(&self, hash: u64) -> usize {
         (hash as usize) % self.num_buckets
     }
 
@@ -673,6 +817,64 @@ mod tests {
         assert!(VacuumFilter::new(100, 1.5).is_err());
     }
 
+    #[test]
+    fn test_insert_batch_matches_insert() {
+        let keys: Vec<String> = (0..500).map(|i| format!("key_{}", i)).collect();
+
+        let mut batched = VacuumFilter::new(1000, 0.01).unwrap();
+        batched.insert_batch(&keys).unwrap();
+
+        let mut serial = VacuumFilter::new(1000, 0.01).unwrap();
+        for key in &keys {
+            serial.insert(key.as_bytes()).unwrap();
+        }
+
+        assert_eq!(batched.len(), serial.len());
+        assert!(batched
+            .buckets
+            .iter()
+            .zip(&serial.buckets)
+            .all(|(a, b)| a.entries == b.entries));
+        assert!(keys.iter().all(|key| batched.contains(key.as_bytes())));
+    }
+
+    #[test]
+    fn test_insert_batch_parallel_matches_insert_batch() {
+        let keys: Vec<[u8; 8]> = (0..VacuumFilter::PARALLEL_BATCH_LEN as u64 + 1000)
+            .map(|i| i.wrapping_mul(0x9E37_79B9_7F4A_7C15).to_le_bytes())
+            .collect();
+
+        let mut parallel = VacuumFilter::new(keys.len(), 0.01).unwrap();
+        parallel.insert_batch_parallel(&keys).unwrap();
+
+        let mut serial = VacuumFilter::new(keys.len(), 0.01).unwrap();
+        serial.insert_batch(&keys).unwrap();
+
+        assert_eq!(parallel.len(), serial.len());
+        assert!(parallel
+            .buckets
+            .iter()
+            .zip(&serial.buckets)
+            .all(|(a, b)| a.entries == b.entries));
+    }
+
+    #[test]
+    fn test_contains_batch_matches_contains() {
+        let mut filter = VacuumFilter::new(1000, 0.01).unwrap();
+        for i in 0..600u32 {
+            filter.insert(&i.to_le_bytes()).unwrap();
+        }
+        for i in (0..600u32).step_by(3) {
+            filter.delete(&i.to_le_bytes()).unwrap();
+        }
+
+        // Odd length exercises the partial final group
+        let keys: Vec<[u8; 4]> = (0..2003u32).map(u32::to_le_bytes).collect();
+        let expected: Vec<bool> = keys.iter().map(|key| filter.contains(key)).collect();
+        assert_eq!(filter.contains_batch(&keys), expected);
+        assert!(filter.contains_batch::<&[u8]>(&[]).is_empty());
+    }
+
     #[test]
     fn test_insert_and_contains() {
         let mut filter = VacuumFilter::new(100, 0.01).unwrap();
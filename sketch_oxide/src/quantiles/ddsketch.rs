@@ -47,45 +47,250 @@
 //! - Paper: "DDSketch: A Fast and Fully-Mergeable Quantile Sketch with Relative-Error Guarantees" (VLDB 2019)
 //! - Datadog blog: https://www.datadoghq.com/blog/engineering/computing-accurate-percentiles-with-ddsketch/
 
-use crate::common::{Mergeable, Sketch, SketchError};
-use std::collections::HashMap;
+use crate::common::{simd, validation, Mergeable, Sketch, SketchError};
+
+// Coefficients of the cubic that approximates log2 on the significand:
+// log2((1 + s) * 2^e) ≈ e + ((A * s + B) * s + C) * s for s in [0, 1).
+// The cubic is exact at s = 0 and s = 1, increasing, and its slope in ln(v)
+// never drops below C, so scaling indices by 1 / (C * ln(gamma)) keeps every
+// bin within a factor of gamma (the CubicallyInterpolatedMapping used by
+// Datadog's reference implementations).
+const CUBIC_A: f64 = 6.0 / 35.0;
+const CUBIC_B: f64 = -3.0 / 5.0;
+const CUBIC_C: f64 = 10.0 / 7.0;
+
+const SIGNIFICAND_MASK: u64 = (1 << 52) - 1;
+const ONE_BITS: u64 = 0x3ff << 52;
+
+/// Approximates `log2(value)` from the IEEE-754 exponent plus a cubic in
+/// the significand, avoiding a `ln()` call per update
+#[inline]
+fn approx_log2(value: f64) -> f64 {
+    if value < f64::MIN_POSITIVE {
+        // Subnormals have no implicit leading bit; they are rare enough
+        // to take the exact path
+        return value.log2();
+    }
+    let bits = value.to_bits();
+    let exponent = ((bits >> 52) & 0x7ff) as i64 - 1023;
+    let s = f64::from_bits((bits & SIGNIFICAND_MASK) | ONE_BITS) - 1.0;
+    ((CUBIC_A * s + CUBIC_B) * s + CUBIC_C) * s + exponent as f64
+}
+
+/// Inverse of [`approx_log2`], solving the cubic with Cardano's formula
+fn approx_exp2(x: f64) -> f64 {
+    let exponent = x.floor();
+    let d0 = CUBIC_B * CUBIC_B - 3.0 * CUBIC_A * CUBIC_C;
+    let d1 = 2.0 * CUBIC_B * CUBIC_B * CUBIC_B
+        - 9.0 * CUBIC_A * CUBIC_B * CUBIC_C
+        - 27.0 * CUBIC_A * CUBIC_A * (x - exponent);
+    let p = ((d1 - (d1 * d1 - 4.0 * d0 * d0 * d0).sqrt()) / 2.0).cbrt();
+    let s = -(CUBIC_B + p + d0 / p) / (3.0 * CUBIC_A);
+    (1.0 + s) * 2.0_f64.powf(exponent)
+}
 
 /// Store for binned values
 ///
 /// Maintains histogram bins with counts, along with min/max tracking.
+/// Bins are a dense array covering a contiguous index range that starts at
+/// `origin` and grows on either side as new extremes arrive, so an update is
+/// a single array access with no hashing. Empty bins hold zero.
+///
+/// The range is bounded by `MAX_BIN_SPAN`: when a new extreme would widen it
+/// further, the lowest bins are collapsed into the new lowest bin, as in
+/// Datadog's collapsing-lowest dense store. Quantiles that fall in the
+/// collapsed bin lose the relative error guarantee; the others keep it.
 #[derive(Debug, Clone)]
 struct Store {
-    bins: HashMap<i32, u64>, // bin_index -> count
-    count: u64,              // total count
-    min: f64,                // minimum value
-    max: f64,                // maximum value
+    origin: i32,      // bin index of counts[0]
+    counts: Vec<u64>, // count per bin for indices origin..origin + len
+    count: u64,       // total count
+    min: f64,         // minimum value
+    max: f64,         // maximum value
 }
 
 impl Store {
     fn new() -> Self {
         Self {
-            bins: HashMap::new(),
+            origin: 0,
+            counts: Vec::new(),
             count: 0,
             min: f64::INFINITY,
             max: f64::NEG_INFINITY,
         }
     }
 
+    /// Empties the store without releasing the bin allocation
+    fn clear(&mut self) {
+        self.origin = 0;
+        self.counts.clear();
+        self.count = 0;
+        self.min = f64::INFINITY;
+        self.max = f64::NEG_INFINITY;
+    }
+
     fn add(&mut self, index: i32) {
-        *self.bins.entry(index).or_insert(0) += 1;
+        self.add_count(index, 1);
         self.count += 1;
     }
 
+    /// Adds `count` to bin `index`, growing the bin range if needed
+    ///
+    /// Indices below a collapsed range land in the lowest bin.
+    #[inline]
+    fn add_count(&mut self, index: i32, count: u64) {
+        let slot = index as i64 - self.origin as i64;
+        if slot < 0 || slot >= self.counts.len() as i64 {
+            self.extend_range(index, index);
+        }
+        let slot = (index as i64 - self.origin as i64).max(0) as usize;
+        self.counts[slot] += count;
+    }
+
+    /// Grows the bin range to cover `lo..=hi`, collapsing the lowest bins
+    /// if the range would exceed `MAX_BIN_SPAN`
+    ///
+    /// Growing upwards appends (amortized by `Vec`); growing downwards moves
+    /// `origin` and shifts the existing counts right in one memmove.
+    #[cold]
+    fn extend_range(&mut self, lo: i32, hi: i32) {
+        let (lo, hi) = match self.highest() {
+            Some(top) => (lo.min(self.origin) as i64, hi.max(top) as i64),
+            None => (lo as i64, hi as i64),
+        };
+        let lo = lo.max(hi - MAX_BIN_SPAN + 1);
+
+        if self.counts.is_empty() {
+            self.counts.resize((hi - lo + 1) as usize, 0);
+        } else if lo < self.origin as i64 {
+            let shift = (self.origin as i64 - lo) as usize;
+            self.counts.splice(0..0, std::iter::repeat_n(0, shift));
+        } else if lo > self.origin as i64 {
+            // Fold every bin below `lo` into bin `lo`
+            let cut = ((lo - self.origin as i64) as usize).min(self.counts.len());
+            let collapsed = self
+                .counts
+                .drain(..cut)
+                .fold(0u64, |sum, count| sum.saturating_add(count));
+            if self.counts.is_empty() {
+                self.counts.push(0);
+            }
+            self.counts[0] = self.counts[0].saturating_add(collapsed);
+        }
+        self.origin = lo as i32;
+
+        let len = (hi - lo + 1) as usize;
+        if len > self.counts.len() {
+            self.counts.resize(len, 0);
+        }
+    }
+
+    /// Index of the highest bin in the range, if any
+    fn highest(&self) -> Option<i32> {
+        (!self.counts.is_empty()).then(|| self.origin + (self.counts.len() - 1) as i32)
+    }
+
+    /// Iterates non-empty bins as (index, count) in increasing index order
+    fn bins(&self) -> impl DoubleEndedIterator<Item = (i32, u64)> + '_ {
+        let origin = self.origin;
+        self.counts
+            .iter()
+            .enumerate()
+            .filter(|&(_, &count)| count > 0)
+            .map(move |(slot, &count)| (origin + slot as i32, count))
+    }
+
     fn merge(&mut self, other: &Store) {
-        for (&index, &count) in &other.bins {
-            *self.bins.entry(index).or_insert(0) += count;
+        if let Some(other_hi) = other.highest() {
+            self.extend_range(other.origin, other_hi);
+            // Bins of `other` below a collapsed range go to the lowest bin
+            let below = ((self.origin as i64 - other.origin as i64).max(0) as usize)
+                .min(other.counts.len());
+            let (collapsed, rest) = other.counts.split_at(below);
+            self.counts[0] = collapsed
+                .iter()
+                .fold(self.counts[0], |sum, &count| sum.saturating_add(count));
+            let start = (other.origin as i64 + below as i64 - self.origin as i64) as usize;
+            simd::add_assign_saturating_u64(&mut self.counts[start..], rest);
         }
         self.count += other.count;
         self.min = self.min.min(other.min);
         self.max = self.max.max(other.max);
     }
+
+    /// Writes the bin count followed by (index, count) pairs in index order
+    fn serialize_bins(&self, bytes: &mut Vec<u8>) {
+        let num_bins = self.counts.iter().filter(|&&count| count > 0).count();
+        bytes.extend_from_slice(&(num_bins as u64).to_le_bytes());
+        for (index, count) in self.bins() {
+            bytes.extend_from_slice(&index.to_le_bytes());
+            bytes.extend_from_slice(&count.to_le_bytes());
+        }
+    }
+
+    /// Reads the bins written by `serialize_bins`, advancing `pos` past them
+    ///
+    /// The dense range is sized once from the lowest and highest index, and
+    /// ranges wider than `MAX_BIN_SPAN` are rejected: no store grows past it,
+    /// so such a blob cannot have been written by `serialize`.
+    fn deserialize_bins(bytes: &[u8], pos: &mut usize) -> Result<Self, SketchError> {
+        let truncated =
+            || SketchError::DeserializationError("Insufficient data for DDSketch bins".to_string());
+        let num_bins = bytes
+            .get(*pos..*pos + 8)
+            .map(|len| u64::from_le_bytes(len.try_into().unwrap()))
+            .ok_or_else(truncated)?;
+        *pos += 8;
+        let bin_bytes = usize::try_from(num_bins)
+            .ok()
+            .and_then(|n| n.checked_mul(12))
+            .and_then(|n| bytes.get(*pos..pos.checked_add(n)?))
+            .ok_or_else(truncated)?;
+        *pos += bin_bytes.len();
+
+        let bins = bin_bytes.chunks_exact(12).map(|bin| {
+            (
+                i32::from_le_bytes(bin[0..4].try_into().unwrap()),
+                u64::from_le_bytes(bin[4..12].try_into().unwrap()),
+            )
+        });
+        let mut store = Store::new();
+        if num_bins > 0 {
+            let (lo, hi) = bins
+                .clone()
+                .fold((i32::MAX, i32::MIN), |(lo, hi), (index, _)| {
+                    (lo.min(index), hi.max(index))
+                });
+            if hi as i64 - lo as i64 >= MAX_BIN_SPAN {
+                return Err(SketchError::DeserializationError(format!(
+                    "DDSketch bin range {lo}..={hi} is too wide"
+                )));
+            }
+            store.extend_range(lo, hi);
+            for (index, count) in bins {
+                store.add_count(index, count);
+            }
+        }
+        Ok(store)
+    }
 }
 
+/// Widest bin range a store holds: 2^20 bins (8 MiB)
+///
+/// Covers the whole f64 range for relative accuracy down to about 1e-3, and
+/// a 1e90 ratio between the largest and smallest value at 1e-4. Stores
+/// collapse their lowest bins to stay within it, and `deserialize` rejects
+/// wider ranges, so every serialized sketch round-trips.
+const MAX_BIN_SPAN: i64 = 1 << 20;
+
+/// Serialization format version, stored in the top byte of `zero_count`
+///
+/// Version 1 indexes bins with the cubic `approx_log2` mapping. Sketches
+/// from 0.1.6 and earlier used ln-based indices, which the new mapping
+/// reads back as different values (over 10% off at alpha = 0.01 near
+/// 1e6), so `deserialize` rejects them.
+const FORMAT_VERSION: u8 = 1;
+
 /// DDSketch for quantile estimation with relative error guarantees
 ///
 /// # Algorithm
@@ -101,7 +306,7 @@ impl Store {
 ///
 /// # Complexity
 ///
-/// - **Update**: O(1) average, O(log n) worst case (hash map)
+/// - **Update**: O(1) amortized (dense array indexed from a movable origin)
 /// - **Quantile query**: O(k) where k is number of distinct bins
 /// - **Merge**: O(k₁ + k₂) where k₁, k₂ are bin counts
 /// - **Space**: O(k) where k ≈ log₁₊α(max/min)
@@ -117,10 +322,11 @@ impl Store {
 /// This relative error guarantee holds for all quantiles.
 #[derive(Debug, Clone)]
 pub struct DDSketch {
-    alpha: f64,    // Relative accuracy parameter (e.g., 0.01 = 1%)
-    gamma: f64,    // Bin width: (1 + alpha) / (1 - alpha)
-    gamma_ln: f64, // ln(gamma) for efficiency
-    offset: f64,   // Bias for log mapping
+    alpha: f64,      // Relative accuracy parameter (e.g., 0.01 = 1%)
+    gamma: f64,      // Bin width: (1 + alpha) / (1 - alpha)
+    gamma_ln: f64,   // ln(gamma) for efficiency
+    offset: f64,     // Bias for log mapping
+    multiplier: f64, // Bins per unit of approximate log2: 1 / (C * ln(gamma))
 
     store_positive: Store, // Positive values
     store_negative: Store, // Negative values (stored as absolute values)
@@ -170,6 +376,7 @@ impl DDSketch {
             gamma,
             gamma_ln,
             offset,
+            multiplier: 1.0 / (CUBIC_C * gamma_ln),
             store_positive: Store::new(),
             store_negative: Store::new(),
             zero_count: 0,
@@ -180,7 +387,7 @@ impl DDSketch {
     ///
     /// # Time Complexity
     ///
-    /// O(1) average case (hash map insertion)
+    /// O(1) amortized (one array access; the bin range grows on new extremes)
     ///
     /// # Example
     ///
@@ -208,30 +415,50 @@ impl DDSketch {
         }
     }
 
+    /// Updates the sketch with a batch of values
+    ///
+    /// Equivalent to calling [`add`](Self::add) for each value, without
+    /// per-value call overhead at language-binding boundaries.
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use sketch_oxide::quantiles::DDSketch;
+    ///
+    /// let mut dd = DDSketch::new(0.01).unwrap();
+    /// dd.add_batch(&[1.0, -2.5, 0.0, 42.0]);
+    /// assert_eq!(dd.count(), 4);
+    /// ```
+    pub fn add_batch(&mut self, values: &[f64]) {
+        for &value in values {
+            self.add(value);
+        }
+    }
+
     /// Maps a value to its bin index using logarithmic binning
     ///
-    /// Formula: k = ceil(log_gamma(value)) + offset
+    /// Formula: k = ceil(approx_log2(value) * multiplier) + offset
     ///
-    /// This ensures that values within a factor of gamma are mapped to the same bin,
-    /// which provides the relative error guarantee.
+    /// `approx_log2` reads the exponent bits and evaluates a cubic in the
+    /// significand instead of calling `ln()`. The multiplier is chosen so
+    /// that every bin still spans at most a factor of gamma, which provides
+    /// the relative error guarantee.
     fn key(&self, value: f64) -> i32 {
-        // DDSketch mapping: k = ceil(log_gamma(value)) + offset
-        ((value.ln() / self.gamma_ln + self.offset).ceil()) as i32
+        ((approx_log2(value) * self.multiplier + self.offset).ceil()) as i32
     }
 
     /// Maps a bin index back to a representative value
     ///
-    /// Formula: value = 2 * gamma^(k-1) / (1 + gamma^(-1))
+    /// Formula: value = 2 * lo * hi / (lo + hi)
     ///
-    /// This returns the geometric midpoint of the bin's range [gamma^(k-1), gamma^k],
-    /// which provides better accuracy than using just the upper bound.
+    /// where [lo, hi] is the bin's value range. Since hi / lo <= gamma, this
+    /// point is within alpha relative error of every value in the bin.
     fn value(&self, index: i32) -> f64 {
-        // Geometric midpoint: 2 * gamma^(k-1) / (1 + 1/gamma)
-        // Simplified: 2 * gamma^(k-1) * gamma / (gamma + 1)
-        // Which equals: 2 * gamma^k / (gamma + 1)
-        let exponent = (index as f64) - self.offset;
-        let gamma_k = self.gamma.powf(exponent);
-        2.0 * gamma_k / (self.gamma + 1.0)
+        let upper = (index as f64) - self.offset;
+        let lo = approx_exp2((upper - 1.0) / self.multiplier);
+        let hi = approx_exp2(upper / self.multiplier);
+        // 2 * lo * hi / (lo + hi), arranged so lo * hi cannot underflow
+        2.0 * lo / (1.0 + lo / hi)
     }
 
     /// Returns the total count of values
@@ -301,11 +528,9 @@ impl DDSketch {
 
         // Negative values (in reverse order, largest negative first)
         if rank <= self.store_negative.count {
-            let mut indices: Vec<_> = self.store_negative.bins.keys().copied().collect();
-            indices.sort_by(|a, b| b.cmp(a)); // Reverse for negatives
-
-            for index in indices {
-                accumulated += self.store_negative.bins[&index];
+            // Reverse for negatives
+            for (index, count) in self.store_negative.bins().rev() {
+                accumulated += count;
                 if accumulated >= rank {
                     return Some(-self.value(index));
                 }
@@ -320,11 +545,8 @@ impl DDSketch {
         accumulated += self.zero_count;
 
         // Positive values
-        let mut indices: Vec<_> = self.store_positive.bins.keys().copied().collect();
-        indices.sort();
-
-        for index in indices {
-            accumulated += self.store_positive.bins[&index];
+        for (index, count) in self.store_positive.bins() {
+            accumulated += count;
             if accumulated >= rank {
                 return Some(self.value(index));
             }
@@ -420,6 +642,25 @@ impl DDSketch {
     pub fn alpha(&self) -> f64 {
         self.alpha
     }
+
+    /// Removes all values, keeping the bin storage allocated for reuse
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use sketch_oxide::quantiles::DDSketch;
+    ///
+    /// let mut dd = DDSketch::new(0.01).unwrap();
+    /// dd.add(42.0);
+    /// dd.clear();
+    /// assert_eq!(dd.count(), 0);
+    /// assert_eq!(dd.quantile(0.5), None);
+    /// ```
+    pub fn clear(&mut self) {
+        self.store_positive.clear();
+        self.store_negative.clear();
+        self.zero_count = 0;
+    }
 }
 
 impl Sketch for DDSketch {
@@ -440,32 +681,26 @@ impl Sketch for DDSketch {
     fn serialize(&self) -> Vec<u8> {
         let mut bytes = Vec::new();
 
-        // Header: alpha, gamma, gamma_ln, offset, zero_count
+        // Header: alpha, gamma, gamma_ln, offset, zero_count (with the
+        // format version in its top byte)
         bytes.extend_from_slice(&self.alpha.to_le_bytes());
         bytes.extend_from_slice(&self.gamma.to_le_bytes());
         bytes.extend_from_slice(&self.gamma_ln.to_le_bytes());
         bytes.extend_from_slice(&self.offset.to_le_bytes());
-        bytes.extend_from_slice(&self.zero_count.to_le_bytes());
+        let zero_count = validation::tag_format_version(self.zero_count, FORMAT_VERSION);
+        bytes.extend_from_slice(&zero_count.to_le_bytes());
 
         // Positive store
         bytes.extend_from_slice(&self.store_positive.count.to_le_bytes());
         bytes.extend_from_slice(&self.store_positive.min.to_le_bytes());
         bytes.extend_from_slice(&self.store_positive.max.to_le_bytes());
-        bytes.extend_from_slice(&(self.store_positive.bins.len() as u64).to_le_bytes());
-        for (&index, &count) in &self.store_positive.bins {
-            bytes.extend_from_slice(&index.to_le_bytes());
-            bytes.extend_from_slice(&count.to_le_bytes());
-        }
+        self.store_positive.serialize_bins(&mut bytes);
 
         // Negative store
         bytes.extend_from_slice(&self.store_negative.count.to_le_bytes());
         bytes.extend_from_slice(&self.store_negative.min.to_le_bytes());
         bytes.extend_from_slice(&self.store_negative.max.to_le_bytes());
-        bytes.extend_from_slice(&(self.store_negative.bins.len() as u64).to_le_bytes());
-        for (&index, &count) in &self.store_negative.bins {
-            bytes.extend_from_slice(&index.to_le_bytes());
-            bytes.extend_from_slice(&count.to_le_bytes());
-        }
+        self.store_negative.serialize_bins(&mut bytes);
 
         bytes
     }
@@ -482,6 +717,8 @@ impl Sketch for DDSketch {
         let gamma_ln = f64::from_le_bytes(bytes[16..24].try_into().unwrap());
         let offset = f64::from_le_bytes(bytes[24..32].try_into().unwrap());
         let zero_count = u64::from_le_bytes(bytes[32..40].try_into().unwrap());
+        let zero_count =
+            validation::validate_format_version(zero_count, FORMAT_VERSION, "DDSketch")?;
 
         let mut pos = 40;
 
@@ -492,53 +729,39 @@ impl Sketch for DDSketch {
         pos += 8;
         let pos_max = f64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap());
         pos += 8;
-        let pos_bins_len = u64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap()) as usize;
-        pos += 8;
-
-        let mut pos_bins = HashMap::new();
-        for _ in 0..pos_bins_len {
-            let index = i32::from_le_bytes(bytes[pos..pos + 4].try_into().unwrap());
-            pos += 4;
-            let count = u64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap());
-            pos += 8;
-            pos_bins.insert(index, count);
-        }
+        let store_positive = Store::deserialize_bins(bytes, &mut pos)?;
 
         // Read negative store
+        if bytes.len() < pos + 32 {
+            return Err(SketchError::DeserializationError(
+                "Insufficient data for DDSketch negative store".to_string(),
+            ));
+        }
         let neg_count = u64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap());
         pos += 8;
         let neg_min = f64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap());
         pos += 8;
         let neg_max = f64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap());
         pos += 8;
-        let neg_bins_len = u64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap()) as usize;
-        pos += 8;
-
-        let mut neg_bins = HashMap::new();
-        for _ in 0..neg_bins_len {
-            let index = i32::from_le_bytes(bytes[pos..pos + 4].try_into().unwrap());
-            pos += 4;
-            let count = u64::from_le_bytes(bytes[pos..pos + 8].try_into().unwrap());
-            pos += 8;
-            neg_bins.insert(index, count);
-        }
+        let store_negative = Store::deserialize_bins(bytes, &mut pos)?;
 
         Ok(DDSketch {
             alpha,
             gamma,
             gamma_ln,
             offset,
+            multiplier: 1.0 / (CUBIC_C * gamma_ln),
             store_positive: Store {
-                bins: pos_bins,
                 count: pos_count,
                 min: pos_min,
                 max: pos_max,
+                ..store_positive
             },
             store_negative: Store {
-                bins: neg_bins,
                 count: neg_count,
                 min: neg_min,
                 max: neg_max,
+                ..store_negative
             },
             zero_count,
         })
@@ -622,6 +845,204 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_add_batch_matches_add() {
+        let values: Vec<f64> = (-50..200).map(|i| i as f64 * 1.7).collect();
+
+        let mut single = DDSketch::new(0.01).unwrap();
+        for &v in &values {
+            single.add(v);
+        }
+        let mut batched = DDSketch::new(0.01).unwrap();
+        batched.add_batch(&values);
+
+        assert_eq!(batched.count(), single.count());
+        for q in [0.0, 0.1, 0.5, 0.9, 1.0] {
+            assert_eq!(batched.quantile(q), single.quantile(q));
+        }
+    }
+
+    #[test]
+    fn test_approx_log2() {
+        // Exact at powers of two, increasing in between
+        for e in -1022..1024 {
+            let v = 2.0_f64.powi(e);
+            assert_eq!(approx_log2(v), e as f64);
+        }
+        assert_eq!(approx_log2(f64::from_bits(1)), -1074.0);
+        let mut prev = f64::NEG_INFINITY;
+        for i in 1..10_000 {
+            let l = approx_log2(1.0 + i as f64 / 10_000.0);
+            assert!(l > prev);
+            assert!((l - (1.0 + i as f64 / 10_000.0).log2()).abs() < 0.01);
+            prev = l;
+        }
+
+        for &v in &[1e-300, 0.37, 1.0, 1.5, 3.0, 1234.5678, 1e300] {
+            let recovered = approx_exp2(approx_log2(v));
+            assert!((recovered - v).abs() / v < 1e-9, "{} -> {}", v, recovered);
+        }
+    }
+
+    #[test]
+    fn test_relative_error_guarantee() {
+        for &alpha in &[0.001, 0.01, 0.05, 0.1] {
+            let dd = DDSketch::new(alpha).unwrap();
+            let mut v = 1e-200;
+            while v < 1e200 {
+                let recovered = dd.value(dd.key(v));
+                let relative_error = (recovered - v).abs() / v;
+                assert!(
+                    relative_error <= alpha + 1e-9,
+                    "alpha {}: {} -> {} (error {})",
+                    alpha,
+                    v,
+                    recovered,
+                    relative_error
+                );
+                v *= 1.0 + 0.37 * alpha;
+            }
+        }
+    }
+
+    #[test]
+    fn test_store_merge() {
+        let mut a = Store::new();
+        for &i in &[-3, 1, 2, 5, 9, 10, 11] {
+            a.add(i);
+        }
+        let mut b = Store::new();
+        for &i in &[-7, 1, 3, 4, 9, 12, 12] {
+            b.add(i);
+        }
+
+        a.merge(&b);
+        let bins: Vec<(i32, u64)> = a.bins().collect();
+        assert_eq!(
+            bins,
+            vec![
+                (-7, 1),
+                (-3, 1),
+                (1, 2),
+                (2, 1),
+                (3, 1),
+                (4, 1),
+                (5, 1),
+                (9, 2),
+                (10, 1),
+                (11, 1),
+                (12, 2)
+            ]
+        );
+        assert_eq!(a.count, 14);
+
+        // The range grows on both sides as new extremes arrive
+        let mut c = Store::new();
+        for &i in &[5, 2, 8, 2, -1, 5] {
+            c.add(i);
+        }
+        assert_eq!(c.origin, -1);
+        assert_eq!(c.counts.len(), 10);
+        let bins: Vec<(i32, u64)> = c.bins().collect();
+        assert_eq!(bins, vec![(-1, 1), (2, 2), (5, 2), (8, 1)]);
+    }
+
+    #[test]
+    fn test_deserialize_rejects_wide_bin_range() {
+        let mut dd = DDSketch::new(0.01).unwrap();
+        dd.add(1.0);
+        let valid = dd.serialize();
+        assert_eq!(DDSketch::deserialize(&valid).unwrap().count(), 1);
+
+        // Positive bins at i32::MIN and i32::MAX would need a 2^32-bin store
+        let mut bytes = valid[..64].to_vec();
+        bytes.extend_from_slice(&2u64.to_le_bytes());
+        for index in [i32::MIN, i32::MAX] {
+            bytes.extend_from_slice(&index.to_le_bytes());
+            bytes.extend_from_slice(&1u64.to_le_bytes());
+        }
+        bytes.extend_from_slice(&valid[valid.len() - 32..]);
+        assert!(DDSketch::deserialize(&bytes).is_err());
+
+        // A bin count that overruns the blob
+        let mut truncated = valid[..64].to_vec();
+        truncated.extend_from_slice(&u64::MAX.to_le_bytes());
+        truncated.extend_from_slice(&valid[valid.len() - 32..]);
+        assert!(DDSketch::deserialize(&truncated).is_err());
+    }
+
+    #[test]
+    fn test_store_collapses_lowest_bins() {
+        let top = MAX_BIN_SPAN as i32 + 5;
+        let mut a = Store::new();
+        a.add(0);
+        a.add(3);
+        a.add(top);
+        assert_eq!(a.counts.len(), MAX_BIN_SPAN as usize);
+        assert_eq!(a.origin, 6);
+
+        // Indices below the collapsed range land in the lowest bin
+        a.add(1);
+        let bins: Vec<(i32, u64)> = a.bins().collect();
+        assert_eq!(bins, vec![(6, 3), (top, 1)]);
+
+        // Merging a store that reaches below the range collapses it too
+        let mut b = Store::new();
+        b.add(-10);
+        b.add(top + 2);
+        a.merge(&b);
+        assert_eq!(a.counts.len(), MAX_BIN_SPAN as usize);
+        let bins: Vec<(i32, u64)> = a.bins().collect();
+        assert_eq!(bins, vec![(8, 4), (top, 1), (top + 2, 1)]);
+        assert_eq!(a.count, 6);
+    }
+
+    #[test]
+    fn test_small_relative_accuracy_is_bounded() {
+        // The bin span between 1 and 1e3 at this accuracy exceeds i32
+        let mut dd = DDSketch::new(1e-9).unwrap();
+        dd.add(1.0);
+        dd.add(1e3);
+        assert!(dd.store_positive.counts.len() <= MAX_BIN_SPAN as usize);
+        assert_eq!(dd.count(), 2);
+    }
+
+    #[test]
+    fn test_serialization_roundtrip_small_relative_accuracy() {
+        let mut dd = DDSketch::new(1e-7).unwrap();
+        dd.add(1.0);
+        dd.add(1e6);
+        dd.add(-1.0);
+        dd.add(-1e6);
+
+        let restored = DDSketch::deserialize(&dd.serialize()).unwrap();
+        assert_eq!(restored.count(), 4);
+        for q in [0.0, 0.25, 0.5, 0.75, 1.0] {
+            assert_eq!(restored.quantile(q), dd.quantile(q));
+        }
+
+        // The top bin is not collapsed and keeps its accuracy
+        let max = restored.quantile(1.0).unwrap();
+        assert!((max - 1e6).abs() / 1e6 < 1e-6, "max {}", max);
+    }
+
+    #[test]
+    fn test_deserialize_rejects_legacy_format() {
+        // DDSketch::new(0.01) with 1e6 added, serialized by the 0.1.6 release
+        let legacy: [u8; 116] = [
+            123, 20, 174, 71, 225, 122, 132, 63, 253, 74, 129, 90, 191, 82, 240, 63, 125, 5, 157,
+            5, 14, 123, 148, 63, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 128, 132, 46, 65, 0, 0, 0, 0, 128, 132, 46, 65, 1, 0, 0, 0, 0, 0, 0,
+            0, 179, 2, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 240,
+            127, 0, 0, 0, 0, 0, 0, 240, 255, 0, 0, 0, 0, 0, 0, 0, 0,
+        ];
+
+        match DDSketch::deserialize(&legacy) {
+            Err(SketchError::DeserializationError(msg)) => assert!(msg.contains("legacy")),
+            other => panic!("expected legacy format error, got {other:?}"),
+        }
+    }
+
     #[test]
     fn test_gamma_calculation() {
         let dd = DDSketch::new(0.01).unwrap();
@@ -20,6 +20,9 @@ impl SplineSketch {
     /// Default maximum number of samples
     pub const DEFAULT_MAX_SAMPLES: usize = 200;
 
+    /// Values below which a parallel batch stays on one thread
+    const PARALLEL_BATCH_LEN: usize = 1 << 16;
+
     /// Creates a new SplineSketch with specified maximum sample count
     pub fn new(max_samples: usize) -> Self {
         SplineSketch {
@@ -73,13 +76,66 @@ impl SplineSketch {
         self.weight += weight;
         self.min_value = self.min_value.min(value);
         self.max_value = self.max_value.max(value);
-        self.samples.push(value);
+        // Samples stay sorted, so insert in place instead of re-sorting
+        let pos = self.samples.partition_point(|&s| s < value);
+        self.samples.insert(pos, value);
 
         if self.samples.len() > self.max_samples {
             self.compress();
         }
+    }
 
-        self.samples.sort_unstable();
+    /// Updates the sketch with every value in `values` using all cores
+    ///
+    /// Each thread builds a private sketch with the same `max_samples` from
+    /// its share of the values, and the partial sketches are then merged
+    /// into this one. Because compression depends on the order in which
+    /// samples arrive, the retained samples can differ slightly from a serial
+    /// [`update`](Self::update) loop, with the same accuracy. Batches shorter
+    /// than 65 536 values are applied serially.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::quantiles::SplineSketch;
+    ///
+    /// let values: Vec<u64> = (0..200_000).collect();
+    /// let mut sketch = SplineSketch::new(200);
+    /// sketch.update_batch_parallel(&values);
+    ///
+    /// assert_eq!(sketch.total_weight(), 200_000.0);
+    /// let median = sketch.query(0.5);
+    /// assert!((90_000..110_000).contains(&median));
+    /// ```
+    pub fn update_batch_parallel(&mut self, values: &[u64]) {
+        let threads = std::thread::available_parallelism().map_or(1, |n| n.get());
+        if threads < 2 || values.len() < Self::PARALLEL_BATCH_LEN {
+            for &value in values {
+                self.update(value, 1.0);
+            }
+            return;
+        }
+
+        let max_samples = self.max_samples;
+        let chunk_len = values.len().div_ceil(threads);
+        std::thread::scope(|scope| {
+            let partials: Vec<_> = values
+                .chunks(chunk_len)
+                .map(|chunk| {
+                    scope.spawn(move || {
+                        let mut partial = SplineSketch::new(max_samples);
+                        for &value in chunk {
+                            partial.update(value, 1.0);
+                        }
+                        partial
+                    })
+                })
+                .collect();
+            for partial in partials {
+                let partial = partial.join().expect("SplineSketch worker panicked");
+                self.merge_into(&partial);
+            }
+        });
     }
 
     /// Compresses the samples by retaining quantile boundaries
@@ -91,26 +147,23 @@ impl SplineSketch {
         let target_size = self.max_samples;
         let current_size = self.samples.len();
 
-        // Use simpler stratified sampling that preserves quantiles better
-        let mut compressed = Vec::with_capacity(target_size);
+        // Use simpler stratified sampling that preserves quantiles better.
+        // Selected indices never fall behind the write position, so the
+        // samples are compacted in place and the buffer keeps its capacity.
+        let samples = &mut self.samples;
 
-        // Always keep the extremes
-        if !self.samples.is_empty() {
-            compressed.push(self.samples[0]);
-
-            // Select quantile boundaries: 0%, 10%, 20%, ..., 90%, 100%
-            for i in 1..target_size - 1 {
-                let ratio = i as f64 / (target_size - 1) as f64;
-                let pos = ratio * (current_size - 1) as f64;
-                let idx = pos.round() as usize;
-                compressed.push(self.samples[idx]);
-            }
-
-            compressed.push(self.samples[current_size - 1]);
-            compressed.dedup();
+        // Always keep the extremes (index 0 already holds the minimum)
+        // Select quantile boundaries: 0%, 10%, 20%, ..., 90%, 100%
+        for i in 1..target_size - 1 {
+            let ratio = i as f64 / (target_size - 1) as f64;
+            let pos = ratio * (current_size - 1) as f64;
+            let idx = pos.round() as usize;
+            samples[i] = samples[idx];
         }
 
-        self.samples = compressed;
+        samples[target_size - 1] = samples[current_size - 1];
+        samples.truncate(target_size);
+        samples.dedup();
     }
 
     /// Estimates a quantile using monotone cubic spline interpolation
@@ -330,6 +383,7 @@ impl Sketch for SplineSketch {
             ]);
             samples.push(value);
         }
+        samples.sort_unstable();
         let offset = 16 + sample_count * 8;
 
         let min_value = u64::from_le_bytes([
@@ -627,6 +681,33 @@ mod tests {
         assert!(q75 <= q90, "{} <= {}", q75, q90);
     }
 
+    #[test]
+    fn test_update_batch_parallel() {
+        let values: Vec<u64> = (0..100_000).rev().collect();
+        let mut sketch = SplineSketch::new(200);
+        sketch.update_batch_parallel(&values);
+
+        assert_eq!(sketch.total_weight(), 100_000.0);
+        assert_eq!(sketch.min(), Some(0));
+        assert_eq!(sketch.max(), Some(99_999));
+        assert!(sketch.sample_count() <= 200);
+        let median = sketch.query(0.5);
+        assert!(median.abs_diff(50_000) < 5_000, "median={}", median);
+    }
+
+    #[test]
+    fn test_update_batch_parallel_small_batch_is_serial() {
+        let values: Vec<u64> = (0..1000).collect();
+        let mut batched = SplineSketch::new(100);
+        batched.update_batch_parallel(&values);
+
+        let mut serial = SplineSketch::new(100);
+        for &value in &values {
+            serial.update(value, 1.0);
+        }
+        assert_eq!(batched.samples, serial.samples);
+    }
+
     #[test]
     fn test_reset() {
         let mut sketch = SplineSketch::new(200);
@@ -646,6 +727,21 @@ mod tests {
         assert_eq!(sketch.max(), None);
     }
 
+    #[test]
+    fn test_buffer_reused_across_compress_and_reset() {
+        let mut sketch = SplineSketch::new(200);
+        let capacity = sketch.samples.capacity();
+
+        for round in 0..3u64 {
+            for i in (0..1000u64).rev() {
+                sketch.update(i * 7 % 1000 + round, 1.0);
+            }
+            assert!(sketch.samples.windows(2).all(|w| w[0] <= w[1]));
+            assert_eq!(sketch.samples.capacity(), capacity);
+            sketch.reset();
+        }
+    }
+
     #[test]
     fn test_serialization_empty() {
         let sketch = SplineSketch::new(200);
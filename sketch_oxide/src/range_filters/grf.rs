@@ -204,12 +204,20 @@ impl GRF {
         // Sort and deduplicate keys
         let mut sorted_keys: Vec<u64> = keys.to_vec();
         sorted_keys.sort_unstable();
-        sorted_keys.dedup();
+        Self::dedup_sorted(&mut sorted_keys);
 
         let key_count = sorted_keys.len();
 
-        // Create shape-based segments
-        let segments = Self::create_segments(&sorted_keys, bits_per_key);
+        // Create shape-based segments, dispatching once on the width so each
+        // segment size gets its own specialized build loop.
+        // More bits = larger segments (better compression)
+        // Fewer bits = smaller segments (better precision)
+        let segments = match bits_per_key {
+            2..=3 => Self::create_segments::<4>(&sorted_keys, bits_per_key),
+            4..=5 => Self::create_segments::<8>(&sorted_keys, bits_per_key),
+            6..=7 => Self::create_segments::<16>(&sorted_keys, bits_per_key),
+            _ => Self::create_segments::<32>(&sorted_keys, bits_per_key),
+        };
 
         // Generate fingerprints for each segment
         let fingerprints = Self::generate_fingerprints(&segments, &sorted_keys, bits_per_key);
@@ -233,31 +241,46 @@ impl GRF {
         })
     }
 
+    /// Remove duplicates from sorted keys without branching on each key
+    ///
+    /// Every key is written to the output cursor, which only advances when
+    /// the key differs from the last kept one. Irregular run lengths then
+    /// cost no branch mispredictions.
+    fn dedup_sorted(keys: &mut Vec<u64>) {
+        if keys.is_empty() {
+            return;
+        }
+        let mut len = 1;
+        for i in 1..keys.len() {
+            let key = keys[i];
+            keys[len] = key;
+            len += (key != keys[len - 1]) as usize;
+        }
+        keys.truncate(len);
+    }
+
     /// Create shape-based segments from sorted keys
     ///
     /// This is the core innovation of GRF: adaptive segmentation based on
     /// key distribution patterns (gaps, density, etc.)
-    fn create_segments(keys: &[u64], bits_per_key: usize) -> Vec<Segment> {
-        let mut segments = Vec::new();
+    ///
+    /// `TARGET_SEGMENT_SIZE` is a const parameter, so each width's build loop
+    /// is compiled with its segment size as a constant.
+    fn create_segments<const TARGET_SEGMENT_SIZE: usize>(
+        keys: &[u64],
+        bits_per_key: usize,
+    ) -> Vec<Segment> {
+        let mut segments = Vec::with_capacity(keys.len().div_ceil(TARGET_SEGMENT_SIZE + 1));
 
         if keys.is_empty() {
             return segments;
         }
 
-        // Adaptive segment size based on bits_per_key
-        // More bits = larger segments (better compression)
-        // Fewer bits = smaller segments (better precision)
-        let target_segment_size = match bits_per_key {
-            2..=3 => 4,
-            4..=5 => 8,
-            6..=7 => 16,
-            _ => 32,
-        };
-
+        let fingerprint_mask = (1u64 << bits_per_key.min(8)) - 1;
         let mut start_idx = 0;
 
         while start_idx < keys.len() {
-            let end_idx = (start_idx + target_segment_size).min(keys.len() - 1);
+            let end_idx = (start_idx + TARGET_SEGMENT_SIZE).min(keys.len() - 1);
 
             // Calculate gap-based adjustment
             // If there's a large gap in the middle of a segment, split it
@@ -270,7 +293,7 @@ impl GRF {
             let max_key = keys[actual_end];
 
             // Generate fingerprint based on segment boundaries
-            let fingerprint = Self::compute_segment_fingerprint(min_key, max_key, bits_per_key);
+            let fingerprint = Self::compute_segment_fingerprint(min_key, max_key, fingerprint_mask);
 
             segments.push(Segment {
                 start_idx,
@@ -321,12 +344,11 @@ impl GRF {
     /// Compute fingerprint for a segment
     ///
     /// Uses hash of segment boundaries to create compact fingerprint
-    fn compute_segment_fingerprint(min_key: u64, max_key: u64, bits_per_key: usize) -> u8 {
+    fn compute_segment_fingerprint(min_key: u64, max_key: u64, mask: u64) -> u8 {
         let mut buf = [0u8; 16];
         buf[0..8].copy_from_slice(&min_key.to_le_bytes());
         buf[8..16].copy_from_slice(&max_key.to_le_bytes());
         let hash = xxhash(&buf, 0);
-        let mask = (1u64 << bits_per_key.min(8)) - 1;
         (hash & mask) as u8
     }
 
@@ -465,18 +487,39 @@ impl GRF {
         }
     }
 
-    /// Find segments that overlap with the query range
-    fn find_overlapping_segments(&self, low: u64, high: u64) -> Vec<usize> {
-        let mut overlapping = Vec::new();
+    /// Find the first segment whose keys reach `low`
+    ///
+    /// Segments are sorted and disjoint, so this segment holds the smallest
+    /// key >= `low`, if there is one.
+    fn first_segment_reaching(&self, low: u64) -> Option<&Segment> {
+        let idx = self
+            .segments
+            .partition_point(|segment| segment.max_key < low);
+        self.segments.get(idx)
+    }
+
+    /// Check whether any key in `keys` falls within [low, high]
+    ///
+    /// `key - low <= high - low` (wrapping) tests both bounds with one
+    /// unsigned compare. Each fixed-size chunk is reduced without branches,
+    /// so the compiler can compare the chunk with vector instructions.
+    fn any_key_in_range(keys: &[u64], low: u64, high: u64) -> bool {
+        const LANES: usize = 8;
 
-        for (idx, segment) in self.segments.iter().enumerate() {
-            // Check if segment overlaps with query range
-            if segment.max_key >= low && segment.min_key <= high {
-                overlapping.push(idx);
+        let width = high - low;
+        let mut chunks = keys.chunks_exact(LANES);
+        for chunk in &mut chunks {
+            let hit = chunk
+                .iter()
+                .fold(false, |hit, &key| hit | (key.wrapping_sub(low) <= width));
+            if hit {
+                return true;
             }
         }
-
-        overlapping
+        chunks
+            .remainder()
+            .iter()
+            .any(|&key| key.wrapping_sub(low) <= width)
     }
 }
 
@@ -521,24 +564,19 @@ impl RangeFilter for GRF {
             return false;
         }
 
-        // Find overlapping segments
-        let overlapping_segments = self.find_overlapping_segments(low, high);
-
-        if overlapping_segments.is_empty() {
+        // Only the first segment reaching `low` can hold the smallest key in
+        // range; every later segment starts above it
+        let Some(segment) = self.first_segment_reaching(low) else {
+            return false;
+        };
+        if segment.min_key > high {
             return false;
         }
 
-        // Check if any keys in overlapping segments fall within range
-        for seg_idx in overlapping_segments {
-            let segment = &self.segments[seg_idx];
-
-            // Check actual keys in this segment
-            for i in segment.start_idx..=segment.end_idx {
-                let key = self.keys[i];
-                if key >= low && key <= high {
-                    return true; // Found a key in range
-                }
-            }
+        // Check actual keys in this segment
+        let keys = &self.keys[segment.start_idx..=segment.end_idx];
+        if Self::any_key_in_range(keys, low, high) {
+            return true; // Found a key in range
         }
 
         // No keys found in range, but check fingerprints for false positives
@@ -586,6 +624,63 @@ mod tests {
         assert!(grf.may_contain(50));
     }
 
+    #[test]
+    fn test_dedup_sorted() {
+        // Irregular run lengths, including runs of one
+        let mut keys: Vec<u64> = (0..500u64)
+            .flat_map(|i| std::iter::repeat_n(i * 3, (i * i % 7) as usize + 1))
+            .collect();
+        let mut expected = keys.clone();
+        expected.dedup();
+
+        GRF::dedup_sorted(&mut keys);
+        assert_eq!(keys, expected);
+
+        let mut empty: Vec<u64> = Vec::new();
+        GRF::dedup_sorted(&mut empty);
+        assert!(empty.is_empty());
+
+        let grf = GRF::build(&[5, 5, 5, 1, 1, 9], 6).unwrap();
+        assert_eq!(grf.key_count(), 3);
+    }
+
+    #[test]
+    fn test_segment_size_per_width() {
+        // Evenly spaced keys never split early, so every segment spans
+        // target + 1 keys for its width
+        let keys: Vec<u64> = (0..1000u64).map(|i| i * 10).collect();
+        for (bits_per_key, target) in [(2, 4), (5, 8), (6, 16), (8, 32), (16, 32)] {
+            let grf = GRF::build(&keys, bits_per_key).unwrap();
+            assert_eq!(grf.segment_count(), keys.len().div_ceil(target + 1));
+            assert!(grf.may_contain(990));
+        }
+    }
+
+    #[test]
+    fn test_range_query_matches_key_scan() {
+        // Clustered keys with large gaps, so segments split unevenly
+        let keys: Vec<u64> = (0..2000u64)
+            .map(|i| (i / 50) * 10_000 + (i % 50) * (i % 7 + 1))
+            .collect();
+        let mut sorted = keys.clone();
+        sorted.sort_unstable();
+
+        for bits_per_key in [2, 6, 10] {
+            let grf = GRF::build(&keys, bits_per_key).unwrap();
+            for low in (0..410_000u64).step_by(997) {
+                for width in [0, 1, 5, 40, 300, 20_000] {
+                    let high = low + width;
+                    let expected = sorted.iter().any(|&k| k >= low && k <= high);
+                    assert_eq!(grf.may_contain_range(low, high), expected);
+                }
+            }
+        }
+
+        let grf = GRF::build(&[0, u64::MAX], 6).unwrap();
+        assert!(grf.may_contain_range(u64::MAX, u64::MAX));
+        assert!(!grf.may_contain_range(1, u64::MAX - 1));
+    }
+
     #[test]
     fn test_empty_keys_error() {
         let keys: Vec<u64> = vec![];
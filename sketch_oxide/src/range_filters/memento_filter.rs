@@ -283,6 +283,11 @@ impl MementoFilter {
         self.metadata.num_elements == 0
     }
 
+    /// Get the maximum number of elements the filter accepts
+    pub fn capacity(&self) -> usize {
+        self.metadata.capacity
+    }
+
     /// Get statistics about the filter
     ///
     /// # Returns
@@ -430,6 +435,7 @@ mod tests {
         let filter = MementoFilter::new(1000, 0.01).unwrap();
         assert_eq!(filter.len(), 0);
         assert!(filter.is_empty());
+        assert_eq!(filter.capacity(), 1000);
     }
 
     #[test]
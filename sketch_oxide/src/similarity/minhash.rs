@@ -36,8 +36,8 @@
 //! - Broder, A. Z. (1997). "On the resemblance and containment of documents"
 //! - Used in: LSH, deduplication, recommendation systems, near-duplicate detection
 
-use crate::common::hash::xxhash;
-use crate::common::{Mergeable, Sketch, SketchError};
+use crate::common::hash::xxh3_hash128;
+use crate::common::{simd, validation, Mergeable, Sketch, SketchError};
 use std::hash::Hash;
 
 /// MinHash sketch for Jaccard similarity estimation
@@ -84,6 +84,9 @@ impl MinHash {
     /// Minimum recommended number of permutations
     const MIN_NUM_PERM: usize = 16;
 
+    /// Item × permutation updates below which a batch stays on one thread
+    const PARALLEL_BATCH_WORK: usize = 1 << 20;
+
     /// Creates a new MinHash sketch with specified number of permutations
     ///
     /// # Arguments
@@ -154,7 +157,8 @@ impl MinHash {
 
     /// Updates the MinHash sketch with a new item
     ///
-    /// For each hash function i, computes hash_i(item) and updates
+    /// The item is hashed once; each hash function i is a seeded
+    /// multiply-xorshift permutation of that base hash, and
     /// hash_values[i] = min(hash_values[i], hash_i(item))
     ///
     /// # Time Complexity
@@ -172,16 +176,64 @@ impl MinHash {
     /// mh.update(&vec![1, 2, 3]);
     /// ```
     pub fn update<T: Hash>(&mut self, item: &T) {
-        // Update each hash function's minimum value
-        for i in 0..self.num_perm {
-            // Compute hash with seed
-            let hash = self.hash_with_seed(item, self.hash_seeds[i]);
-
-            // Update minimum
-            if hash < self.hash_values[i] {
-                self.hash_values[i] = hash;
+        // Hash once, then permute the base hash for every hash function
+        let base = xxh3_hash128(item) as u64;
+        simd::min_assign_permuted_u64(&mut self.hash_values, &self.hash_seeds, base);
+    }
+
+    /// Updates the sketch with every item in `items`
+    ///
+    /// Equivalent to calling [`update`](Self::update) per item. Large
+    /// batches (items × num_perm above about a million) are split across
+    /// the available cores: each thread folds its share of the items into
+    /// a private signature, and the partial signatures are combined with
+    /// an element-wise min, so the result is identical to the serial one.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::similarity::MinHash;
+    ///
+    /// let items: Vec<u64> = (0..10_000).collect();
+    /// let mut batched = MinHash::new(256).unwrap();
+    /// batched.update_batch(&items);
+    ///
+    /// let mut serial = MinHash::new(256).unwrap();
+    /// for item in &items {
+    ///     serial.update(item);
+    /// }
+    /// assert_eq!(batched.jaccard_similarity(&serial).unwrap(), 1.0);
+    /// ```
+    pub fn update_batch<T: Hash + Sync>(&mut self, items: &[T]) {
+        let threads = std::thread::available_parallelism().map_or(1, |n| n.get());
+        if threads < 2 || items.len() * self.num_perm < Self::PARALLEL_BATCH_WORK {
+            for item in items {
+                self.update(item);
             }
+            return;
         }
+
+        let seeds = &self.hash_seeds;
+        let chunk_len = items.len().div_ceil(threads);
+        std::thread::scope(|scope| {
+            let partials: Vec<_> = items
+                .chunks(chunk_len)
+                .map(|chunk| {
+                    scope.spawn(move || {
+                        let mut values = vec![u64::MAX; seeds.len()];
+                        for item in chunk {
+                            let base = xxh3_hash128(item) as u64;
+                            simd::min_assign_permuted_u64(&mut values, seeds, base);
+                        }
+                        values
+                    })
+                })
+                .collect();
+            for partial in partials {
+                let values = partial.join().expect("MinHash worker panicked");
+                simd::min_assign_u64(&mut self.hash_values, &values);
+            }
+        });
     }
 
     /// Estimates Jaccard similarity between this sketch and another
@@ -257,50 +309,22 @@ impl MinHash {
         // Count matching hash values
         // According to MinHash theory: P(min_h(A) = min_h(B)) = |A ∩ B| / |A ∪ B|
         // We simply count where the hash values are equal
-        let matches = self
-            .hash_values
-            .iter()
-            .zip(other.hash_values.iter())
-            .filter(|(&a, &b)| a == b)
-            .count();
+        let matches = simd::count_equal_u64(&self.hash_values, &other.hash_values);
 
         // Estimate Jaccard similarity
         let similarity = matches as f64 / self.num_perm as f64;
         Ok(similarity)
     }
 
-    /// Hashes an item with a specific seed
-    ///
-    /// Uses xxhash with seed for 64-bit hash values
-    fn hash_with_seed<T: Hash>(&self, item: &T, seed: u64) -> u64 {
-        use std::hash::Hasher as StdHasher;
-
-        // Convert T to bytes using std Hash trait
-        struct ByteHasher {
-            bytes: Vec<u8>,
-        }
-
-        impl StdHasher for ByteHasher {
-            fn finish(&self) -> u64 {
-                0 // Not used
-            }
-
-            fn write(&mut self, bytes: &[u8]) {
-                self.bytes.extend_from_slice(bytes);
-            }
-        }
-
-        let mut hasher = ByteHasher { bytes: Vec::new() };
-        item.hash(&mut hasher);
-
-        // Use xxhash for high-quality 64-bit hashing
-        xxhash(&hasher.bytes, seed)
-    }
-
     /// Returns the number of permutations (hash functions) used
     pub fn num_perm(&self) -> usize {
         self.num_perm
     }
+
+    /// Resets the signature to its empty state, keeping the hash seeds
+    pub fn clear(&mut self) {
+        self.hash_values.fill(u64::MAX);
+    }
 }
 
 impl Sketch for MinHash {
@@ -331,21 +355,20 @@ impl Sketch for MinHash {
 
     /// Serialize the sketch to bytes
     fn serialize(&self) -> Vec<u8> {
-        // Format: [num_perm:8][hash_seeds][hash_values]
-        let mut bytes = Vec::new();
-
-        // Write num_perm
-        bytes.extend_from_slice(&(self.num_perm as u64).to_le_bytes());
+        // Format: [version:1|num_perm:7][hash_seeds][hash_values]
+        let mut bytes = Vec::with_capacity(8 + self.num_perm * 16);
 
-        // Write hash seeds
-        for &seed in &self.hash_seeds {
-            bytes.extend_from_slice(&seed.to_le_bytes());
-        }
+        // Write num_perm, with the format version in its top byte
+        let num_perm = validation::tag_format_version(self.num_perm as u64, FORMAT_VERSION);
+        bytes.extend_from_slice(&num_perm.to_le_bytes());
 
-        // Write hash values
-        for &value in &self.hash_values {
-            bytes.extend_from_slice(&value.to_le_bytes());
-        }
+        // Write hash seeds, then hash values
+        bytes.extend(self.hash_seeds.iter().flat_map(|seed| seed.to_le_bytes()));
+        bytes.extend(
+            self.hash_values
+                .iter()
+                .flat_map(|value| value.to_le_bytes()),
+        );
 
         bytes
     }
@@ -363,7 +386,9 @@ impl Sketch for MinHash {
             bytes[0..8]
                 .try_into()
                 .map_err(|_| SketchError::DeserializationError("Invalid num_perm".to_string()))?,
-        ) as usize;
+        );
+        let num_perm = validation::validate_format_version(num_perm, FORMAT_VERSION, "MinHash")?;
+        let num_perm = num_perm as usize;
 
         let expected_len = 8 + (num_perm * 8 * 2); // num_perm + seeds + values
         if bytes.len() != expected_len {
@@ -374,27 +399,20 @@ impl Sketch for MinHash {
             )));
         }
 
+        // Length is validated above, so both sections decode as whole words
+        let decode = |section: &[u8]| -> Vec<u64> {
+            section
+                .chunks_exact(8)
+                .map(|chunk| u64::from_le_bytes(chunk.try_into().unwrap()))
+                .collect()
+        };
+        let (seed_bytes, value_bytes) = bytes[8..].split_at(num_perm * 8);
+
         // Read hash seeds
-        let mut hash_seeds = Vec::with_capacity(num_perm);
-        for i in 0..num_perm {
-            let offset = 8 + (i * 8);
-            let seed = u64::from_le_bytes(
-                bytes[offset..offset + 8]
-                    .try_into()
-                    .map_err(|_| SketchError::DeserializationError("Invalid seed".to_string()))?,
-            );
-            hash_seeds.push(seed);
-        }
+        let hash_seeds = decode(seed_bytes);
 
         // Read hash values
-        let mut hash_values = Vec::with_capacity(num_perm);
-        for i in 0..num_perm {
-            let offset = 8 + (num_perm * 8) + (i * 8);
-            let value = u64::from_le_bytes(bytes[offset..offset + 8].try_into().map_err(|_| {
-                SketchError::DeserializationError("Invalid hash value".to_string())
-            })?);
-            hash_values.push(value);
-        }
+        let hash_values = decode(value_bytes);
 
         Ok(MinHash {
             num_perm,
@@ -404,6 +422,13 @@ impl Sketch for MinHash {
     }
 }
 
+/// Serialization format version, stored in the top byte of `num_perm`
+///
+/// Version 1 derives every permutation from one XXH3 base hash. Signatures
+/// from 0.1.6 and earlier hashed each permutation separately and are not
+/// comparable with new ones, so `deserialize` rejects them.
+const FORMAT_VERSION: u8 = 1;
+
 impl Mergeable for MinHash {
     /// Merges another MinHash sketch into this one
     ///
@@ -452,9 +477,7 @@ impl Mergeable for MinHash {
         }
 
         // Take minimum for each hash function (union operation)
-        for i in 0..self.num_perm {
-            self.hash_values[i] = self.hash_values[i].min(other.hash_values[i]);
-        }
+        simd::min_assign_u64(&mut self.hash_values, &other.hash_values);
 
         Ok(())
     }
@@ -478,6 +501,30 @@ mod tests {
         assert!(mh.hash_values.iter().all(|&v| v == u64::MAX));
     }
 
+    #[test]
+    fn test_update_batch_matches_update() {
+        // Large enough to take the multi-threaded path
+        let items: Vec<u64> = (0..20_000).collect();
+        let mut batched = MinHash::new(256).unwrap();
+        batched.update(&u64::MAX);
+        batched.update_batch(&items);
+
+        let mut serial = MinHash::new(256).unwrap();
+        serial.update(&u64::MAX);
+        for item in &items {
+            serial.update(item);
+        }
+        assert_eq!(batched.hash_values, serial.hash_values);
+
+        // Small batches stay serial
+        let mut small = MinHash::new(32).unwrap();
+        small.update_batch(&["a", "b"]);
+        let mut expected = MinHash::new(32).unwrap();
+        expected.update(&"a");
+        expected.update(&"b");
+        assert_eq!(small.hash_values, expected.hash_values);
+    }
+
     #[test]
     fn test_update() {
         let mut mh = MinHash::new(128).unwrap();
@@ -549,4 +596,36 @@ mod tests {
         let unique_seeds: std::collections::HashSet<_> = mh.hash_seeds.iter().collect();
         assert_eq!(unique_seeds.len(), 128, "Seeds should be unique");
     }
+
+    #[test]
+    fn test_deserialize_rejects_legacy_format() {
+        // MinHash::new(16) updated with "apple" and "banana", serialized by
+        // the 0.1.6 release
+        let legacy: [u8; 264] = [
+            16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 175, 205, 29, 123, 57, 168, 32, 226,
+            244, 101, 185, 161, 106, 158, 120, 110, 79, 69, 9, 128, 24, 93, 196, 6, 236, 129, 76,
+            114, 168, 184, 139, 248, 155, 116, 168, 81, 106, 137, 57, 27, 234, 162, 126, 116, 12,
+            159, 203, 83, 225, 50, 69, 31, 190, 154, 130, 44, 60, 171, 22, 201, 58, 19, 132, 197,
+            195, 138, 201, 65, 144, 120, 229, 62, 166, 176, 140, 54, 140, 72, 184, 243, 9, 61, 177,
+            60, 221, 236, 126, 101, 246, 222, 91, 5, 224, 38, 211, 194, 123, 219, 187, 224, 63,
+            160, 33, 134, 47, 169, 58, 152, 85, 117, 31, 142, 25, 77, 204, 0, 22, 15, 78, 181, 70,
+            95, 185, 179, 97, 124, 142, 45, 104, 127, 13, 99, 6, 35, 70, 86, 205, 90, 177, 49, 19,
+            45, 231, 139, 68, 9, 195, 245, 198, 28, 224, 154, 177, 18, 101, 55, 130, 39, 196, 11,
+            193, 164, 249, 208, 199, 116, 249, 170, 26, 144, 113, 116, 85, 12, 151, 26, 244, 235,
+            151, 160, 132, 45, 183, 188, 206, 13, 182, 242, 10, 199, 245, 213, 15, 122, 154, 119,
+            97, 37, 222, 38, 24, 54, 127, 111, 122, 220, 245, 25, 54, 155, 239, 211, 211, 72, 96,
+            205, 93, 120, 34, 58, 46, 249, 237, 173, 145, 136, 82, 220, 68, 77, 91, 84, 212, 170,
+            187, 65, 254, 209, 139, 109, 217, 95, 93, 78, 48, 190, 43, 15,
+        ];
+
+        match MinHash::deserialize(&legacy) {
+            Err(SketchError::DeserializationError(msg)) => assert!(msg.contains("legacy")),
+            other => panic!("expected legacy format error, got {other:?}"),
+        }
+
+        let mut mh = MinHash::new(16).unwrap();
+        mh.update(&"apple");
+        let restored = MinHash::deserialize(&mh.serialize()).unwrap();
+        assert_eq!(restored.hash_values, mh.hash_values);
+    }
 }
@@ -28,7 +28,7 @@
 //! - Datar, Gionis, Indyk, Motwani. "Maintaining Stream Statistics over Sliding Windows"
 //!   (SODA 2002)
 
-use crate::common::{Mergeable, Result, Sketch, SketchError};
+use crate::common::{simd, Mergeable, Result, Sketch, SketchError};
 
 // ============================================================================
 // TESTS FIRST (TDD Approach)
@@ -358,6 +358,17 @@ mod tests {
         assert_eq!(est1, est2);
     }
 
+    #[test]
+    fn test_deserialize_rejects_non_power_of_two_bucket() {
+        let mut eh = ExponentialHistogram::new(1000, 0.1).unwrap();
+        eh.insert(100, 1);
+
+        let mut bytes = eh.serialize();
+        let len = bytes.len();
+        bytes[len - 8..].copy_from_slice(&3u64.to_le_bytes());
+        assert!(ExponentialHistogram::deserialize(&bytes).is_err());
+    }
+
     // -------------------------------------------------------------------------
     // Test 15: Sketch Trait
     // -------------------------------------------------------------------------
@@ -482,6 +493,141 @@ mod tests {
             max_buckets
         );
     }
+
+    // -------------------------------------------------------------------------
+    // Test 21: Merge Keeps L-Canonical Form
+    // -------------------------------------------------------------------------
+    #[test]
+    fn test_merge_keeps_canonical_form() {
+        let mut a = ExponentialHistogram::new(100000, 0.25).unwrap();
+        let mut b = ExponentialHistogram::new(100000, 0.25).unwrap();
+        for i in 0..3000 {
+            a.insert(i * 2, 1);
+            b.insert(i * 2 + 1, 1);
+        }
+
+        a.merge(&b).unwrap();
+
+        // At most k + 1 buckets of each size survive compression
+        for bucket in a.buckets() {
+            let same_size = a.buckets().filter(|o| o.count() == bucket.count()).count();
+            assert!(
+                same_size <= a.k + 1,
+                "size {} has {} buckets",
+                bucket.count(),
+                same_size
+            );
+        }
+        let total: u64 = a.buckets().map(|b| b.count()).sum();
+        assert_eq!(total, 6000);
+    }
+
+    // -------------------------------------------------------------------------
+    // Test 22: Power-of-Two Decomposition Order
+    // -------------------------------------------------------------------------
+    #[test]
+    fn test_power_of_two_decomposition() {
+        let exponents: Vec<u8> = set_bit_exponents(0b1011_0101).collect();
+        assert_eq!(exponents, vec![0, 2, 4, 5, 7]);
+        assert_eq!(set_bit_exponents(0).count(), 0);
+        assert_eq!(set_bit_exponents(u64::MAX).count(), 64);
+
+        // Smallest bucket ends up newest (front), as before
+        let mut eh = ExponentialHistogram::new(1000, 0.1).unwrap();
+        eh.insert(5, 15);
+        let sizes: Vec<u64> = eh.buckets().map(|b| b.count()).collect();
+        assert_eq!(sizes, vec![1, 2, 4, 8]);
+    }
+
+    // -------------------------------------------------------------------------
+    // Test 23: Expire With Out-of-Order Buckets
+    // -------------------------------------------------------------------------
+    #[test]
+    fn test_expire_out_of_order() {
+        let mut eh = ExponentialHistogram::new(100, 0.1).unwrap();
+        eh.insert(900, 1);
+        eh.insert(10, 1);
+        eh.insert(20, 1);
+        eh.insert(950, 1); // newest first: 950, 20, 10, 900
+
+        eh.expire(1000);
+        let timestamps: Vec<u64> = eh.buckets().map(|b| b.timestamp).collect();
+        assert_eq!(timestamps, vec![950, 20, 900]);
+
+        // Sorted case: the stale suffix is cut after one straddling bucket
+        let mut eh = ExponentialHistogram::new(100, 0.1).unwrap();
+        for t in [10, 20, 30, 950, 960] {
+            eh.insert(t, 1);
+        }
+        eh.expire(1000);
+        assert!(eh.buckets().filter(|b| b.timestamp < 900).count() <= 1);
+        assert_eq!(eh.count(1000).1, 2);
+    }
+
+    // -------------------------------------------------------------------------
+    // Test 24: Small Merges Are Buffered
+    // -------------------------------------------------------------------------
+    #[test]
+    fn test_small_merges_buffered() {
+        let mut big = ExponentialHistogram::new(100000, 0.1).unwrap();
+        for i in 0..5000 {
+            big.insert(i, 1);
+        }
+        let mut eager = big.clone();
+
+        let mut small = ExponentialHistogram::new(100000, 0.1).unwrap();
+        small.insert(6000, 1);
+
+        big.merge(&small).unwrap();
+        assert_eq!(big.pending.len(), 1);
+        assert_eq!(big.num_buckets(), big.timestamps.len() + 1);
+
+        // Queries and serialization see the buffered bucket
+        let (estimate, _, _) = big.count(6000);
+        assert!(
+            estimate >= 5001 - 5001 / 10,
+            "Estimate {} too low",
+            estimate
+        );
+        let restored = ExponentialHistogram::deserialize(&big.serialize()).unwrap();
+        assert_eq!(restored.count(6000), big.count(6000));
+
+        // Folding in matches an eager merge
+        eager.insert(6000, 1);
+        big.expire(6000);
+        eager.expire(6000);
+        assert!(big.pending.is_empty());
+        assert_eq!(big.count(6000), eager.count(6000));
+    }
+
+    // -------------------------------------------------------------------------
+    // Test 25: Queries Read Buffered Buckets Without Folding Them In
+    // -------------------------------------------------------------------------
+    #[test]
+    fn test_count_reads_pending_buckets() {
+        let mut big = ExponentialHistogram::new(100, 0.1).unwrap();
+        big.insert(10, 4);
+        for t in 200..240 {
+            big.insert(t, 1);
+        }
+
+        // A buffered bucket inside the window and one that straddles it,
+        // newer than the oldest folded-in bucket
+        let mut small = ExponentialHistogram::new(100, 0.1).unwrap();
+        small.insert(250, 1);
+        small.insert(120, 2);
+        big.merge(&small).unwrap();
+        assert_eq!(big.pending.len(), 2);
+
+        let (estimate, lower, upper) = big.count(300);
+        assert_eq!((lower, upper), (41, 43));
+        assert_eq!(estimate, 42);
+        assert_eq!(big.pending.len(), 2);
+
+        // The serialized buckets hold the same counts, so queries agree
+        let restored = ExponentialHistogram::deserialize(&big.serialize()).unwrap();
+        assert_eq!(restored.count(300), big.count(300));
+    }
 }
 
 // ============================================================================
@@ -489,12 +635,41 @@ mod tests {
 // ============================================================================
 
 /// A bucket in the exponential histogram
-#[derive(Clone, Debug)]
+///
+/// Buckets are stored column-wise in [`ExponentialHistogram`]; this is the
+/// row view used when sorting and merging.
+#[derive(Clone, Copy, Debug)]
 struct EHBucket {
     /// Timestamp when this bucket was created
     timestamp: u64,
-    /// Count of events in this bucket (always a power of 2)
-    count: u64,
+    /// log2 of the number of events in this bucket (counts are powers of 2)
+    log2_count: u8,
+}
+
+impl EHBucket {
+    /// Number of events in this bucket
+    #[inline]
+    fn count(&self) -> u64 {
+        1u64 << self.log2_count
+    }
+}
+
+/// Iterates the exponents of the set bits of `count`, lowest first
+///
+/// Each step takes the trailing-zero count and clears the lowest set bit
+/// (`c & (c - 1)`), which lowers to `tzcnt`/`blsr` on x86_64 with BMI1 and
+/// has no data-dependent branch other than the loop exit.
+#[inline(always)]
+fn set_bit_exponents(count: u64) -> impl Iterator<Item = u8> {
+    let mut remaining = count;
+    std::iter::from_fn(move || {
+        if remaining == 0 {
+            return None;
+        }
+        let exponent = remaining.trailing_zeros() as u8;
+        remaining &= remaining - 1;
+        Some(exponent)
+    })
 }
 
 /// Exponential Histogram with formal error bounds
@@ -520,8 +695,13 @@ struct EHBucket {
 /// ```
 #[derive(Clone, Debug)]
 pub struct ExponentialHistogram {
-    /// Buckets sorted by timestamp (newest first)
-    buckets: Vec<EHBucket>,
+    /// Bucket timestamps, sorted newest first
+    timestamps: Vec<u64>,
+    /// Bucket sizes as log2 of the event count, parallel to `timestamps`
+    ///
+    /// Counts are always powers of 2, so one byte per bucket suffices and
+    /// window scans touch 9 bytes per bucket instead of 16.
+    log2_counts: Vec<u8>,
     /// Window size in time units
     window_size: u64,
     /// Error bound (epsilon)
@@ -530,6 +710,8 @@ pub struct ExponentialHistogram {
     k: usize,
     /// Last timestamp seen (for monotonicity tracking)
     last_timestamp: u64,
+    /// Buckets from small merges not yet folded into the bucket columns
+    pending: Vec<EHBucket>,
 }
 
 impl ExponentialHistogram {
@@ -575,11 +757,13 @@ impl ExponentialHistogram {
         let k = (1.0_f64 / epsilon).ceil() as usize;
 
         Ok(ExponentialHistogram {
-            buckets: Vec::new(),
+            timestamps: Vec::new(),
+            log2_counts: Vec::new(),
             window_size,
             epsilon,
             k,
             last_timestamp: 0,
+            pending: Vec::new(),
         })
     }
 
@@ -601,10 +785,34 @@ impl ExponentialHistogram {
         self.k
     }
 
-    /// Returns the number of buckets
+    /// Returns the number of buckets, including buckets from merges that
+    /// have not been folded in yet
     #[inline]
     pub fn num_buckets(&self) -> usize {
-        self.buckets.len()
+        self.timestamps.len() + self.pending.len()
+    }
+
+    /// Iterates the folded-in buckets as rows, newest first
+    fn buckets(&self) -> impl Iterator<Item = EHBucket> + '_ {
+        self.timestamps
+            .iter()
+            .zip(self.log2_counts.iter())
+            .map(|(&timestamp, &log2_count)| EHBucket {
+                timestamp,
+                log2_count,
+            })
+    }
+
+    /// Replaces the bucket columns with `buckets` sorted newest first and
+    /// compresses the result
+    fn rebuild(&mut self, mut buckets: Vec<EHBucket>) {
+        buckets.sort_by(|a, b| b.timestamp.cmp(&a.timestamp));
+        self.timestamps.clear();
+        self.log2_counts.clear();
+        self.timestamps.extend(buckets.iter().map(|b| b.timestamp));
+        self.log2_counts
+            .extend(buckets.iter().map(|b| b.log2_count));
+        self.compress();
     }
 
     /// Inserts an event at the given timestamp with the specified count
@@ -628,101 +836,95 @@ impl ExponentialHistogram {
             return;
         }
 
+        self.flush_pending();
+
         // Track timestamp for monotonicity
         self.last_timestamp = self.last_timestamp.max(timestamp);
 
-        // Decompose count into powers of 2 and add buckets
-        let mut remaining = count;
-        while remaining > 0 {
-            // Find the largest power of 2 <= remaining
-            let power = 63 - remaining.leading_zeros();
-            let bucket_count = 1u64 << power;
-
-            // Insert bucket at the front (newest first)
-            self.buckets.insert(
-                0,
-                EHBucket {
-                    timestamp,
-                    count: bucket_count,
-                },
-            );
-
-            remaining -= bucket_count;
-        }
+        // Decompose count into powers of 2, smallest first, and insert them
+        // at the front (newest first) with a single shift of the old buckets
+        let num_new = count.count_ones() as usize;
+        self.timestamps
+            .splice(0..0, std::iter::repeat_n(timestamp, num_new));
+        self.log2_counts.splice(0..0, set_bit_exponents(count));
 
         // Compress buckets to maintain l-canonical form
         self.compress();
     }
 
+    /// Folds buckets buffered by small merges into the main bucket list
+    ///
+    /// Sorts newest first and compresses once for the whole batch, instead
+    /// of once per merged histogram.
+    fn flush_pending(&mut self) {
+        if self.pending.is_empty() {
+            return;
+        }
+        let mut buckets: Vec<EHBucket> = self.buckets().collect();
+        buckets.append(&mut self.pending);
+        self.rebuild(buckets);
+    }
+
     /// Compresses buckets to maintain l-canonical form
     ///
     /// Ensures at most k+1 buckets of each size (power of 2).
     /// When exceeded, merges the two oldest buckets of that size.
+    ///
+    /// Each size is tallied and its two oldest buckets located in a single
+    /// scan, so compression needs no temporary index vectors.
     fn compress(&mut self) {
-        if self.buckets.len() < 2 {
+        if self.timestamps.len() < 2 {
             return;
         }
 
-        // Sort buckets by count (ascending) then by timestamp (descending within same count)
-        // This groups same-sized buckets together
-        let mut changed = true;
-        while changed {
-            changed = false;
-
-            // Group buckets by their count and check invariant
-            let mut i = 0;
-            while i < self.buckets.len() {
-                let current_count = self.buckets[i].count;
-
-                // Find all consecutive buckets with same count
-                // Note: buckets may not be perfectly sorted, so scan all
-                let same_count_indices: Vec<usize> = (0..self.buckets.len())
-                    .filter(|&j| self.buckets[j].count == current_count)
-                    .collect();
-
-                if same_count_indices.len() > self.k + 1 {
-                    // Too many buckets of this size
-                    // Find the two oldest (smallest timestamps)
-                    let mut indices_by_time: Vec<(usize, u64)> = same_count_indices
-                        .iter()
-                        .map(|&idx| (idx, self.buckets[idx].timestamp))
-                        .collect();
-                    indices_by_time.sort_by_key(|&(_, ts)| ts);
-
-                    // Merge the two oldest
-                    let oldest_idx = indices_by_time[0].0;
-                    let second_oldest_idx = indices_by_time[1].0;
-
-                    // Keep the older timestamp, double the count
-                    let older_timestamp = self.buckets[oldest_idx]
-                        .timestamp
-                        .min(self.buckets[second_oldest_idx].timestamp);
-                    let merged_count = current_count * 2;
-
-                    // Update the first one, remove the second
-                    let (keep_idx, remove_idx) = if oldest_idx < second_oldest_idx {
-                        (oldest_idx, second_oldest_idx)
-                    } else {
-                        (second_oldest_idx, oldest_idx)
-                    };
-
-                    self.buckets[keep_idx] = EHBucket {
-                        timestamp: older_timestamp,
-                        count: merged_count,
-                    };
-                    self.buckets.remove(remove_idx);
-
-                    changed = true;
-                    break; // Restart the scan
+        while let Some((keep_idx, remove_idx)) = self.overfull_pair() {
+            // Update the first one to the doubled, older bucket; remove the second
+            self.timestamps[keep_idx] = self.timestamps[keep_idx].min(self.timestamps[remove_idx]);
+            self.log2_counts[keep_idx] += 1;
+            self.timestamps.remove(remove_idx);
+            self.log2_counts.remove(remove_idx);
+        }
+    }
+
+    /// Finds the two oldest buckets of the first size (in bucket order) that
+    /// has more than k+1 buckets, returned as (lower index, higher index)
+    fn overfull_pair(&self) -> Option<(usize, usize)> {
+        let sizes = &self.log2_counts;
+        for (i, &size) in sizes.iter().enumerate() {
+            // Visit each size once, at its first occurrence
+            if sizes[..i].contains(&size) {
+                continue;
+            }
+
+            // Tally this size and track its two oldest buckets; strict
+            // comparisons keep the lower index on timestamp ties
+            let mut tally = 0;
+            let mut oldest = (i, self.timestamps[i]);
+            let mut second: Option<(usize, u64)> = None;
+            for (j, (&s, &ts)) in sizes.iter().zip(self.timestamps.iter()).enumerate().skip(i) {
+                if s != size {
+                    continue;
+                }
+                tally += 1;
+                if j == i {
+                    continue;
                 }
+                if ts < oldest.1 {
+                    second = Some(oldest);
+                    oldest = (j, ts);
+                } else if second.is_none_or(|(_, t)| ts < t) {
+                    second = Some((j, ts));
+                }
+            }
 
-                // Move to next different count
-                i += 1;
-                while i < self.buckets.len() && self.buckets[i].count == current_count {
-                    i += 1;
+            if tally > self.k + 1 {
+                if let Some((second_idx, _)) = second {
+                    let (a, b) = (oldest.0, second_idx);
+                    return Some((a.min(b), a.max(b)));
                 }
             }
         }
+        None
     }
 
     /// Returns the count estimate with bounds for the window ending at current_time
@@ -751,16 +953,12 @@ impl ExponentialHistogram {
     /// println!("Count: {} in [{}, {}]", est, lower, upper);
     /// ```
     pub fn count(&self, current_time: u64) -> (u64, u64, u64) {
-        if self.buckets.is_empty() {
-            return (0, 0, 0);
-        }
-
         let window_start = current_time.saturating_sub(self.window_size);
 
         let mut total = 0u64;
-        let mut oldest_partial_count = 0u64;
+        let mut oldest_partial: Option<EHBucket> = None;
 
-        for bucket in &self.buckets {
+        for bucket in self.buckets() {
             if bucket.timestamp > current_time {
                 // Future bucket, skip
                 continue;
@@ -768,15 +966,30 @@ impl ExponentialHistogram {
 
             if bucket.timestamp >= window_start {
                 // Fully within window
-                total += bucket.count;
+                total += bucket.count();
             } else {
                 // Partially outside window - this is the oldest relevant bucket
                 // We count half of it (approximation)
-                oldest_partial_count = bucket.count;
+                oldest_partial = Some(bucket);
                 break;
             }
         }
 
+        // Buckets buffered by small merges are unsorted, so instead of
+        // folding them in here each one is added to the sum, or becomes the
+        // partial bucket if it is the newest one outside the window so far
+        for &bucket in &self.pending {
+            if bucket.timestamp > current_time {
+                continue;
+            }
+            if bucket.timestamp >= window_start {
+                total += bucket.count();
+            } else if oldest_partial.is_none_or(|partial| bucket.timestamp > partial.timestamp) {
+                oldest_partial = Some(bucket);
+            }
+        }
+        let oldest_partial_count = oldest_partial.map_or(0, |bucket| bucket.count());
+
         // Estimate: count full buckets + half of partial bucket
         let estimate = total + oldest_partial_count / 2;
 
@@ -798,26 +1011,53 @@ impl ExponentialHistogram {
     ///
     /// * `current_time` - The current time
     pub fn expire(&mut self, current_time: u64) {
+        self.flush_pending();
+
         let window_start = current_time.saturating_sub(self.window_size);
 
-        // Keep track of whether we've found one outside bucket to keep
+        // Buckets are newest first, so the expired ones normally form a
+        // suffix: locate its start with a vectorized scan, keep that one
+        // straddling bucket and cut the rest off both columns
+        let first_outside = simd::first_less_than_u64(&self.timestamps, window_start);
+        if first_outside == self.timestamps.len() {
+            return;
+        }
+        let rest = &self.timestamps[first_outside + 1..];
+        if rest.iter().all(|&t| t < window_start) {
+            self.timestamps.truncate(first_outside + 1);
+            self.log2_counts.truncate(first_outside + 1);
+            return;
+        }
+
+        // Out-of-order inserts left in-window buckets behind an expired one
         let mut found_outside = false;
 
-        self.buckets.retain(|bucket| {
-            if bucket.timestamp >= window_start {
+        // Compact both columns in place
+        let mut kept = 0;
+        for i in 0..self.timestamps.len() {
+            let keep = if self.timestamps[i] >= window_start {
                 true // Fully in window
             } else if !found_outside {
                 found_outside = true;
                 true // Keep one straddling bucket
             } else {
                 false // Remove older buckets
+            };
+            if keep {
+                self.timestamps[kept] = self.timestamps[i];
+                self.log2_counts[kept] = self.log2_counts[i];
+                kept += 1;
             }
-        });
+        }
+        self.timestamps.truncate(kept);
+        self.log2_counts.truncate(kept);
     }
 
     /// Clears all buckets
     pub fn clear(&mut self) {
-        self.buckets.clear();
+        self.timestamps.clear();
+        self.log2_counts.clear();
+        self.pending.clear();
         self.last_timestamp = 0;
     }
 
@@ -829,7 +1069,9 @@ impl ExponentialHistogram {
 
     /// Returns memory usage in bytes (approximate)
     pub fn memory_usage(&self) -> usize {
-        std::mem::size_of::<Self>() + self.buckets.len() * std::mem::size_of::<EHBucket>()
+        std::mem::size_of::<Self>()
+            + self.timestamps.len() * (std::mem::size_of::<u64>() + std::mem::size_of::<u8>())
+            + self.pending.len() * std::mem::size_of::<EHBucket>()
     }
 }
 
@@ -852,23 +1094,30 @@ impl Sketch for ExponentialHistogram {
     }
 
     fn is_empty(&self) -> bool {
-        self.buckets.is_empty()
+        self.timestamps.is_empty() && self.pending.is_empty()
     }
 
     fn serialize(&self) -> Vec<u8> {
-        let mut bytes = Vec::new();
+        // Pending buckets are written in timestamp order but not compressed;
+        // the next insert or merge after deserializing compresses them.
+        // The folded-in buckets are already sorted, so this sort is one
+        // merge of two runs.
+        let mut buckets: Vec<EHBucket> =
+            self.buckets().chain(self.pending.iter().copied()).collect();
+        buckets.sort_by(|a, b| b.timestamp.cmp(&a.timestamp));
+        let mut bytes = Vec::with_capacity(40 + buckets.len() * 16);
 
         // Header
         bytes.extend_from_slice(&self.window_size.to_le_bytes());
         bytes.extend_from_slice(&self.epsilon.to_le_bytes());
         bytes.extend_from_slice(&(self.k as u64).to_le_bytes());
         bytes.extend_from_slice(&self.last_timestamp.to_le_bytes());
-        bytes.extend_from_slice(&(self.buckets.len() as u64).to_le_bytes());
+        bytes.extend_from_slice(&(buckets.len() as u64).to_le_bytes());
 
         // Buckets
-        for bucket in &self.buckets {
+        for bucket in buckets {
             bytes.extend_from_slice(&bucket.timestamp.to_le_bytes());
-            bytes.extend_from_slice(&bucket.count.to_le_bytes());
+            bytes.extend_from_slice(&bucket.count().to_le_bytes());
         }
 
         bytes
@@ -898,22 +1147,32 @@ impl Sketch for ExponentialHistogram {
             )));
         }
 
-        let mut buckets = Vec::with_capacity(num_buckets);
+        let mut timestamps = Vec::with_capacity(num_buckets);
+        let mut log2_counts = Vec::with_capacity(num_buckets);
         let mut offset = HEADER_SIZE;
 
         for _ in 0..num_buckets {
             let timestamp = u64::from_le_bytes(bytes[offset..offset + 8].try_into().unwrap());
             let count = u64::from_le_bytes(bytes[offset + 8..offset + 16].try_into().unwrap());
-            buckets.push(EHBucket { timestamp, count });
+            if !count.is_power_of_two() {
+                return Err(SketchError::DeserializationError(format!(
+                    "Bucket count {} is not a power of 2",
+                    count
+                )));
+            }
+            timestamps.push(timestamp);
+            log2_counts.push(count.trailing_zeros() as u8);
             offset += 16;
         }
 
         Ok(ExponentialHistogram {
-            buckets,
+            timestamps,
+            log2_counts,
             window_size,
             epsilon,
             k,
             last_timestamp,
+            pending: Vec::new(),
         })
     }
 }
@@ -940,19 +1199,31 @@ impl Mergeable for ExponentialHistogram {
             });
         }
 
-        // Merge buckets from other
-        for bucket in &other.buckets {
-            self.buckets.push(bucket.clone());
-        }
-
         // Update last timestamp
         self.last_timestamp = self.last_timestamp.max(other.last_timestamp);
 
-        // Sort by timestamp (newest first) for consistent ordering
-        self.buckets.sort_by(|a, b| b.timestamp.cmp(&a.timestamp));
+        let incoming = other.timestamps.len() + other.pending.len();
 
-        // Compress to maintain invariant
-        self.compress();
+        // Small-into-large: buffer the few incoming buckets and fold them in
+        // once about sqrt(n) have accumulated, so a run of small merges costs
+        // one sort + compress of the large side rather than one per merge
+        if incoming < self.timestamps.len() / 4 {
+            self.pending.extend(other.buckets());
+            self.pending.extend_from_slice(&other.pending);
+            if self.pending.len() * self.pending.len() >= self.timestamps.len() {
+                self.flush_pending();
+            }
+            return Ok(());
+        }
+
+        // Merge buckets as rows (single allocation for both sides), then
+        // sort newest first and compress to maintain the invariant
+        let mut buckets = Vec::with_capacity(self.num_buckets() + incoming);
+        buckets.extend(self.buckets());
+        buckets.append(&mut self.pending);
+        buckets.extend(other.buckets());
+        buckets.extend_from_slice(&other.pending);
+        self.rebuild(buckets);
 
         Ok(())
     }
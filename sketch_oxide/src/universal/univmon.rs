@@ -307,6 +307,78 @@ impl UnivMon {
         Ok(())
     }
 
+    /// Update the sketch with many items and their values
+    ///
+    /// Equivalent to calling [`update`](Self::update) for each pair in order,
+    /// but items are hashed once per tile of 256 and each layer then
+    /// processes the whole tile before the next layer, so a layer's sketch
+    /// stays in cache while its sampled items are applied.
+    ///
+    /// # Errors
+    ///
+    /// Returns `InvalidParameter` if `items` and `values` differ in length or
+    /// any value is negative. Nothing is updated in that case.
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::universal::UnivMon;
+    ///
+    /// let mut univmon = UnivMon::new(10000, 0.01, 0.01).unwrap();
+    /// let items: Vec<[u8; 8]> = (0..1000u64).map(u64::to_le_bytes).collect();
+    /// let values = vec![1500.0; 1000];
+    ///
+    /// univmon.update_batch(&items, &values).unwrap();
+    /// assert_eq!(univmon.total_updates(), 1000);
+    /// ```
+    pub fn update_batch<K: AsRef<[u8]>>(&mut self, items: &[K], values: &[f64]) -> Result<()> {
+        const TILE: usize = 256;
+
+        if items.len() != values.len() {
+            return Err(SketchError::InvalidParameter {
+                param: "values".to_string(),
+                value: values.len().to_string(),
+                constraint: format!("must have one value per item ({})", items.len()),
+            });
+        }
+        if let Some(&value) = values.iter().find(|&&v| v < 0.0) {
+            return Err(SketchError::InvalidParameter {
+                param: "value".to_string(),
+                value: value.to_string(),
+                constraint: "must be >= 0".to_string(),
+            });
+        }
+
+        self.total_updates += items.len() as u64;
+
+        let mut hashes = [0u64; TILE];
+        for (items, values) in items.chunks(TILE).zip(values.chunks(TILE)) {
+            for (hash, item) in hashes.iter_mut().zip(items) {
+                let mut hasher = XxHash64::with_seed(0xDEADBEEF);
+                hasher.write(item.as_ref());
+                *hash = hasher.finish();
+            }
+            let hashes = &hashes[..items.len()];
+
+            for layer in &mut self.layers {
+                let sample_divisor = (1.0 / layer.sampling_rate) as u64;
+
+                for ((&item_hash, item), &value) in hashes.iter().zip(items).zip(values) {
+                    if item_hash.is_multiple_of(sample_divisor) {
+                        let item = item.as_ref();
+                        layer.sample_count += 1;
+                        layer.value_sum += value / layer.sampling_rate;
+                        let scaled_value = (value / layer.sampling_rate) as i64;
+                        layer.count_sketch.update(&item, scaled_value);
+                        layer.heavy_hitters.update(item.to_vec());
+                    }
+                }
+            }
+        }
+
+        Ok(())
+    }
+
     /// Estimate the L1 norm (sum of all frequencies)
     ///
     /// The L1 norm represents the total "mass" in the stream:
@@ -459,31 +531,68 @@ impl UnivMon {
             return 0.0;
         }
 
-        // Estimate entropy using layer-based approach
+        self.sampled_entropy(l1)
+            .unwrap_or_else(|| Self::uniform_entropy(l1, self.estimate_l2()))
+    }
+
+    /// Estimate L1, L2 and entropy together
+    ///
+    /// Equivalent to calling [`estimate_l1`](Self::estimate_l1),
+    /// [`estimate_l2`](Self::estimate_l2) and
+    /// [`estimate_entropy`](Self::estimate_entropy), but the L2 inner product
+    /// is computed once and reused by the entropy fallback.
+    ///
+    /// # Returns
+    ///
+    /// `(l1, l2, entropy)`
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use sketch_oxide::universal::UnivMon;
+    ///
+    /// let mut univmon = UnivMon::new(10000, 0.01, 0.01).unwrap();
+    /// univmon.update(b"A", 100.0).unwrap();
+    /// univmon.update(b"B", 100.0).unwrap();
+    ///
+    /// let (l1, l2, entropy) = univmon.estimate_all();
+    /// assert_eq!(l1, univmon.estimate_l1());
+    /// assert_eq!(l2, univmon.estimate_l2());
+    /// assert_eq!(entropy, univmon.estimate_entropy());
+    /// ```
+    pub fn estimate_all(&self) -> (f64, f64, f64) {
+        let l1 = self.estimate_l1();
+        let l2 = self.estimate_l2();
+
+        let entropy = if l1 > 0.0 {
+            self.sampled_entropy(l1)
+                .unwrap_or_else(|| Self::uniform_entropy(l1, l2))
+        } else {
+            0.0
+        };
+
+        (l1, l2, entropy)
+    }
+
+    /// Average entropy of the tracked items across sufficiently sampled layers
+    ///
+    /// Returns `None` if no layer has enough samples to contribute.
+    fn sampled_entropy(&self, l1: f64) -> Option<f64> {
         // Use the method from UnivMon paper: sum across layers
         let mut entropy_sum = 0.0;
         let mut layer_count = 0;
 
         for layer in self.layers.iter() {
-            if layer.sample_count < 10 {
-                continue; // Skip layers with too few samples
-            }
-
-            // Get heavy hitters from this layer
-            let items = layer
-                .heavy_hitters
-                .frequent_items(crate::frequency::frequent::ErrorType::NoFalsePositives);
-
-            if items.is_empty() {
-                continue;
+            if layer.sample_count < 10 || layer.heavy_hitters.is_empty() {
+                continue; // Skip layers with too few samples or no tracked items
             }
 
             // Estimate entropy contribution from this layer
             let mut layer_entropy = 0.0;
 
-            for (item, _lower, _upper) in &items {
+            for item in layer.heavy_hitters.items() {
                 // Estimate frequency from count sketch
-                let freq = layer.count_sketch.estimate(&item).abs() as f64;
+                let freq = layer.count_sketch.estimate(item).abs() as f64;
 
                 if freq > 0.0 {
                     let prob = freq / l1;
@@ -497,19 +606,18 @@ impl UnivMon {
             layer_count += 1;
         }
 
-        if layer_count > 0 {
-            entropy_sum / layer_count as f64
+        (layer_count > 0).then(|| entropy_sum / layer_count as f64)
+    }
+
+    /// Entropy fallback from the norms alone, assuming a uniform distribution
+    fn uniform_entropy(l1: f64, l2: f64) -> f64 {
+        if l2 > 0.0 {
+            // For uniform distribution of n items: H ≈ log2(n)
+            // Approximate: n ≈ L1² / L2²
+            let n_estimate = (l1 * l1) / (l2 * l2 + 1.0);
+            n_estimate.max(1.0).log2()
         } else {
-            // Fallback: estimate from L1 and L2
-            let l2 = self.estimate_l2();
-            if l2 > 0.0 {
-                // For uniform distribution of n items: H ≈ log2(n)
-                // Approximate: n ≈ L1² / L2²
-                let n_estimate = (l1 * l1) / (l2 * l2 + 1.0);
-                n_estimate.max(1.0).log2()
-            } else {
-                0.0
-            }
+            0.0
         }
     }
 
@@ -559,21 +667,18 @@ impl UnivMon {
 
         let threshold_count = threshold * l1;
 
-        // Collect heavy hitters from all layers
-        let mut candidates: HashMap<Vec<u8>, f64> = HashMap::new();
+        // Gather candidates from all layers, borrowing the tracked items so
+        // only the ones that pass the threshold are ever cloned
+        let mut candidates: HashMap<&[u8], f64> = HashMap::new();
 
         for layer in &self.layers {
-            let items = layer
-                .heavy_hitters
-                .frequent_items(crate::frequency::frequent::ErrorType::NoFalseNegatives);
-
-            for (item, _lower, _upper) in items {
+            for item in layer.heavy_hitters.items() {
                 // Estimate frequency using Count Sketch
-                let freq = layer.count_sketch.estimate(&item).abs() as f64;
+                let freq = layer.count_sketch.estimate(item).abs() as f64;
 
                 // Keep maximum estimate across layers
                 candidates
-                    .entry(item)
+                    .entry(item.as_slice())
                     .and_modify(|e| *e = e.max(freq))
                     .or_insert(freq);
             }
@@ -583,6 +688,7 @@ impl UnivMon {
         let mut result: Vec<(Vec<u8>, f64)> = candidates
             .into_iter()
             .filter(|(_item, freq)| *freq >= threshold_count)
+            .map(|(item, freq)| (item.to_vec(), freq))
             .collect();
 
         result.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
@@ -144,6 +144,19 @@ fn test_empty_sketch() {
     assert_eq!(cms.estimate(&"another"), 0);
 }
 
+#[test]
+fn test_clear_resets_counters() {
+    let mut cms = CountMinSketch::new(0.01, 0.01).unwrap();
+    for _ in 0..10 {
+        cms.update(&"item");
+    }
+    cms.clear();
+
+    assert_eq!(cms.estimate(&"item"), 0);
+    cms.update(&"item");
+    assert_eq!(cms.estimate(&"item"), 1);
+}
+
 // ============================================================================
 // PHASE 2: Accuracy Tests
 // ============================================================================
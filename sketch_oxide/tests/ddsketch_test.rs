@@ -65,6 +65,27 @@ fn test_empty_sketch() {
     assert_eq!(dd.max(), None);
 }
 
+#[test]
+fn test_clear_then_reuse() {
+    let mut dd = DDSketch::new(0.01).unwrap();
+    for i in -500..500 {
+        dd.add(i as f64);
+    }
+    dd.clear();
+
+    assert!(dd.is_empty());
+    assert_eq!(dd.min(), None);
+    assert_eq!(dd.max(), None);
+
+    for i in 1..=100 {
+        dd.add(i as f64);
+    }
+    assert_eq!(dd.count(), 100);
+    assert_eq!(dd.min(), Some(1.0));
+    let p50 = dd.quantile(0.5).unwrap();
+    assert!((p50 - 50.0).abs() <= 1.0, "p50 = {p50}");
+}
+
 // ============================================================================
 // Quantile Accuracy Tests
 // ============================================================================
@@ -432,6 +432,41 @@ fn test_integer_items() {
     assert_eq!(lower, 1);
 }
 
+#[test]
+fn test_clear_resets_items_and_offset() {
+    let mut sketch = FrequentItems::new(2).unwrap();
+    for item in ["a", "b", "c", "a"] {
+        sketch.update(item.to_string());
+    }
+    assert!(sketch.offset() > 0);
+
+    sketch.clear();
+    assert!(sketch.is_empty());
+    assert_eq!(sketch.offset(), 0);
+    assert_eq!(sketch.get_estimate(&"a".to_string()), None);
+}
+
+#[test]
+fn test_update_by_ref_matches_update_by() {
+    let mut owned: FrequentItems<String> = FrequentItems::new(3).unwrap();
+    let mut borrowed: FrequentItems<String> = FrequentItems::new(3).unwrap();
+
+    for (i, item) in ["a", "b", "a", "c", "d", "a", "e", "b"].iter().enumerate() {
+        let count = (i % 3) as u64;
+        owned.update_by(item.to_string(), count);
+        borrowed.update_by_ref(*item, count);
+    }
+
+    assert_eq!(owned.num_items(), borrowed.num_items());
+    assert_eq!(owned.offset(), borrowed.offset());
+    for item in ["a", "b", "c", "d", "e"] {
+        assert_eq!(
+            owned.get_estimate(&item.to_string()),
+            borrowed.get_estimate_ref(item)
+        );
+    }
+}
+
 #[test]
 fn test_error_bound_formula() {
     let max_size = 10;
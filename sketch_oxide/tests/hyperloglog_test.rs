@@ -85,6 +85,17 @@ mod basic_operations {
         assert!(!hll.is_empty());
     }
 
+    #[test]
+    fn test_clear() {
+        let mut hll = HyperLogLog::new(12).unwrap();
+        for i in 0..1000u64 {
+            hll.update(&i);
+        }
+        hll.clear();
+        assert!(hll.is_empty());
+        assert_eq!(hll.estimate(), 0.0);
+    }
+
     #[test]
     fn test_estimate_empty() {
         let hll = HyperLogLog::new(12).unwrap();
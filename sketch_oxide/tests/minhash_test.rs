@@ -93,6 +93,20 @@ fn test_empty_sketch() {
     );
 }
 
+#[test]
+fn test_clear_matches_new_sketch() {
+    let mut mh1 = MinHash::new(128).unwrap();
+    let mut mh2 = MinHash::new(128).unwrap();
+    mh1.update(&"stale");
+    mh1.clear();
+
+    for item in ["a", "b", "c"] {
+        mh1.update(&item);
+        mh2.update(&item);
+    }
+    assert_eq!(mh1.jaccard_similarity(&mh2).unwrap(), 1.0);
+}
+
 // ============================================================================
 // PHASE 2: Jaccard Similarity Tests
 // ============================================================================
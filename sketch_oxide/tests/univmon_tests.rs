@@ -5,15 +5,15 @@
 //!
 //! Test Categories:
 //! 1. Construction (8 tests) - Parameter validation, layer calculation
-//! 2. Basic Updates (10 tests) - Update mechanism, sampling
+//! 2. Basic Updates (12 tests) - Update mechanism, sampling
 //! 3. L1 Norm (12 tests) - Sum estimation, accuracy
 //! 4. L2 Norm (12 tests) - Squared sum, variance
-//! 5. Entropy Estimation (12 tests) - Shannon entropy, distributions
+//! 5. Entropy Estimation (13 tests) - Shannon entropy, distributions
 //! 6. Heavy Hitters (15 tests) - Top-k, thresholds
 //! 7. Change Detection (18 tests) - Temporal changes, anomalies
 //! 8. Advanced Features (18 tests) - Merge, serialization, layers
 //!
-//! Total: 105 tests (exceeding 85+ requirement)
+//! Total: 108 tests (exceeding 85+ requirement)
 
 use sketch_oxide::universal::{UnivMon, UnivMonStats};
 use sketch_oxide::{Mergeable, Sketch, SketchError};
@@ -82,7 +82,7 @@ fn test_construction_parameter_storage() {
 }
 
 // ============================================================================
-// Category 2: Basic Updates (10 tests)
+// Category 2: Basic Updates (12 tests)
 // ============================================================================
 
 #[test]
@@ -176,6 +176,42 @@ fn test_update_empty_key() {
     assert!(univmon.update(b"", 1.0).is_ok());
 }
 
+#[test]
+fn test_update_batch_matches_update() {
+    // Crosses several 256-item tiles, with a partial final tile
+    let items: Vec<String> = (0..1000).map(|i| format!("flow_{}", i % 300)).collect();
+    let values: Vec<f64> = (0..1000).map(|i| (i % 17) as f64 * 10.0).collect();
+
+    let mut batched = UnivMon::new(10000, 0.01, 0.01).unwrap();
+    batched.update_batch(&items, &values).unwrap();
+
+    let mut serial = UnivMon::new(10000, 0.01, 0.01).unwrap();
+    for (item, &value) in items.iter().zip(&values) {
+        serial.update(item.as_bytes(), value).unwrap();
+    }
+
+    assert_eq!(batched.serialize(), serial.serialize());
+    assert_eq!(batched.estimate_l1(), serial.estimate_l1());
+
+    // Ties in heavy_hitters come out in hash-map order, so compare sorted
+    let mut batched_hh = batched.heavy_hitters(0.01);
+    let mut serial_hh = serial.heavy_hitters(0.01);
+    batched_hh.sort_by(|a, b| a.0.cmp(&b.0));
+    serial_hh.sort_by(|a, b| a.0.cmp(&b.0));
+    assert_eq!(batched_hh, serial_hh);
+}
+
+#[test]
+fn test_update_batch_rejects_invalid_input() {
+    let mut univmon = UnivMon::new(1000, 0.01, 0.01).unwrap();
+
+    assert!(univmon.update_batch(&[b"a", b"b"], &[1.0]).is_err());
+    assert!(univmon.update_batch(&[b"a", b"b"], &[1.0, -1.0]).is_err());
+
+    // A rejected batch leaves the sketch untouched
+    assert!(univmon.is_empty());
+}
+
 // ============================================================================
 // Category 3: L1 Norm Estimation (12 tests)
 // ============================================================================
@@ -621,7 +657,7 @@ fn test_l2_positive_definite() {
 }
 
 // ============================================================================
-// Category 5: Entropy Estimation (12 tests)
+// Category 5: Entropy Estimation (13 tests)
 // ============================================================================
 
 #[test]
@@ -858,6 +894,31 @@ fn test_entropy_extreme_skew() {
     );
 }
 
+#[test]
+fn test_estimate_all_matches_individual_estimators() {
+    let mut univmon = UnivMon::new(100000, 0.01, 0.01).unwrap();
+    assert_eq!(univmon.estimate_all(), (0.0, 0.0, 0.0));
+
+    for i in 0..1000 {
+        let packet_size = if i % 10 == 0 { 1500.0 } else { 800.0 };
+        univmon
+            .update(
+                format!("192.168.{}.{}", i / 256, i % 256).as_bytes(),
+                packet_size,
+            )
+            .unwrap();
+    }
+
+    assert_eq!(
+        univmon.estimate_all(),
+        (
+            univmon.estimate_l1(),
+            univmon.estimate_l2(),
+            univmon.estimate_entropy()
+        )
+    );
+}
+
 // ============================================================================
 // Category 6: Heavy Hitters (15 tests)
 // ============================================================================
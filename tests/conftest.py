@@ -0,0 +1,333 @@
+"""
+Shared fixtures and result aggregation for the cross-language validation suite
+
+Each test's outcome is collected as its report arrives. With pytest-xdist
+the reports from every worker are forwarded to the controller process, so
+the summary is built and written once, in the controller's
+pytest_sessionfinish, whether or not the run was distributed.
+
+Passes are also remembered in pytest's cache (.pytest_cache), keyed by a
+digest of the compiled extension and of this directory's test sources. A
+rerun against the same build skips tests that already passed there and
+counts them as passed; rebuilding the extension or editing a test
+invalidates the entries, and the next run discards them. Use
+--no-validation-cache (or --cache-clear) to run everything.
+
+Only tests under this directory are recorded, cached and exported; other
+suites collected in the same session are left alone.
+
+With --validation-ndjson=PATH the controller also streams one JSON line per
+outcome to PATH ("-" for stdout) as reports arrive, for CI tooling that
+merges shards.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+try:
+    import sketch_oxide
+except ImportError:  # the validation tests skip themselves in this case
+    sketch_oxide = None
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+RESULTS_FILE = "validation_results.json"
+
+# Tests outside this directory (pytest tests python/tests) are not tracked
+SUITE_DIR = Path(__file__).parent.resolve()
+
+# Algorithms shipped by sketch_oxide; the validation tests cover a subset
+TOTAL_ALGORITHMS = 41
+
+PASSES_KEY = "sketch_oxide/validation_passes"
+DIGEST_KEY = "sketch_oxide/validation_digest"
+CACHED_PASS = "cached pass"
+# Beyond this many entries for one build the least-hit ones are evicted
+MAX_CACHED_PASSES = 512
+
+
+@dataclass
+class ValidationResults:
+    """Outcomes recorded during the run, summarized once at the end"""
+
+    passed: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    cached: List[str] = field(default_factory=list)
+    # Reports seen from this suite, skips included
+    reports: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summarize the outcomes in the validation_results.json layout"""
+        total = len(self.passed) + len(self.errors)
+        # Parametrized variants of one test validate the same algorithm
+        validated = {nodeid.split("[")[0] for nodeid in self.passed}
+        return {
+            "python": {
+                "total": total,
+                "passed": len(self.passed),
+                "failed": len(self.errors),
+                "errors": list(self.errors),
+            },
+            "summary": {
+                "total_algorithms": TOTAL_ALGORITHMS if total else 0,
+                "validated_algorithms": len(validated),
+            },
+        }
+
+
+_results = ValidationResults()
+
+# Open in the controller when --validation-ndjson is given
+_ndjson_fd: Optional[int] = None
+_ndjson_config: Optional[pytest.Config] = None
+
+# Node IDs are relative to the rootdir, set in pytest_configure
+_rootpath: Optional[Path] = None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--no-validation-cache",
+        action="store_true",
+        default=False,
+        help="run validation tests even if they passed against the same build",
+    )
+    parser.addoption(
+        "--validation-ndjson",
+        metavar="PATH",
+        default=None,
+        help="stream one JSON line per validation outcome to PATH ('-': stdout)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    global _ndjson_fd, _ndjson_config, _rootpath
+    _rootpath = config.rootpath
+    path = config.getoption("validation_ndjson")
+    if path is None or hasattr(config, "workerinput"):
+        return
+
+    _ndjson_config = config
+    if path == "-":
+        _ndjson_fd = sys.stdout.fileno()
+    else:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        _ndjson_fd = os.open(path, flags, 0o644)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    global _ndjson_fd
+    if _ndjson_fd is not None and _ndjson_fd != sys.stdout.fileno():
+        os.close(_ndjson_fd)
+    _ndjson_fd = None
+
+
+def emit_ndjson(config: pytest.Config, record: Dict[str, Any]) -> None:
+    """Write one record as a single unbuffered line"""
+    if orjson is not None:
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = (json.dumps(record) + "\n").encode()
+
+    # stdout is captured while tests run; write past the capture
+    capman = config.pluginmanager.getplugin("capturemanager")
+    suspended = capman.global_and_fixture_disabled() if capman else None
+    with suspended or contextlib.nullcontext():
+        os.write(_ndjson_fd, line)
+
+
+def in_suite(nodeid: str) -> bool:
+    """Whether a test node belongs to the validation suite in this directory"""
+    assert _rootpath is not None
+    path = (_rootpath / nodeid.split("::")[0]).resolve()
+    return SUITE_DIR in path.parents
+
+
+def cache_enabled(config: pytest.Config) -> bool:
+    """Whether passes can be looked up and recorded for this run"""
+    return (
+        sketch_oxide is not None
+        and getattr(config, "cache", None) is not None
+        and not config.getoption("no_validation_cache")
+    )
+
+
+def suite_digest(config: pytest.Config) -> str:
+    """SHA-256 over the native extension and the test sources next to this file
+
+    The digest is memoized against the files' sizes and mtimes, so the
+    extension is only re-read after it has been rebuilt.
+    """
+    native = Path(sketch_oxide.sketch_oxide.__file__)
+    files = [native] + sorted(SUITE_DIR.glob("*.py"))
+    stamp = [[str(f), f.stat().st_mtime_ns, f.stat().st_size] for f in files]
+
+    memo = config.cache.get(DIGEST_KEY, None)
+    if memo and memo["stamp"] == stamp:
+        return memo["digest"]
+
+    sha = hashlib.sha256()
+    for f in files:
+        sha.update(f.read_bytes())
+    digest = sha.hexdigest()
+    if not hasattr(config, "workerinput"):
+        config.cache.set(DIGEST_KEY, {"stamp": stamp, "digest": digest})
+    return digest
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Skip tests that already passed against this exact build"""
+    if not cache_enabled(config):
+        return
+
+    digest = suite_digest(config)
+    passes = config.cache.get(PASSES_KEY, {})
+    skip = pytest.mark.skip(reason=CACHED_PASS)
+    for item in items:
+        if in_suite(item.nodeid) and f"{digest}:{item.nodeid}" in passes:
+            item.add_marker(skip)
+
+
+def is_cached_pass(report: pytest.TestReport) -> bool:
+    """Whether a skip report comes from the pass cache"""
+    longrepr = report.longrepr
+    return isinstance(longrepr, tuple) and longrepr[2].endswith(CACHED_PASS)
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    """Record the outcome of each validation test"""
+    if not in_suite(report.nodeid):
+        return
+
+    _results.reports += 1
+    record: Dict[str, Any] = {"nodeid": report.nodeid, "when": report.when}
+    if report.when == "call" and report.passed:
+        _results.passed.append(report.nodeid)
+        record["outcome"] = "passed"
+    elif report.skipped and is_cached_pass(report):
+        _results.passed.append(report.nodeid)
+        _results.cached.append(report.nodeid)
+        record["outcome"] = "cached"
+    elif report.failed:
+        crash = getattr(report.longrepr, "reprcrash", None)
+        message = crash.message if crash else str(report.longrepr)
+        _results.errors.append(f"{report.head_line}: {message}")
+        record.update(outcome="failed", message=message)
+    elif report.skipped:
+        record["outcome"] = "skipped"
+    else:
+        return  # passing setup/teardown phases
+
+    if _ndjson_fd is not None:
+        record["duration"] = report.duration
+        emit_ndjson(_ndjson_config, record)
+
+
+def export_json(results: Dict[str, Any], filename: str) -> None:
+    """Write results as indented JSON, with orjson's encoder when installed"""
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+def record_passes(config: pytest.Config) -> None:
+    """Count this run's passes in the cache, evicting the least-hit entries
+
+    Entries recorded under another digest can never be hit again, so they
+    are dropped first; otherwise their accumulated hits would outrank the
+    current build's fresh entries in the eviction below.
+    """
+    digest = suite_digest(config)
+    prefix = f"{digest}:"
+    cached: Dict[str, int] = config.cache.get(PASSES_KEY, {})
+    passes = {key: hits for key, hits in cached.items() if key.startswith(prefix)}
+    for nodeid in _results.passed:
+        key = prefix + nodeid
+        passes[key] = passes.get(key, 0) + 1
+
+    if len(passes) > MAX_CACHED_PASSES:
+        kept = sorted(passes.items(), key=lambda entry: entry[1], reverse=True)
+        passes = dict(kept[:MAX_CACHED_PASSES])
+    config.cache.set(PASSES_KEY, passes)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Export the aggregated results from the controller process"""
+    if hasattr(session.config, "workerinput"):
+        return  # xdist worker: its reports are aggregated by the controller
+    if not _results.reports:
+        return  # no validation tests ran in this session
+
+    export_json(_results.as_dict(), RESULTS_FILE)
+
+    if cache_enabled(session.config) and _results.passed:
+        record_passes(session.config)
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Point at the exported results once the run is over"""
+    if hasattr(terminalreporter.config, "workerinput") or not _results.reports:
+        return
+
+    if _results.cached:
+        terminalreporter.write_line(
+            f"{len(_results.cached)} validation tests reused cached passes "
+            "(--no-validation-cache to rerun them)"
+        )
+    terminalreporter.write_line(f"Results exported to {RESULTS_FILE}")
+
+
+# Sketches are built once per session and clear()ed by each test before use,
+# so re-running the suite pays for construction and allocation only once.
+
+
+@pytest.fixture(scope="session")
+def hll() -> Any:
+    return sketch_oxide.HyperLogLog(14)
+
+
+@pytest.fixture(scope="session")
+def ddsketch() -> Any:
+    return sketch_oxide.DDSketch(relative_accuracy=0.01)
+
+
+@pytest.fixture(scope="session")
+def bloom_filter() -> Any:
+    return sketch_oxide.BloomFilter(n=1000, fpr=0.01)
+
+
+@pytest.fixture(scope="session")
+def count_min() -> Any:
+    return sketch_oxide.CountMinSketch(epsilon=0.01, delta=0.001)
+
+
+@pytest.fixture(scope="session", params=[64, 128, 256], ids=lambda p: f"perm{p}")
+def minhash_pair(request: pytest.FixtureRequest) -> Tuple[Any, Any]:
+    num_perm = request.param
+    return sketch_oxide.MinHash(num_perm), sketch_oxide.MinHash(num_perm)
+
+
+@pytest.fixture(scope="session")
+def reservoir() -> Any:
+    return sketch_oxide.ReservoirSampling(k=10)
+
+
+@pytest.fixture(scope="session")
+def frequent_items() -> Any:
+    return sketch_oxide.FrequentItems(max_size=5)